@@ -2,9 +2,10 @@
 from fastapi import APIRouter, HTTPException
 from app.infrastructure.reporting import (
     build_dashboard_metrics,
-    generate_csv_report,
-    generate_pdf_report
+    generate_pdf_report,
+    stream_csv_report,
 )
+from fastapi.responses import StreamingResponse
 import requests
 import logging
 
@@ -100,8 +101,8 @@ async def get_jobs_list(page: int = 0, size: int = 10):
 
 @router.get("/export/csv")
 async def export_csv():
-    """CSV-Export"""
-    return generate_csv_report().getvalue()
+    """CSV-Export (blockweise gestreamt)"""
+    return StreamingResponse(stream_csv_report(), media_type="text/csv")
 
 @router.get("/export/pdf")
 async def export_pdf():
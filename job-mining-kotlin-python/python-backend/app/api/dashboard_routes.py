@@ -1,16 +1,22 @@
 """
-Dashboard API mit echten Datenbank-Daten
+Dashboard API mit echten Datenbank-Daten (eingebetteter Results-Store, SQLite)
 """
 from fastapi import APIRouter, HTTPException
-from sqlalchemy import func, text
-from app.infrastructure.database import SessionLocal
-from app.infrastructure.db_models import Job, Skill, DiscoveryCandidate
-from typing import Dict, Any
+from app.infrastructure.cooccurrence_engine import get_skill_cooccurrence
+from app.infrastructure.job_classifier import classify_job_role
+from app.infrastructure.reporting import aggregate_quality_metrics, open_results_store
+from app.infrastructure.skill_trend_matrix import get_skill_trend_matrix
+from typing import Dict, Any, Optional
 import logging
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 logger = logging.getLogger(__name__)
 
+CHART_COLORS = [
+    '#3498db', '#e74c3c', '#2ecc71', '#f39c12',
+    '#9b59b6', '#1abc9c', '#34495e', '#e67e22'
+]
+
 
 @router.get("/stats")
 async def get_dashboard_stats() -> Dict[str, Any]:
@@ -24,28 +30,32 @@ async def get_dashboard_stats() -> Dict[str, Any]:
         - avg_quality: Durchschnittliche Extraktionsqualität
     """
     try:
-        db = SessionLocal()
+        store = open_results_store()
 
         # Jobs zählen
-        total_jobs = db.query(func.count(Job.id)).scalar()
-
-        # Unique Skills (ESCO-Codes)
-        total_skills = db.query(func.count(func.distinct(Skill.esco_code))).scalar()
+        total_jobs = store.count_jobs()
 
-        # Discovery Skills (neue Kandidaten)
-        discovery_skills = db.query(func.count(DiscoveryCandidate.id)).scalar()
+        # Unique Skills (ESCO-URIs)
+        total_skills = store.query(
+            "SELECT COUNT(DISTINCT esco_uri) FROM competences WHERE esco_uri IS NOT NULL AND esco_uri != ''"
+        )[0][0]
 
-        # Durchschnittliche Qualität (aus Jobs)
-        avg_quality = db.query(func.avg(Job.extraction_quality)).scalar() or 0.0
+        # Discovery Skills (neue Begriffe)
+        discovery_skills = store.query(
+            "SELECT COUNT(DISTINCT label) FROM competences WHERE is_discovery = 1 AND label IS NOT NULL"
+        )[0][0]
 
-        db.close()
+        years = store.query(
+            "SELECT DISTINCT posting_year_int FROM jobs"
+            " WHERE posting_year_int IS NOT NULL AND duplicate_of IS NULL ORDER BY posting_year_int"
+        )
 
         return {
             "total_jobs": total_jobs,
             "total_skills": total_skills,
             "discovery_skills": discovery_skills,
-            "avg_quality": round(avg_quality * 100, 1),  # 87.5%
-            "years_covered": [2020, 2021, 2022, 2023, 2024, 2025]
+            "avg_quality": aggregate_quality_metrics()['avg_quality'],  # 87.5%
+            "years_covered": [row[0] for row in years]
         }
 
     except Exception as e:
@@ -58,64 +68,70 @@ async def get_competence_trends() -> Dict[str, Any]:
     """
     📈 Skill-Trends über Zeit (Chart.js Format)
 
-    Gruppiert Jobs nach Jahr und zählt Top Skills.
+    Die 5 häufigsten Skills mit ihren Vorkommen pro Jahr (Skill-Trend-Matrix).
     """
     try:
-        db = SessionLocal()
-
-        # SQL-Query: Skills pro Jahr zählen
-        query = text("""
-                     SELECT
-                         EXTRACT(YEAR FROM j.posting_date) AS year,
-                s.label,
-                COUNT(*) AS count
-                     FROM jobs j
-                         JOIN skills s ON s.job_id = j.id
-                     WHERE j.posting_date IS NOT NULL
-                     GROUP BY year, s.label
-                     ORDER BY year, count DESC;
-                     """)
-
-        result = db.execute(query).fetchall()
-        db.close()
-
-        # Transformiere zu Chart.js Format
-        labels = sorted(set(row[0] for row in result))
-        datasets = {}
-
-        for year, label, count in result:
-            if label not in datasets:
-                datasets[label] = {
-                    "label": label,
-                    "data": [0] * len(labels),
-                    "borderColor": get_random_color(),
-                    "tension": 0.4
-                }
-
-            year_index = labels.index(year)
-            datasets[label]["data"][year_index] = count
-
-        # Top 5 Skills
-        top_datasets = list(datasets.values())[:5]
-
-        return {
-            "labels": [str(int(y)) for y in labels],
-            "datasets": top_datasets
-        }
+        trends = get_skill_trend_matrix(open_results_store())
+        return _chart_series(trends, [label for label, _ in trends.top_labels(5)], freq='year')
 
     except Exception as e:
         logger.error(f"Fehler beim Laden der Trends: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def get_random_color() -> str:
-    """Generiert zufällige Chart.js Farben"""
-    import random
-    colors = [
-        '#3498db', '#e74c3c', '#2ecc71', '#f39c12',
-        '#9b59b6', '#1abc9c', '#34495e', '#e67e22'
-    ]
-    return random.choice(colors)
+@router.get("/skill-trends")
+async def get_skill_trends(
+    skills: Optional[str] = None,
+    freq: str = "month",
+    role: Optional[str] = None,
+    region: Optional[str] = None,
+    top_n: int = 5,
+    min_year: int = 2024,
+) -> Dict[str, Any]:
+    """
+    📈 Zeitreihen pro Monat/Jahr, optional nach Rolle oder Region gefiltert
+
+    Args:
+        skills: Komma-getrennte Skills (default: die top_n häufigsten im Slice)
+        freq: 'month' oder 'year'
+        role: Rollen-Kategorie (z.B. 'data_science')
+        region: Region wie im Ergebnis gespeichert
+        min_year: Vergleichsjahr für Emerging Skills
+
+    Returns:
+        Chart.js-Format (labels, datasets) plus emerging_skills für denselben Slice
+    """
+    if freq not in ("month", "year"):
+        raise HTTPException(status_code=400, detail="freq muss 'month' oder 'year' sein")
+    try:
+        trends = get_skill_trend_matrix(open_results_store())
+        labels = [s.strip() for s in skills.split(",") if s.strip()] if skills else \
+            [label for label, _ in trends.top_labels(top_n, role=role, region=region)]
+        chart = _chart_series(trends, labels, freq=freq, role=role, region=region)
+        chart["emerging_skills"] = trends.emerging(min_year, role=role, region=region)
+        return chart
+
+    except Exception as e:
+        logger.error(f"Fehler bei Skill-Trends: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _chart_series(trends, skills, freq: str, role: Optional[str] = None,
+                  region: Optional[str] = None) -> Dict[str, Any]:
+    series = trends.series(skills, freq=freq, role=role, region=region)
+    labels = sorted({period for counts in series.values() for period in counts})
+    return {
+        "labels": labels,
+        "datasets": [
+            {
+                "label": skill,
+                "data": [counts.get(period, 0) for period in labels],
+                "borderColor": CHART_COLORS[i % len(CHART_COLORS)],
+                "tension": 0.4
+            }
+            for i, (skill, counts) in enumerate(series.items())
+        ]
+    }
 
 
 @router.get("/role-distribution")
@@ -126,19 +142,17 @@ async def get_role_distribution() -> Dict[str, Any]:
     Beispiel: Business Analyst, Data Scientist, etc.
     """
     try:
-        db = SessionLocal()
+        store = open_results_store()
 
         # Jobs pro Rolle zählen
-        query = text("""
-                     SELECT job_role, COUNT(*) AS count
-                     FROM jobs
-                     WHERE job_role IS NOT NULL
-                     GROUP BY job_role
-                     ORDER BY count DESC;
-                     """)
-
-        result = db.execute(query).fetchall()
-        db.close()
+        result = store.query("""
+            SELECT job_role, COUNT(*) AS count
+            FROM jobs
+            WHERE job_role IS NOT NULL AND job_role != ''
+              AND duplicate_of IS NULL
+            GROUP BY job_role
+            ORDER BY count DESC
+        """)
 
         labels = [row[0] for row in result]
         data = [row[1] for row in result]
@@ -147,10 +161,7 @@ async def get_role_distribution() -> Dict[str, Any]:
             "labels": labels,
             "datasets": [{
                 "data": data,
-                "backgroundColor": [
-                    '#3498db', '#e74c3c', '#2ecc71', '#f39c12',
-                    '#9b59b6', '#1abc9c', '#34495e', '#e67e22'
-                ]
+                "backgroundColor": CHART_COLORS
             }]
         }
 
@@ -171,18 +182,15 @@ async def get_level_progression() -> Dict[str, Any]:
     Level 5: Academia
     """
     try:
-        db = SessionLocal()
+        store = open_results_store()
 
         # Skills pro Level zählen
-        query = text("""
-                     SELECT level, COUNT(*) AS count
-                     FROM skills
-                     GROUP BY level
-                     ORDER BY level;
-                     """)
-
-        result = db.execute(query).fetchall()
-        db.close()
+        result = store.query("""
+            SELECT COALESCE(level, 2) AS lvl, COUNT(*) AS count
+            FROM competences
+            GROUP BY lvl
+            ORDER BY lvl
+        """)
 
         level_names = {
             1: "Level 1: Discovery",
@@ -217,36 +225,116 @@ async def get_emerging_skills() -> list[Dict[str, Any]]:
     Vergleicht Häufigkeit: 2024 vs. 2023
     """
     try:
-        db = SessionLocal()
-
-        query = text("""
-                     SELECT
-                         s.label,
-                         COUNT(CASE WHEN EXTRACT(YEAR FROM j.posting_date) = 2024 THEN 1 END) AS count_2024,
-                         COUNT(CASE WHEN EXTRACT(YEAR FROM j.posting_date) = 2023 THEN 1 END) AS count_2023,
-                         (COUNT(CASE WHEN EXTRACT(YEAR FROM j.posting_date) = 2024 THEN 1 END) -
-                          COUNT(CASE WHEN EXTRACT(YEAR FROM j.posting_date) = 2023 THEN 1 END)) AS growth
-                     FROM skills s
-                              JOIN jobs j ON s.job_id = j.id
-                     WHERE EXTRACT(YEAR FROM j.posting_date) IN (2023, 2024)
-                     GROUP BY s.label
-                     HAVING growth > 0
-                     ORDER BY growth DESC
-                         LIMIT 10;
-                     """)
-
-        result = db.execute(query).fetchall()
-        db.close()
-
+        trends = get_skill_trend_matrix(open_results_store())
         return [
-            {
-                "skill": row[0],
-                "growth": row[3],
-                "growth_pct": round((row[1] / max(row[2], 1) - 1) * 100, 1)
-            }
-            for row in result
+            {"skill": row["skill"], "growth": row["growth"], "growth_pct": row["growth_pct"]}
+            for row in trends.growth(2023, 2024, top_n=10)
         ]
 
     except Exception as e:
         logger.error(f"Fehler bei Emerging Skills: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/skills/related")
+async def get_related_skills(skill: str, top_k: int = 10, metric: str = "npmi", min_count: int = 2) -> Dict[str, Any]:
+    """
+    🔗 Skills, die häufig gemeinsam mit ``skill`` gefordert werden
+
+    Args:
+        metric: count | lift | pmi | npmi | jaccard
+        min_count: Mindestanzahl gemeinsamer Jobs (PMI überbewertet seltene Paare)
+    """
+    try:
+        engine = get_skill_cooccurrence(open_results_store())
+        if skill not in engine.label_index:
+            raise HTTPException(status_code=404, detail=f"Skill '{skill}' nicht gefunden")
+        return {
+            "skill": skill,
+            "metric": metric,
+            "jobs": int(engine.doc_freq[engine.label_index[skill]]),
+            "related": engine.related(skill, top_k=top_k, metric=metric, min_count=min_count),
+        }
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Fehler bei verwandten Skills: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/skills/pairs")
+async def get_skill_pairs(top_k: int = 20, metric: str = "npmi", min_count: int = 3) -> Dict[str, Any]:
+    """🔗 Stärkste Skill-Paare im gesamten Korpus (PMI/Lift-Ranking)"""
+    try:
+        engine = get_skill_cooccurrence(open_results_store())
+        return {"metric": metric, "pairs": engine.top_pairs(top_k=top_k, metric=metric, min_count=min_count)}
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Fehler bei Skill-Paaren: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/skills/graph")
+async def get_skill_graph(
+    seed: Optional[str] = None,
+    top_nodes: int = 30,
+    metric: str = "npmi",
+    min_count: int = 3,
+    max_edges_per_node: int = 5,
+) -> Dict[str, Any]:
+    """
+    🕸️ Beschnittener Skill-Graph (Knoten + Kanten) für Netzwerk-Visualisierungen
+
+    Ohne ``seed``: die häufigsten Skills; mit ``seed``: der Skill und seine stärksten Nachbarn.
+    """
+    try:
+        engine = get_skill_cooccurrence(open_results_store())
+        return engine.graph(seed=seed, top_nodes=top_nodes, metric=metric, min_count=min_count,
+                            max_edges_per_node=max_edges_per_node)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Fehler beim Skill-Graph: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/roles/network")
+async def get_role_network(min_similarity: float = 0.1) -> Dict[str, Any]:
+    """🕸️ Verwandte Rollen: Kosinus-Ähnlichkeit der Skill-Profile aller Rollen-Kategorien"""
+    try:
+        return get_skill_cooccurrence(open_results_store()).role_network(min_similarity=min_similarity)
+
+    except Exception as e:
+        logger.error(f"Fehler beim Rollen-Netzwerk: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/roles/skills")
+async def get_role_skills(role: str, top_k: int = 15, metric: str = "count") -> Dict[str, Any]:
+    """
+    🎯 Typische Skills einer Rolle über alle analysierten Jobs
+
+    Args:
+        role: Rollen-Kategorie (z.B. 'data_science') oder Rollenbezeichnung ('Data Scientist')
+        metric: count (häufigste) | lift (überdurchschnittlich häufig)
+    """
+    try:
+        engine = get_skill_cooccurrence(open_results_store())
+        category = role if role in engine.role_index else classify_job_role(role)['category']
+        return {
+            "role": role,
+            "role_category": category,
+            "skills": engine.role_skills(category, top_k=top_k, metric=metric),
+        }
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Fehler bei Rollen-Skills: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -49,7 +49,9 @@ class AnalysisResultFactory:
             region: str = "Unbekannt",
             is_segmented: bool = False,
             source_url: Optional[str] = None,
-            raw_text_hash: Optional[str] = None
+            raw_text_hash: Optional[str] = None,
+            duplicate_of: Optional[str] = None,
+            duplicate_similarity: Optional[float] = None
     ) -> AnalysisResultDTO:
         """Baut das finale AnalysisResultDTO für die Datenbank/Kotlin."""
 
@@ -69,5 +71,7 @@ class AnalysisResultFactory:
             raw_text_hash=raw_text_hash,
             is_segmented=is_segmented,
             source_url=source_url,
+            duplicate_of=duplicate_of,
+            duplicate_similarity=duplicate_similarity,
             competences=competences
         )
@@ -1,9 +1,10 @@
+import hashlib
 import logging
-from typing import BinaryIO, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 # Core & Domain
 from app.core.normalize import parse_date
-from app.domain.models import AnalysisResultDTO
+from app.domain.models import AnalysisResultDTO, CompetenceDTO
 
 # Interfaces
 from app.interfaces.interfaces import (
@@ -16,6 +17,7 @@ from app.interfaces.interfaces import (
 from app.application.factories.analysis_result_factory import AnalysisResultFactory
 from app.infrastructure.extractor.metadata_extractor import MetadataExtractor
 from app.infrastructure.extractor.discovery_logger import log_candidates
+from app.infrastructure.metrics import count, document_timings, stage_timer
 
 logger = logging.getLogger(__name__)
 
@@ -30,13 +32,16 @@ class JobMiningWorkflowManager(IJobMiningWorkflowManager):
                  competence_extractor: ICompetenceExtractor,
                  organization_service,
                  role_service,
-                 metadata_extractor: MetadataExtractor):
+                 metadata_extractor: MetadataExtractor,
+                 duplicate_index=None):
 
         self.text_extractor = text_extractor
         self.competence_extractor = competence_extractor
         self.organization_service = organization_service
         self.role_service = role_service
         self.metadata_extractor = metadata_extractor
+        # Optional: Index mit ``find_near_duplicate(text, exclude_hash)`` (z.B. ResultsStore)
+        self.duplicate_index = duplicate_index
 
     async def run_full_analysis(self, file_object: BinaryIO, filename: str) -> AnalysisResultDTO:
         """
@@ -45,18 +50,20 @@ class JobMiningWorkflowManager(IJobMiningWorkflowManager):
         Mit umfassender Fehlerbehandlung.
         """
         try:
-            # 1. Text extrahieren (Delegation an AdvancedTextExtractor)
-            text = self.text_extractor.extract_text(file_object, filename)
+            with document_timings(filename):
+                # 1. Text extrahieren (Delegation an AdvancedTextExtractor)
+                with stage_timer("text_extraction"):
+                    text = self.text_extractor.extract_text(file_object, filename)
 
-            if not text:
-                # Fehler werfen oder leeres Result zurückgeben (hier: Fehler für sauberes Logging)
-                logger.error(f"AdvancedTextExtractor lieferte leeren Text für '{filename}'.")
-                raise ValueError(f"AdvancedTextExtractor konnte keinen Text aus {filename} lesen.")
+                if not text:
+                    # Fehler werfen oder leeres Result zurückgeben (hier: Fehler für sauberes Logging)
+                    logger.error(f"AdvancedTextExtractor lieferte leeren Text für '{filename}'.")
+                    raise ValueError(f"AdvancedTextExtractor konnte keinen Text aus {filename} lesen.")
 
-            # 2. Cleaning (WICHTIG: Null-Bytes entfernen, sonst DB-Fehler oder 'kein Text')
-            cleaned_raw_text = text.replace('\x00', '')
+                # 2. Cleaning (WICHTIG: Null-Bytes entfernen, sonst DB-Fehler oder 'kein Text')
+                cleaned_raw_text = text.replace('\x00', '')
 
-            return self._execute_pipeline(cleaned_raw_text, source_name=filename)
+                return self._execute_pipeline(cleaned_raw_text, source_name=filename)
         except ValueError as e:
             # Validierungsfehler weiterwerfen
             raise
@@ -81,6 +88,63 @@ class JobMiningWorkflowManager(IJobMiningWorkflowManager):
     def _run_analysis_from_text(self, text: str, source_name: str) -> AnalysisResultDTO:
         return self.run_analysis_from_scraped_text(text, source_name)
 
+    def run_analyses_from_scraped_texts(self, items: List[Tuple[str, str]], batch_size: int = 16) -> List[Union[AnalysisResultDTO, Exception]]:
+        """
+        Einstiegspunkt 3: Mehrere gescrapte Texte (Bulk-URL-Analyse).
+        Metadaten/Rolle laufen pro Text, das spaCy-Parsing gebündelt über ``nlp.pipe``.
+
+        Args:
+            items: Liste von (text, source_name)
+
+        Returns:
+            Pro Eintrag ein AnalysisResultDTO oder die aufgetretene Exception (gleiche Reihenfolge)
+        """
+        contexts: List[Union[Dict[str, Any], Exception]] = []
+        duplicates: Dict[int, AnalysisResultDTO] = {}
+        for text, source_name in items:
+            try:
+                source_url = source_name if source_name.startswith('http') else None
+                text = text.replace('\x00', '')
+                duplicate = self._find_duplicate(text)
+                if duplicate is not None:
+                    duplicates[len(contexts)] = self._build_duplicate_result(text, source_name, source_url, duplicate)
+                    contexts.append({})
+                    continue
+                contexts.append(self._prepare_context(text, source_name, source_url))
+            except Exception as e:
+                logger.error(f"❌ Vorbereitung fehlgeschlagen für '{source_name}': {e}")
+                contexts.append(ValueError(f"Analyse-Fehler für {source_name}: {str(e)}"))
+
+        ready = [ctx for i, ctx in enumerate(contexts) if not isinstance(ctx, Exception) and i not in duplicates]
+        extract_many = getattr(self.competence_extractor, 'extract_many', None) if ready else None
+        if extract_many is not None:
+            try:
+                batched = extract_many([ctx['analysis_text'] for ctx in ready],
+                                       [ctx['role'] for ctx in ready], batch_size=batch_size)
+                for ctx, competences in zip(ready, batched):
+                    ctx['competences'] = competences
+                logger.info(f"🧠 Batch-NLP: {len(ready)} Texte in einem nlp.pipe-Lauf")
+            except Exception as e:
+                logger.warning(f"⚠️ Batch-NLP fehlgeschlagen, Einzel-Extraktion: {e}")
+
+        results: List[Union[AnalysisResultDTO, Exception]] = []
+        for i, ctx in enumerate(contexts):
+            if isinstance(ctx, Exception):
+                results.append(ctx)
+                continue
+            if i in duplicates:
+                results.append(duplicates[i])
+                count("documents_total", status="duplicate")
+                continue
+            try:
+                competences = ctx['competences'] if 'competences' in ctx else self._extract_competences(ctx)
+                results.append(self._build_result(ctx, competences))
+                count("documents_total", status="analysed")
+            except Exception as e:
+                results.append(e)
+                count("documents_total", status="error")
+        return results
+
     def _execute_pipeline(self, text: str, source_name: str, source_url: Optional[str] = None) -> AnalysisResultDTO:
         """
         Die KERN-LOGIK (SSoT).
@@ -88,109 +152,186 @@ class JobMiningWorkflowManager(IJobMiningWorkflowManager):
         Mit robuster Fehlerbehandlung an kritischen Stellen.
         """
         try:
-            # ═══════════════════════════════════════
-            # 📊 BEST PRACTICE: Detailliertes Status-Logging
-            # ═══════════════════════════════════════
-            logger.info("=" * 60)
-            logger.info(f"🚀 ANALYSE START: {source_name}")
-            logger.info("=" * 60)
+            duplicate = self._find_duplicate(text)
+            if duplicate is not None:
+                count("documents_total", status="duplicate")
+                return self._build_duplicate_result(text, source_name, source_url, duplicate)
+            with document_timings(source_name):
+                ctx = self._prepare_context(text, source_name, source_url)
+                competences = self._extract_competences(ctx)
+                result = self._build_result(ctx, competences)
+            count("documents_total", status="analysed")
+            return result
+        except ValueError:
+            # ValueError weiterwerfen (z.B. von DTO-Erstellung)
+            count("documents_total", status="error")
+            raise
+        except Exception as e:
+            count("documents_total", status="error")
+            logger.error(f"❌ Kritischer Fehler in _execute_pipeline für '{source_name}': {e}", exc_info=True)
+            raise ValueError(f"Pipeline-Fehler: {str(e)}")
 
-            # Schritt A: Metadaten & Datum (Ebene 6)
-            logger.info("--- 🏢 METADATA EXTRACTION")
-            meta = {}
-            try:
+    def _find_duplicate(self, text: str) -> Optional[Dict[str, Any]]:
+        """Kanonische Anzeige, falls ``text`` ein Near-Duplicate einer bereits analysierten ist"""
+        if self.duplicate_index is None:
+            return None
+        try:
+            # Identischer Text (erneute Analyse) zählt nicht als Duplikat von sich selbst
+            return self.duplicate_index.find_near_duplicate(
+                text, exclude_hash=hashlib.sha256(text.encode('utf-8')).hexdigest())
+        except Exception as e:
+            logger.warning(f"⚠️ Near-Duplicate-Prüfung fehlgeschlagen: {e}")
+            return None
+
+    def _build_duplicate_result(self, text: str, source_name: str, source_url: Optional[str],
+                                duplicate: Dict[str, Any]) -> AnalysisResultDTO:
+        """Ergebnis eines Near-Duplicates: Felder und Kompetenzen der kanonischen Anzeige, eigener Text/Quelle"""
+        canonical = duplicate['payload']
+        logger.info(f"🔁 Near-Duplicate ({duplicate['similarity']:.0%}) von {duplicate['raw_text_hash'][:12]}: "
+                    f"{source_name} → NLP-Analyse übersprungen")
+        return AnalysisResultFactory.create_result(
+            title=canonical.get('title') or 'Unbekannte Position',
+            job_role=canonical.get('job_role') or '',
+            industry=canonical.get('industry') or '',
+            region=canonical.get('region') or "Unbekannt",
+            posting_date=canonical.get('posting_date') or "2024-12-01",
+            raw_text=text,
+            is_segmented=canonical.get('is_segmented', False),
+            source_url=source_url,
+            competences=[CompetenceDTO(**c) for c in canonical.get('competences') or []],
+            duplicate_of=duplicate['raw_text_hash'],
+            duplicate_similarity=duplicate['similarity'],
+        )
+
+    def _prepare_context(self, text: str, source_name: str, source_url: Optional[str] = None) -> Dict[str, Any]:
+        """Pipeline-Schritte A + B: Metadaten, Segmentierung, Branche & Rolle"""
+        # ═══════════════════════════════════════
+        # 📊 BEST PRACTICE: Detailliertes Status-Logging
+        # ═══════════════════════════════════════
+        logger.info("=" * 60)
+        logger.info(f"🚀 ANALYSE START: {source_name}")
+        logger.info("=" * 60)
+
+        # Schritt A: Metadaten & Datum (Ebene 6)
+        logger.info("--- 🏢 METADATA EXTRACTION")
+        meta = {}
+        try:
+            with stage_timer("metadata"):
                 meta = self.metadata_extractor.extract_all(text, filename=source_name)
 
-                # ✅ BEST PRACTICE: Zeige extrahierte Metadaten
-                logger.info(f"    ✓ Titel: \"{meta.get('job_title', 'N/A')}\"")
-                logger.info(f"    ✓ Firma: \"{meta.get('company_name', 'N/A')}\"")
-                logger.info(f"    ✓ Branch: {meta.get('industry', 'N/A')}")
-                logger.info(f"    ✓ Ort: {meta.get('region', 'N/A')}")
-                logger.info(f"    ✓ Datum: {meta.get('posting_date', 'N/A')}")
-                logger.info(f"    ✓ Kategorie: {meta.get('job_role', 'N/A')}")
+            # ✅ BEST PRACTICE: Zeige extrahierte Metadaten
+            logger.info(f"    ✓ Titel: \"{meta.get('job_title', 'N/A')}\"")
+            logger.info(f"    ✓ Firma: \"{meta.get('company_name', 'N/A')}\"")
+            logger.info(f"    ✓ Branch: {meta.get('industry', 'N/A')}")
+            logger.info(f"    ✓ Ort: {meta.get('region', 'N/A')}")
+            logger.info(f"    ✓ Datum: {meta.get('posting_date', 'N/A')}")
+            logger.info(f"    ✓ Kategorie: {meta.get('job_role', 'N/A')}")
 
-            except Exception as e:
-                logger.warning(f"    ⚠️ Metadaten-Extraktion fehlgeschlagen: {e}")
-                meta = {'job_title': 'Unbekannte Position', 'posting_date': '2024-12-01'}
-
-            # --- 💎 GOLD: Smarte Segmentierung integriert ---
-            tasks = meta.get('tasks_clean', '')
-            reqs = meta.get('requirements_clean', '')
-            # Baue "Konzentrat" für die KI
-            segmented_text = (tasks + " " + reqs).strip()
-
-            # Vorsegmentierter Text ohne Benefits/About-Blöcke
-            prefiltered_text = meta.get('processing_text') or text
-
-            # Fallback-Logik: Wenn Segmentierung fehlschlägt (z.B. < 50 Zeichen), nimm prefilter.
-            if len(segmented_text) < 50:
-                logger.info(f"Segmentierung für '{source_name}' zu kurz. Nutze vorgefilterten Text.")
-                analysis_text = prefiltered_text if prefiltered_text else text
-            else:
-                analysis_text = segmented_text
-            # -----------------------------------------------
-
-            # Datum normalisieren (Fallback auf heute, falls MetadataExtractor nichts findet)
-            posting_date = meta.get('posting_date') or "2024-12-01"
-
-            # Schritt B: Kontext-Erkennung (Branche & Rolle)
-            industry = None
-            role = None
-            
-            try:
+        except Exception as e:
+            logger.warning(f"    ⚠️ Metadaten-Extraktion fehlgeschlagen: {e}")
+            meta = {'job_title': 'Unbekannte Position', 'posting_date': '2024-12-01'}
+
+        # --- 💎 GOLD: Smarte Segmentierung integriert ---
+        tasks = meta.get('tasks_clean', '')
+        reqs = meta.get('requirements_clean', '')
+        # Baue "Konzentrat" für die KI
+        segmented_text = (tasks + " " + reqs).strip()
+
+        # Vorsegmentierter Text ohne Benefits/About-Blöcke
+        prefiltered_text = meta.get('processing_text') or text
+
+        # Fallback-Logik: Wenn Segmentierung fehlschlägt (z.B. < 50 Zeichen), nimm prefilter.
+        if len(segmented_text) < 50:
+            logger.info(f"Segmentierung für '{source_name}' zu kurz. Nutze vorgefilterten Text.")
+            analysis_text = prefiltered_text if prefiltered_text else text
+        else:
+            analysis_text = segmented_text
+        # -----------------------------------------------
+
+        # Datum normalisieren (Fallback auf heute, falls MetadataExtractor nichts findet)
+        posting_date = meta.get('posting_date') or "2024-12-01"
+
+        # Schritt B: Kontext-Erkennung (Branche & Rolle)
+        industry = None
+        role = None
+
+        try:
+            with stage_timer("industry"):
                 # Versuche zuerst die neuere detect_industry API, fallback auf classify_industry (Legacy) falls nötig
                 if hasattr(self.organization_service, 'detect_industry'):
                     industry = self.organization_service.detect_industry(text)
-                
+
                 if not isinstance(industry, str):
                     # Fallback
                     industry = getattr(self.organization_service, 'classify_industry', lambda t: None)(text)
-            except Exception as e:
-                logger.warning(f"⚠️ Industry-Erkennung fehlgeschlagen: {e}")
-                industry = "Unbekannt"
+        except Exception as e:
+            logger.warning(f"⚠️ Industry-Erkennung fehlgeschlagen: {e}")
+            industry = "Unbekannt"
 
-            try:
+        try:
+            with stage_timer("role"):
                 role = self.role_service.classify_role(text, meta.get('job_title') or source_name)
-            except Exception as e:
-                logger.warning(f"⚠️ Rollen-Erkennung fehlgeschlagen: {e}")
-                role = "Unbekannt"
-
-            # Schritt C: NLP Extraktion (Ebene 1-5)
-            logger.info("")
-            logger.info("--- 🔍 COMPETENCE EXTRACTION")
-            competences = []
-            try:
-                # WICHTIG: Übergibt 'role' an den Extractor, wie im Interface gefixt.
-                competences = self.competence_extractor.extract_competences(text=analysis_text, role=role)
-
-                # ✅ BEST PRACTICE: Zeige Extraction-Ergebnis
-                logger.info(f"    ✅ Extrahiert: {len(competences)} Kompetenzen")
-
-                # Gruppiere nach Level
-                level_counts = {}
-                digital_count = 0
-                discovery_count = 0
-                for comp in competences:
-                    level = getattr(comp, 'level', 2)
-                    level_counts[level] = level_counts.get(level, 0) + 1
-                    if getattr(comp, 'is_digital', False):
-                        digital_count += 1
-                    if getattr(comp, 'is_discovery', False):
-                        discovery_count += 1
-
-                logger.info(f"    📊 Breakdown:")
-                for lvl in sorted(level_counts.keys()):
-                    logger.info(f"       Level {lvl}: {level_counts[lvl]} Skills")
-                if digital_count > 0:
-                    logger.info(f"       Digital Skills: {digital_count}")
-                if discovery_count > 0:
-                    logger.info(f"       Discovery: {discovery_count}")
-
-            except Exception as e:
-                logger.error(f"    ❌ Kompetenz-Extraktion fehlgeschlagen: {e}", exc_info=True)
-                # Weiter mit leerer Liste
+        except Exception as e:
+            logger.warning(f"⚠️ Rollen-Erkennung fehlgeschlagen: {e}")
+            role = "Unbekannt"
+
+        return {
+            'text': text,
+            'source_name': source_name,
+            'source_url': source_url,
+            'meta': meta,
+            'analysis_text': analysis_text,
+            'posting_date': posting_date,
+            'industry': industry,
+            'role': role,
+        }
+
+    def _extract_competences(self, ctx: Dict[str, Any]) -> List:
+        """Pipeline-Schritt C: NLP Extraktion (Ebene 1-5)"""
+        analysis_text, role = ctx['analysis_text'], ctx['role']
+        logger.info("")
+        logger.info("--- 🔍 COMPETENCE EXTRACTION")
+        competences = []
+        try:
+            # WICHTIG: Übergibt 'role' an den Extractor, wie im Interface gefixt.
+            competences = self.competence_extractor.extract_competences(text=analysis_text, role=role)
+
+            # ✅ BEST PRACTICE: Zeige Extraction-Ergebnis
+            logger.info(f"    ✅ Extrahiert: {len(competences)} Kompetenzen")
+
+            # Gruppiere nach Level
+            level_counts = {}
+            digital_count = 0
+            discovery_count = 0
+            for comp in competences:
+                level = getattr(comp, 'level', 2)
+                level_counts[level] = level_counts.get(level, 0) + 1
+                if getattr(comp, 'is_digital', False):
+                    digital_count += 1
+                if getattr(comp, 'is_discovery', False):
+                    discovery_count += 1
+
+            logger.info(f"    📊 Breakdown:")
+            for lvl in sorted(level_counts.keys()):
+                logger.info(f"       Level {lvl}: {level_counts[lvl]} Skills")
+            if digital_count > 0:
+                logger.info(f"       Digital Skills: {digital_count}")
+            if discovery_count > 0:
+                logger.info(f"       Discovery: {discovery_count}")
 
-            # Discovery: unbekannte Kandidaten sammeln (vereinfachte Heuristik)
+        except Exception as e:
+            logger.error(f"    ❌ Kompetenz-Extraktion fehlgeschlagen: {e}", exc_info=True)
+            # Weiter mit leerer Liste
+
+        return competences
+
+    def _build_result(self, ctx: Dict[str, Any], competences: List) -> AnalysisResultDTO:
+        """Discovery-Logging + Pipeline-Schritt D: DTO bauen (Ebene 7)"""
+        text, meta, role = ctx['text'], ctx['meta'], ctx['role']
+        industry, posting_date, analysis_text = ctx['industry'], ctx['posting_date'], ctx['analysis_text']
+        source_url = ctx['source_url']
+        # Discovery: unbekannte Kandidaten sammeln (vereinfachte Heuristik)
+        with stage_timer("discovery_log"):
             try:
                 # Labels für Ausschluss (bekannte ESCO-Begriffe)
                 known_labels = set()
@@ -224,9 +365,10 @@ class JobMiningWorkflowManager(IJobMiningWorkflowManager):
                 logger.debug(f"Discovery-Logging fehlgeschlagen: {e}")
                 pass
 
-            # Schritt D: DTO Bauen (Ebene 7)
-            try:
-                # Nutzt die Factory, um Zirkelbezüge zu vermeiden.
+        # Schritt D: DTO Bauen (Ebene 7)
+        try:
+            # Nutzt die Factory, um Zirkelbezüge zu vermeiden.
+            with stage_timer("dto_build"):
                 result = AnalysisResultFactory.create_result(
                     title=meta.get('job_title') or 'Unbekannte Position',
                     job_role=role,
@@ -239,26 +381,19 @@ class JobMiningWorkflowManager(IJobMiningWorkflowManager):
                     competences=competences
                 )
 
-                # ✅ BEST PRACTICE: Final Summary
-                logger.info("")
-                logger.info("--- 📊 RESULT")
-                logger.info(f"    ✅ Job: \"{meta.get('job_title', 'N/A')}\"")
-                logger.info(f"    ✅ Firma: {meta.get('company_name', 'N/A')} ({industry})")
-                logger.info(f"    ✅ Kompetenzen: {len(competences)} gesamt")
-                logger.info("=" * 60)
+            # ✅ BEST PRACTICE: Final Summary
+            logger.info("")
+            logger.info("--- 📊 RESULT")
+            logger.info(f"    ✅ Job: \"{meta.get('job_title', 'N/A')}\"")
+            logger.info(f"    ✅ Firma: {meta.get('company_name', 'N/A')} ({industry})")
+            logger.info(f"    ✅ Kompetenzen: {len(competences)} gesamt")
+            logger.info("=" * 60)
 
-                return result
+            return result
 
-            except Exception as e:
-                logger.error(f"    ❌ DTO-Erstellung fehlgeschlagen: {e}", exc_info=True)
-                raise ValueError(f"Konnte kein Analyse-Ergebnis erstellen: {str(e)}")
-                
-        except ValueError:
-            # ValueError weiterwerfen (z.B. von DTO-Erstellung)
-            raise
         except Exception as e:
-            logger.error(f"❌ Kritischer Fehler in _execute_pipeline für '{source_name}': {e}", exc_info=True)
-            raise ValueError(f"Pipeline-Fehler: {str(e)}")
+            logger.error(f"    ❌ DTO-Erstellung fehlgeschlagen: {e}", exc_info=True)
+            raise ValueError(f"Konnte kein Analyse-Ergebnis erstellen: {str(e)}")
 
     def create_competence_dto(self, **kwargs):
         """Zentrale Factory-Methode für Extractors (z.B. Discovery).
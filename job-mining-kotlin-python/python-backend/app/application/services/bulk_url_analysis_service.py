@@ -0,0 +1,272 @@
+"""
+Bulk-URL-Analyse: Viele Stellen-URLs in einem Lauf
+Statt je URL Scrape → Analyse → Export seriell:
+
+- Deduplizierung über ``WebScraper.normalize_url`` (kanonische URL)
+- Paralleler Abruf über den gepoolten AsyncHttpClient (Host-Limits gelten)
+- NLP gebündelt: fertige Texte werden gesammelt und als Batch analysiert
+- Ergebnisse pro URL, sobald ihr Batch fertig ist (Async-Iterator → NDJSON)
+- Unveränderte Seiten (HTTP-Cache) liefern das gespeicherte Ergebnis ohne NLP
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.infrastructure.cache.http_cache import HttpResponseCache, get_http_cache
+from app.infrastructure.crawling.web_scraper import ScrapedContent, WebScraper
+
+logger = logging.getLogger(__name__)
+
+MAX_BULK_URLS = int(os.getenv("MAX_BULK_URLS", "500"))
+DEFAULT_BATCH_SIZE = 8
+DEFAULT_MAX_CONCURRENCY = 16
+MIN_TEXT_CHARS = 100        # wie /analyse/scrape-url
+FAST_MODE_CHARS = 4000      # wie URLInput.fast
+
+STATUS_OK = "ok"
+STATUS_DUPLICATE = "duplicate"
+STATUS_SKIPPED = "skipped"
+STATUS_ERROR = "error"
+
+
+class BulkUrlAnalysisService:
+    """
+    Analysiert viele URLs nebenläufig und liefert pro URL einen Ergebnis-Record.
+
+    Args:
+        manager: Workflow-Manager; nutzt ``run_analyses_from_scraped_texts`` (Batch),
+            sonst ``run_analysis_from_scraped_text`` pro Text
+        scraper: WebScraper (nur statischer Pfad, ``scrape_async``)
+        batch_size: Texte pro NLP-Batch
+        max_concurrency: Gleichzeitige Abrufe insgesamt (pro Host begrenzt der Client)
+        fast: Text wie beim Einzel-Endpunkt auf 4000 Zeichen kürzen
+        flush_after_s: Unvollständigen Batch analysieren, wenn so lange kein Abruf fertig wurde
+        on_result: Callback pro neu berechnetem AnalysisResultDTO (z.B. ``save_result``)
+        http_cache: HTTP-Cache für unveränderte Seiten (default: globale Instanz, falls aktiviert)
+    """
+
+    def __init__(
+        self,
+        manager,
+        scraper: Optional[WebScraper] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        fast: bool = True,
+        flush_after_s: float = 1.0,
+        on_result: Optional[Callable[[Any], None]] = None,
+        http_cache: Optional[HttpResponseCache] = None,
+    ):
+        self.manager = manager
+        self.scraper = scraper or WebScraper(use_playwright=False)
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.fast = fast
+        self.flush_after_s = flush_after_s
+        self.on_result = on_result
+        self.http_cache = http_cache if http_cache is not None else get_http_cache()
+        self.variant = 'fast' if fast else 'full'
+
+    # ------------------------------------------------------------------
+    # Planung
+    # ------------------------------------------------------------------
+
+    def plan(self, urls: Iterable[str]) -> Tuple[List[Tuple[str, str]], List[Dict[str, Any]]]:
+        """
+        Dedupliziert und filtert die Eingabe.
+
+        Returns:
+            (zu ladende (url, canonical_url)-Paare, sofort fertige Records für
+            Duplikate / ungültige URLs / JS-Domains)
+        """
+        to_fetch: List[Tuple[str, str]] = []
+        immediate: List[Dict[str, Any]] = []
+        first_seen: Dict[str, str] = {}
+
+        for raw in urls:
+            url = (raw or "").strip()
+            if not url:
+                continue
+            canonical = self.scraper.normalize_url(url)
+            if not canonical.startswith(("http://", "https://")):
+                immediate.append(self._record(url, canonical, STATUS_ERROR, error="Ungültige URL (nur http/https)"))
+                continue
+            if canonical in first_seen:
+                immediate.append(self._record(url, canonical, STATUS_DUPLICATE, duplicate_of=first_seen[canonical]))
+                continue
+            first_seen[canonical] = url
+            if self.scraper.requires_js_rendering(canonical):
+                immediate.append(self._record(url, canonical, STATUS_SKIPPED,
+                                              error="Domain erfordert JavaScript-Rendering (Einzel-Endpunkt mit render_js nutzen)"))
+                continue
+            to_fetch.append((url, canonical))
+
+        return to_fetch, immediate
+
+    # ------------------------------------------------------------------
+    # Ausführung
+    # ------------------------------------------------------------------
+
+    async def analyze(self, urls: Iterable[str]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Liefert pro Eingabe-URL einen Record (``type='url'``) in Fertigstellungs-
+        Reihenfolge und zum Schluss einen Record mit ``type='summary'``.
+        """
+        start = time.monotonic()
+        counts: Counter = Counter()
+        to_fetch, immediate = self.plan(urls)
+        logger.info(f"🌐 Bulk-Analyse: {len(to_fetch)} URLs laden, {len(immediate)} sofort erledigt")
+
+        for record in immediate:
+            counts[record['status']] += 1
+            yield record
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(url: str, canonical: str):
+            async with semaphore:
+                try:
+                    content = await self.scraper.scrape_async(
+                        canonical, use_cache=self.http_cache is not None, http_cache=self.http_cache
+                    )
+                    return url, canonical, content
+                except Exception as e:
+                    return url, canonical, e
+
+        pending = {asyncio.create_task(fetch(url, canonical)) for url, canonical in to_fetch}
+        batch: List[Tuple[str, str, ScrapedContent]] = []
+        try:
+            while pending or batch:
+                done = set()
+                if pending:
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=self.flush_after_s if batch else None,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+
+                for task in done:
+                    url, canonical, content = task.result()
+                    record = self._check_content(url, canonical, content)
+                    if record is not None:
+                        counts[record['status']] += 1
+                        counts['cached'] += bool(record.get('cached'))
+                        yield record
+                    else:
+                        batch.append((url, canonical, content))
+
+                # Batch voll, Wartezeit abgelaufen oder nichts mehr unterwegs → analysieren
+                if batch and (len(batch) >= self.batch_size or not done or not pending):
+                    current, batch = batch[:self.batch_size], batch[self.batch_size:]
+                    for record in await self._analyze_batch(current):
+                        counts[record['status']] += 1
+                        yield record
+        finally:
+            for task in pending:
+                task.cancel()
+
+        elapsed_ms = int((time.monotonic() - start) * 1000)
+        logger.info(f"✅ Bulk-Analyse fertig in {elapsed_ms}ms: {dict(counts)}")
+        yield {
+            'type': 'summary',
+            'total': sum(counts[s] for s in (STATUS_OK, STATUS_DUPLICATE, STATUS_SKIPPED, STATUS_ERROR)),
+            'ok': counts[STATUS_OK],
+            'cached': counts['cached'],
+            'duplicates': counts[STATUS_DUPLICATE],
+            'skipped': counts[STATUS_SKIPPED],
+            'errors': counts[STATUS_ERROR],
+            'elapsed_ms': elapsed_ms,
+        }
+
+    async def analyze_contents(self, items: List[Tuple[str, str, ScrapedContent]]) -> List[Dict[str, Any]]:
+        """
+        Analysiert bereits geladene Seiten (z.B. vom JobCrawler) in Batches.
+
+        Args:
+            items: Liste von (url, canonical_url, ScrapedContent)
+        """
+        records: List[Dict[str, Any]] = []
+        batch: List[Tuple[str, str, ScrapedContent]] = []
+        for url, canonical, content in items:
+            record = self._check_content(url, canonical, content)
+            if record is not None:
+                records.append(record)
+            else:
+                batch.append((url, canonical, content))
+        for start in range(0, len(batch), self.batch_size):
+            records.extend(await self._analyze_batch(batch[start:start + self.batch_size]))
+        return records
+
+    def _check_content(self, url: str, canonical: str, content) -> Optional[Dict[str, Any]]:
+        """Fehler-Record für unbrauchbare Abrufe, sonst None"""
+        if isinstance(content, Exception):
+            return self._record(url, canonical, STATUS_ERROR, error=f"Scraping-Fehler: {content}")
+        text = content.text or ""
+        if len(text) < MIN_TEXT_CHARS:
+            reason = "; ".join(content.warnings) or f"Zu wenig Text ({len(text)} Zeichen)"
+            return self._record(url, canonical, STATUS_ERROR, error=reason,
+                                http_status=content.http_status, fetch_ms=content.latency_ms)
+        if content.unchanged and self.http_cache is not None:
+            cached = self.http_cache.get_analysis(canonical, content.content_sha256, self.variant)
+            if cached:
+                return self._record(url, canonical, STATUS_OK, result=cached, cached=True,
+                                    http_status=content.http_status, fetch_ms=content.latency_ms)
+        return None
+
+    async def _analyze_batch(self, batch: List[Tuple[str, str, ScrapedContent]]) -> List[Dict[str, Any]]:
+        """NLP für einen Batch im Thread-Pool (Event-Loop lädt währenddessen weiter)"""
+        items = []
+        for _, canonical, content in batch:
+            text = content.text[:FAST_MODE_CHARS] if self.fast else content.text
+            items.append((text.replace('\x00', ''), canonical))
+
+        started = time.monotonic()
+        results = await asyncio.to_thread(self._run_manager, items)
+        analysis_ms = int((time.monotonic() - started) * 1000)
+        logger.info(f"🧠 Batch mit {len(items)} Texten analysiert ({analysis_ms}ms)")
+
+        records = []
+        finished = []
+        for (url, canonical, content), result in zip(batch, results):
+            extra = {'http_status': content.http_status, 'fetch_ms': content.latency_ms, 'analysis_ms': analysis_ms}
+            if isinstance(result, Exception):
+                records.append(self._record(url, canonical, STATUS_ERROR, error=f"Analysefehler: {result}", **extra))
+                continue
+            result_dict = result.dict()
+            finished.append((canonical, content, result, result_dict))
+            records.append(self._record(url, canonical, STATUS_OK, result=result_dict, cached=False, **extra))
+        if finished:
+            # Cache- und Export-Schreibzugriffe blockieren sonst den Event-Loop (laufende Abrufe)
+            await asyncio.to_thread(self._store_results, finished)
+        return records
+
+    def _store_results(self, finished: List[Tuple[str, ScrapedContent, Any, Dict[str, Any]]]) -> None:
+        """HTTP-Cache und ``on_result`` für die erfolgreichen Ergebnisse eines Batches (im Thread)"""
+        for canonical, content, result, result_dict in finished:
+            if self.http_cache is not None and content.content_sha256:
+                self.http_cache.put_analysis(canonical, content.content_sha256, self.variant, result_dict)
+            if self.on_result is not None:
+                try:
+                    self.on_result(result)
+                except Exception as e:
+                    logger.warning(f"Export fehlgeschlagen für {canonical}: {e}")
+
+    def _run_manager(self, items: List[Tuple[str, str]]) -> List[Any]:
+        run_many = getattr(self.manager, 'run_analyses_from_scraped_texts', None)
+        if run_many is not None:
+            return run_many(items, batch_size=self.batch_size)
+
+        results = []
+        for text, source_name in items:
+            try:
+                results.append(self.manager.run_analysis_from_scraped_text(text, source_name))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    @staticmethod
+    def _record(url: str, canonical: str, status: str, **fields) -> Dict[str, Any]:
+        return {'type': 'url', 'url': url, 'canonical_url': canonical, 'status': status, **fields}
@@ -29,6 +29,11 @@ from typing import Dict, List, Optional, Tuple, Set
 from datetime import datetime
 from collections import defaultdict
 
+from app.infrastructure.io.write_behind import WriteBehindWriter, load_json
+
+# Ein Writer für alle Instanzen (ein Timer, ein Flush beim Shutdown über flush_all_writers)
+_writer = WriteBehindWriter()
+
 
 class DiscoveryLearningService:
     """
@@ -41,7 +46,7 @@ class DiscoveryLearningService:
     4. Bei Validierung: Level erhöhen
     """
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, writer: Optional[WriteBehindWriter] = None):
         if data_dir is None:
             data_dir = Path(__file__).resolve().parents[3] / "data" / "discovery"
 
@@ -56,6 +61,9 @@ class DiscoveryLearningService:
         # Learning Storage
         self.learning_db_file = self.data_dir / "learning_db.json"
 
+        # Write-behind: Wiederholte Sichtungen schreiben nicht jedes Mal die ganze Datei
+        self._writer = writer or _writer
+
         # Load existing discoveries
         self.discovered_roles: Dict = self._load_json(self.discovered_roles_file)
         self.discovered_skills: Dict = self._load_json(self.discovered_skills_file)
@@ -331,7 +339,7 @@ class DiscoveryLearningService:
         else:
             print(f"   ✅ Rolle validiert: '{normalized}'")
 
-        self._save_json(self.discovered_roles_file, self.discovered_roles)
+        self._save_json(self.discovered_roles_file, self.discovered_roles, immediate=True)
 
     def validate_skill(self, skill_name: str, target_level: Optional[int] = None):
         """Validiert eine Fähigkeit."""
@@ -351,7 +359,7 @@ class DiscoveryLearningService:
         else:
             print(f"   ✅ Fähigkeit validiert: '{normalized}'")
 
-        self._save_json(self.discovered_skills_file, self.discovered_skills)
+        self._save_json(self.discovered_skills_file, self.discovered_skills, immediate=True)
 
     def validate_industry(self, industry_name: str, target_level: Optional[int] = None):
         """Validiert eine Industrie."""
@@ -371,7 +379,7 @@ class DiscoveryLearningService:
         else:
             print(f"   ✅ Industrie validiert: '{normalized}'")
 
-        self._save_json(self.discovered_industries_file, self.discovered_industries)
+        self._save_json(self.discovered_industries_file, self.discovered_industries, immediate=True)
 
     # ═══════════════════════════════════════════════════════════════════
     # EXPORT: Discoveries → ESCO-Format
@@ -538,16 +546,16 @@ class DiscoveryLearningService:
         return dict(by_level)
 
     def _load_json(self, file_path: Path) -> Dict:
-        """Lädt JSON-Datei."""
-        if file_path.exists():
-            with file_path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
-
-    def _save_json(self, file_path: Path, data: Dict):
-        """Speichert JSON-Datei."""
-        with file_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """Lädt JSON-Datei (offene Write-behind-Änderungen werden vorher geschrieben)."""
+        return load_json(file_path)
+
+    def _save_json(self, file_path: Path, data: Dict, immediate: bool = False):
+        """Merkt die Datei zum Schreiben vor (Write-behind); ``immediate`` für manuelle Aktionen."""
+        self._writer.mark_dirty(file_path, data, immediate=immediate)
+
+    def flush(self) -> int:
+        """Schreibt alle offenen Änderungen (z.B. am Ende eines Batch-Laufs)."""
+        return self._writer.flush()
 
 
 # ============================================================================
@@ -19,10 +19,11 @@ Basis:
 """
 
 import json
-import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from app.core.keyword_classifier import KeywordClassifier
+
 
 class IndustryService:
     """
@@ -332,6 +333,9 @@ class IndustryService:
             ],
         }
 
+        # Einmalig kompilieren (statt re.search pro Pattern und Aufruf)
+        self._industry_classifier = KeywordClassifier(self.INDUSTRY_PATTERNS)
+
     def _classify_with_patterns(self, text: str) -> str:
         """
         Klassifiziert mit Industrie-Patterns
@@ -339,12 +343,7 @@ class IndustryService:
         Returns:
             Spezifische Industrie oder "Sonstige Branche"
         """
-        for industry, patterns in self.INDUSTRY_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return industry
-
-        return "Sonstige Branche"
+        return self._industry_classifier.first_match(text) or "Sonstige Branche"
 
     # ═══════════════════════════════════════════════════════════════════
     # DATA LOADING (7-Ebenen-Struktur)
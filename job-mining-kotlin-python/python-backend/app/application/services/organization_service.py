@@ -1,9 +1,9 @@
 # domain/services/organization_service.py (NEU DOMAIN SERVICE)
 
 import json
-import re
 from pathlib import Path
 from typing import Dict
+from app.core.keyword_classifier import KeywordClassifier, get_keyword_classifier
 from app.infrastructure.clients.kotlin_rule_client import KotlinRuleClient
 
 class OrganizationService:
@@ -30,6 +30,7 @@ class OrganizationService:
             ("Telekommunikation", r"telekom|telco|5g|netz|carrier|broadband|dsl|mobilfunk"),
             ("Öffentlicher Sektor", r"behörde|verwaltung|amt|stadt|kommune|ministerium|oeffentlich|öffentlich"),
         ]
+        self._keyword_classifier = KeywordClassifier(dict(self.keyword_industries))
 
         # Primäre Regeln aus Kotlin, Fallback aus lokaler JSON, dann heuristik
         try:
@@ -75,39 +76,15 @@ class OrganizationService:
         """
         Klassifiziert die Branche anhand des gesamten Stellentextes mithilfe des Regelwerks.
         """
-        text_lower = job_text.lower()
-        scores = {}
-
-        for industry, pattern in self.industry_mappings.items():
-            try:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    return industry
-            except re.error:
-                print(f"⚠️ Warnung: Ungültiges Regex-Muster für Branche '{industry}': {pattern}")
-                continue
-
-        return default_industry
+        # Kompilierte Regeln werden gecached und nur bei geänderten Mappings neu gebaut
+        industry = get_keyword_classifier(self.industry_mappings).first_match(job_text)
+        return industry or default_industry
 
     def classify_industry_neu(self, text: str) -> str:
         """Prüft den Text gegen die geladenen Keywords."""
-        text_lower = text.lower()
-        scores = {}
-
-        for industry, pattern in self.industry_keywords.items():
-            # Pattern ist z.B. "Bank|Versicherung"
-            # Wir machen daraus eine RegEx-Suche
-            try:
-                hits = len(re.findall(f"({pattern})", text_lower, re.IGNORECASE))
-                if hits > 0:
-                    scores[industry] = hits
-            except:
-                continue
-
-        if not scores:
-            return "Unbekannt"
-
-        # Gewinner ist die Branche mit den meisten Treffern
-        return max(scores, key=scores.get)
+        # Pattern ist z.B. "Bank|Versicherung" - Gewinner ist die Branche mit den meisten Treffern
+        best = get_keyword_classifier(self.industry_keywords).best_match(text)
+        return best or "Unbekannt"
 
     def _load_mappings(self) -> Dict[str, str]:
         """Holt Mappings von Kotlin (via Client)."""
@@ -146,20 +123,6 @@ class OrganizationService:
 
     def _heuristic_industry(self, text: str) -> str:
         """Einfache Schlüsselwort-basierte Zuordnung als Fallback-Layer."""
-        text_lower = text.lower()
-        scores = {}
-
-        for industry, pattern in self.keyword_industries:
-            try:
-                hits = len(re.findall(pattern, text_lower, re.IGNORECASE))
-                if hits:
-                    scores[industry] = hits
-            except re.error:
-                continue
-
-        if not scores:
-            return ""
-
-        return max(scores, key=scores.get)
+        return self._keyword_classifier.best_match(text) or ""
 
 
@@ -4,8 +4,11 @@ import json
 import re
 from pathlib import Path
 from typing import Dict
+from app.core.keyword_classifier import KeywordClassifier, get_keyword_classifier
 from app.infrastructure.clients.kotlin_rule_client import KotlinRuleClient
 
+GENERIC_ENGINEER_PATTERN = re.compile(r"\bsoftware|developer|engineer|entwickler\b", re.IGNORECASE)
+
 class RoleService:
     """
     Domain Service für die Klassifizierung der Berufsrolle.
@@ -80,15 +83,17 @@ class RoleService:
     def classify_roleNEU(self, job_text: str, job_title: str) -> str:
         """Klassifiziert basierend auf Titel (hoch gewichtet) und Text."""
         full_text = (job_title + " " + job_text).lower()
+        classifier = get_keyword_classifier(self.role_mappings)
+
+        hits = classifier.count_hits(full_text)
+        title_hits = classifier.count_hits(job_title)
 
         best_role = "Unbekannt"
         max_score = 0
 
-        for role, pattern in self.role_mappings.items():
-            score = len(re.findall(f"({pattern})", full_text, re.IGNORECASE))
-
+        for role, score in hits.items():
             # Bonus, wenn das Keyword im Titel steht
-            if re.search(f"({pattern})", job_title.lower(), re.IGNORECASE):
+            if role in title_hits:
                 score *= 2
 
             if score > max_score:
@@ -98,14 +103,8 @@ class RoleService:
         return best_role
 
     def _match_role_patterns(self, patterns: Dict[str, str], search_target: str) -> str:
-        for role, pattern in patterns.items():
-            try:
-                if re.search(pattern, search_target, re.IGNORECASE):
-                    return role
-            except re.error:
-                print(f"⚠️ Warnung: Ungültiges Regex-Muster für Rolle '{role}': {pattern}")
-                continue
-        return ""
+        # Kompilierte Regeln werden gecached und nur bei geänderten Mappings neu gebaut
+        return get_keyword_classifier(patterns).first_match(search_target) or ""
 
     def _load_fallback_mappings(self) -> Dict[str, str]:
         """Lädt lokale Fallback-Regeln aus data/fallback_rules/role_mappings_fallback.json."""
@@ -351,6 +350,9 @@ class RoleService:
             ],
         }
 
+        # Einmalig kompilieren (statt re.search pro Pattern und Aufruf)
+        self._best_practice_classifier = KeywordClassifier(self.IT_ROLE_PATTERNS)
+
     def _classify_with_best_practice(self, text: str) -> str:
         """
         Klassifiziert mit spezifischen IT-Rollen Patterns
@@ -358,13 +360,12 @@ class RoleService:
         Returns:
             Spezifische Rolle oder "Sonstige Rolle"
         """
-        for role, patterns in self.IT_ROLE_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return role
+        role = self._best_practice_classifier.first_match(text)
+        if role:
+            return role
 
         # Fallback: Generic Software Engineer
-        if re.search(r"\bsoftware|developer|engineer|entwickler\b", text, re.IGNORECASE):
+        if GENERIC_ENGINEER_PATTERN.search(text):
             return "Software Engineer"
 
         return "Sonstige Rolle"
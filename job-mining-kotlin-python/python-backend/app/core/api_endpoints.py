@@ -1,12 +1,24 @@
-from fastapi import UploadFile, File, HTTPException, Depends
+import asyncio
+import json
+import re
+from fastapi import UploadFile, File, HTTPException, Depends, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
-import requests
 from bs4 import BeautifulSoup
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
 
 from app.interfaces.interfaces import IJobMiningWorkflowManager
 from app.infrastructure.io.job_directory_processor import JobDirectoryProcessor
 from app.infrastructure.io.js_scraper import scrape_with_rendering
+from app.infrastructure.crawling.async_http_client import get_async_http_client
+from app.infrastructure.crawling.web_scraper import WebScraper
+from app.infrastructure.cache.http_cache import get_http_cache
+from app.infrastructure.cache.response_cache import get_response_cache, http_date, is_not_modified, make_etag
+from app.infrastructure.reporting import results_version
+from app.domain.models import AnalysisResultDTO
+from app.application.services.bulk_url_analysis_service import BulkUrlAnalysisService, MAX_BULK_URLS, STATUS_OK
+from app.infrastructure.crawling.crawl_frontier import CrawlFrontier
+from app.infrastructure.crawling.job_crawler import CrawlRules, DEFAULT_DETAIL_PATTERN, JobCrawler
 
 # Input-Modell für den Scraper-Endpunkt
 class URLInput(BaseModel):
@@ -14,6 +26,20 @@ class URLInput(BaseModel):
     render_js: Optional[bool] = False
     fast: Optional[bool] = True  # Begrenze Analyse auf kompakte Größe für Geschwindigkeit
 
+# Input-Modell für den Bulk-Scraper-Endpunkt
+class BulkURLInput(BaseModel):
+    urls: List[str]
+    fast: Optional[bool] = True
+    batch_size: Optional[int] = 8  # Texte pro NLP-Batch
+
+# Input-Modell für den Crawler (Listing-Seiten als Seeds)
+class CrawlInput(BaseModel):
+    seeds: List[str]
+    max_fetches: Optional[int] = 1000  # Budget pro Lauf (Listing + Detail)
+    detail_pattern: Optional[str] = None  # Regex auf den Pfad der Detailseiten
+    listing_pattern: Optional[str] = None  # Regex für weitere Listing-Seiten (Paginierung)
+    fast: Optional[bool] = True
+
 # Helper: Extrahiert Text aus dem HTML
 def _extract_job_content(soup: BeautifulSoup) -> str:
     # ... (Implementierung wie zuvor)
@@ -28,6 +54,17 @@ def _extract_job_content(soup: BeautifulSoup) -> str:
     return soup.body.get_text(separator=' ', strip=True) if soup.body else soup.get_text(separator=' ', strip=True)
 
 
+_scraper: Optional[WebScraper] = None
+
+
+def _get_scraper() -> WebScraper:
+    """Ein WebScraper pro Prozess statt einer neuen Instanz pro Request"""
+    global _scraper
+    if _scraper is None:
+        _scraper = WebScraper(use_playwright=False)  # sync-WebScraper nur für statische Seiten verwenden
+    return _scraper
+
+
 # --- API ENDPUNKTE (JETZT MODULAR) ---
 
 # Endpoint 1: Datei-Upload
@@ -40,14 +77,20 @@ def analyse_job_ad(file: UploadFile = File(...), manager: IJobMiningWorkflowMana
         raise HTTPException(status_code=500, detail=f"Analysefehler: {str(e)}")
 
 # Endpoint 2: Web-Scraping
-async def scrape_and_analyze_url(url_input: URLInput, manager: IJobMiningWorkflowManager = Depends(lambda: None)):
+async def scrape_and_analyze_url(url_input: URLInput, manager: IJobMiningWorkflowManager = Depends(lambda: None),
+                                 on_new_result: Optional[Callable] = None):
+    """
+    on_new_result wird nur für frisch berechnete Ergebnisse aufgerufen (z.B. Export);
+    bei unverändertem Inhalt kommt das Ergebnis aus dem HTTP-Cache.
+    """
     url = url_input.url
     raw_text = ""
+    content = None
 
-    # Nutze den zentralen WebScraper mit Limits (requests) und Async-Playwright für JS
+    # Geteilter WebScraper + gepoolter Async-HTTP-Client (Keep-Alive, robots.txt, Limits);
+    # Async-Playwright für JS
     try:
-        from app.infrastructure.crawling.web_scraper import WebScraper
-        scraper = WebScraper(use_playwright=False)  # sync-WebScraper nur für statische Seiten verwenden
+        scraper = _get_scraper()
 
         if url_input.render_js:
             # Async Playwright für JS-lastige Seiten
@@ -56,21 +99,20 @@ async def scrape_and_analyze_url(url_input: URLInput, manager: IJobMiningWorkflo
             except Exception as pe:
                 # Wenn Playwright fehlschlägt, versuche statisches Fallback
                 print(f"⚠️ Playwright fehlgeschlagen, Fallback static: {pe}")
-                headers = {'User-Agent': 'Mozilla/5.0'}
-                response = requests.get(url, headers=headers, timeout=8)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content[:1024*512], 'html.parser')
+                fetched = await get_async_http_client().fetch(url)
+                if not fetched.ok:
+                    status = fetched.status if fetched.status >= 400 else 502
+                    raise HTTPException(status_code=status, detail=f"HTTP-Fehler beim Scraping: {fetched.error or fetched.status}")
+                soup = BeautifulSoup(fetched.body[:1024*512], 'html.parser')
                 raw_text = _extract_job_content(soup)
         else:
             # Frühzeitiger Abbruch bei JS-heavy Domains ohne Rendering
             if scraper.requires_js_rendering(url):
                 raise HTTPException(status_code=400, detail="Diese Domain erfordert JavaScript-Rendering. Bitte 'render_js' aktivieren.")
-            content = scraper.scrape(url, force_playwright=False)
+            content = await scraper.scrape_async(url)
             raw_text = content.text or ""
     except HTTPException as he:
         raise he
-    except requests.HTTPError as e2:
-        raise HTTPException(status_code=e2.response.status_code, detail=f"HTTP-Fehler beim Scraping: {e2}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Scraping-Fehler: {str(e)}")
 
@@ -87,13 +129,160 @@ async def scrape_and_analyze_url(url_input: URLInput, manager: IJobMiningWorkflo
 
     cleaned_raw_text = raw_text.replace('\x00', '')
 
+    # Inhalt unverändert (304 / gleicher Hash) → gespeichertes Ergebnis, Pipeline überspringen
+    http_cache = get_http_cache()
+    variant = 'fast' if url_input.fast else 'full'
+    if content is not None and content.unchanged and http_cache is not None:
+        cached_result = http_cache.get_analysis(content.canonical_url, content.content_sha256, variant)
+        if cached_result:
+            print(f"♻️ Inhalt unverändert, Analyse aus Cache: {content.canonical_url}")
+            return AnalysisResultDTO(**cached_result)
+
     # Aufruf der Analyse-Logik
     try:
         analysis_result = manager.run_analysis_from_scraped_text(cleaned_raw_text, url)
-        return analysis_result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysefehler im Workflow Manager: {str(e)}")
 
+    if content is not None and content.content_sha256 and http_cache is not None:
+        http_cache.put_analysis(content.canonical_url, content.content_sha256, variant, analysis_result.dict())
+    if on_new_result is not None:
+        on_new_result(analysis_result)
+    return analysis_result
+
+# Endpoint 2b: Bulk-Web-Scraping (NDJSON-Stream)
+def validate_bulk_input(bulk_input: BulkURLInput) -> None:
+    urls = [u for u in bulk_input.urls if u and u.strip()]
+    if not urls:
+        raise HTTPException(status_code=400, detail="Keine URLs übergeben")
+    if len(urls) > MAX_BULK_URLS:
+        raise HTTPException(status_code=413, detail=f"Zu viele URLs: {len(urls)} (max. {MAX_BULK_URLS})")
+
+
+async def stream_bulk_url_analysis(bulk_input: BulkURLInput, manager: IJobMiningWorkflowManager,
+                                   on_result: Optional[Callable] = None) -> AsyncIterator[str]:
+    """Eine JSON-Zeile pro URL, sobald ihr Batch analysiert ist; zuletzt eine Summary-Zeile."""
+    service = BulkUrlAnalysisService(
+        manager,
+        scraper=_get_scraper(),
+        batch_size=bulk_input.batch_size or 8,
+        fast=bool(bulk_input.fast),
+        on_result=on_result,
+    )
+    async for record in service.analyze(bulk_input.urls):
+        yield json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+# Endpoint 2c: Crawler (läuft im Hintergrund, Stand in der SQLite-Frontier)
+_frontier: Optional[CrawlFrontier] = None
+_crawl_task: Optional[asyncio.Task] = None
+_last_crawl: Dict = {}
+
+
+def _get_frontier() -> CrawlFrontier:
+    global _frontier
+    if _frontier is None:
+        _frontier = CrawlFrontier()
+    return _frontier
+
+
+def start_crawl(crawl_input: CrawlInput, manager: IJobMiningWorkflowManager,
+                on_result: Optional[Callable] = None) -> Dict:
+    """Startet einen Crawl-Lauf als Hintergrund-Task (409, falls bereits einer läuft)."""
+    global _crawl_task
+    if _crawl_task is not None and not _crawl_task.done():
+        raise HTTPException(status_code=409, detail="Es läuft bereits ein Crawl")
+    seeds = [s.strip() for s in crawl_input.seeds if s and s.strip()]
+    if not seeds:
+        raise HTTPException(status_code=400, detail="Keine Seed-URLs übergeben")
+    try:
+        rules = CrawlRules(detail_pattern=crawl_input.detail_pattern or DEFAULT_DETAIL_PATTERN,
+                           listing_pattern=crawl_input.listing_pattern)
+    except re.error as e:
+        raise HTTPException(status_code=400, detail=f"Ungültiges Pattern: {e}")
+
+    service = BulkUrlAnalysisService(manager, scraper=_get_scraper(), fast=bool(crawl_input.fast), on_result=on_result)
+
+    async def analyse_details(items) -> int:
+        records = await service.analyze_contents(items)
+        return sum(1 for r in records if r['status'] == STATUS_OK)
+
+    crawler = JobCrawler(_get_frontier(), rules=rules, scraper=_get_scraper(), on_details=analyse_details)
+
+    async def run():
+        _last_crawl.clear()
+        _last_crawl.update({'seeds': seeds, 'status': 'running'})
+        try:
+            stats = await crawler.run(seeds, max_fetches=crawl_input.max_fetches)
+            _last_crawl.update({'status': 'completed', **stats.to_dict()})
+        except asyncio.CancelledError:
+            _last_crawl['status'] = 'cancelled'
+            raise
+        except Exception as e:
+            _last_crawl.update({'status': 'failed', 'error': str(e)})
+
+    _crawl_task = asyncio.create_task(run())
+    return {"status": "started", "seeds": len(seeds), "max_fetches": crawl_input.max_fetches}
+
+
+def crawl_status() -> Dict:
+    return {
+        "running": _crawl_task is not None and not _crawl_task.done(),
+        "frontier": _get_frontier().stats(),
+        "last_run": dict(_last_crawl),
+    }
+
+
+async def stop_crawl() -> None:
+    """Bricht einen laufenden Crawl ab; offene Claims werden beim nächsten Start fortgesetzt."""
+    if _crawl_task is not None and not _crawl_task.done():
+        _crawl_task.cancel()
+        try:
+            await _crawl_task
+        except asyncio.CancelledError:
+            pass
+
+# --- REPORTS: Response-Cache + Conditional GET (ETag / Last-Modified) ---
+
+def _report_validators(request: Request, params: Dict[str, Any]):
+    cache = get_response_cache()
+    data_version, modified = results_version()
+    key = cache.key(request.url.path, params)
+    etag = make_etag(data_version, key)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if modified:
+        headers["Last-Modified"] = http_date(modified)
+    not_modified = is_not_modified(etag, modified, request.headers.get("if-none-match"),
+                                   request.headers.get("if-modified-since"))
+    if not_modified:
+        cache.not_modified += 1
+    return cache, key, data_version, modified, headers, not_modified
+
+
+def cached_report_response(request: Request, params: Dict[str, Any], compute: Callable[[], bytes],
+                           media_type: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Report-Antwort aus dem Response-Cache (Schlüssel: Pfad + Parameter, gültig je Datenstand).
+    Passendes If-None-Match / If-Modified-Since → 304 ohne Berechnung; neue Ergebnisse
+    ändern den Datenstand und damit ETag und Cache-Eintrag.
+    """
+    cache, key, data_version, modified, validators, not_modified = _report_validators(request, params)
+    if not_modified:
+        return Response(status_code=304, headers=validators)
+    entry = cache.get_or_compute(key, data_version, modified, compute, media_type)
+    return Response(entry.body, media_type=entry.media_type, headers={**validators, **(headers or {})})
+
+
+def conditional_stream_response(request: Request, params: Dict[str, Any], body: Iterator[bytes],
+                                media_type: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Wie cached_report_response, aber ohne Body-Cache: große Exporte bleiben gestreamt,
+    unveränderte Downloads werden per 304 eingespart.
+    """
+    _, _, _, _, validators, not_modified = _report_validators(request, params)
+    if not_modified:
+        return Response(status_code=304, headers=validators)
+    return StreamingResponse(body, media_type=media_type, headers={**validators, **(headers or {})})
+
 # Endpoint 3: Batch-Verarbeitung mit Statistiken
 def batch_process_local_jobs(manager: IJobMiningWorkflowManager = Depends(lambda: None)):
     """
@@ -90,6 +90,10 @@ class AnalysisResultDTO(BaseModel):
     # Status
     is_segmented: bool = False  # True wenn Aufgaben/Anforderungen getrennt
     source_url: Optional[str] = None  # Quelle für Web-Scraping (URLs)
+
+    # Near-Duplicate: raw_text_hash der kanonischen Anzeige (Kompetenzen übernommen, keine NLP-Analyse)
+    duplicate_of: Optional[str] = None
+    duplicate_similarity: Optional[float] = None
     
     # Erkannte Kompetenzen
     competences: List[CompetenceDTO] = Field(default_factory=list)
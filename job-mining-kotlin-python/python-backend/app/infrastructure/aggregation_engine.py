@@ -0,0 +1,121 @@
+"""
+Aggregation-Engine für Reporting/Dashboard
+Liest den Ergebnis-Korpus (batch_results/*.json) genau einmal und reicht jeden
+Job an beliebig viele Akkumulatoren weiter.
+
+- Jede Datei wird einmal geparst (Dateihandles werden geschlossen)
+- Teure Klassifizierungen (Rolle, Kompetenz-Kategorie) werden pro Lauf gecacht
+- Fehler in einem Akkumulator betreffen nur diesen Akkumulator für diesen Job (Warnung im Log)
+"""
+
+import json
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.infrastructure.job_classifier import categorize_competence, classify_job_role
+
+logger = logging.getLogger(__name__)
+
+
+class JobRecord:
+    """Ein geparster Job mit lazy berechneter Klassifizierung"""
+
+    __slots__ = ('data', 'path', '_classification', '_category_cache')
+
+    def __init__(self, data: Dict[str, Any], path: Optional[Path] = None,
+                 category_cache: Optional[Dict[Tuple[str, Tuple[str, ...]], str]] = None):
+        self.data = data
+        self.path = path
+        self._classification: Optional[Dict[str, str]] = None
+        self._category_cache = category_cache if category_cache is not None else {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    @property
+    def competences(self) -> List[Dict[str, Any]]:
+        return self.data.get('competences', [])
+
+    @property
+    def classification(self) -> Dict[str, str]:
+        """classify_job_role(title, job_role, industry) - einmal pro Job"""
+        if self._classification is None:
+            self._classification = classify_job_role(
+                self.data.get('title', ''), self.data.get('job_role', ''), self.data.get('industry', '')
+            )
+        return self._classification
+
+    def competence_category(self, label: str, collections: List[str]) -> str:
+        """categorize_competence(label, collections)['category'] - einmal pro Lauf und Label"""
+        key = (label, tuple(collections or ()))
+        category = self._category_cache.get(key)
+        if category is None:
+            category = categorize_competence(label, collections)['category']
+            self._category_cache[key] = category
+        return category
+
+
+class Accumulator(ABC):
+    """
+    Basisklasse für Akkumulatoren.
+
+    ``add`` wird pro Job aufgerufen, ``result`` einmal am Ende.
+    """
+
+    name: str = 'accumulator'
+
+    @abstractmethod
+    def add(self, record: JobRecord) -> None:
+        ...
+
+    @abstractmethod
+    def result(self) -> Any:
+        ...
+
+
+def load_job_file(path: Path) -> Optional[Dict[str, Any]]:
+    """Liest eine Ergebnis-Datei; None bei kaputtem JSON"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def iter_job_records(paths: Iterable[Path]) -> Iterator[JobRecord]:
+    """Parst die Dateien der Reihe nach (eine Datei gleichzeitig im Speicher); Near-Duplicates zählen nicht"""
+    category_cache: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+    for path in paths:
+        data = load_job_file(path)
+        if isinstance(data, dict) and not data.get('duplicate_of'):
+            yield JobRecord(data, path, category_cache)
+
+
+class AggregationEngine:
+    """
+    Ein Durchlauf über den Korpus, alle Akkumulatoren gleichzeitig.
+
+    Beispiel:
+        engine = AggregationEngine([TopSkillsAccumulator(), RegionAccumulator()])
+        results = engine.run(_iter_job_files())   # {name: result}
+    """
+
+    def __init__(self, accumulators: Iterable[Accumulator]):
+        self.accumulators = list(accumulators)
+        self.jobs_seen = 0
+
+    def run(self, paths: Iterable[Path]) -> Dict[str, Any]:
+        return self.run_records(iter_job_records(paths))
+
+    def run_records(self, records: Iterable[JobRecord]) -> Dict[str, Any]:
+        for record in records:
+            self.jobs_seen += 1
+            for acc in self.accumulators:
+                try:
+                    acc.add(record)
+                except Exception as e:
+                    logger.warning(f"⚠️ Akkumulator '{acc.name}' fehlgeschlagen für {record.path or 'Job'}: {e}")
+        logger.debug(f"📊 Aggregation: {self.jobs_seen} Jobs, {len(self.accumulators)} Akkumulatoren")
+        return {acc.name: acc.result() for acc in self.accumulators}
@@ -1,5 +1,13 @@
 """Cache Infrastructure"""
 
 from .cache_manager import CacheManager, get_cache_manager
+from .text_cache import ExtractedTextCache, get_text_cache, sha256_file, sha256_stream
+from .http_cache import HttpCacheEntry, HttpResponseCache, get_http_cache
+from .response_cache import CachedResponse, ResponseCache, get_response_cache, is_not_modified, make_etag
 
-__all__ = ['CacheManager', 'get_cache_manager']
+__all__ = [
+    'CacheManager', 'get_cache_manager',
+    'ExtractedTextCache', 'get_text_cache', 'sha256_file', 'sha256_stream',
+    'HttpCacheEntry', 'HttpResponseCache', 'get_http_cache',
+    'CachedResponse', 'ResponseCache', 'get_response_cache', 'is_not_modified', 'make_etag',
+]
@@ -0,0 +1,206 @@
+"""
+HTTP-Response-Cache für wiederholt gescrapte Stellen-URLs (Conditional GET)
+Schlüssel ist die kanonische URL (WebScraper.normalize_url)
+
+Pro URL wird gespeichert:
+- Validatoren: ETag / Last-Modified → Revalidierung per If-None-Match / If-Modified-Since
+- SHA-256 von Body und extrahiertem Text → "unverändert" auch ohne 304
+- Extrahierter Text + Titel/Firma → kein erneutes HTML-Parsing
+- Analyse-Ergebnisse (separate Dateien) → Pipeline wird bei unverändertem Inhalt übersprungen
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.infrastructure.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# Bei Änderungen an Format oder Text-Extraktion erhöhen → alte Einträge werden ignoriert
+HTTP_CACHE_VERSION = 1
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class HttpCacheEntry:
+    """Gecachter Stand einer URL"""
+    canonical_url: str
+    body_sha256: str
+    text_sha256: str
+    text: str
+    title: Optional[str] = None
+    company: Optional[str] = None
+    http_status: int = 200
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = field(default_factory=time.time)
+    validated_at: float = field(default_factory=time.time)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Header für den Revalidierungs-Request"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HttpResponseCache:
+    """
+    Dateibasierter Cache: ``<cache_dir>/<ab>/<sha256(url)>.json.gz`` für den
+    Seiteninhalt, ``<...>.<variant>.analysis.json.gz`` für Analyse-Ergebnisse.
+
+    Analyse-Ergebnisse hängen am Text-Hash: ändert sich der Text, passen sie
+    nicht mehr und werden ignoriert.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, version: int = HTTP_CACHE_VERSION):
+        base = os.getenv("BASE_DATA_DIR", "data")
+        self.cache_dir = Path(cache_dir or os.path.join(base, "cache", "http"))
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        get_metrics().register_cache("http", self)
+
+    @staticmethod
+    def _key(canonical_url: str) -> str:
+        return sha256_text(canonical_url)
+
+    def _path(self, canonical_url: str, suffix: str = "json.gz") -> Path:
+        key = self._key(canonical_url)
+        return self.cache_dir / key[:2] / f"{key}.{suffix}"
+
+    # ------------------------------------------------------------------
+    # Seiteninhalt
+    # ------------------------------------------------------------------
+
+    def get(self, canonical_url: str) -> Optional[HttpCacheEntry]:
+        data = self._read(self._path(canonical_url))
+        if data is None or data.get('version') != self.version or data.get('canonical_url') != canonical_url:
+            self.misses += 1
+            return None
+        data.pop('version', None)
+        self.hits += 1
+        try:
+            return HttpCacheEntry(**data)
+        except TypeError as e:
+            logger.warning(f"⚠️ HTTP-Cache-Eintrag ungültig ({canonical_url}): {e}")
+            return None
+
+    def put(self, entry: HttpCacheEntry) -> bool:
+        return self._write(self._path(entry.canonical_url), {'version': self.version, **asdict(entry)})
+
+    def mark_validated(self, entry: HttpCacheEntry, etag: Optional[str] = None,
+                       last_modified: Optional[str] = None) -> HttpCacheEntry:
+        """Aktualisiert Validatoren/Zeitstempel nach erfolgreicher Revalidierung"""
+        self.not_modified += 1
+        entry.validated_at = time.time()
+        entry.etag = etag or entry.etag
+        entry.last_modified = last_modified or entry.last_modified
+        self.put(entry)
+        return entry
+
+    # ------------------------------------------------------------------
+    # Analyse-Ergebnisse
+    # ------------------------------------------------------------------
+
+    def get_analysis(self, canonical_url: str, text_sha256: str, variant: str) -> Optional[Dict[str, Any]]:
+        """Gespeichertes Analyse-Ergebnis, wenn es zum aktuellen Text passt"""
+        data = self._read(self._path(canonical_url, f"{variant}.analysis.json.gz"))
+        if not data or data.get('version') != self.version or data.get('text_sha256') != text_sha256:
+            return None
+        return data.get('result')
+
+    def put_analysis(self, canonical_url: str, text_sha256: str, variant: str, result: Dict[str, Any]) -> bool:
+        payload = {'version': self.version, 'text_sha256': text_sha256, 'result': result}
+        return self._write(self._path(canonical_url, f"{variant}.analysis.json.gz"), payload)
+
+    def clear_analyses(self) -> int:
+        """Löscht nur Analyse-Ergebnisse (z.B. nach Knowledge-Refresh); Seiteninhalte bleiben"""
+        return self._unlink_all("*/*.analysis.json.gz")
+
+    # ------------------------------------------------------------------
+    # Verwaltung
+    # ------------------------------------------------------------------
+
+    def clear(self) -> int:
+        """Löscht alle Einträge. Returns: Anzahl gelöschter Dateien"""
+        count = self._unlink_all("*/*.json.gz")
+        logger.info(f"🗑️ {count} HTTP-Cache-Einträge gelöscht")
+        return count
+
+    def get_cache_info(self) -> dict:
+        """Statistik für Admin-/Debug-Zwecke"""
+        files = list(self.cache_dir.glob("*/*.json.gz"))
+        analyses = [f for f in files if f.name.endswith(".analysis.json.gz")]
+        return {
+            'cache_dir': str(self.cache_dir),
+            'pages': len(files) - len(analyses),
+            'analyses': len(analyses),
+            'total_size_kb': sum(f.stat().st_size for f in files) // 1024,
+            'hits': self.hits,
+            'misses': self.misses,
+            'not_modified': self.not_modified,
+        }
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️ HTTP-Cache beschädigt ({path.name}): {e}")
+            return None
+
+    def _write(self, path: Path, payload: Dict[str, Any]) -> bool:
+        """Schreibt atomar (Temp-Datei + os.replace)."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+                json.dump(payload, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            logger.error(f"❌ HTTP-Cache Schreiben fehlgeschlagen: {e}")
+            return False
+
+    def _unlink_all(self, pattern: str) -> int:
+        count = 0
+        for entry in self.cache_dir.glob(pattern):
+            try:
+                entry.unlink()
+                count += 1
+            except OSError as e:
+                logger.error(f"❌ Fehler beim Löschen von {entry}: {e}")
+        return count
+
+
+# Globale Instanz für einfachen Zugriff
+_http_cache = None
+
+def get_http_cache() -> Optional[HttpResponseCache]:
+    """Globale Instanz; None wenn per HTTP_CACHE_ENABLED=false deaktiviert"""
+    global _http_cache
+    if os.getenv("HTTP_CACHE_ENABLED", "true").lower() not in {"1", "true", "yes"}:
+        return None
+    if _http_cache is None:
+        _http_cache = HttpResponseCache()
+    return _http_cache
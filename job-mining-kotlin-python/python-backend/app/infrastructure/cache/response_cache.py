@@ -0,0 +1,158 @@
+"""
+Server-seitiger Response-Cache für die Report-Endpunkte (/reports/*)
+Schlüssel: Pfad + Query-Parameter, gültig für genau einen Datenstand (reporting.results_version)
+
+- Validatoren: ETag (Datenstand + Schlüssel) / Last-Modified (letzter Schreibzugriff)
+- Conditional Requests: If-None-Match / If-Modified-Since → 304 ohne Neuberechnung
+- Neuer Datenstand (gespeichertes Ergebnis) → alle Einträge werden verworfen
+- Gleichzeitige Anfragen für denselben Schlüssel berechnen nur einmal
+- LRU-begrenzt (RESPONSE_CACHE_MAX_ENTRIES)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlencode
+
+from app.infrastructure.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '128'))
+_LOCK_STRIPES = 32
+
+
+@dataclass
+class CachedResponse:
+    """Fertig berechneter Response-Body samt Validatoren"""
+    body: bytes
+    media_type: str
+    data_version: str
+    etag: str
+    last_modified: Optional[str]
+
+
+def make_etag(data_version: str, key: str) -> str:
+    """Schwaches ETag: gleicher Datenstand + gleiche Parameter → inhaltlich gleiche Antwort"""
+    digest = hashlib.sha256(f"{data_version}|{key}".encode('utf-8')).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def http_date(timestamp: float) -> Optional[str]:
+    return formatdate(timestamp, usegmt=True) if timestamp else None
+
+
+def is_not_modified(etag: str, modified: float, if_none_match: Optional[str],
+                    if_modified_since: Optional[str]) -> bool:
+    """
+    Auswertung der Conditional-Header (RFC 9110): If-None-Match hat Vorrang,
+    If-Modified-Since wird nur ohne If-None-Match berücksichtigt.
+    """
+    if if_none_match:
+        tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+        return '*' in tags or etag.removeprefix('W/') in tags
+    if if_modified_since and modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        # HTTP-Datum hat Sekundenauflösung
+        return int(modified) <= since
+    return False
+
+
+class ResponseCache:
+    """
+    In-Memory-Cache pro Prozess. Ungültig wird ein Eintrag nur über den Datenstand:
+    jede Anfrage liest die aktuelle Version (eine Punktabfrage), Einträge eines
+    älteren Stands werden beim ersten Zugriff mit neuer Version komplett verworfen.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._data_version: Optional[str] = None
+        self._lock = threading.Lock()
+        self._compute_locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        get_metrics().register_cache("response", self)
+
+    @staticmethod
+    def key(path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Kanonischer Schlüssel: Pfad + sortierte, gesetzte Parameter"""
+        items = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+        return f"{path}?{urlencode(items)}" if items else path
+
+    def _lookup(self, key: str, data_version: str) -> Optional[CachedResponse]:
+        with self._lock:
+            if data_version != self._data_version:
+                if self._entries:
+                    logger.info(f"🧹 Response-Cache verworfen ({len(self._entries)} Einträge, neuer Datenstand)")
+                self._entries.clear()
+                self._data_version = data_version
+                return None
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def get_or_compute(self, key: str, data_version: str, modified: float,
+                       compute: Callable[[], bytes], media_type: str) -> CachedResponse:
+        """
+        Gecachte Antwort für (Schlüssel, Datenstand) oder einmalige Berechnung.
+
+        Args:
+            compute: liefert den Body; läuft pro Schlüssel höchstens einmal gleichzeitig
+        """
+        entry = self._lookup(key, data_version)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        with self._compute_locks[hash(key) % _LOCK_STRIPES]:
+            # Wartende Anfragen übernehmen das Ergebnis der ersten
+            entry = self._lookup(key, data_version)
+            if entry is not None:
+                self.hits += 1
+                return entry
+            self.misses += 1
+            entry = CachedResponse(
+                body=compute(), media_type=media_type, data_version=data_version,
+                etag=make_etag(data_version, key), last_modified=http_date(modified),
+            )
+            with self._lock:
+                if data_version == self._data_version:
+                    self._entries[key] = entry
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._data_version = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'not_modified': self.not_modified,
+        }
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
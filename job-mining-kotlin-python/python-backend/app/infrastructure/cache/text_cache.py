@@ -0,0 +1,140 @@
+"""
+Content-addressed Cache für extrahierte Dokument-Texte
+Re-Runs nach ESCO-/Knowledge-Updates überspringen PDF/DOCX-Parsing und OCR
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+
+from app.infrastructure.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# Bei Änderungen an der Extraktionslogik erhöhen → alte Einträge werden ignoriert
+TEXT_CACHE_VERSION = 2
+
+_HASH_CHUNK = 1024 * 1024
+
+
+def sha256_stream(stream: BinaryIO) -> str:
+    """SHA-256 eines Streams in 1-MB-Blöcken; Position steht danach wieder auf 0."""
+    stream.seek(0)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(_HASH_CHUNK), b""):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def sha256_file(path: str) -> str:
+    """SHA-256 einer Datei"""
+    with open(path, 'rb') as f:
+        return sha256_stream(f)
+
+
+class ExtractedTextCache:
+    """
+    Speichert extrahierten Text + Parser-Metadaten gzip-komprimiert unter
+    dem SHA-256 der Eingabe-Bytes: ``<cache_dir>/<ab>/<sha256>.<namespace>.json.gz``
+
+    Der Namespace trennt Ergebnisse verschiedener Extraktoren (z.B.
+    ``extractor.pdf`` vs. ``parser.pdf``), da sie unterschiedlich bereinigen.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, version: int = TEXT_CACHE_VERSION):
+        base = os.getenv("BASE_DATA_DIR", "data")
+        self.cache_dir = Path(cache_dir or os.path.join(base, "cache", "text"))
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        get_metrics().register_cache("text", self)
+
+    def _path(self, digest: str, namespace: str) -> Path:
+        return self.cache_dir / digest[:2] / f"{digest}.{namespace}.json.gz"
+
+    def get(self, digest: str, namespace: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns:
+            {'text': str, 'metadata': dict} oder None
+        """
+        path = self._path(digest, namespace)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️ Text-Cache beschädigt ({path.name}): {e}")
+            self.misses += 1
+            return None
+
+        if entry.get('version') != self.version:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug(f"✅ Text-Cache Treffer: {digest[:12]} ({namespace})")
+        return {'text': entry.get('text', ''), 'metadata': entry.get('metadata', {})}
+
+    def put(self, digest: str, namespace: str, text: str, metadata: Optional[Dict] = None) -> bool:
+        """Schreibt atomar (Temp-Datei + os.replace)."""
+        path = self._path(digest, namespace)
+        entry = {
+            'version': self.version,
+            'sha256': digest,
+            'namespace': namespace,
+            'text': text,
+            'metadata': metadata or {},
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+                json.dump(entry, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            logger.error(f"❌ Text-Cache Schreiben fehlgeschlagen: {e}")
+            return False
+
+    def clear(self) -> int:
+        """Löscht alle Einträge. Returns: Anzahl gelöschter Dateien"""
+        count = 0
+        for entry in self.cache_dir.glob("*/*.json.gz"):
+            try:
+                entry.unlink()
+                count += 1
+            except OSError as e:
+                logger.error(f"❌ Fehler beim Löschen von {entry}: {e}")
+        logger.info(f"🗑️ {count} Text-Cache-Einträge gelöscht")
+        return count
+
+    def get_cache_info(self) -> dict:
+        """Statistik für Admin-/Debug-Zwecke"""
+        files = list(self.cache_dir.glob("*/*.json.gz"))
+        return {
+            'cache_dir': str(self.cache_dir),
+            'entries': len(files),
+            'total_size_kb': sum(f.stat().st_size for f in files) // 1024,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+# Globale Instanz für einfachen Zugriff
+_text_cache = None
+
+def get_text_cache() -> Optional[ExtractedTextCache]:
+    """Globale Instanz; None wenn per TEXT_CACHE_ENABLED=false deaktiviert"""
+    global _text_cache
+    if os.getenv("TEXT_CACHE_ENABLED", "true").lower() not in {"1", "true", "yes"}:
+        return None
+    if _text_cache is None:
+        _text_cache = ExtractedTextCache()
+    return _text_cache
@@ -0,0 +1,349 @@
+"""
+Ko-Vorkommen-Engine: Skill × Skill und Rolle × Skill über alle analysierten Stellenanzeigen
+Basis für verwandte Skills, PMI/Lift-Rankings und Netzwerk-Exporte (Rollen-Seite).
+
+- Quelle: ``skill_pair_counts`` / ``role_skill_counts`` des Results-Stores (einmal geladen)
+- Danach inkrementell: der Store meldet jeden gespeicherten, ersetzten oder gelöschten Job;
+  Schreibvorgänge anderer Prozesse (``data_version``) → Neuladen beim nächsten Zugriff
+- Skill × Skill als symmetrische CSR-Matrix (NumPy) plus kleinem Änderungs-Overlay,
+  das ab OVERLAY_LIMIT Einträgen in die CSR-Matrix eingefaltet wird
+- Zählt Jobs (nicht Nennungen): ein Skill zählt pro Job höchstens einmal
+"""
+
+import logging
+import threading
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.infrastructure.results_store import ResultsStore, per_store_singleton
+
+logger = logging.getLogger(__name__)
+
+METRICS = ('count', 'lift', 'pmi', 'npmi', 'jaccard')
+OVERLAY_LIMIT = 50_000
+
+
+def pair_metrics(n_ab: np.ndarray, n_a: np.ndarray, n_b: np.ndarray, total: int) -> Dict[str, np.ndarray]:
+    """
+    Assoziationsmaße für Skill-Paare (vektorisiert).
+
+    - lift: P(a,b) / (P(a)·P(b))
+    - pmi: log2(lift)
+    - npmi: pmi / -log2(P(a,b)), normiert auf [-1, 1]
+    - jaccard: |a ∩ b| / |a ∪ b|
+    """
+    n_ab = np.asarray(n_ab, dtype=np.float64)
+    n_a = np.asarray(n_a, dtype=np.float64)
+    n_b = np.asarray(n_b, dtype=np.float64)
+    total = max(float(total), 1.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lift = n_ab * total / (n_a * n_b)
+        pmi = np.log2(lift)
+        p_ab = n_ab / total
+        npmi = np.where(p_ab < 1.0, pmi / -np.log2(p_ab), 1.0)
+        jaccard = n_ab / (n_a + n_b - n_ab)
+    return {'count': n_ab, 'lift': lift, 'pmi': pmi, 'npmi': npmi, 'jaccard': jaccard}
+
+
+def _check_metric(metric: str) -> None:
+    if metric not in METRICS:
+        raise ValueError(f"Unbekannte Metrik '{metric}' (erlaubt: {', '.join(METRICS)})")
+
+
+def _pair_entry(scores: Dict[str, np.ndarray], i: int, **names: Any) -> Dict[str, Any]:
+    entry = dict(names)
+    entry['count'] = int(scores['count'][i])
+    for name in ('lift', 'pmi', 'npmi', 'jaccard'):
+        entry[name] = round(float(scores[name][i]), 4)
+    return entry
+
+
+class SkillCooccurrence:
+    """
+    Dünn besetzte Ko-Vorkommen-Matrizen mit Abfragen für Dashboard und API.
+
+    Beispiel:
+        engine = get_skill_cooccurrence(store)
+        engine.related('Python', top_k=10, metric='npmi')
+        engine.graph(seed='Python', top_nodes=25)
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.version = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self.labels: List[Optional[str]] = []      # Index = skill_id
+        self.label_index: Dict[str, int] = {}
+        self.role_names: List[str] = []
+        self.role_index: Dict[str, int] = {}
+        self.total_jobs = 0
+        self.doc_freq = np.zeros(0, dtype=np.int64)
+        self.role_jobs = np.zeros(0, dtype=np.int64)
+        self.role_skill = np.zeros((0, 0), dtype=np.int64)
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int64)
+        self._data = np.zeros(0, dtype=np.int64)
+        self._overlay: Dict[int, Dict[int, int]] = {}
+        self._overlay_size = 0
+
+    # ------------------------------------------------------------------
+    # Laden / inkrementelle Pflege
+    # ------------------------------------------------------------------
+
+    def load(self, store: ResultsStore) -> None:
+        with self._lock:
+            counts = store.cooccurrence_counts()
+            self.version = counts['version']
+            self._load_counts(counts)
+        logger.info(f"🕸️ Ko-Vorkommen geladen: {len(self.label_index)} Skills, "
+                    f"{len(self._data) // 2} Paare, {self.total_jobs} Jobs")
+
+    def _load_counts(self, counts: Dict[str, Any]) -> None:
+        self._reset()
+        for skill_id, label in counts['skills']:
+            self._register_skill(skill_id, label)
+        for role, _ in counts['role_jobs']:
+            self._register_role(role)
+        for role, _, _ in counts['role_skills']:
+            self._register_role(role)
+        self._grow()
+
+        for role, n in counts['role_jobs']:
+            self.role_jobs[self.role_index[role]] = n
+        if counts['role_skills']:
+            roles, skill_ids, n = zip(*counts['role_skills'])
+            role_ids = np.array([self.role_index[r] for r in roles], dtype=np.int64)
+            np.add.at(self.role_skill, (role_ids, np.array(skill_ids, dtype=np.int64)), np.array(n, dtype=np.int64))
+        self.doc_freq = self.role_skill.sum(axis=0)
+        self.total_jobs = int(self.role_jobs.sum())
+
+        if counts['pairs']:
+            pairs = np.array(counts['pairs'], dtype=np.int64)
+            self._build_csr(pairs[:, 0], pairs[:, 1], pairs[:, 2])
+
+    def _register_skill(self, skill_id: int, label: str) -> None:
+        if skill_id >= len(self.labels):
+            self.labels.extend([None] * (skill_id + 1 - len(self.labels)))
+        if self.labels[skill_id] is None:
+            self.labels[skill_id] = label
+            self.label_index[label] = skill_id
+
+    def _register_role(self, role: str) -> int:
+        if role not in self.role_index:
+            self.role_index[role] = len(self.role_names)
+            self.role_names.append(role)
+        return self.role_index[role]
+
+    def _grow(self) -> None:
+        """Arrays an neue Skills/Rollen anpassen"""
+        n_skills, n_roles = len(self.labels), len(self.role_names)
+        if len(self.doc_freq) < n_skills:
+            self.doc_freq = np.concatenate([self.doc_freq, np.zeros(n_skills - len(self.doc_freq), dtype=np.int64)])
+        if len(self.role_jobs) < n_roles:
+            self.role_jobs = np.concatenate([self.role_jobs, np.zeros(n_roles - len(self.role_jobs), dtype=np.int64)])
+        if self.role_skill.shape != (n_roles, n_skills):
+            grown = np.zeros((n_roles, n_skills), dtype=np.int64)
+            grown[:self.role_skill.shape[0], :self.role_skill.shape[1]] = self.role_skill
+            self.role_skill = grown
+        if len(self._indptr) < n_skills + 1:
+            pad = np.full(n_skills + 1 - len(self._indptr), self._indptr[-1], dtype=np.int64)
+            self._indptr = np.concatenate([self._indptr, pad])
+
+    def _build_csr(self, a: np.ndarray, b: np.ndarray, n: np.ndarray) -> None:
+        """Symmetrische CSR-Matrix aus oberem Dreieck (a < b)"""
+        keep = n > 0
+        rows = np.concatenate([a[keep], b[keep]])
+        cols = np.concatenate([b[keep], a[keep]])
+        vals = np.concatenate([n[keep], n[keep]])
+        order = np.lexsort((cols, rows))
+        self._indices, self._data = cols[order], vals[order]
+        self._indptr = np.zeros(len(self.labels) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(self.labels)), out=self._indptr[1:])
+
+    def apply(self, jobs: List[Tuple]) -> None:
+        """Übernimmt Job-Differenzen (vorzeichen, rolle, skill_ids, labels)"""
+        with self._lock:
+            for sign, role, skill_ids, labels in jobs:
+                for skill_id, label in zip(skill_ids, labels):
+                    self._register_skill(skill_id, label)
+                role_id = self._register_role(role)
+                self._grow()
+                ids = np.array(skill_ids, dtype=np.int64)
+                self.total_jobs += sign
+                self.role_jobs[role_id] += sign
+                self.role_skill[role_id, ids] += sign
+                self.doc_freq[ids] += sign
+                for a, b in combinations(skill_ids, 2):
+                    for x, y in ((a, b), (b, a)):
+                        row = self._overlay.setdefault(x, {})
+                        if y not in row:
+                            self._overlay_size += 1
+                        row[y] = row.get(y, 0) + sign
+            if self._overlay_size > OVERLAY_LIMIT:
+                self._fold()
+
+    def _fold(self) -> None:
+        """Overlay in die CSR-Matrix übernehmen"""
+        if not self._overlay:
+            return
+        rows = np.repeat(np.arange(len(self._indptr) - 1), np.diff(self._indptr))
+        upper = rows < self._indices
+        ov = [(a, b, n) for a, row in self._overlay.items() for b, n in row.items() if a < b and n]
+        ov_arr = np.array(ov, dtype=np.int64).reshape(-1, 3)
+        a = np.concatenate([rows[upper], ov_arr[:, 0]])
+        b = np.concatenate([self._indices[upper], ov_arr[:, 1]])
+        n = np.concatenate([self._data[upper], ov_arr[:, 2]])
+        keys = a * len(self.labels) + b
+        unique, inverse = np.unique(keys, return_inverse=True)
+        summed = np.bincount(inverse, weights=n).astype(np.int64)
+        self._build_csr(unique // len(self.labels), unique % len(self.labels), summed)
+        self._overlay, self._overlay_size = {}, 0
+
+    def _row(self, skill_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Nachbarn eines Skills und Anzahl gemeinsamer Jobs (CSR + Overlay)"""
+        start, end = self._indptr[skill_id], self._indptr[skill_id + 1]
+        neighbors, counts = self._indices[start:end], self._data[start:end]
+        overlay = self._overlay.get(skill_id)
+        if overlay:
+            keys, inverse = np.unique(
+                np.concatenate([neighbors, np.fromiter(overlay.keys(), dtype=np.int64, count=len(overlay))]),
+                return_inverse=True,
+            )
+            values = np.concatenate([counts, np.fromiter(overlay.values(), dtype=np.int64, count=len(overlay))])
+            neighbors, counts = keys, np.bincount(inverse, weights=values).astype(np.int64)
+        keep = counts > 0
+        return neighbors[keep], counts[keep]
+
+    # ------------------------------------------------------------------
+    # Abfragen
+    # ------------------------------------------------------------------
+
+    def related(self, skill: str, top_k: int = 10, metric: str = 'npmi', min_count: int = 2) -> List[Dict[str, Any]]:
+        """Top-k Skills, die gemeinsam mit ``skill`` gefordert werden"""
+        _check_metric(metric)
+        with self._lock:
+            skill_id = self.label_index.get(skill)
+            if skill_id is None:
+                return []
+            neighbors, counts = self._row(skill_id)
+            keep = counts >= min_count
+            neighbors, counts = neighbors[keep], counts[keep]
+            scores = pair_metrics(counts, self.doc_freq[skill_id], self.doc_freq[neighbors], self.total_jobs)
+            order = np.lexsort((-counts, -scores[metric]))[:top_k]
+            return [_pair_entry(scores, i, skill=self.labels[neighbors[i]]) for i in order]
+
+    def top_pairs(self, top_k: int = 20, metric: str = 'npmi', min_count: int = 3) -> List[Dict[str, Any]]:
+        """Stärkste Skill-Paare im gesamten Korpus"""
+        _check_metric(metric)
+        with self._lock:
+            self._fold()
+            rows = np.repeat(np.arange(len(self._indptr) - 1), np.diff(self._indptr))
+            keep = (rows < self._indices) & (self._data >= min_count)
+            a, b, counts = rows[keep], self._indices[keep], self._data[keep]
+            scores = pair_metrics(counts, self.doc_freq[a], self.doc_freq[b], self.total_jobs)
+            order = np.lexsort((-counts, -scores[metric]))[:top_k]
+            return [_pair_entry(scores, i, source=self.labels[a[i]], target=self.labels[b[i]]) for i in order]
+
+    def role_skills(self, role: str, top_k: int = 15, metric: str = 'count', min_count: int = 1) -> List[Dict[str, Any]]:
+        """
+        Typische Skills einer Rollen-Kategorie.
+
+        metric='count': häufigste Skills; metric='lift': überdurchschnittlich häufig gegenüber allen Jobs
+        """
+        if metric not in ('count', 'lift'):
+            raise ValueError("metric muss 'count' oder 'lift' sein")
+        with self._lock:
+            role_id = self.role_index.get(role)
+            if role_id is None or self.role_jobs[role_id] <= 0:
+                return []
+            counts = self.role_skill[role_id]
+            candidates = np.flatnonzero(counts >= max(min_count, 1))
+            share = counts[candidates] / self.role_jobs[role_id]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                lift = share / (self.doc_freq[candidates] / max(self.total_jobs, 1))
+            key = counts[candidates] if metric == 'count' else lift
+            order = np.lexsort((-counts[candidates], -key))[:top_k]
+            return [
+                {
+                    'skill': self.labels[candidates[i]],
+                    'count': int(counts[candidates[i]]),
+                    'share': round(float(share[i]), 4),
+                    'lift': round(float(lift[i]), 4),
+                }
+                for i in order
+            ]
+
+    def role_network(self, min_similarity: float = 0.1, shared_skills: int = 3) -> Dict[str, Any]:
+        """Rollen-Netzwerk: Kosinus-Ähnlichkeit der Skill-Profile (Anteil Jobs je Skill)"""
+        with self._lock:
+            active = np.flatnonzero(self.role_jobs > 0)
+            profiles = self.role_skill[active] / self.role_jobs[active][:, None]
+            norms = np.linalg.norm(profiles, axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                similarity = (profiles @ profiles.T) / np.outer(norms, norms)
+            nodes = [{'id': self.role_names[r], 'jobs': int(self.role_jobs[r])} for r in active]
+            edges = []
+            for i, j in zip(*np.triu_indices(len(active), k=1)):
+                if not similarity[i, j] >= min_similarity:
+                    continue
+                overlap = np.minimum(profiles[i], profiles[j])
+                top = [int(s) for s in np.argsort(-overlap, kind='stable')[:shared_skills] if overlap[s] > 0]
+                edges.append({
+                    'source': self.role_names[active[i]],
+                    'target': self.role_names[active[j]],
+                    'weight': round(float(similarity[i, j]), 4),
+                    'shared_skills': [self.labels[s] for s in top],
+                })
+            return {'nodes': nodes, 'edges': edges}
+
+    def graph(self, seed: Optional[str] = None, top_nodes: int = 30, metric: str = 'npmi', min_count: int = 3,
+              max_edges_per_node: int = 5) -> Dict[str, Any]:
+        """
+        Beschnittener Skill-Graph für die Visualisierung.
+
+        Knoten: ``seed`` und seine stärksten Nachbarn bzw. die häufigsten Skills;
+        Kanten: je Knoten höchstens ``max_edges_per_node`` stärkste Verbindungen innerhalb der Knotenmenge.
+        """
+        _check_metric(metric)
+        with self._lock:
+            if seed is not None:
+                if seed not in self.label_index:
+                    return {'nodes': [], 'edges': [], 'metric': metric}
+                neighbors = self.related(seed, top_k=top_nodes - 1, metric=metric, min_count=min_count)
+                node_ids = [self.label_index[seed]] + [self.label_index[n['skill']] for n in neighbors]
+            else:
+                order = np.argsort(-self.doc_freq, kind='stable')[:top_nodes]
+                node_ids = [int(i) for i in order if self.doc_freq[i] > 0]
+            node_set = np.array(node_ids, dtype=np.int64)
+
+            edges: Dict[Tuple[int, int], Dict[str, Any]] = {}
+            for u in node_ids:
+                neighbors, counts = self._row(u)
+                keep = np.isin(neighbors, node_set) & (counts >= min_count)
+                neighbors, counts = neighbors[keep], counts[keep]
+                scores = pair_metrics(counts, self.doc_freq[u], self.doc_freq[neighbors], self.total_jobs)
+                for i in np.lexsort((-counts, -scores[metric]))[:max_edges_per_node]:
+                    v = int(neighbors[i])
+                    edges.setdefault((min(u, v), max(u, v)), {
+                        'source': self.labels[min(u, v)],
+                        'target': self.labels[max(u, v)],
+                        'count': int(counts[i]),
+                        'weight': round(float(scores[metric][i]), 4),
+                    })
+            return {
+                'nodes': [{'id': self.labels[i], 'count': int(self.doc_freq[i])} for i in node_ids],
+                'edges': list(edges.values()),
+                'metric': metric,
+            }
+
+
+_engines = per_store_singleton('cooccurrence', SkillCooccurrence)
+
+
+def get_skill_cooccurrence(store: ResultsStore) -> SkillCooccurrence:
+    """Engine-Instanz pro Store: einmal laden, danach über die Store-Differenzen aktuell halten"""
+    return _engines.get(store)
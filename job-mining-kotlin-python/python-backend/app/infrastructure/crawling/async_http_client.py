@@ -0,0 +1,293 @@
+"""
+Async HTTP Client mit Connection-Pool und Host-Politeness
+Ersetzt die nackten requests.get-Aufrufe (je URL neuer DNS-Lookup + TLS-Handshake)
+
+Features:
+- httpx.AsyncClient mit Keep-Alive-Pool (HTTP/2, falls 'h2' installiert ist)
+- Pro Host: max. parallele Requests + Mindestabstand zwischen Requests
+- robots.txt pro Host gecacht (inkl. Crawl-delay)
+- Budgets wie WebScraper: MAX_HTML_BYTES (Body-Limit), MAX_TOTAL_MS (Gesamtzeit)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 JobMining/1.0'
+DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml',
+    'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8',
+}
+
+# Gleiche Budgets wie WebScraper (requests-Pfad)
+DEFAULT_TIMEOUT = (3.0, 6.0)       # (connect, read) Sekunden
+DEFAULT_MAX_BYTES = 1024 * 1024    # MAX_HTML_BYTES
+DEFAULT_MAX_TOTAL_MS = 8000        # MAX_TOTAL_MS
+
+ROBOTS_TTL_S = 6 * 3600
+
+
+@dataclass
+class FetchResult:
+    """Ergebnis eines HTTP-Abrufs (wirft nie - Fehler stehen in ``error``)"""
+    url: str
+    status: int = 0
+    final_url: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    elapsed_ms: int = 0
+    truncated: bool = False
+    warnings: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status < 300
+
+    @property
+    def text(self) -> str:
+        """Body als Text (Charset aus Content-Type, sonst UTF-8)"""
+        charset = "utf-8"
+        content_type = self.headers.get("content-type", "")
+        if "charset=" in content_type:
+            charset = content_type.split("charset=", 1)[1].split(";")[0].strip() or "utf-8"
+        try:
+            return self.body.decode(charset, errors="ignore")
+        except LookupError:
+            return self.body.decode("utf-8", errors="ignore")
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class _HostSlot:
+    """Concurrency + Rate-Limit für einen Host"""
+
+    def __init__(self, max_concurrency: int, min_interval_s: float):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.min_interval_s = min_interval_s
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            async with self._lock:
+                now = time.monotonic()
+                wait = self._next_start - now
+                self._next_start = max(now, self._next_start) + self.min_interval_s
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc):
+        self.semaphore.release()
+
+
+class AsyncHttpClient:
+    """
+    Gepoolter, höflicher HTTP-Client für Scraping und Crawling.
+
+    Args:
+        max_connections: Gesamtgröße des Connection-Pools
+        max_per_host: Parallele Requests pro Host
+        min_interval_s: Mindestabstand zwischen Request-Starts pro Host
+        max_bytes: Body-Limit (Rest wird verworfen, ``truncated=True``)
+        max_total_ms: Zeitbudget pro Abruf inkl. Download
+        respect_robots: robots.txt beachten
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 50,
+        max_per_host: int = 4,
+        min_interval_s: float = 0.5,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_total_ms: int = DEFAULT_MAX_TOTAL_MS,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        respect_robots: bool = True,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        self.max_per_host = max_per_host
+        self.min_interval_s = min_interval_s
+        self.max_bytes = max_bytes
+        self.max_total_ms = max_total_ms
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+
+        connect, read = timeout
+        self._client = httpx.AsyncClient(
+            http2=_http2_available(),
+            follow_redirects=True,
+            timeout=httpx.Timeout(read, connect=connect),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=30.0,
+            ),
+            headers={'User-Agent': user_agent, **DEFAULT_HEADERS},
+        )
+        self._hosts: Dict[str, _HostSlot] = {}
+        self._robots: Dict[str, Tuple[float, Optional[RobotFileParser]]] = {}
+        self._robots_locks: Dict[str, asyncio.Lock] = {}
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client.is_closed
+
+    # ------------------------------------------------------------------
+    # Öffentliche API
+    # ------------------------------------------------------------------
+
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        """GET mit robots.txt-Check, Host-Limits und Byte-/Zeitbudget."""
+        result = FetchResult(url=url, final_url=url)
+        host = self._host_key(url)
+        if not host:
+            result.error = "Ungültige URL"
+            return result
+
+        if self.respect_robots and not await self.allowed(url):
+            result.error = "robots.txt verbietet Zugriff"
+            result.warnings.append(result.error)
+            return result
+
+        start = time.monotonic()
+        async with self._slot(host):
+            chunks: List[bytes] = []
+            try:
+                await asyncio.wait_for(
+                    self._download(url, headers, result, chunks),
+                    timeout=self.max_total_ms / 1000,
+                )
+            except asyncio.TimeoutError:
+                result.truncated = True
+                result.warnings.append(f"Download nach {self.max_total_ms}ms abgebrochen (Timeout)")
+                if not result.status:
+                    result.error = "Timeout"
+            except httpx.HTTPError as e:
+                result.error = f"{type(e).__name__}: {e}"
+            result.body = b"".join(chunks)
+
+        result.elapsed_ms = int((time.monotonic() - start) * 1000)
+        return result
+
+    async def fetch_many(self, urls: Iterable[str]) -> List[FetchResult]:
+        """Parallel abrufen (Host-Limits gelten weiterhin); Reihenfolge bleibt erhalten."""
+        return list(await asyncio.gather(*(self.fetch(u) for u in urls)))
+
+    async def allowed(self, url: str) -> bool:
+        """robots.txt-Prüfung (gecacht pro Host, Fehler → erlaubt)"""
+        parser = await self._robots_for(url)
+        return parser is None or parser.can_fetch(self.user_agent, url)
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return ""
+        return f"{parsed.scheme}://{parsed.netloc.lower()}"
+
+    def _slot(self, host: str) -> _HostSlot:
+        slot = self._hosts.get(host)
+        if slot is None:
+            slot = _HostSlot(self.max_per_host, self.min_interval_s)
+            self._hosts[host] = slot
+        return slot
+
+    async def _download(self, url: str, headers: Optional[Dict[str, str]], result: FetchResult, chunks: List[bytes]) -> None:
+        async with self._client.stream("GET", url, headers=headers) as response:
+            result.status = response.status_code
+            result.final_url = str(response.url)
+            result.headers = {k.lower(): v for k, v in response.headers.items()}
+            total = 0
+            async for chunk in response.aiter_bytes(16384):
+                remaining = self.max_bytes - total
+                chunks.append(chunk[:remaining])
+                total += len(chunk)
+                if total >= self.max_bytes:
+                    result.truncated = True
+                    result.warnings.append(f"HTML bei {self.max_bytes} Bytes gekürzt")
+                    break
+
+    async def _robots_for(self, url: str) -> Optional[RobotFileParser]:
+        host = self._host_key(url)
+        cached = self._robots.get(host)
+        if cached and time.monotonic() - cached[0] < ROBOTS_TTL_S:
+            return cached[1]
+
+        lock = self._robots_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            cached = self._robots.get(host)
+            if cached and time.monotonic() - cached[0] < ROBOTS_TTL_S:
+                return cached[1]
+
+            parser: Optional[RobotFileParser] = None
+            try:
+                response = await self._client.get(f"{host}/robots.txt")
+                if response.status_code in (401, 403):
+                    parser = RobotFileParser()
+                    parser.disallow_all = True
+                elif response.status_code < 400:
+                    parser = RobotFileParser()
+                    parser.parse(response.text[:512 * 1024].splitlines())
+                    delay = parser.crawl_delay(self.user_agent)
+                    if delay:
+                        self._slot(host).min_interval_s = max(self.min_interval_s, float(delay))
+            except httpx.HTTPError as e:
+                logger.debug(f"robots.txt für {host} nicht abrufbar: {e}")
+
+            self._robots[host] = (time.monotonic(), parser)
+            return parser
+
+
+# ============================================================================
+# Geteilte Instanz (ein Pool pro Prozess / Event-Loop)
+# ============================================================================
+
+_shared_client: Optional[AsyncHttpClient] = None
+
+
+def get_async_http_client() -> AsyncHttpClient:
+    """Gibt den prozessweiten Client zurück (lazy, im laufenden Event-Loop erzeugt)"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = AsyncHttpClient()
+    return _shared_client
+
+
+async def close_async_http_client() -> None:
+    """Schließt den geteilten Client (App-Shutdown)"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
@@ -0,0 +1,298 @@
+"""
+Persistente Crawl-Frontier (SQLite)
+Prioritäts-Queue für Listing- und Detailseiten mit Host-Politeness
+
+- Dedup über kanonische URL (Primärschlüssel) → bekannte Postings werden nie erneut geladen
+- Pro Host: höchstens ein Abruf gleichzeitig + nächster erlaubter Abruf (``hosts.next_allowed_at``),
+  Claims verteilen sich dadurch über Hosts
+- Wiederaufnahme: beim Öffnen werden abgebrochene Claims (in_progress) wieder freigegeben
+- Fehler: Retry mit exponentiellem Backoff bis ``max_attempts``
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+logger = logging.getLogger(__name__)
+
+KIND_LISTING = "listing"
+KIND_DETAIL = "detail"
+
+STATE_PENDING = "pending"
+STATE_IN_PROGRESS = "in_progress"
+STATE_DONE = "done"
+STATE_FAILED = "failed"
+
+DEFAULT_HOST_INTERVAL_S = float(os.getenv("CRAWL_HOST_INTERVAL_S", "1.0"))
+DEFAULT_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY_S = 60.0
+
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "source", "trk", "trackingid"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    canonical_url TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    host TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    depth INTEGER NOT NULL DEFAULT 0,
+    parent_url TEXT,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    discovered_at REAL NOT NULL,
+    next_fetch_at REAL NOT NULL DEFAULT 0,
+    fetched_at REAL,
+    content_sha256 TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_urls_ready ON urls (state, next_fetch_at, priority DESC, discovered_at);
+CREATE INDEX IF NOT EXISTS idx_urls_host ON urls (host, state);
+CREATE TABLE IF NOT EXISTS hosts (
+    host TEXT PRIMARY KEY,
+    next_allowed_at REAL NOT NULL DEFAULT 0,
+    min_interval_s REAL NOT NULL
+);
+"""
+
+
+def canonicalize_url(url: str, keep_query: bool = False) -> str:
+    """
+    Kanonische URL für Dedup.
+
+    Detailseiten: ohne Query/Fragment (wie ``WebScraper.normalize_url``).
+    Listing-Seiten (``keep_query=True``): Query bleibt (Paginierung), aber sortiert
+    und ohne Tracking-Parameter.
+    """
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    path = parsed.path or "/"
+    query = ""
+    if keep_query and parsed.query:
+        params = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+                  if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS]
+        query = urlencode(sorted(params))
+    return urlunparse((scheme, netloc, path, "", query, ""))
+
+
+@dataclass
+class FrontierItem:
+    canonical_url: str
+    url: str
+    host: str
+    kind: str
+    priority: int
+    depth: int
+    attempts: int
+    parent_url: Optional[str] = None
+
+
+class CrawlFrontier:
+    """
+    SQLite-basierte Frontier (eine Datei, WAL-Modus, thread-sicher).
+
+    Args:
+        db_path: Datenbankdatei (``:memory:`` für Tests)
+        host_interval_s: Mindestabstand zwischen zwei Claims pro Host
+        max_attempts: Versuche bis eine URL als ``failed`` gilt
+    """
+
+    def __init__(self, db_path: Optional[str] = None, host_interval_s: float = DEFAULT_HOST_INTERVAL_S,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        base = os.getenv("BASE_DATA_DIR", "data")
+        self.db_path = db_path or os.path.join(base, "crawl", "frontier.sqlite3")
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.host_interval_s = host_interval_s
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            if self.db_path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        resumed = self._release_stale_claims()
+        if resumed:
+            logger.info(f"♻️ Frontier: {resumed} abgebrochene Claims wieder freigegeben")
+
+    # ------------------------------------------------------------------
+    # Einfügen
+    # ------------------------------------------------------------------
+
+    def add(self, url: str, kind: str = KIND_DETAIL, priority: int = 0, depth: int = 0,
+            parent_url: Optional[str] = None) -> bool:
+        """Fügt eine URL hinzu. Returns: True wenn neu (bekannte URLs werden ignoriert)"""
+        return self.add_many([url], kind, priority, depth, parent_url) == 1
+
+    def add_many(self, urls: Iterable[str], kind: str = KIND_DETAIL, priority: int = 0, depth: int = 0,
+                 parent_url: Optional[str] = None) -> int:
+        """Returns: Anzahl neu eingefügter URLs"""
+        now = time.time()
+        rows = []
+        for url in urls:
+            canonical = canonicalize_url(url, keep_query=(kind == KIND_LISTING))
+            host = urlparse(canonical).netloc
+            if not host:
+                continue
+            rows.append((canonical, url, host, kind, priority, depth, parent_url, now))
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            cursor = self._conn.executemany(
+                "INSERT OR IGNORE INTO urls (canonical_url, url, host, kind, priority, depth, parent_url, discovered_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            inserted = cursor.rowcount
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO hosts (host, min_interval_s) VALUES (?, ?)",
+                {(row[2], self.host_interval_s) for row in rows},
+            )
+            self._conn.execute("COMMIT")
+        return inserted
+
+    def reschedule(self, urls: Iterable[str], kind: str = KIND_LISTING, older_than_s: float = 0.0,
+                   priority: Optional[int] = None) -> int:
+        """
+        Setzt bereits geladene URLs (z.B. Listing-Seeds für den nächsten Nachtlauf)
+        wieder auf ``pending``, wenn ihr letzter Abruf älter als ``older_than_s`` ist.
+        """
+        cutoff = time.time() - older_than_s
+        canonicals = [canonicalize_url(u, keep_query=(kind == KIND_LISTING)) for u in urls]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN")
+            for canonical in canonicals:
+                self._conn.execute(
+                    "UPDATE urls SET state = ?, attempts = 0, next_fetch_at = 0, error = NULL, "
+                    "priority = COALESCE(?, priority) "
+                    "WHERE canonical_url = ? AND state IN (?, ?) AND COALESCE(fetched_at, 0) <= ?",
+                    (STATE_PENDING, priority, canonical, STATE_DONE, STATE_FAILED, cutoff),
+                )
+            self._conn.execute("COMMIT")
+            return self._conn.total_changes - before
+
+    # ------------------------------------------------------------------
+    # Claims
+    # ------------------------------------------------------------------
+
+    def claim(self, limit: int, now: Optional[float] = None) -> List[FrontierItem]:
+        """
+        Holt bis zu ``limit`` fällige URLs - höchstens eine pro Host und nur Hosts,
+        deren Politeness-Intervall abgelaufen ist. Markiert sie als ``in_progress``.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT u.* FROM urls u JOIN hosts h ON h.host = u.host "
+                    "WHERE u.state = ? AND u.next_fetch_at <= ? AND h.next_allowed_at <= ? "
+                    "AND NOT EXISTS (SELECT 1 FROM urls b WHERE b.host = u.host AND b.state = ?) "
+                    "ORDER BY u.priority DESC, u.discovered_at LIMIT ?",
+                    (STATE_PENDING, now, now, STATE_IN_PROGRESS, limit * 8),
+                ).fetchall()
+
+                items: List[FrontierItem] = []
+                seen_hosts = set()
+                for row in rows:
+                    if row["host"] in seen_hosts:
+                        continue
+                    seen_hosts.add(row["host"])
+                    items.append(FrontierItem(
+                        canonical_url=row["canonical_url"], url=row["url"], host=row["host"],
+                        kind=row["kind"], priority=row["priority"], depth=row["depth"],
+                        attempts=row["attempts"], parent_url=row["parent_url"],
+                    ))
+                    if len(items) >= limit:
+                        break
+
+                for item in items:
+                    self._conn.execute("UPDATE urls SET state = ?, attempts = attempts + 1 WHERE canonical_url = ?",
+                                       (STATE_IN_PROGRESS, item.canonical_url))
+                    self._conn.execute("UPDATE hosts SET next_allowed_at = ? + min_interval_s WHERE host = ?",
+                                       (now, item.host))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return items
+
+    def complete(self, canonical_url: str, content_sha256: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE urls SET state = ?, fetched_at = ?, content_sha256 = ?, error = NULL WHERE canonical_url = ?",
+                (STATE_DONE, time.time(), content_sha256, canonical_url),
+            )
+
+    def fail(self, canonical_url: str, error: str, retry: bool = True) -> str:
+        """
+        Markiert einen Fehlschlag. Mit ``retry`` und verbleibenden Versuchen wird
+        die URL mit Backoff (60s, 120s, 240s, ...) wieder eingeplant.
+
+        Returns:
+            Neuer Zustand (``pending`` oder ``failed``)
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT attempts FROM urls WHERE canonical_url = ?", (canonical_url,)).fetchone()
+            attempts = row["attempts"] if row else self.max_attempts
+            if retry and attempts < self.max_attempts:
+                state = STATE_PENDING
+                next_fetch_at = time.time() + RETRY_BASE_DELAY_S * (2 ** max(0, attempts - 1))
+            else:
+                state = STATE_FAILED
+                next_fetch_at = 0
+            self._conn.execute(
+                "UPDATE urls SET state = ?, next_fetch_at = ?, fetched_at = ?, error = ? WHERE canonical_url = ?",
+                (state, next_fetch_at, time.time(), error[:500], canonical_url),
+            )
+        return state
+
+    # ------------------------------------------------------------------
+    # Abfragen
+    # ------------------------------------------------------------------
+
+    def is_known(self, url: str, kind: str = KIND_DETAIL) -> bool:
+        canonical = canonicalize_url(url, keep_query=(kind == KIND_LISTING))
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM urls WHERE canonical_url = ?", (canonical,)).fetchone() is not None
+
+    def next_due_at(self) -> Optional[float]:
+        """Frühester Zeitpunkt, zu dem wieder etwas claimbar ist (None = nichts mehr offen)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(MAX(u.next_fetch_at, h.next_allowed_at)) AS due FROM urls u "
+                "JOIN hosts h ON h.host = u.host WHERE u.state = ?",
+                (STATE_PENDING,),
+            ).fetchone()
+        return row["due"] if row and row["due"] is not None else None
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Anzahl URLs je Typ und Zustand, z.B. {'detail': {'done': 120, 'pending': 30}}"""
+        result: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            for row in self._conn.execute("SELECT kind, state, COUNT(*) AS n FROM urls GROUP BY kind, state"):
+                result.setdefault(row["kind"], {})[row["state"]] = row["n"]
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _release_stale_claims(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE urls SET state = ?, attempts = MAX(attempts - 1, 0) WHERE state = ?",
+                (STATE_PENDING, STATE_IN_PROGRESS),
+            )
+            return cursor.rowcount
@@ -0,0 +1,274 @@
+"""
+Job-Crawler: Listing-Seiten → Detail-URLs → Analyse-Pipeline
+Arbeitet auf der persistenten CrawlFrontier (SQLite)
+
+- Listing-Seiten (Seeds + Paginierung) werden in Detail-URLs expandiert
+- Bekannte Detail-URLs werden nie erneut geladen (Dedup in der Frontier)
+- Begrenzte Parallelität; Politeness über Frontier (pro Host) + AsyncHttpClient
+- Abbruch/Neustart jederzeit möglich: offener Stand liegt in der Frontier
+- Geladene Detailseiten gehen gebündelt an ``on_details`` (z.B. BulkUrlAnalysisService)
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Awaitable, Callable, Iterable, List, Optional, Pattern, Tuple
+from urllib.parse import urljoin, urlparse
+
+from app.infrastructure.crawling.async_http_client import get_async_http_client
+from app.infrastructure.crawling.crawl_frontier import (
+    CrawlFrontier,
+    FrontierItem,
+    KIND_DETAIL,
+    KIND_LISTING,
+)
+from app.infrastructure.crawling.web_scraper import ScrapedContent, WebScraper
+
+logger = logging.getLogger(__name__)
+
+# Typische Pfade von Stellen-Detailseiten (Segment nach dem Präfix = Job-ID/Slug)
+DEFAULT_DETAIL_PATTERN = (
+    r"/(jobs?|stellen|stellenangebote?|stellenanzeigen?|job-?offers?|jobposting|positions?|vacanc(y|ies))"
+    r"/[^/?#]+"
+)
+NEXT_PAGE_TEXTS = {"weiter", "nächste", "nächste seite", "next", "next page", "›", "»", ">"}
+
+PRIORITY_SEED = 10
+PRIORITY_DETAIL = 5
+PRIORITY_PAGINATION = 1
+
+DetailItems = List[Tuple[str, str, ScrapedContent]]
+
+
+@dataclass
+class CrawlRules:
+    """
+    Regeln für die Link-Expansion.
+
+    Args:
+        detail_pattern: Regex (auf den Pfad) für Detailseiten
+        listing_pattern: Optionaler Regex (auf Pfad+Query) für weitere Listing-Seiten;
+            ohne Pattern zählen nur rel="next"/"Weiter"-Links als Paginierung
+        same_host_only: Nur Links auf dem Host der Listing-Seite folgen
+        max_depth: Maximale Paginierungstiefe ab Seed
+    """
+    detail_pattern: str = DEFAULT_DETAIL_PATTERN
+    listing_pattern: Optional[str] = None
+    same_host_only: bool = True
+    max_depth: int = 50
+    _detail_re: Optional[Pattern] = field(default=None, init=False, repr=False)
+    _listing_re: Optional[Pattern] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self._detail_re = re.compile(self.detail_pattern, re.I)
+        self._listing_re = re.compile(self.listing_pattern, re.I) if self.listing_pattern else None
+
+    def is_detail(self, url: str) -> bool:
+        return bool(self._detail_re.search(urlparse(url).path))
+
+    def is_listing(self, url: str) -> bool:
+        if self._listing_re is None:
+            return False
+        parsed = urlparse(url)
+        return bool(self._listing_re.search(parsed.path + ("?" + parsed.query if parsed.query else "")))
+
+
+def extract_links(html, base_url: str, rules: CrawlRules) -> Tuple[List[str], List[str]]:
+    """
+    Zerlegt die Links einer Listing-Seite.
+
+    Returns:
+        (Detail-URLs, weitere Listing-URLs) - jeweils absolut, ohne Duplikate
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    base_host = urlparse(base_url).netloc.lower()
+    details: List[str] = []
+    listings: List[str] = []
+    seen = set()
+
+    candidates = [(tag.get('href'), tag) for tag in soup.find_all(['a', 'link'], href=True)]
+    for href, tag in candidates:
+        href = (href or "").strip()
+        if not href or href.startswith(('#', 'mailto:', 'tel:', 'javascript:')):
+            continue
+        absolute = urljoin(base_url, href).split('#', 1)[0]
+        parsed = urlparse(absolute)
+        if parsed.scheme not in ('http', 'https'):
+            continue
+        if rules.same_host_only and parsed.netloc.lower() != base_host:
+            continue
+        if absolute in seen:
+            continue
+
+        rel = {r.lower() for r in (tag.get('rel') or [])}
+        text = tag.get_text(" ", strip=True).lower() if tag.name == 'a' else ""
+        if 'next' in rel or text in NEXT_PAGE_TEXTS or rules.is_listing(absolute):
+            listings.append(absolute)
+            seen.add(absolute)
+        elif tag.name == 'a' and rules.is_detail(absolute):
+            details.append(absolute)
+            seen.add(absolute)
+
+    return details, listings
+
+
+@dataclass
+class CrawlStats:
+    """Zähler eines Crawl-Laufs"""
+    listings_fetched: int = 0
+    details_fetched: int = 0
+    details_discovered: int = 0
+    listings_discovered: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    analysed: int = 0
+    elapsed_ms: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class JobCrawler:
+    """
+    Crawlt Listing-Seiten und übergibt neue Detailseiten gebündelt an ``on_details``.
+
+    Args:
+        frontier: Persistente Frontier
+        rules: Link-Regeln (Detail-/Listing-Erkennung)
+        scraper: WebScraper für Detailseiten (nutzt HTTP-Cache + gepoolten Client)
+        max_concurrency: Gleichzeitige Abrufe insgesamt
+        detail_batch_size: Detailseiten pro ``on_details``-Aufruf
+        on_details: async Callback (Liste von (url, canonical_url, ScrapedContent)) → Anzahl analysiert
+        max_idle_wait_s: Lauf beenden, wenn die nächste fällige URL weiter in der Zukunft liegt
+    """
+
+    def __init__(
+        self,
+        frontier: CrawlFrontier,
+        rules: Optional[CrawlRules] = None,
+        scraper: Optional[WebScraper] = None,
+        max_concurrency: int = 8,
+        detail_batch_size: int = 8,
+        on_details: Optional[Callable[[DetailItems], Awaitable[int]]] = None,
+        max_idle_wait_s: float = 30.0,
+    ):
+        self.frontier = frontier
+        self.rules = rules or CrawlRules()
+        self.scraper = scraper or WebScraper(use_playwright=False)
+        self.max_concurrency = max(1, max_concurrency)
+        self.detail_batch_size = max(1, detail_batch_size)
+        self.on_details = on_details
+        self.max_idle_wait_s = max_idle_wait_s
+        self._pending_details: DetailItems = []
+
+    async def run(self, seeds: Iterable[str], max_fetches: Optional[int] = None,
+                  listing_recrawl_after_s: float = 12 * 3600) -> CrawlStats:
+        """
+        Ein Crawl-Lauf: Seeds einplanen, Frontier abarbeiten bis leer, Budget
+        erschöpft oder nur noch Retries in ferner Zukunft offen sind.
+        """
+        start = time.monotonic()
+        stats = CrawlStats()
+        seeds = [s for s in seeds if s and s.strip()]
+        self.frontier.add_many(seeds, KIND_LISTING, priority=PRIORITY_SEED)
+        self.frontier.reschedule(seeds, KIND_LISTING, older_than_s=listing_recrawl_after_s, priority=PRIORITY_SEED)
+        logger.info(f"🕷️ Crawl startet: {len(seeds)} Seeds, Frontier {self.frontier.stats()}")
+
+        claimed = 0
+        in_flight = set()
+        while True:
+            free = self.max_concurrency - len(in_flight)
+            if max_fetches is not None:
+                free = min(free, max_fetches - claimed)
+            if free > 0:
+                for item in self.frontier.claim(free):
+                    in_flight.add(asyncio.create_task(self._process(item, stats)))
+                    claimed += 1
+
+            if not in_flight:
+                due = self.frontier.next_due_at()
+                budget_left = max_fetches is None or claimed < max_fetches
+                if due is None or not budget_left:
+                    break
+                wait = due - time.time()
+                if wait > self.max_idle_wait_s:
+                    logger.info(f"⏸️ Nächste fällige URL erst in {wait:.0f}s - Lauf endet (Stand bleibt in der Frontier)")
+                    break
+                await asyncio.sleep(min(max(wait, 0.01), 1.0))
+                continue
+
+            # Kurzes Polling, damit frei werdende Hosts zügig neue Claims bekommen
+            _, in_flight = await asyncio.wait(in_flight, timeout=0.2, return_when=asyncio.FIRST_COMPLETED)
+            if len(self._pending_details) >= self.detail_batch_size:
+                stats.analysed += await self._flush_details()
+
+        stats.analysed += await self._flush_details()
+        stats.elapsed_ms = int((time.monotonic() - start) * 1000)
+        logger.info(f"✅ Crawl fertig: {stats.to_dict()}")
+        return stats
+
+    async def _process(self, item: FrontierItem, stats: CrawlStats) -> None:
+        try:
+            if item.kind == KIND_LISTING:
+                await self._process_listing(item, stats)
+            else:
+                await self._process_detail(item, stats)
+        except Exception as e:
+            logger.error(f"❌ Crawl-Fehler bei {item.canonical_url}: {e}", exc_info=True)
+            self.frontier.fail(item.canonical_url, f"{type(e).__name__}: {e}")
+            stats.failed += 1
+
+    async def _process_listing(self, item: FrontierItem, stats: CrawlStats) -> None:
+        fetched = await get_async_http_client().fetch(item.canonical_url)
+        if not fetched.ok:
+            self._fail(item, fetched.error or f"HTTP {fetched.status}", fetched.status, stats)
+            return
+
+        details, listings = extract_links(fetched.body, fetched.final_url or item.canonical_url, self.rules)
+        new_details = self.frontier.add_many(details, KIND_DETAIL, priority=PRIORITY_DETAIL,
+                                             depth=item.depth + 1, parent_url=item.canonical_url)
+        new_listings = 0
+        if item.depth < self.rules.max_depth:
+            new_listings = self.frontier.add_many(listings, KIND_LISTING, priority=PRIORITY_PAGINATION,
+                                                  depth=item.depth + 1, parent_url=item.canonical_url)
+        self.frontier.complete(item.canonical_url, hashlib.sha256(fetched.body).hexdigest())
+
+        stats.listings_fetched += 1
+        stats.details_discovered += new_details
+        stats.listings_discovered += new_listings
+        logger.info(f"📄 Listing {item.canonical_url}: {len(details)} Details ({new_details} neu), "
+                    f"{new_listings} neue Listing-Seiten")
+
+    async def _process_detail(self, item: FrontierItem, stats: CrawlStats) -> None:
+        content = await self.scraper.scrape_async(item.canonical_url)
+        if not content.text:
+            error = "; ".join(content.warnings) or f"HTTP {content.http_status}"
+            self._fail(item, error, content.http_status, stats)
+            return
+
+        self.frontier.complete(item.canonical_url, content.content_sha256)
+        stats.details_fetched += 1
+        stats.unchanged += int(content.unchanged)
+        self._pending_details.append((item.url, item.canonical_url, content))
+
+    def _fail(self, item: FrontierItem, error: str, status: int, stats: CrawlStats) -> None:
+        # Retry nur bei vorübergehenden Fehlern (Netzwerk, 429, 5xx)
+        retry = (status == 0 and "robots.txt" not in error) or status == 429 or status >= 500
+        state = self.frontier.fail(item.canonical_url, error, retry=retry)
+        stats.failed += 1
+        logger.warning(f"⚠️ {item.kind} {item.canonical_url}: {error} → {state}")
+
+    async def _flush_details(self) -> int:
+        batch, self._pending_details = self._pending_details, []
+        if not batch or self.on_details is None:
+            return 0
+        try:
+            return await self.on_details(batch)
+        except Exception as e:
+            logger.error(f"❌ Analyse von {len(batch)} gecrawlten Postings fehlgeschlagen: {e}", exc_info=True)
+            return 0
@@ -31,9 +31,11 @@ class ScrapedContent:
     company: Optional[str]
     text: str
     http_status: int
-    render_engine: str  # "requests" | "playwright"
+    render_engine: str  # "requests" | "httpx" | "playwright" | "cache"
     latency_ms: int
     warnings: list
+    content_sha256: Optional[str] = None  # SHA-256 des extrahierten Texts
+    unchanged: bool = False  # Inhalt seit letztem Abruf unverändert (HTTP-Cache)
     
 
 class WebScraper:
@@ -56,9 +58,25 @@ class WebScraper:
     MAX_HTML_BYTES = 1024 * 1024  # max. 1 MB HTML einlesen
     MAX_TOTAL_MS = 8000           # max. Gesamtzeit für requests-Scrape
     
+    # Geteilte requests-Session (Keep-Alive) für alle Instanzen
+    _session = None
+    
     def __init__(self, use_playwright: bool = True):
         self.use_playwright = use_playwright
         self._playwright_browser = None
+    
+    @classmethod
+    def _get_session(cls):
+        """requests.Session mit Connection-Pool (kein Handshake pro URL)"""
+        if cls._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            cls._session = session
+        return cls._session
         
     def normalize_url(self, url: str) -> str:
         """
@@ -128,10 +146,7 @@ class WebScraper:
                     )
     
     def _scrape_with_requests(self, url: str, warnings: list) -> ScrapedContent:
-        """Statisches Scraping mit requests + BeautifulSoup"""
-        import requests
-        from bs4 import BeautifulSoup
-        
+        """Statisches Scraping mit requests (geteilte Session) + BeautifulSoup"""
         start_ms = int(time.time() * 1000)
         
         headers = {
@@ -141,7 +156,7 @@ class WebScraper:
         }
         
         # Streamed Download mit Byte-Grenze
-        response = requests.get(url, timeout=self.REQUEST_TIMEOUT, headers=headers, stream=True)
+        response = self._get_session().get(url, timeout=self.REQUEST_TIMEOUT, headers=headers, stream=True)
         response.raise_for_status()
         
         # Lese maximal MAX_HTML_BYTES, um riesige Seiten zu vermeiden
@@ -163,6 +178,94 @@ class WebScraper:
         html = b''.join(chunks)
         
         latency_ms = int(time.time() * 1000) - start_ms
+        return self._build_content(url, html, response.status_code, latency_ms, warnings)
+    
+    async def scrape_async(self, url: str, use_cache: bool = True, http_cache=None) -> ScrapedContent:
+        """
+        Statisches Scraping über den gepoolten AsyncHttpClient
+        (Keep-Alive, Host-Limits, robots.txt, gleiche Byte-/Zeitbudgets).
+        Fehler liefern ein leeres Ergebnis mit Warnungen statt Exceptions.
+        
+        Mit HTTP-Cache: Revalidierung per If-None-Match/If-Modified-Since;
+        bei 304 oder gleichem Body-/Text-Hash ist ``unchanged=True``.
+        """
+        from app.infrastructure.crawling.async_http_client import get_async_http_client
+        from app.infrastructure.cache.http_cache import HttpCacheEntry, get_http_cache, sha256_bytes, sha256_text
+        
+        canonical_url = self.normalize_url(url)
+        cache = (http_cache or get_http_cache()) if use_cache else None
+        cached = cache.get(canonical_url) if cache is not None else None
+        
+        fetched = await get_async_http_client().fetch(
+            canonical_url, headers=cached.conditional_headers() if cached else None
+        )
+        warnings = list(fetched.warnings)
+        etag = fetched.headers.get('etag')
+        last_modified = fetched.headers.get('last-modified')
+        
+        if cached is not None and fetched.status == 304:
+            cache.mark_validated(cached, etag, last_modified)
+            return self._content_from_cache(cached, fetched.elapsed_ms, warnings)
+        
+        if not fetched.ok:
+            warnings.append(f"requests fehlgeschlagen: {fetched.error or f'HTTP {fetched.status}'}")
+            return ScrapedContent(
+                url=canonical_url,
+                canonical_url=canonical_url,
+                title=None,
+                company=None,
+                text="",
+                http_status=fetched.status,
+                render_engine='httpx',
+                latency_ms=fetched.elapsed_ms,
+                warnings=warnings
+            )
+        
+        body_sha256 = sha256_bytes(fetched.body)
+        if cached is not None and cached.body_sha256 == body_sha256:
+            # Server ohne Validatoren, Body identisch → kein erneutes Parsing
+            cache.mark_validated(cached, etag, last_modified)
+            return self._content_from_cache(cached, fetched.elapsed_ms, warnings)
+        
+        content = self._build_content(canonical_url, fetched.body, fetched.status, fetched.elapsed_ms, warnings)
+        content.render_engine = 'httpx'
+        content.content_sha256 = sha256_text(content.text)
+        content.unchanged = cached is not None and cached.text_sha256 == content.content_sha256
+        
+        if cache is not None and not fetched.truncated and len(content.text) >= self.MIN_TEXT_LENGTH:
+            cache.put(HttpCacheEntry(
+                canonical_url=canonical_url,
+                body_sha256=body_sha256,
+                text_sha256=content.content_sha256,
+                text=content.text,
+                title=content.title,
+                company=content.company,
+                http_status=fetched.status,
+                etag=etag,
+                last_modified=last_modified,
+                fetched_at=cached.fetched_at if content.unchanged else time.time(),
+            ))
+        return content
+    
+    def _content_from_cache(self, cached, latency_ms: int, warnings: list) -> ScrapedContent:
+        """ScrapedContent aus einem revalidierten Cache-Eintrag"""
+        return ScrapedContent(
+            url=cached.canonical_url,
+            canonical_url=cached.canonical_url,
+            title=cached.title,
+            company=cached.company,
+            text=cached.text,
+            http_status=cached.http_status,
+            render_engine='cache',
+            latency_ms=latency_ms,
+            warnings=warnings,
+            content_sha256=cached.text_sha256,
+            unchanged=True
+        )
+    
+    def _build_content(self, url: str, html: bytes, http_status: int, latency_ms: int, warnings: list) -> ScrapedContent:
+        """HTML → ScrapedContent (Cleansing, Titel, Firma)"""
+        from bs4 import BeautifulSoup
         
         # Parse HTML
         try:
@@ -198,7 +301,7 @@ class WebScraper:
             title=title,
             company=company,
             text=text,
-            http_status=response.status_code,
+            http_status=http_status,
             render_engine='requests',
             latency_ms=latency_ms,
             warnings=warnings
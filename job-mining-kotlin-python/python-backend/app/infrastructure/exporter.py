@@ -1,11 +1,34 @@
 import json
+import logging
 import os
+import sqlite3
+import threading
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 from app.domain.models import AnalysisResultDTO
+from app.infrastructure.metrics import stage_timer
+from app.infrastructure.results_store import get_results_store, results_store_enabled
+
+logger = logging.getLogger(__name__)
 
 EXPORT_DIR = Path(os.getenv('BATCH_RESULTS_DIR', 'data/exports/batch_results'))
+SUMMARY_FILE = 'summary.json'
+SUMMARY_DB = 'summary.sqlite3'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summary_items (
+    raw_text_hash TEXT PRIMARY KEY,
+    file_name TEXT NOT NULL,
+    skills INTEGER NOT NULL,
+    counted INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS summary_counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO summary_counters (name, value) VALUES ('processed', 0), ('skills_total', 0);
+"""
 
 
 def ensure_dir() -> None:
@@ -19,31 +42,188 @@ def _filename_for(result: AnalysisResultDTO) -> str:
     return f"{safe[:60]}_{result.raw_text_hash[:16]}.json"
 
 
+class SummaryStore:
+    """
+    Inkrementelle Summary-Zähler (SQLite, eine Zeile pro raw_text_hash).
+
+    Jeder ``record`` läuft in einer Transaktion: Zähler werden um die Differenz
+    zum bisherigen Eintrag desselben Hashs angepasst - Überschreiben zählt nicht doppelt.
+    Near-Duplicates (``counted=False``) werden geführt, zählen aber nicht mit.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(summary_items)")}
+            if 'counted' not in columns:
+                self._conn.execute("ALTER TABLE summary_items ADD COLUMN counted INTEGER NOT NULL DEFAULT 1")
+
+    def record(self, raw_text_hash: str, file_name: str, skills: int, counted: bool = True) -> Optional[str]:
+        """
+        Trägt ein Ergebnis ein bzw. aktualisiert es.
+
+        Args:
+            counted: False für Near-Duplicates (weder in processed noch in skills_total)
+
+        Returns:
+            Bisheriger Dateiname, falls sich dieser geändert hat (sonst None)
+        """
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT file_name, skills, counted FROM summary_items WHERE raw_text_hash = ?",
+                                   (raw_text_hash,)).fetchone()
+                conn.execute("INSERT OR REPLACE INTO summary_items (raw_text_hash, file_name, skills, counted) "
+                             "VALUES (?, ?, ?, ?)", (raw_text_hash, file_name, skills, int(counted)))
+                old_counted = row[2] if row else 0
+                old_skills = row[1] if old_counted else 0
+                conn.execute("UPDATE summary_counters SET value = value + ? WHERE name = 'processed'",
+                             (int(counted) - old_counted,))
+                conn.execute("UPDATE summary_counters SET value = value + ? WHERE name = 'skills_total'",
+                             ((skills if counted else 0) - old_skills,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        if row and row[0] != file_name:
+            return row[0]
+        return None
+
+    def replace_all(self, items: List[tuple]) -> None:
+        """Ersetzt den kompletten Stand (Reparatur) - Items: (raw_text_hash, file_name, skills, counted)"""
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM summary_items")
+                conn.executemany("INSERT OR REPLACE INTO summary_items (raw_text_hash, file_name, skills, counted) "
+                                 "VALUES (?, ?, ?, ?)", items)
+                conn.execute("UPDATE summary_counters SET value = "
+                             "(SELECT COUNT(*) FROM summary_items WHERE counted = 1) WHERE name = 'processed'")
+                conn.execute("UPDATE summary_counters SET value = "
+                             "(SELECT COALESCE(SUM(skills), 0) FROM summary_items WHERE counted = 1) "
+                             "WHERE name = 'skills_total'")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def summary(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT name, value FROM summary_counters").fetchall()
+        counters = dict(rows)
+        return {
+            'processed': counters.get('processed', 0),
+            'skills_total': counters.get('skills_total', 0),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_stores: Dict[str, SummaryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_summary_store() -> SummaryStore:
+    """Summary-Store des aktuellen Export-Verzeichnisses (eine Instanz pro Pfad)"""
+    ensure_dir()
+    db_path = EXPORT_DIR / SUMMARY_DB
+    with _stores_lock:
+        store = _stores.get(str(db_path))
+        if store is None:
+            store = SummaryStore(db_path)
+            _stores[str(db_path)] = store
+        return store
+
+
+def _write_summary(summary: Dict[str, int]) -> Path:
+    out = EXPORT_DIR / SUMMARY_FILE
+    tmp = out.with_suffix('.json.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, out)
+    return out
+
+
+def _write_result_file(result: AnalysisResultDTO, data: Dict) -> str:
+    file_name = _filename_for(result)
+    with open(EXPORT_DIR / file_name, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return file_name
+
+
+def _record_summary(result: AnalysisResultDTO, file_name: str, counted: bool) -> None:
+    previous = get_summary_store().record(result.raw_text_hash, file_name, len(result.competences or []), counted)
+    if previous:
+        # Gleicher Text, neuer Titel → alte Datei würde beim Reporting doppelt zählen
+        (EXPORT_DIR / previous).unlink(missing_ok=True)
+
+
 def save_result(result: AnalysisResultDTO) -> Path:
+    """Schreibt das Ergebnis als JSON, in den Results-Store und aktualisiert die Summary inkrementell."""
+    return save_results([result])[0]
+
+
+def save_results(results: List[AnalysisResultDTO]) -> List[Path]:
+    """Wie ``save_result`` für mehrere Ergebnisse; der Results-Store schreibt alle in einer Transaktion."""
     ensure_dir()
-    out_path = EXPORT_DIR / _filename_for(result)
-    with open(out_path, 'w', encoding='utf-8') as f:
-        json.dump(result.model_dump(), f, ensure_ascii=False, indent=2)
-    return out_path
+    with stage_timer("export"):
+        datas = [result.dict() for result in results]
+        file_names = [_write_result_file(result, data) for result, data in zip(results, datas)]
+        duplicates = {result.raw_text_hash for result in results if result.duplicate_of}
+        if results_store_enabled() and datas:
+            store = get_results_store()
+            store.upsert_many(datas, file_names)
+            # Der Store entscheidet über Near-Duplicates (auch ohne duplicate_of im Ergebnis)
+            duplicates = store.duplicate_keys([result.raw_text_hash for result in results])
+        for result, file_name in zip(results, file_names):
+            _record_summary(result, file_name, result.raw_text_hash not in duplicates)
+        _write_summary(get_summary_store().summary())
+    return [EXPORT_DIR / name for name in file_names]
 
 
 def rebuild_summary() -> Path:
+    """
+    Reparatur: Liest alle Export-Dateien neu ein und setzt den Summary-Store zurück.
+
+    Im normalen Betrieb nicht nötig - ``save_result`` pflegt die Zähler selbst.
+    """
     ensure_dir()
-    jobs = list(EXPORT_DIR.glob('*.json'))
-    processed = 0
-    skills_total = 0
-    for p in jobs:
+    items: Dict[str, tuple] = {}
+    for p in EXPORT_DIR.glob('*.json'):
+        if p.name == SUMMARY_FILE:
+            continue
         try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            processed += 1
-            skills_total += len(data.get('competences', []))
+            with open(p, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         except Exception:
             continue
-    summary = {
-        'processed': processed,
-        'skills_total': skills_total,
-    }
-    out = EXPORT_DIR / 'summary.json'
-    with open(out, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, ensure_ascii=False, indent=2)
-    return out
+        key = data.get('raw_text_hash') or p.stem
+        items[key] = (key, p.name, len(data.get('competences', [])), int(not data.get('duplicate_of')))
+
+    if results_store_enabled() and items:
+        # Verknüpfung durch den Store steht nicht in jeder Export-Datei
+        duplicates = get_results_store().duplicate_keys(items)
+        items = {key: item[:3] + (0 if key in duplicates else item[3],) for key, item in items.items()}
+
+    store = get_summary_store()
+    store.replace_all(list(items.values()))
+    summary = store.summary()
+    logger.info(f"🔧 Summary neu aufgebaut: {summary}")
+    path = _write_summary(summary)
+    if results_store_enabled():
+        # Gecachte dashboard-metrics und ETags hängen am Datenstand des Results-Stores
+        get_results_store().touch_data_version()
+    return path
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    print(rebuild_summary())
@@ -1,12 +1,13 @@
 import os
-import tempfile
 import logging
 from typing import BinaryIO, Optional
-from pypdf import PdfReader
-from docx import Document
 
 # Korrekter Import des Interfaces
 from app.interfaces.interfaces import ITextExtractor
+from app.infrastructure.cache.text_cache import ExtractedTextCache, get_text_cache, sha256_stream
+from app.infrastructure.extractor.docx_engine import DocxEngine, get_docx_engine
+from app.infrastructure.extractor.pdf_extraction_engine import PdfExtractionEngine
+from app.infrastructure.extractor.ocr_pipeline import OcrPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -16,40 +17,56 @@ class AdvancedTextExtractor(ITextExtractor):
     Kennt keine Business-Logik, nur Dateiformate.
     """
 
+    def __init__(
+        self,
+        pdf_engine: Optional[PdfExtractionEngine] = None,
+        ocr_pipeline: Optional[OcrPipeline] = None,
+        text_cache: Optional[ExtractedTextCache] = None,
+        docx_engine: Optional[DocxEngine] = None,
+    ):
+        self.pdf_engine = pdf_engine or PdfExtractionEngine()
+        self.docx_engine = docx_engine or get_docx_engine()
+        self.ocr_pipeline = ocr_pipeline or OcrPipeline()
+        self.text_cache = text_cache if text_cache is not None else get_text_cache()
+
     def extract_text(self, file_stream: BinaryIO, filename: str) -> str:
         """
         Hauptmethode: Entscheidet anhand der Dateiendung, welcher Parser genutzt wird.
+        Identische Bytes werden nur einmal geparst (Text-Cache über SHA-256).
         """
-        # Sicherheitsnetz: Stream auf Anfang setzen
-        file_stream.seek(0)
-
         # Dateiendung normalisieren (kleingeschrieben)
         file_ext = os.path.splitext(filename)[1].lower()
 
+        if self.text_cache is None:
+            file_stream.seek(0)
+            return self._extract_by_type(file_stream, filename, file_ext)
+
+        digest = sha256_stream(file_stream)
+        namespace = f"extractor{file_ext or '.bin'}"
+        cached = self.text_cache.get(digest, namespace)
+        if cached is not None:
+            logger.info(f"✅ Text-Cache Treffer für {filename} ({len(cached['text'])} Zeichen)")
+            return cached['text']
+
+        text = self._extract_by_type(file_stream, filename, file_ext)
+        if text and text.strip():
+            self.text_cache.put(digest, namespace, text, {'filename': filename, 'chars': len(text)})
+        return text
+
+    def _extract_by_type(self, file_stream: BinaryIO, filename: str, file_ext: str) -> str:
+        """Parser-Auswahl anhand der Dateiendung (ohne Cache)."""
+        # Sicherheitsnetz: Stream auf Anfang setzen
+        file_stream.seek(0)
+
         try:
             if file_ext == '.pdf':
                 return self._extract_from_pdf(file_stream, filename)
             elif file_ext == '.docx':
                 return self._extract_from_docx(file_stream)
             elif file_ext in ['.jpg', '.jpeg', '.png']:
-                # ✅ BEST PRACTICE: Screenshot/Bild-Support via OCR
-                # Speichere Stream temporär für Bild-OCR
+                # ✅ BEST PRACTICE: Screenshot/Bild-Support via OCR (gecacht, ohne Temp-Datei)
                 try:
-                    with tempfile.NamedTemporaryFile(mode='wb', suffix=file_ext, delete=False) as tmp_file:
-                        file_stream.seek(0)
-                        tmp_file.write(file_stream.read())
-                        tmp_path = tmp_file.name
-
-                    # Bild-OCR
-                    text = self._extract_from_image(tmp_path)
-
-                    # Cleanup
-                    try:
-                        os.unlink(tmp_path)
-                    except:
-                        pass
-
-                    return text
+                    return self.ocr_pipeline.ocr_image(file_stream)
                 except Exception as img_e:
                     logger.error(f"Bild-Extraktion fehlgeschlagen für {filename}: {img_e}")
                     return ""
@@ -69,7 +86,8 @@ class AdvancedTextExtractor(ITextExtractor):
         ✅ BEST PRACTICE: Multi-Methode PDF-Extraktion mit OCR Fallback
 
         Extraction-Kette:
-        1. pypdf (PdfReader) - Schnellste Methode
+        1. PdfExtractionEngine - pdftotext (falls vorhanden) oder pypdf,
+           seitenparallel mit Zeitlimit pro Seite
         2. pdfminer.six - Alternative bei Problemen
         3. OCR (pytesseract) - Fallback für gescannte PDFs
 
@@ -80,16 +98,9 @@ class AdvancedTextExtractor(ITextExtractor):
         Returns:
             Extrahierter Text
         """
-        text_parts = []
         try:
-            # METHODE 1: pypdf (Standard)
-            reader = PdfReader(file_stream)
-            for page in reader.pages:
-                content = page.extract_text()
-                if content:
-                    text_parts.append(content)
-
-            extracted_text = "\n".join(text_parts)
+            # METHODE 1: PdfExtractionEngine (pdftotext / pypdf, seitenparallel)
+            extracted_text = self.pdf_engine.extract(file_stream).text
 
             # ✅ BEST PRACTICE: Fallback bei zu kurzem Text (< 100 Zeichen)
             if len(extracted_text.strip()) < 100:
@@ -110,22 +121,8 @@ class AdvancedTextExtractor(ITextExtractor):
                 if len(extracted_text.strip()) < 100:
                     logger.warning(f"⚠️ Text immer noch zu kurz, versuche OCR Fallback")
 
-                    # Speichere Stream temporär für OCR
                     try:
-                        with tempfile.NamedTemporaryFile(mode='wb', suffix='.pdf', delete=False) as tmp_file:
-                            file_stream.seek(0)
-                            tmp_file.write(file_stream.read())
-                            tmp_path = tmp_file.name
-
-                        # OCR Extraktion
-                        ocr_text = self._perform_ocr_fallback(tmp_path)
-
-                        # Cleanup
-                        try:
-                            os.unlink(tmp_path)
-                        except:
-                            pass
-
+                        ocr_text = self._perform_ocr_fallback(file_stream)
                         if ocr_text and len(ocr_text.strip()) > len(extracted_text.strip()):
                             logger.info(f"✅ OCR-Fallback erfolgreich: {len(ocr_text)} Zeichen")
                             return ocr_text
@@ -140,64 +137,28 @@ class AdvancedTextExtractor(ITextExtractor):
             return ""
 
     def _extract_from_docx(self, file_stream: BinaryIO) -> str:
-        text_parts = []
+        """DOCX direkt aus dem Stream (DocxEngine: Pandoc stdin oder XML-Streaming)."""
         try:
-            document = Document(file_stream)
-            for para in document.paragraphs:
-                if para.text:
-                    text_parts.append(para.text)
-            return "\n".join(text_parts)
+            return self.docx_engine.extract(file_stream).text
         except Exception as e:
-            print(f"❌ DOCX-Parsing Fehler: {e}")
+            logger.error(f"❌ DOCX-Parsing Fehler: {e}")
             return ""
 
-    def _perform_ocr_fallback(self, file_path: str) -> str:
+    def _perform_ocr_fallback(self, source) -> str:
         """
-        ✅ BEST PRACTICE: OCR Fallback für gescannte PDFs und Screenshots
+        ✅ BEST PRACTICE: OCR Fallback für gescannte PDFs
 
-        Verwendet pdf2image + pytesseract für Text-Extraktion aus Bildern.
-        Wichtig für:
-        - Gescannte PDFs (ohne Text-Layer)
-        - Screenshots von Job-Portalen
-        - Alte PDF-Archive
+        Delegiert an die OcrPipeline: lazy Rasterung mit adaptiver DPI,
+        parallele Seiten, Early-Stop und Seiten-Cache.
 
         Args:
-            file_path: Pfad zur Datei (PDF oder Bild)
+            source: PDF als Pfad oder BinaryIO
 
         Returns:
             Extrahierter Text via OCR oder leerer String bei Fehler
         """
         try:
-            from pdf2image import convert_from_path
-            import pytesseract
-        except ImportError as e:
-            logger.warning(f"OCR-Bibliotheken nicht verfügbar: {e}")
-            logger.warning("Install: pip install pdf2image pytesseract")
-            logger.warning("System: apt-get install tesseract-ocr tesseract-ocr-deu poppler-utils")
-            return ""
-
-        try:
-            logger.info(f"🔍 OCR Fallback für: {file_path}")
-
-            # Konvertiere PDF/Bild zu Bildern
-            images = convert_from_path(file_path, dpi=200)
-
-            text_parts = []
-            for i, image in enumerate(images[:20], 1):  # Max 20 Seiten für Performance
-                try:
-                    # Tesseract mit deutschem Sprachpaket
-                    page_text = pytesseract.image_to_string(image, lang='deu')
-                    if page_text.strip():
-                        text_parts.append(page_text)
-                    logger.debug(f"   OCR Seite {i}: {len(page_text)} Zeichen")
-                except Exception as e:
-                    logger.warning(f"   OCR Seite {i} fehlgeschlagen: {e}")
-                    continue
-
-            full_text = "\n".join(text_parts)
-            logger.info(f"✅ OCR erfolgreich: {len(full_text)} Zeichen aus {len(images)} Seite(n)")
-            return full_text
-
+            return self.ocr_pipeline.ocr_pdf(source).text
         except Exception as e:
             logger.error(f"❌ OCR Fallback fehlgeschlagen: {e}")
             return ""
@@ -206,7 +167,7 @@ class AdvancedTextExtractor(ITextExtractor):
         """
         ✅ BEST PRACTICE: Direkte OCR-Extraktion für Bild-Dateien
 
-        Für Screenshots und Bilder von Job-Anzeigen.
+        Für Screenshots und Bilder von Job-Anzeigen (gecacht über Bild-Hash).
 
         Args:
             file_path: Pfad zum Bild (.jpg, .jpeg, .png)
@@ -214,22 +175,9 @@ class AdvancedTextExtractor(ITextExtractor):
         Returns:
             Extrahierter Text via OCR
         """
-        try:
-            import pytesseract
-            from PIL import Image
-        except ImportError as e:
-            logger.warning(f"OCR-Bibliotheken nicht verfügbar: {e}")
-            return ""
-
         try:
             logger.info(f"🖼️ Bild-OCR für: {file_path}")
-
-            image = Image.open(file_path)
-            text = pytesseract.image_to_string(image, lang='deu')
-
-            logger.info(f"✅ Bild-OCR erfolgreich: {len(text)} Zeichen")
-            return text
-
+            return self.ocr_pipeline.ocr_image(file_path)
         except Exception as e:
             logger.error(f"❌ Bild-OCR fehlgeschlagen: {e}")
             return ""
@@ -2,6 +2,7 @@ import spacy
 from typing import List, Optional
 from app.interfaces.interfaces import ICompetenceExtractor
 from app.domain.models import CompetenceDTO
+from app.infrastructure.metrics import count, stage_timer
 
 class CompetenceExtractor(ICompetenceExtractor):
     def __init__(self, spacy_ext, fuzzy_ext, discovery_ext, nlp_model=None):
@@ -22,18 +23,35 @@ class CompetenceExtractor(ICompetenceExtractor):
         """
         # Normalisiere auf ein spaCy Doc
         if isinstance(text_or_doc, str):
-            doc = self.nlp(text_or_doc)
+            with stage_timer("nlp_parse"):
+                doc = self.nlp(text_or_doc)
         else:
             doc = text_or_doc
 
         # Extraktion
-        results = self.spacy_ext.extract(doc)                     # Pass 1: Matcher (Ebene 2/4/5)
-        results += self.fuzzy_ext.extract_competences(doc.text)   # Pass 2: Fuzzy (Varianten)
-        results += self.discovery_ext.extract(doc)               # Pass 3: Discovery (Ebene 1)
+        with stage_timer("matcher"):
+            matched = list(self.spacy_ext.extract(doc))           # Pass 1: Matcher (Ebene 2/4/5)
+        with stage_timer("fuzzy"):
+            fuzzy = list(self.fuzzy_ext.extract_competences(doc.text))  # Pass 2: Fuzzy (Varianten)
+        with stage_timer("discovery"):
+            discovered = list(self.discovery_ext.extract(doc))    # Pass 3: Discovery (Ebene 1)
+        count("competence_matches_total", len(matched), source="matcher")
+        count("competence_matches_total", len(fuzzy), source="fuzzy")
+        count("competence_matches_total", len(discovered), source="discovery")
+        results = matched + fuzzy + discovered
 
         # Bereinigung und Typ-Sicherung
         return self._merge_and_level_check(results, role)
 
+    def extract_many(self, texts: List[str], roles: List[str], batch_size: int = 16) -> List[List[CompetenceDTO]]:
+        """Batch-Variante für viele Texte: Parsing über ``nlp.pipe`` statt einzelner ``nlp()``-Aufrufe.
+
+        Returns:
+            Eine Kompetenzliste pro Text (gleiche Reihenfolge wie ``texts``)
+        """
+        docs = self.nlp.pipe(texts, batch_size=batch_size)
+        return [self.extract(doc, role) for doc, role in zip(docs, roles)]
+
     def _merge_and_level_check(self, dtos: List[CompetenceDTO], role: str) -> List[CompetenceDTO]:
         seen_uris = set()
         merged = []
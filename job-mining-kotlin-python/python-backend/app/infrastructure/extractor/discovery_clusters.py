@@ -0,0 +1,201 @@
+"""
+Gruppierung von Discovery-Kandidaten: Schreibvarianten eines Begriffs als ein Cluster
+("Cloud-Plattformen" / "Cloudplattform" / "cloud plattform" → ein Review-Eintrag)
+
+- Normalisierung: klein, Umlaute gefaltet, ohne Bindestriche / Leerzeichen / Satzzeichen
+- MinHash (NumPy) über Zeichen-3-Gramme + LSH-Bänder: Kandidatenpaare nur aus gemeinsamen
+  Buckets, kein paarweiser Vergleich aller Begriffe
+- Verifikation der Bucket-Treffer mit RapidFuzz (``DISCOVERY_CLUSTER_MIN_SCORE``)
+- Inkrementell: neue Begriffe werden vorgemerkt und vor der nächsten Abfrage in Blöcken
+  eingeordnet; Cluster wachsen per Union, entfernte Begriffe verlassen ihr Cluster
+"""
+
+import logging
+import os
+import re
+import zlib
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+from rapidfuzz import fuzz
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 64
+BANDS = 16
+SHINGLE_SIZE = 3
+BATCH_SIZE = 2048
+CLUSTER_MIN_SCORE = float(os.getenv("DISCOVERY_CLUSTER_MIN_SCORE", "90"))
+
+_FOLD = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_NON_WORD = re.compile(r"[^0-9a-z+#]")
+
+
+def fold_term(term: str) -> str:
+    """Vergleichsform: klein, Umlaute gefaltet, nur Buchstaben/Ziffern (+ und # für C++/C#)"""
+    return _NON_WORD.sub("", str(term or "").lower().translate(_FOLD))
+
+
+def shingles(folded: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Zeichen-n-Gramme mit Rand-Markern (^ / $), damit Wortanfang und -ende mitzählen"""
+    padded = f"^{folded}$"
+    if len(padded) <= size:
+        return {padded}
+    return {padded[i:i + size] for i in range(len(padded) - size + 1)}
+
+
+class CandidateClusterer:
+    """
+    Inkrementelle Cluster über Begriffe (normalisierte Store-Terme).
+
+    Args:
+        num_perm: Anzahl MinHash-Funktionen
+        bands: LSH-Bänder (num_perm / bands Werte pro Band; mehr Bänder = mehr Kandidatenpaare)
+        min_score: RapidFuzz-Mindestähnlichkeit (0-100) der gefalteten Formen
+    """
+
+    def __init__(self, num_perm: int = NUM_PERM, bands: int = BANDS, min_score: float = CLUSTER_MIN_SCORE):
+        if num_perm % bands:
+            raise ValueError("num_perm muss durch bands teilbar sein")
+        self.rows = num_perm // bands
+        self.bands = bands
+        self.min_score = min_score
+        rng = np.random.default_rng(20240601)
+        # Multiply-Shift-Hashes: (a·h + b) mod 2^64, obere 32 Bit
+        self._a = rng.integers(1, 2 ** 63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+        # Fasst die Werte eines Bands zu einem 64-Bit-Bucket-Schlüssel zusammen
+        self._band_mix = rng.integers(1, 2 ** 63, self.rows, dtype=np.uint64) | np.uint64(1)
+
+        self._folded: Dict[str, str] = {}
+        self._band_keys: Dict[str, List[int]] = {}
+        self._buckets: List[Dict[int, Set[str]]] = [{} for _ in range(bands)]
+        self._cluster_of: Dict[str, int] = {}
+        self._members: Dict[int, Set[str]] = {}
+        self._next_id = 0
+        self._pending: Dict[str, None] = {}
+        self._changed: Set[int] = set()
+
+    # ------------------------------------------------------------------
+    # Änderungen
+    # ------------------------------------------------------------------
+
+    def add(self, term: str) -> None:
+        """Merkt einen neuen Begriff vor (eingeordnet wird in ``process_pending``)"""
+        if term not in self._cluster_of:
+            self._pending[term] = None
+
+    def remove(self, term: str) -> None:
+        """Entfernt einen Begriff (Freigabe / Ignorieren); das restliche Cluster bleibt bestehen"""
+        if term in self._pending:
+            del self._pending[term]
+            return
+        cid = self._cluster_of.pop(term, None)
+        if cid is None:
+            return
+        members = self._members[cid]
+        members.discard(term)
+        if not members:
+            del self._members[cid]
+        self._changed.add(cid)
+        for band, key in zip(self._buckets, self._band_keys.pop(term)):
+            bucket = band[key]
+            bucket.discard(term)
+            if not bucket:
+                del band[key]
+        del self._folded[term]
+
+    def touch(self, term: str) -> None:
+        """Häufigkeit eines Begriffs hat sich geändert → Cluster-Zusammenfassung neu berechnen"""
+        cid = self._cluster_of.get(term)
+        if cid is not None:
+            self._changed.add(cid)
+
+    def process_pending(self) -> int:
+        """
+        Ordnet vorgemerkte Begriffe ein (blockweise MinHash, Bucket-Treffer per RapidFuzz prüfen).
+
+        Returns:
+            Anzahl eingeordneter Begriffe
+        """
+        terms = list(self._pending)
+        self._pending.clear()
+        for start in range(0, len(terms), BATCH_SIZE):
+            batch = terms[start:start + BATCH_SIZE]
+            folded = [fold_term(t) for t in batch]
+            for term, form, keys in zip(batch, folded, self._band_keys_for(folded)):
+                self._insert(term, form, keys)
+        if terms:
+            logger.debug(f"🧩 {len(terms)} Discovery-Begriffe eingeordnet ({len(self._members)} Cluster)")
+        return len(terms)
+
+    def _band_keys_for(self, folded: List[str]) -> List[List[int]]:
+        """MinHash-Signaturen eines Blocks (vektorisiert) → ein Bucket-Schlüssel pro Band"""
+        hashes: List[int] = []
+        offsets: List[int] = []
+        for form in folded:
+            offsets.append(len(hashes))
+            hashes.extend(zlib.crc32(s.encode("utf-8")) for s in shingles(form))
+        h = np.array(hashes, dtype=np.uint64)
+        values = (self._a[:, None] * h[None, :] + self._b[:, None]) >> np.uint64(32)
+        signatures = np.minimum.reduceat(values, offsets, axis=1).T
+        bands = signatures.reshape(len(folded), self.bands, self.rows)
+        return (bands * self._band_mix).sum(axis=2).tolist()
+
+    def _insert(self, term: str, form: str, keys: List[int]) -> None:
+        neighbours: Set[str] = set()
+        for band, key in zip(self._buckets, keys):
+            bucket = band.get(key)
+            if bucket:
+                neighbours.update(bucket)
+
+        cid = self._next_id
+        self._next_id += 1
+        self._members[cid] = {term}
+        self._cluster_of[term] = cid
+        self._folded[term] = form
+        self._band_keys[term] = keys
+        for band, key in zip(self._buckets, keys):
+            band.setdefault(key, set()).add(term)
+        self._changed.add(cid)
+
+        for other in neighbours:
+            if self._cluster_of[other] == self._cluster_of[term]:
+                continue
+            if fuzz.ratio(form, self._folded[other], score_cutoff=self.min_score):
+                self._merge(self._cluster_of[term], self._cluster_of[other])
+
+    def _merge(self, first: int, second: int) -> None:
+        # Kleineres Cluster in das größere umhängen
+        if len(self._members[first]) < len(self._members[second]):
+            first, second = second, first
+        moved = self._members.pop(second)
+        for term in moved:
+            self._cluster_of[term] = first
+        self._members[first].update(moved)
+        self._changed.update((first, second))
+
+    # ------------------------------------------------------------------
+    # Lesen
+    # ------------------------------------------------------------------
+
+    def cluster_of(self, term: str) -> Optional[int]:
+        return self._cluster_of.get(term)
+
+    def members(self, cid: int) -> Set[str]:
+        return self._members.get(cid, set())
+
+    def cluster_ids(self) -> List[int]:
+        return list(self._members)
+
+    def terms(self) -> List[str]:
+        """Alle bekannten Begriffe (eingeordnet + vorgemerkt)"""
+        return list(self._cluster_of) + list(self._pending)
+
+    def pop_changed(self) -> Set[int]:
+        """Seit dem letzten Aufruf geänderte (auch aufgelöste) Cluster-IDs"""
+        changed, self._changed = self._changed, set()
+        return changed
+
+    def __len__(self) -> int:
+        return len(self._members)
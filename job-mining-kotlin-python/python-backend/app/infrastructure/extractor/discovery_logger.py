@@ -1,8 +1,9 @@
-import json
 import os
 from pathlib import Path
 from typing import List, Dict
 
+from app.infrastructure.extractor.discovery_store import DiscoveryStore, get_discovery_store
+
 
 def _data_base_dir() -> Path:
     base = os.environ.get("BASE_DATA_DIR")
@@ -18,52 +19,11 @@ def _ensure_discovery_dir(base: Path) -> Path:
     return d
 
 
-def log_candidates(candidates: List[Dict]):
-    """Persistiert Kandidaten in /data/discovery/candidates.json (append + merge)."""
-    base = _data_base_dir()
-    ddir = _ensure_discovery_dir(base)
-    fpath = ddir / "candidates.json"
-    ignore_path = ddir / "ignore_skills.json"
-
-    existing: List[Dict] = []
-    if fpath.exists():
-        try:
-            existing = json.loads(fpath.read_text(encoding="utf-8")) or []
-        except Exception:
-            existing = []
-
-    # Merge nach Schlüssel (term + role)
-    index = {}
-    for item in existing:
-        key = (str(item.get("term", "")).lower().strip(), str(item.get("role", "")).lower().strip())
-        index[key] = item
-
-    # Ignorierte Begriffe laden
-    ignored = set()
-    if ignore_path.exists():
-        try:
-            ignored_list = json.loads(ignore_path.read_text(encoding="utf-8")) or []
-            ignored = {str(x).lower().strip() for x in ignored_list}
-        except Exception:
-            ignored = set()
+def get_store() -> DiscoveryStore:
+    """Discovery-Store für BASE_DATA_DIR/discovery"""
+    return get_discovery_store(_ensure_discovery_dir(_data_base_dir()))
 
-    for cand in candidates:
-        key = (str(cand.get("term", "")).lower().strip(), str(cand.get("role", "")).lower().strip())
-        # Überspringe ignorierte Begriffe
-        if key[0] in ignored:
-            continue
-        if key in index:
-            # Zähle Häufigkeit hoch
-            prev = index[key]
-            prev["count"] = int(prev.get("count", 0)) + int(cand.get("count", 1))
-        else:
-            # Minimalfelder garantieren
-            index[key] = {
-                "term": cand.get("term"),
-                "role": cand.get("role"),
-                "context": cand.get("context", ""),
-                "count": int(cand.get("count", 1))
-            }
 
-    merged = list(index.values())
-    fpath.write_text(json.dumps(merged, ensure_ascii=False, indent=2), encoding="utf-8")
+def log_candidates(candidates: List[Dict]):
+    """Persistiert Kandidaten: O(1)-Append ins Discovery-Log, candidates.json wird im Hintergrund kompaktiert."""
+    get_store().log_candidates(candidates)
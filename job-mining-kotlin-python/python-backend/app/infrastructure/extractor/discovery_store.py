@@ -0,0 +1,764 @@
+"""
+Discovery-Store: Kandidaten für neue Skills als Append-only-Ereignislog
+Ersetzt das Lesen, Mergen und Neuschreiben von candidates.json pro analysiertem Dokument.
+
+- ``candidates.log``: eine JSON-Zeile pro Dokument, O(1)-Append unter Datei-Sperre
+- ``candidates.json``: kompaktierter Snapshot (Format wie bisher, wird auch von der Kotlin-API gelesen)
+- Aggregation im Speicher: Snapshot + Log; Einträge anderer Prozesse werden ab dem
+  zuletzt gelesenen Log-Offset nachgelesen
+- Kompaktierung im Hintergrund (Log-Größe / Zeitintervall) und beim Beenden:
+  Snapshot atomar ersetzen, Log leeren
+- Freigaben/Ignorieren sind Log-Ereignisse (O(k) pro Aktion); approved_skills.json und
+  ignore_skills.json sind kompaktierte Snapshots (Kotlin-API, Extraktor) und werden nur bei
+  der Kompaktierung neu geschrieben. Von außen geänderte Dateien werden neu gelesen,
+  entfernt werden dann nur die neu ignorierten Begriffe
+- Review-Index: Sortierlisten (Häufigkeit / Begriff) + Term- und Rollen-Index für
+  Cursor-Pagination (``query``) und Freigabe/Ignorieren in O(k) (``remove_terms``)
+- Varianten-Cluster (MinHash/LSH + RapidFuzz, siehe discovery_clusters) für das Review
+  pro Cluster (``cluster_query`` / ``cluster_members``)
+"""
+
+import base64
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.infrastructure.extractor.discovery_clusters import CandidateClusterer
+
+try:
+    import fcntl
+except ImportError:  # Windows: nur prozessinterne Sperre
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "candidates.json"
+LOG_FILE = "candidates.log"
+LOCK_FILE = "candidates.lock"
+IGNORE_FILE = "ignore_skills.json"
+APPROVED_FILE = "approved_skills.json"
+
+COMPACT_LOG_BYTES = int(os.getenv("DISCOVERY_COMPACT_LOG_BYTES", str(4 * 1024 * 1024)))
+COMPACT_INTERVAL_SECONDS = float(os.getenv("DISCOVERY_COMPACT_INTERVAL_SECONDS", "60"))
+
+REVIEW_PAGE_LIMIT = 50
+REVIEW_MAX_LIMIT = 500
+REVIEW_SORTS = ("count", "term")
+DEFAULT_ENTITY_TYPE = "skill"
+
+CandidateKey = Tuple[str, str]
+
+
+def _norm(value: Any) -> str:
+    return str(value or "").lower().strip()
+
+
+def candidate_key(term: Any, role: Any) -> CandidateKey:
+    """Merge-Schlüssel wie bisher: (term, role) klein geschrieben, ohne Leerraum am Rand"""
+    return _norm(term), _norm(role)
+
+
+def encode_cursor(position: Tuple) -> str:
+    """Cursor = Sortierschlüssel des letzten gelieferten Eintrags (URL-sicher)"""
+    raw = json.dumps(list(position), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, shape: Tuple[type, ...]) -> Tuple:
+    """Cursor → Sortierschlüssel; ``shape``: erwartete Typen (passend zu Sortierung / Abfrage)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = tuple(json.loads(raw))
+    except Exception:
+        raise ValueError("Ungültiger Cursor")
+    if len(position) != len(shape) or not all(isinstance(v, t) for v, t in zip(position, shape)):
+        raise ValueError("Cursor passt nicht zur Abfrage")
+    return position
+
+
+class DiscoveryStore:
+    """
+    Discovery-Kandidaten eines Verzeichnisses (thread- und prozess-sicher).
+
+    Args:
+        directory: Discovery-Verzeichnis (candidates.json, ignore_skills.json, approved_skills.json)
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.snapshot_path = self.directory / SNAPSHOT_FILE
+        self.log_path = self.directory / LOG_FILE
+        self.lock_path = self.directory / LOCK_FILE
+        self.ignore_path = self.directory / IGNORE_FILE
+        self.approved_path = self.directory / APPROVED_FILE
+
+        self._lock = threading.RLock()
+        self._index: Dict[CandidateKey, Dict[str, Any]] = {}
+        # Review-Index: Term/Rolle → Schlüssel, Sortierlisten werden vor Abfragen nachgezogen
+        self._by_term: Dict[str, Set[CandidateKey]] = {}
+        self._by_role: Dict[str, Set[CandidateKey]] = {}
+        self._order_count: List[Tuple[int, str, str]] = []  # (-count, term, role)
+        self._order_term: List[CandidateKey] = []
+        self._order_built = False
+        self._stale: Dict[CandidateKey, Optional[int]] = {}  # Schlüssel → Count in _order_count
+        # Varianten-Cluster: Sortierliste (-Summe, Repräsentant) + Zusammenfassung pro Cluster-ID
+        self._clusterer = CandidateClusterer()
+        self._cluster_order: List[Tuple[int, str]] = []
+        self._cluster_info: Dict[int, Tuple[int, str]] = {}
+        self._clusters_built = False
+        self._snapshot_id: Optional[Tuple[int, int, int]] = None
+        self._log_offset = 0
+        self._loaded = False
+        # Review-Entscheidungen: Stand der JSON-Dateien + noch nicht kompaktierte Log-Ereignisse
+        self._ignored: Set[str] = set()
+        self._ignore_terms: Dict[str, str] = {}  # normalisiert → Schreibweise in ignore_skills.json
+        self._approved: Dict[str, str] = {}  # Begriff → Label (approved_skills.json)
+        self._pending_ignored: Dict[str, str] = {}
+        self._pending_approved: Dict[str, str] = {}
+        self._ignore_id: Optional[Tuple[int, int, int]] = None
+        self._approved_id: Optional[Tuple[int, int, int]] = None
+
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Sperren / Nachlesen
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool = True):
+        """Prozessübergreifende Sperre (flock auf candidates.lock), zusätzlich prozessintern"""
+        with self._lock:
+            with open(self.lock_path, "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _file_id(self, path: Path) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _read_json(self, path: Path, default: Any) -> Any:
+        try:
+            return json.loads(path.read_text(encoding="utf-8")) or default
+        except FileNotFoundError:
+            return default
+        except Exception as e:
+            logger.warning(f"⚠️ {path.name} nicht lesbar: {e}")
+            return default
+
+    def _refresh_decisions(self) -> None:
+        """
+        Liest ignore_skills.json / approved_skills.json nur, wenn sie von außen ersetzt wurden
+        (Kotlin-API, Kompaktierung eines anderen Prozesses). Noch nicht kompaktierte
+        Entscheidungen aus dem Log bleiben erhalten; entfernt werden nur neu ignorierte Begriffe.
+        """
+        ignore_id = self._file_id(self.ignore_path)
+        if ignore_id != self._ignore_id:
+            terms = {_norm(x): str(x) for x in self._read_json(self.ignore_path, []) if _norm(x)}
+            terms.update(self._pending_ignored)
+            added = [term for term in terms if term not in self._ignored]
+            self._ignore_terms, self._ignored = terms, set(terms)
+            self._ignore_id = ignore_id
+            for term in added:
+                self._drop_term(term)
+        approved_id = self._file_id(self.approved_path)
+        if approved_id != self._approved_id:
+            approved = self._read_json(self.approved_path, {})
+            self._approved = dict(approved) if isinstance(approved, dict) else {}
+            self._approved.update(self._pending_approved)
+            self._approved_id = approved_id
+
+    def _reset_index(self) -> None:
+        self._index, self._by_term, self._by_role = {}, {}, {}
+        self._order_built, self._stale = False, {}
+        self._clusters_built = False
+
+    def _load_snapshot(self) -> None:
+        self._reset_index()
+        try:
+            items = json.loads(self.snapshot_path.read_text(encoding="utf-8")) or []
+        except FileNotFoundError:
+            items = []
+        except Exception as e:
+            logger.warning(f"⚠️ {SNAPSHOT_FILE} nicht lesbar, starte leer: {e}")
+            items = []
+        for item in items:
+            if isinstance(item, dict) and _norm(item.get("term")) not in self._ignored:
+                self._add(item.get("term"), item.get("role"), item.get("context", ""), item.get("count", 1),
+                          item.get("entity_type"))
+        # Cluster bleiben erhalten (Kompaktierung eines anderen Prozesses ändert kaum Begriffe)
+        for term in self._clusterer.terms():
+            if term not in self._by_term:
+                self._clusterer.remove(term)
+        self._snapshot_id = self._file_id(self.snapshot_path)
+        self._log_offset = 0
+        # Das Log wird ab Offset 0 neu gelesen und liefert die offenen Entscheidungen erneut
+        self._pending_ignored, self._pending_approved = {}, {}
+
+    def _refresh(self) -> int:
+        """
+        Bringt die Aggregation auf den Stand der Dateien (nur unter Sperre aufrufen).
+        Snapshot ersetzt (Kompaktierung eines anderen Prozesses, Kotlin-API) → neu laden,
+        sonst nur neue Log-Zeilen ab dem letzten Offset lesen.
+
+        Returns:
+            Byte-Größe des Logs
+        """
+        self._refresh_decisions()
+        if not self._loaded or self._file_id(self.snapshot_path) != self._snapshot_id:
+            self._load_snapshot()
+            self._loaded = True
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(self._log_offset)
+                tail = f.read()
+        except FileNotFoundError:
+            return 0
+        # Nur vollständige Zeilen übernehmen (abgebrochener Append bleibt liegen)
+        end = tail.rfind(b"\n") + 1
+        for line in tail[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                logger.warning("⚠️ Unlesbare Zeile in candidates.log übersprungen")
+                continue
+            self._apply_event(event)
+        self._log_offset += end
+        return self._log_offset + (len(tail) - end)
+
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        # "r": entfernte Begriffe, "a": Freigaben {Begriff: Label}, "i": ignorierte Begriffe,
+        # "c": Kandidaten eines Dokuments
+        for term in event.get("r", []):
+            self._drop_term(_norm(term))
+        for term, label in event.get("a", {}).items():
+            self._drop_term(_norm(term))
+            self._approved[term] = self._pending_approved[term] = label
+        for term in event.get("i", []):
+            norm = _norm(term)
+            self._drop_term(norm)
+            self._ignored.add(norm)
+            self._ignore_terms.setdefault(norm, term)
+            self._pending_ignored.setdefault(norm, term)
+        for row in event.get("c", []):
+            term, role, context, count = row[:4]
+            if _norm(term) not in self._ignored:
+                self._add(term, role, context, count, row[4] if len(row) > 4 else None)
+
+    def _add(self, term: Any, role: Any, context: Any, count: Any, entity_type: Any = None) -> None:
+        key = candidate_key(term, role)
+        entry = self._index.get(key)
+        if entry is not None:
+            if self._order_built:
+                self._stale.setdefault(key, entry["count"])
+            entry["count"] = int(entry.get("count", 0)) + int(1 if count is None else count)
+        else:
+            if self._order_built:
+                self._stale.setdefault(key, None)
+            # Minimalfelder garantieren
+            entry = {"term": term, "role": role, "context": context or "",
+                     "count": int(1 if count is None else count)}
+            if entity_type and entity_type != DEFAULT_ENTITY_TYPE:
+                entry["entity_type"] = entity_type
+            self._index[key] = entry
+            if key[0] not in self._by_term:
+                self._clusterer.add(key[0])
+            self._by_term.setdefault(key[0], set()).add(key)
+            self._by_role.setdefault(key[1], set()).add(key)
+        self._clusterer.touch(key[0])
+
+    def _drop_term(self, term: str) -> List[Dict[str, Any]]:
+        """Entfernt alle Rollen-Einträge eines (normalisierten) Begriffs, O(Einträge des Begriffs)"""
+        removed = []
+        for key in self._by_term.pop(term, ()):
+            entry = self._index.pop(key)
+            if self._order_built:
+                self._stale.setdefault(key, entry["count"])
+            keys = self._by_role.get(key[1])
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_role[key[1]]
+            removed.append(entry)
+        if removed:
+            self._clusterer.remove(term)
+        return removed
+
+    def _sync_order(self) -> None:
+        """Zieht die Sortierlisten nach: wenige Änderungen per bisect, viele per Neusortierung"""
+        if self._order_built and len(self._stale) <= max(1000, len(self._index) // 20):
+            for key, old_count in self._stale.items():
+                if old_count is not None:
+                    pos = bisect.bisect_left(self._order_count, (-old_count, key[0], key[1]))
+                    del self._order_count[pos]
+                entry = self._index.get(key)
+                if entry is not None:
+                    bisect.insort(self._order_count, (-entry["count"], key[0], key[1]))
+                if (old_count is None) != (entry is None):
+                    pos = bisect.bisect_left(self._order_term, key)
+                    if entry is None:
+                        del self._order_term[pos]
+                    else:
+                        self._order_term.insert(pos, key)
+        else:
+            self._order_count = sorted((-entry["count"], key[0], key[1]) for key, entry in self._index.items())
+            self._order_term = sorted(self._index)
+            self._order_built = True
+        self._stale = {}
+
+    # ------------------------------------------------------------------
+    # Schreiben
+    # ------------------------------------------------------------------
+
+    def log_candidates(self, candidates: Iterable[Dict[str, Any]]) -> int:
+        """
+        Kandidaten eines Dokuments: eine Log-Zeile anhängen + Aggregation aktualisieren.
+        Ignorierte Begriffe werden übersprungen.
+
+        Returns:
+            Anzahl geloggter Kandidaten
+        """
+        with self._file_lock():
+            log_size = self._refresh()
+            rows = [
+                [c.get("term"), c.get("role"), c.get("context", ""), int(c.get("count", 1))]
+                + ([c["entity_type"]] if c.get("entity_type") not in (None, DEFAULT_ENTITY_TYPE) else [])
+                for c in candidates
+                if isinstance(c, dict) and _norm(c.get("term")) and _norm(c.get("term")) not in self._ignored
+            ]
+            if not rows:
+                return 0
+            self._append_locked({"c": rows}, log_size)
+            self._apply_event({"c": rows})
+        if self._log_offset >= COMPACT_LOG_BYTES:
+            self._request_compaction()
+        return len(rows)
+
+    def _append_locked(self, event: Dict[str, Any], log_size: int) -> None:
+        line = json.dumps({"t": round(time.time(), 3), **event}, ensure_ascii=False).encode("utf-8") + b"\n"
+        if log_size != self._log_offset:
+            # Abgebrochene letzte Zeile abschließen (wird beim Lesen übersprungen)
+            line = b"\n" + line
+        with open(self.log_path, "ab") as f:
+            f.write(line)
+        self._log_offset = log_size + len(line)
+
+    def remove_terms(self, terms: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Entfernt Kandidaten (alle Rollen) zu den Begriffen in O(k) über den Term-Index:
+        ein Entfernen-Ereignis im Log, der Snapshot folgt mit der nächsten regulären
+        Kompaktierung (sofort, wenn kein Kompaktierungs-Thread läuft).
+
+        Returns:
+            Entfernte Einträge
+        """
+        return self._review(terms, lambda removed: {"r": sorted({_norm(e["term"]) for e in removed})})
+
+    def approve_terms(self, terms: Iterable[str], canonical: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Gibt Kandidaten frei wie ``remove_terms``; die Freigaben (Begriff → Label) landen als
+        Ereignis im Log und mit der nächsten Kompaktierung in approved_skills.json.
+
+        Args:
+            canonical: normalisierter Begriff → Label (Cluster-Freigabe), sonst Label = Begriff
+
+        Returns:
+            Freigegebene Einträge
+        """
+        canonical = canonical or {}
+        return self._review(terms, lambda removed: {
+            "a": {e["term"]: canonical.get(_norm(e["term"]), e["term"]) for e in removed}
+        })
+
+    def ignore_terms(self, terms: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Ignoriert Kandidaten wie ``remove_terms``; die Begriffe landen als Ereignis im Log
+        und mit der nächsten Kompaktierung in ignore_skills.json.
+
+        Returns:
+            Ignorierte Einträge
+        """
+        return self._review(terms, lambda removed: {"i": list(dict.fromkeys(e["term"] for e in removed))})
+
+    def _review(self, terms: Iterable[str], make_event) -> List[Dict[str, Any]]:
+        wanted = {_norm(t) for t in terms} - {""}
+        with self._file_lock():
+            log_size = self._refresh()
+            removed = [entry for term in wanted for entry in self._drop_term(term)]
+            if removed:
+                event = make_event(removed)
+                self._append_locked(event, log_size)
+                self._apply_event(event)
+        if removed and not self._compactor_running():
+            self.compact()
+        return removed
+
+    def clear(self) -> None:
+        with self._file_lock():
+            self._refresh()
+            self._reset_index()
+            self._clusterer = CandidateClusterer()
+            self._compact_locked()
+
+    def compact(self) -> None:
+        """Schreibt den Snapshot (atomar) und leert das Log"""
+        with self._file_lock():
+            self._refresh()
+            self._compact_locked()
+
+    def _write_json(self, path: Path, data: Any) -> Optional[Tuple[int, int, int]]:
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+        return self._file_id(path)
+
+    def _compact_locked(self) -> None:
+        self._sync_order()
+        items = [self._index[(term, role)] for _, term, role in self._order_count]
+        # Entscheidungen vor dem Leeren des Logs festschreiben
+        if self._pending_approved:
+            self._approved_id = self._write_json(self.approved_path, self._approved)
+        if self._pending_ignored:
+            self._ignore_id = self._write_json(self.ignore_path, list(self._ignore_terms.values()))
+        self._pending_ignored, self._pending_approved = {}, {}
+        self._write_json(self.snapshot_path, items)
+        with open(self.log_path, "wb"):
+            pass
+        self._snapshot_id = self._file_id(self.snapshot_path)
+        self._log_offset = 0
+        logger.debug(f"🗜️ Discovery-Snapshot geschrieben ({len(items)} Kandidaten)")
+
+    # ------------------------------------------------------------------
+    # Lesen
+    # ------------------------------------------------------------------
+
+    def candidates(self) -> List[Dict[str, Any]]:
+        """Alle Kandidaten, häufigste zuerst (Kopien)"""
+        with self._file_lock(exclusive=False):
+            self._refresh()
+            self._sync_order()
+            return [dict(self._index[(term, role)]) for _, term, role in self._order_count]
+
+    def approved(self) -> Dict[str, str]:
+        """Freigegebene Begriffe (Begriff → Label), inkl. noch nicht kompaktierter Freigaben"""
+        with self._file_lock(exclusive=False):
+            self._refresh()
+            return dict(self._approved)
+
+    def ignored(self) -> List[str]:
+        """Ignorierte Begriffe, inkl. noch nicht kompaktierter Einträge"""
+        with self._file_lock(exclusive=False):
+            self._refresh()
+            return list(self._ignore_terms.values())
+
+    def count(self) -> int:
+        """Anzahl Kandidaten (ohne Liste aufzubauen)"""
+        with self._file_lock(exclusive=False):
+            self._refresh()
+            return len(self._index)
+
+    def query(self, entity_type: Optional[str] = None, role: Optional[str] = None, min_count: int = 1,
+              prefix: Optional[str] = None, sort: str = "count", cursor: Optional[str] = None,
+              limit: int = REVIEW_PAGE_LIMIT) -> Dict[str, Any]:
+        """
+        Eine Seite Kandidaten für das Review (Keyset-Pagination über den Index).
+
+        Args:
+            entity_type: Nur Kandidaten dieses Typs ("skill", ...)
+            role: Nur Kandidaten dieser Rolle (Groß-/Kleinschreibung egal)
+            min_count: Mindest-Häufigkeit
+            prefix: Begriff beginnt mit (Groß-/Kleinschreibung egal)
+            sort: "count" (häufigste zuerst) oder "term" (alphabetisch)
+            cursor: ``next_cursor`` der vorherigen Seite
+            limit: Seitengröße (max. ``REVIEW_MAX_LIMIT``)
+
+        Returns:
+            {"candidates": [...], "next_cursor": str | None, "total": Anzahl aller Kandidaten}
+
+        Raises:
+            ValueError: Unbekannte Sortierung, ungültiger Cursor oder Limit
+        """
+        if sort not in REVIEW_SORTS:
+            raise ValueError(f"Unbekannte Sortierung '{sort}' (erlaubt: {', '.join(REVIEW_SORTS)})")
+        if not 1 <= limit <= REVIEW_MAX_LIMIT:
+            raise ValueError(f"limit muss zwischen 1 und {REVIEW_MAX_LIMIT} liegen")
+        after = decode_cursor(cursor, (int, str, str) if sort == "count" else (str, str)) if cursor else None
+        prefix_n = _norm(prefix)
+        role_n = _norm(role) if role is not None else None
+        entity_n = _norm(entity_type) or None
+
+        with self._file_lock(exclusive=False):
+            self._refresh()
+            self._sync_order()
+            order = self._review_order(sort, role_n, prefix_n)
+            start = bisect.bisect_right(order, after) if after is not None else 0
+            if sort == "term" and prefix_n and role_n is None:
+                start = max(start, bisect.bisect_left(order, (prefix_n,)))
+
+            page: List[Dict[str, Any]] = []
+            last = None
+            has_more = False
+            for i in range(start, len(order)):
+                position = order[i]
+                key = position[1:] if sort == "count" else position
+                if sort == "count" and -position[0] < min_count:
+                    break
+                if prefix_n and not key[0].startswith(prefix_n):
+                    if sort == "term":
+                        break
+                    continue
+                entry = self._index[key]
+                if entry["count"] < min_count:
+                    continue
+                if entity_n and _norm(entry.get("entity_type", DEFAULT_ENTITY_TYPE)) != entity_n:
+                    continue
+                if len(page) == limit:
+                    has_more = True
+                    break
+                page.append(dict(entry))
+                last = position
+            total = len(self._index)
+
+        return {
+            "candidates": page,
+            "next_cursor": encode_cursor(last) if has_more else None,
+            "total": total,
+        }
+
+    def _review_order(self, sort: str, role: Optional[str], prefix: str) -> List[Tuple]:
+        """Sortierte Positionsliste für eine Abfrage: global oder (klein) nur Rolle / Präfix-Bereich"""
+        if role is not None:
+            keys: Iterable[CandidateKey] = (
+                k for k in self._by_role.get(role, ()) if not prefix or k[0].startswith(prefix)
+            )
+        elif prefix and sort == "count":
+            lo = bisect.bisect_left(self._order_term, (prefix,))
+            hi = bisect.bisect_left(self._order_term, (prefix + "\U0010ffff",))
+            keys = self._order_term[lo:hi]
+        elif sort == "count":
+            return self._order_count
+        else:
+            return self._order_term
+        if sort == "count":
+            return sorted((-self._index[k]["count"], k[0], k[1]) for k in keys)
+        return sorted(keys)
+
+    # ------------------------------------------------------------------
+    # Varianten-Cluster
+    # ------------------------------------------------------------------
+
+    def _term_count(self, term: str) -> int:
+        return sum(self._index[key]["count"] for key in self._by_term.get(term, ()))
+
+    def _display_term(self, term: str) -> str:
+        """Schreibweise des häufigsten Eintrags eines normalisierten Begriffs"""
+        return max((self._index[key] for key in self._by_term[term]), key=lambda e: e["count"])["term"]
+
+    def _ranked_members(self, cid: int) -> List[Tuple[str, int]]:
+        """Begriffe eines Clusters, häufigste zuerst (bei Gleichstand kürzeste Schreibweise)"""
+        counts = [(term, self._term_count(term)) for term in self._clusterer.members(cid)]
+        counts.sort(key=lambda tc: (-tc[1], len(tc[0]), tc[0]))
+        return counts
+
+    def _cluster_summary(self, cid: int) -> Optional[Tuple[int, str]]:
+        ranked = self._ranked_members(cid)
+        if not ranked:
+            return None
+        return sum(count for _, count in ranked), ranked[0][0]
+
+    def _sync_clusters(self) -> None:
+        """Ordnet neue Begriffe ein und zieht die Cluster-Sortierliste nach"""
+        self._clusterer.process_pending()
+        changed = self._clusterer.pop_changed()
+        if self._clusters_built and len(changed) <= max(1000, len(self._cluster_info) // 20):
+            for cid in changed:
+                old = self._cluster_info.pop(cid, None)
+                if old is not None:
+                    del self._cluster_order[bisect.bisect_left(self._cluster_order, (-old[0], old[1]))]
+                summary = self._cluster_summary(cid)
+                if summary is not None:
+                    self._cluster_info[cid] = summary
+                    bisect.insort(self._cluster_order, (-summary[0], summary[1]))
+        else:
+            self._cluster_info = {}
+            for cid in self._clusterer.cluster_ids():
+                summary = self._cluster_summary(cid)
+                if summary is not None:
+                    self._cluster_info[cid] = summary
+            self._cluster_order = sorted((-total, rep) for total, rep in self._cluster_info.values())
+            self._clusters_built = True
+
+    def _cluster_entry(self, cid: int) -> Dict[str, Any]:
+        ranked = self._ranked_members(cid)
+        roles = {self._index[key]["role"] for term, _ in ranked for key in self._by_term[term]}
+        return {
+            "representative": self._display_term(ranked[0][0]),
+            "count": sum(count for _, count in ranked),
+            "size": len(ranked),
+            "terms": [{"term": self._display_term(term), "count": count} for term, count in ranked],
+            "roles": sorted(str(r) for r in roles),
+        }
+
+    def cluster_query(self, role: Optional[str] = None, min_count: int = 1, prefix: Optional[str] = None,
+                      cursor: Optional[str] = None, limit: int = REVIEW_PAGE_LIMIT) -> Dict[str, Any]:
+        """
+        Eine Seite Varianten-Cluster für das Review, Summe der Häufigkeiten absteigend.
+
+        Args:
+            role: Nur Cluster mit mindestens einem Eintrag dieser Rolle
+            min_count: Mindest-Häufigkeit (Summe über alle Varianten)
+            prefix: Mindestens eine Variante beginnt mit (Groß-/Kleinschreibung egal)
+            cursor: ``next_cursor`` der vorherigen Seite
+            limit: Seitengröße (max. ``REVIEW_MAX_LIMIT``)
+
+        Returns:
+            {"clusters": [{"representative", "count", "size", "terms", "roles"}, ...],
+             "next_cursor": str | None, "total": Anzahl Cluster}
+
+        Raises:
+            ValueError: Ungültiger Cursor oder Limit
+        """
+        if not 1 <= limit <= REVIEW_MAX_LIMIT:
+            raise ValueError(f"limit muss zwischen 1 und {REVIEW_MAX_LIMIT} liegen")
+        after = decode_cursor(cursor, (int, str)) if cursor else None
+        prefix_n = _norm(prefix)
+        role_n = _norm(role) if role is not None else None
+
+        with self._file_lock(exclusive=False):
+            self._refresh()
+            self._sync_clusters()
+            order = self._cluster_order
+            start = bisect.bisect_right(order, after) if after is not None else 0
+            page: List[Dict[str, Any]] = []
+            last = None
+            has_more = False
+            for i in range(start, len(order)):
+                position = order[i]
+                if -position[0] < min_count:
+                    break
+                cid = self._clusterer.cluster_of(position[1])
+                members = self._clusterer.members(cid)
+                if prefix_n and not any(term.startswith(prefix_n) for term in members):
+                    continue
+                if role_n is not None and not any(key[1] == role_n for term in members for key in self._by_term[term]):
+                    continue
+                if len(page) == limit:
+                    has_more = True
+                    break
+                page.append(self._cluster_entry(cid))
+                last = position
+            total = len(order)
+
+        return {
+            "clusters": page,
+            "next_cursor": encode_cursor(last) if has_more else None,
+            "total": total,
+        }
+
+    def cluster_members(self, terms: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Cluster zu beliebigen Varianten (meist den Repräsentanten aus ``cluster_query``).
+
+        Returns:
+            [{"representative": str, "terms": [Schreibweisen aller Varianten]}, ...]
+        """
+        clusters: Dict[int, Dict[str, Any]] = {}
+        with self._file_lock(exclusive=False):
+            self._refresh()
+            self._sync_clusters()
+            for term in terms:
+                cid = self._clusterer.cluster_of(_norm(term))
+                if cid is None or cid in clusters:
+                    continue
+                ranked = self._ranked_members(cid)
+                clusters[cid] = {
+                    "representative": self._display_term(ranked[0][0]),
+                    "terms": [self._display_term(t) for t, _ in ranked],
+                }
+        return list(clusters.values())
+
+    # ------------------------------------------------------------------
+    # Hintergrund-Kompaktierung
+    # ------------------------------------------------------------------
+
+    def start_compactor(self, interval: float = COMPACT_INTERVAL_SECONDS) -> None:
+        """Startet den Kompaktierungs-Thread (Log über Schwelle oder älter als ``interval``)"""
+        if self._compactor_running():
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.is_set():
+                self._wake.wait(interval)
+                self._wake.clear()
+                if self._stop.is_set():
+                    break
+                try:
+                    if self.log_path.exists() and self.log_path.stat().st_size > 0:
+                        self.compact()
+                except Exception as e:
+                    logger.warning(f"⚠️ Discovery-Kompaktierung fehlgeschlagen: {e}")
+
+        self._compactor = threading.Thread(target=run, name="discovery-compactor", daemon=True)
+        self._compactor.start()
+
+    def _compactor_running(self) -> bool:
+        return self._compactor is not None and self._compactor.is_alive()
+
+    def _request_compaction(self) -> None:
+        if self._compactor_running():
+            self._wake.set()
+        else:
+            self.compact()
+
+    def close(self) -> None:
+        """Stoppt den Kompaktierungs-Thread und schreibt einen letzten Snapshot"""
+        self._stop.set()
+        self._wake.set()
+        if self._compactor is not None:
+            self._compactor.join(timeout=5)
+            self._compactor = None
+        if self.log_path.exists() and self.log_path.stat().st_size > 0:
+            self.compact()
+
+
+_stores: Dict[str, DiscoveryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_discovery_store(directory: Path) -> DiscoveryStore:
+    """Store-Instanz pro Discovery-Verzeichnis (Kompaktierungs-Thread läuft ab dem ersten Zugriff)"""
+    key = str(Path(directory).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = DiscoveryStore(Path(directory))
+            store.start_compactor()
+            _stores[key] = store
+        return store
+
+
+def close_discovery_stores() -> None:
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        store.close()
@@ -0,0 +1,272 @@
+# infrastructure/extractor/docx_engine.py
+
+"""
+DocxEngine - Einheitliche DOCX-Extraktion ohne Temp-Dateien
+===========================================================
+
+Ersetzt die getrennten DOCX-Pfade in MultiFormatParser (Pandoc über
+``NamedTemporaryFile``) und AdvancedTextExtractor (python-docx):
+
+1. Pandoc (falls installiert, einmal pro Prozess erkannt): Dateipfade werden
+   direkt übergeben, Bytes/Streams über stdin; der Text kommt über stdout.
+2. Fallback / Standard ohne Pandoc: ``word/document.xml`` wird direkt aus dem
+   ZIP per ``iterparse`` gestreamt - kein DOM des ganzen Dokuments,
+   Absätze und Tabellenzeilen in Dokumentreihenfolge, Tracked Changes
+   akzeptiert (``w:delText`` wird verworfen).
+3. Batch: ``extract_many`` verarbeitet viele Dateien in einem Thread-Pool
+   (Pandoc-Subprozesse laufen parallel).
+
+Pandoc liefert für die NLP-Pipeline ``plain``, für den MultiFormatParser
+``markdown`` (wird dort wie bisher bereinigt).
+"""
+
+import io
+import logging
+import os
+import shutil
+import subprocess
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Union
+from xml.etree.ElementTree import iterparse
+
+logger = logging.getLogger(__name__)
+
+PARSER_PANDOC = "pandoc"
+PARSER_XML = "docx-xml"
+
+PANDOC_TIMEOUT = 30
+DEFAULT_BATCH_WORKERS = min(4, os.cpu_count() or 1)
+
+DocxSource = Union[str, Path, bytes, BinaryIO]
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_DCTERMS = "{http://purl.org/dc/terms/}"
+
+# docProps/core.xml → Metadaten-Keys (wie bisher bei python-docx)
+_CORE_PROPERTIES = {
+    f"{_DC}title": "title",
+    f"{_DC}creator": "author",
+    f"{_DC}subject": "subject",
+    f"{_DCTERMS}created": "created",
+    f"{_DCTERMS}modified": "modified",
+}
+
+
+@dataclass
+class DocxResult:
+    """Extrahierter DOCX-Inhalt."""
+    text: str
+    parser: str
+    paragraphs: List[str] = field(default_factory=list)
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+
+@lru_cache(maxsize=1)
+def find_pandoc() -> Optional[str]:
+    """Pfad zu ``pandoc`` oder None - einmal pro Prozess ermittelt."""
+    binary = shutil.which("pandoc")
+    if not binary:
+        logger.info("ℹ️ Pandoc not available - using streaming DOCX-XML parser")
+        return None
+    try:
+        subprocess.run([binary, "--version"], capture_output=True, check=True, timeout=5)
+    except (subprocess.SubprocessError, OSError):
+        logger.info("ℹ️ Pandoc not usable - using streaming DOCX-XML parser")
+        return None
+    logger.info("✅ Pandoc detected - using enhanced DOCX conversion")
+    return binary
+
+
+class DocxEngine:
+    """
+    DOCX → Text. Pandoc bevorzugt (Struktur als Markdown), sonst XML-Streaming.
+
+    Args:
+        prefer_pandoc: False erzwingt den XML-Parser
+    """
+
+    def __init__(self, prefer_pandoc: bool = True):
+        self.prefer_pandoc = prefer_pandoc
+
+    @property
+    def pandoc_available(self) -> bool:
+        return bool(self.prefer_pandoc and find_pandoc())
+
+    def extract(self, source: DocxSource, output_format: str = "plain") -> DocxResult:
+        """
+        Extrahiert Text + Core-Metadaten; Pandoc-Fehler fallen auf XML zurück.
+
+        Args:
+            output_format: Pandoc-Zielformat ('plain' für NLP, 'markdown' mit Struktur)
+        """
+        if self.pandoc_available:
+            try:
+                result = self.extract_pandoc(source, output_format)
+                result.metadata.update(self.read_core_properties(source))
+                return result
+            except (subprocess.SubprocessError, OSError) as e:
+                logger.warning(f"Pandoc parsing failed: {e}. Falling back to DOCX-XML")
+        return self.extract_xml(source)
+
+    def extract_many(self, sources: Iterable[DocxSource], max_workers: int = DEFAULT_BATCH_WORKERS) -> List[Optional[DocxResult]]:
+        """
+        Batch-Modus: Viele Dokumente parallel; Reihenfolge bleibt erhalten.
+        Fehlerhafte Dokumente liefern None.
+        """
+        def safe_extract(source: DocxSource) -> Optional[DocxResult]:
+            try:
+                return self.extract(source)
+            except Exception as e:
+                logger.warning(f"⚠️ DOCX nicht lesbar ({source if isinstance(source, (str, Path)) else 'stream'}): {e}")
+                return None
+
+        sources = list(sources)
+        if max_workers <= 1 or len(sources) <= 1:
+            return [safe_extract(s) for s in sources]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as pool:
+            return list(pool.map(safe_extract, sources))
+
+    # ------------------------------------------------------------------
+    # Pandoc (stdin/stdout)
+    # ------------------------------------------------------------------
+
+    def extract_pandoc(self, source: DocxSource, output_format: str = "markdown") -> DocxResult:
+        """Pandoc DOCX → Text über stdout; Bytes/Streams gehen über stdin."""
+        cmd = [find_pandoc(), "--from=docx", f"--to={output_format}", "--track-changes=accept", "--wrap=none"]
+        stdin = None
+        if isinstance(source, (str, Path)):
+            cmd.append(str(source))
+        else:
+            stdin = _read_bytes(source)
+
+        result = subprocess.run(cmd, input=stdin, capture_output=True, timeout=PANDOC_TIMEOUT)
+        if result.returncode != 0:
+            logger.warning(f"Pandoc error: {result.stderr.decode('utf-8', errors='ignore')}")
+            raise subprocess.CalledProcessError(result.returncode, result.args)
+
+        text = result.stdout.decode("utf-8", errors="ignore")
+        return DocxResult(text=text, parser=PARSER_PANDOC, metadata={"method": f"{output_format}_conversion"})
+
+    # ------------------------------------------------------------------
+    # Streaming XML
+    # ------------------------------------------------------------------
+
+    def extract_xml(self, source: DocxSource) -> DocxResult:
+        """
+        Liest ``word/document.xml`` per iterparse. Absätze außerhalb von
+        Tabellen werden einzeln übernommen, Tabellenzeilen als 'A | B | C'.
+        """
+        blocks: List[str] = []
+        with _open_zip(source) as archive, archive.open("word/document.xml") as xml:
+            table_depth = 0
+            row_cells: List[List[str]] = []
+            cell_parts: List[str] = []
+            run_parts: List[str] = []
+
+            for event, elem in iterparse(xml, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    if tag == f"{_W}tbl":
+                        table_depth += 1
+                    elif tag == f"{_W}tr" and table_depth == 1:
+                        row_cells = []
+                    elif tag == f"{_W}tc" and table_depth == 1:
+                        cell_parts = []
+                    continue
+
+                if tag == f"{_W}t":
+                    run_parts.append(elem.text or "")
+                elif tag == f"{_W}tab":
+                    run_parts.append("\t")
+                elif tag in (f"{_W}br", f"{_W}cr"):
+                    run_parts.append("\n")
+                elif tag == f"{_W}p":
+                    paragraph = "".join(run_parts)
+                    run_parts = []
+                    if table_depth:
+                        if paragraph.strip():
+                            cell_parts.append(paragraph)
+                    elif paragraph.strip():
+                        blocks.append(paragraph)
+                    elem.clear()
+                elif tag == f"{_W}tc" and table_depth == 1:
+                    row_cells.append(cell_parts)
+                elif tag == f"{_W}tr" and table_depth == 1:
+                    row_text = " | ".join("\n".join(cell) for cell in row_cells if cell)
+                    if row_text:
+                        blocks.append(row_text)
+                    elem.clear()
+                elif tag == f"{_W}tbl":
+                    table_depth -= 1
+
+            metadata = self._core_properties(archive)
+
+        metadata["parser"] = PARSER_XML
+        return DocxResult(text="\n".join(blocks), parser=PARSER_XML, paragraphs=blocks, metadata=metadata)
+
+    def read_core_properties(self, source: DocxSource) -> Dict[str, str]:
+        """Titel/Autor/Datum aus docProps/core.xml (leer bei Fehlern)."""
+        try:
+            with _open_zip(source) as archive:
+                return self._core_properties(archive)
+        except (zipfile.BadZipFile, OSError, KeyError):
+            return {}
+
+    @staticmethod
+    def _core_properties(archive: zipfile.ZipFile) -> Dict[str, str]:
+        metadata = {key: "" for key in _CORE_PROPERTIES.values()}
+        try:
+            with archive.open("docProps/core.xml") as xml:
+                for _, elem in iterparse(xml):
+                    key = _CORE_PROPERTIES.get(elem.tag)
+                    if key:
+                        metadata[key] = (elem.text or "").strip()
+        except KeyError:
+            pass
+        return metadata
+
+
+def _read_bytes(source: DocxSource) -> bytes:
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    source.seek(0)
+    data = source.read()
+    source.seek(0)
+    return data
+
+
+class _open_zip:
+    """ZipFile über Pfad, Bytes oder Stream - ohne Kopie in ein Temp-File."""
+
+    def __init__(self, source: DocxSource):
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        elif not isinstance(source, (str, Path)):
+            source.seek(0)
+        self._source = source
+        self._archive: Optional[zipfile.ZipFile] = None
+
+    def __enter__(self) -> zipfile.ZipFile:
+        self._archive = zipfile.ZipFile(self._source)
+        return self._archive
+
+    def __exit__(self, *exc) -> None:
+        self._archive.close()
+        if not isinstance(self._source, (str, Path)):
+            self._source.seek(0)
+
+
+# Globale Instanz für einfachen Zugriff
+_docx_engine = None
+
+def get_docx_engine() -> DocxEngine:
+    """Gibt globale DocxEngine-Instanz zurück"""
+    global _docx_engine
+    if _docx_engine is None:
+        _docx_engine = DocxEngine()
+    return _docx_engine
@@ -2,6 +2,8 @@ import re
 import os
 from typing import Dict, Optional
 
+from app.infrastructure.extractor.section_segmenter import SectionSegmenter, TASKS, REQUIREMENTS
+
 # Import für Zeitreihen-Analyse (Ebene 7)
 try:
     from app.core.normalize import parse_date
@@ -43,33 +45,20 @@ class MetadataExtractor:
         # Cache für kompilierte Patterns
         self._compiled_patterns = {k: re.compile(v, re.IGNORECASE) for k, v in self.category_patterns.items()}
 
-        # Abschnitte, die für Kompetenzen irrelevante Inhalte enthalten (Benefits, About us, Kontakt)
-        self.EXCLUDE_SECTIONS = re.compile(
-            r"(wir bieten|benefits|was wir bieten|what we offer|about us|über uns|ueber uns|why us|warum wir|unternehmen|kontakt|bewerbung)",
-            re.IGNORECASE,
-        )
-
-        # DEINE SEKTIONS-MUSTER (Lookahead-Version für bessere Segmentierung)
-        self.TASK_PATTERN = re.compile(
-            r'(?:DEINE AUFGABEN|TÄTIGKEITEN|WAS DU BEI UNS MACHST|YOUR TASKS|RESPONSIBILITIES|TASKS|WHAT YOU WILL DO)[\s\r\n:.-]+(.*?)(?=(?:DEIN PROFIL|PROFIL|REQUIREMENTS|WIR BIETEN|WIR SUCHEN|BENEFITS|ABOUT US|$))',
-            re.DOTALL | re.IGNORECASE)
-
-        self.REQ_PATTERN = re.compile(
-            r'(?:PROFIL|DEIN PROFIL|YOUR PROFILE|ANFORDERUNGEN|REQUIREMENTS|QUALIFICATIONS|VORAUSSETZUNGEN|SKILLSET)[\s\r\n:.-]+(.*?)(?=(?:DEINE AUFGABEN|TASKS|WIR BIETEN|WIR SUCHEN|BENEFITS|KONTAKT|$))',
-            re.DOTALL | re.IGNORECASE)
+        # Ein-Pass-Segmentierung (tasks/requirements/benefits/about) statt DOTALL-Lookaheads
+        self.segmenter = SectionSegmenter()
 
     def extract_all(self, text: str, filename: str, filepath: str = "") -> Dict:
         """
         Gibt das Dictionary zurück, das exakt zum AnalysisResultDTO passt.
         """
         iso_date, _, _ = parse_date(text)
-        filtered_text = self._strip_irrelevant_sections(text)
-
-        tasks_match = self.TASK_PATTERN.search(filtered_text)
-        reqs_match = self.REQ_PATTERN.search(filtered_text)
+        sections = self.segmenter.segment(text)
+        filtered_text = self.segmenter.relevant_text(sections, fallback=text)
 
-        tasks_clean = tasks_match.group(1).strip() if tasks_match else ""
-        reqs_clean = reqs_match.group(1).strip() if reqs_match else ""
+        by_label = self.segmenter.merge(sections)
+        tasks_clean = by_label.get(TASKS, "")
+        reqs_clean = by_label.get(REQUIREMENTS, "")
 
         # Segmentierung validieren (Ebene 6)
         clean_segment = f"{tasks_clean} {reqs_clean}".strip()
@@ -183,25 +172,4 @@ class MetadataExtractor:
 
     def _strip_irrelevant_sections(self, text: str) -> str:
         """Entfernt Benefits/About/Kontakt-Abschnitte, damit Analyse nur fachliche Teile nutzt."""
-        lines = text.splitlines()
-        kept_lines = []
-        skip_block = False
-
-        heading_reset = re.compile(r"(aufgaben|tasks|tätigkeiten|profil|requirements|qualifikation)", re.IGNORECASE)
-
-        for line in lines:
-            if self.EXCLUDE_SECTIONS.search(line):
-                skip_block = True
-                continue
-
-            # Neue relevante Überschrift beendet das Skipping
-            if skip_block and heading_reset.search(line):
-                skip_block = False
-
-            if not skip_block:
-                kept_lines.append(line)
-
-        cleaned = "\n".join(kept_lines).strip()
-
-        # Falls wir nichts behalten konnten, nutze den Originaltext als Fallback
-        return cleaned if cleaned else text
+        return self.segmenter.strip_irrelevant(text)
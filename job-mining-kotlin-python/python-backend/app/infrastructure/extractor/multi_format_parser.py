@@ -6,7 +6,7 @@ Multi-Format Document Parser v2.0
 
 Unterstützte Formate:
 - PDF (.pdf) - via PyPDF2 mit Metadata
-- DOCX (.docx) - via Pandoc (bevorzugt) oder python-docx (Fallback)
+- DOCX (.docx) - via Pandoc (bevorzugt) oder Streaming DOCX-XML (Fallback)
 - Google Docs - als .docx exportiert
 
 Features:
@@ -21,13 +21,15 @@ Basiert auf: konzept-ideen/Best_Practice Code Lib/BestPracitce_PY/multi_format_p
 
 import re
 import logging
-import subprocess
-import tempfile
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, List
 from dataclasses import dataclass, field
 
+from app.infrastructure.cache.text_cache import ExtractedTextCache, get_text_cache, sha256_file
+from app.infrastructure.extractor.docx_engine import find_pandoc, get_docx_engine
+from app.infrastructure.extractor.pdf_extraction_engine import PdfExtractionEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,9 +66,12 @@ class MultiFormatParser:
     - Fehlerbehandlung & Logging
     """
 
-    def __init__(self):
+    def __init__(self, text_cache: Optional[ExtractedTextCache] = None):
         """Initialize Parser mit Format-Checks"""
         self._check_dependencies()
+        self.pdf_engine = PdfExtractionEngine()
+        self.docx_engine = get_docx_engine()
+        self.text_cache = text_cache if text_cache is not None else get_text_cache()
         logger.info("MultiFormatParser initialized")
 
     def _check_dependencies(self):
@@ -78,24 +83,10 @@ class MultiFormatParser:
             logger.warning("pypdf not installed. Install: pip install pypdf")
             self.pdf_available = False
 
-        try:
-            from docx import Document
-            self.docx_available = True
-        except ImportError:
-            logger.warning("python-docx not installed. Install: pip install python-docx")
-            self.docx_available = False
-
-        # Check for pandoc (optional, für bessere DOCX-Konvertierung)
-        try:
-            subprocess.run(['pandoc', '--version'],
-                         capture_output=True,
-                         check=True,
-                         timeout=5)
-            self.pandoc_available = True
-            logger.info("✅ Pandoc detected - using enhanced DOCX conversion")
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            self.pandoc_available = False
-            logger.info("ℹ️ Pandoc not available - using python-docx fallback")
+        # DOCX: Streaming-XML braucht nur die Stdlib; Pandoc optional
+        # (Erkennung einmal pro Prozess gecacht statt pro Instanz)
+        self.docx_available = True
+        self.pandoc_available = find_pandoc() is not None
 
     def parse_file(self, file_path: str) -> ParsedDocument:
         """
@@ -116,12 +107,34 @@ class MultiFormatParser:
         suffix = path.suffix.lower()
 
         if suffix == '.pdf':
-            return self._parse_pdf(path)
+            parse = self._parse_pdf
         elif suffix in ['.docx', '.doc']:
-            return self._parse_docx(path)
+            parse = self._parse_docx
         else:
             raise ValueError(f"Unsupported format: {suffix}. Supported: .pdf, .docx")
 
+        if self.text_cache is None:
+            return parse(path)
+
+        # Content-addressed Cache: gleiche Bytes → kein erneutes Parsing
+        digest = sha256_file(str(path))
+        namespace = f"parser{suffix}"
+        cached = self.text_cache.get(digest, namespace)
+        if cached is not None:
+            logger.info(f"✅ Text-Cache Treffer: {path.name}")
+            return ParsedDocument(
+                filename=path.name,
+                file_type=cached['metadata'].get('file_type', suffix.lstrip('.')),
+                text=cached['text'],
+                metadata=cached['metadata'],
+            )
+
+        doc = parse(path)
+        doc.metadata['content_sha256'] = digest
+        if doc.text:
+            self.text_cache.put(digest, namespace, doc.text, {**doc.metadata, 'file_type': doc.file_type})
+        return doc
+
     def _parse_pdf(self, path: Path) -> ParsedDocument:
         """
         Extrahiert Text und Metadata aus PDF
@@ -152,22 +165,19 @@ class MultiFormatParser:
                         'page_count': len(reader.pages)
                     }
 
-                # Text-Extraktion (Multi-Page)
-                text_parts = []
-                for page_num, page in enumerate(reader.pages, 1):
-                    try:
-                        text = page.extract_text()
-                        if text:
-                            text_parts.append(text)
-                    except Exception as e:
-                        logger.warning(f"Error extracting page {page_num}: {e}")
-
-                full_text = "\n\n".join(text_parts)
+                # Text-Extraktion (seitenparallel, pdftotext/pypdf)
+                # Bereinigung pro Seite, damit die Seiten-Offsets zum Endtext passen
+                result = self.pdf_engine.extract(path, separator=" ", page_transform=self._clean_text)
+                full_text = result.text
 
-                # Cleanup
-                full_text = self._clean_text(full_text)
+                metadata['page_count'] = result.page_count
+                metadata['pages'] = result.page_offsets()
+                metadata['parser'] = result.backend
+                if result.timed_out_pages:
+                    metadata['timed_out_pages'] = result.timed_out_pages
 
-                logger.info(f"✅ PDF parsed: {len(text_parts)} pages, {len(full_text)} chars")
+                n_pages = sum(1 for p in result.pages if p.text)
+                logger.info(f"✅ PDF parsed ({result.backend}): {n_pages} pages, {len(full_text)} chars")
 
                 return ParsedDocument(
                     filename=path.name,
@@ -186,9 +196,9 @@ class MultiFormatParser:
         """
         Extrahiert Text aus DOCX
 
-        Zwei Methoden:
+        Zwei Methoden (beide ohne Temp-Dateien, siehe DocxEngine):
         1. Pandoc (wenn verfügbar) - Beste Qualität
-        2. python-docx (Fallback) - Standard
+        2. Streaming DOCX-XML (Fallback) - Standard
         """
         logger.info(f"📝 Parsing DOCX: {path.name}")
 
@@ -196,11 +206,8 @@ class MultiFormatParser:
         if self.pandoc_available:
             return self._parse_docx_pandoc(path)
 
-        # Method 2: python-docx (Fallback)
-        if self.docx_available:
-            return self._parse_docx_library(path)
-
-        raise RuntimeError("No DOCX parser available. Install python-docx or pandoc")
+        # Method 2: DOCX-XML (Fallback)
+        return self._parse_docx_xml(path)
 
     def _parse_docx_pandoc(self, path: Path) -> ParsedDocument:
         """
@@ -209,42 +216,20 @@ class MultiFormatParser:
         Basierend auf DOCX Skill Documentation:
         - Behält Struktur bei (Überschriften, Listen, etc.)
         - Tracked Changes werden verarbeitet
-        - Bessere Formatierung als python-docx
+        - Markdown direkt über stdout, keine Temp-Datei
         """
         try:
-            # Temporäre Markdown-Datei
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as tmp:
-                tmp_path = tmp.name
-
-            # Pandoc Konvertierung: DOCX → Markdown
-            # --track-changes=accept: Akzeptiere alle Änderungen
-            result = subprocess.run(
-                ['pandoc', '--track-changes=accept', str(path), '-o', tmp_path],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode != 0:
-                logger.warning(f"Pandoc error: {result.stderr}")
-                raise subprocess.CalledProcessError(result.returncode, result.args)
-
-            # Markdown lesen
-            with open(tmp_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-
-            # Cleanup temp file
-            Path(tmp_path).unlink()
+            result = self.docx_engine.extract_pandoc(path, output_format='markdown')
 
             # Markdown-Formatierung entfernen (optional)
-            text = self._clean_markdown(text)
+            text = self._clean_markdown(result.text)
             text = self._clean_text(text)
 
-            # Metadata (begrenzt bei Pandoc)
-            metadata = {
+            metadata = self.docx_engine.read_core_properties(path)
+            metadata.update({
                 'parser': 'pandoc',
                 'method': 'markdown_conversion'
-            }
+            })
 
             logger.info(f"✅ DOCX parsed (Pandoc): {len(text)} chars")
 
@@ -258,55 +243,22 @@ class MultiFormatParser:
             )
 
         except Exception as e:
-            logger.warning(f"Pandoc parsing failed: {e}. Falling back to python-docx")
-            if self.docx_available:
-                return self._parse_docx_library(path)
-            raise
+            logger.warning(f"Pandoc parsing failed: {e}. Falling back to DOCX-XML")
+            return self._parse_docx_xml(path)
 
-    def _parse_docx_library(self, path: Path) -> ParsedDocument:
+    def _parse_docx_xml(self, path: Path) -> ParsedDocument:
         """
-        DOCX-Parsing mit python-docx (Fallback)
+        DOCX-Parsing per Streaming-XML (Fallback)
 
-        Einfache Text-Extraktion ohne Formatierung
+        Absätze und Tabellenzeilen in Dokumentreihenfolge, ohne Formatierung
         """
-        if not self.docx_available:
-            raise RuntimeError("python-docx not installed")
-
-        from docx import Document
-
         try:
-            doc = Document(path)
-
-            # Metadata
-            core_props = doc.core_properties
-            metadata = {
-                'title': core_props.title or '',
-                'author': core_props.author or '',
-                'subject': core_props.subject or '',
-                'created': str(core_props.created) if core_props.created else '',
-                'modified': str(core_props.modified) if core_props.modified else '',
-                'parser': 'python-docx'
-            }
-
-            # Text-Extraktion (Paragraphs + Tables)
-            text_parts = []
-
-            # Paragraphs
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    text_parts.append(para.text)
+            result = self.docx_engine.extract_xml(path)
 
-            # Tables
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = ' | '.join(cell.text for cell in row.cells if cell.text.strip())
-                    if row_text:
-                        text_parts.append(row_text)
-
-            full_text = "\n\n".join(text_parts)
+            full_text = "\n\n".join(result.paragraphs)
             full_text = self._clean_text(full_text)
 
-            logger.info(f"✅ DOCX parsed (python-docx): {len(full_text)} chars")
+            logger.info(f"✅ DOCX parsed (docx-xml): {len(full_text)} chars")
 
             return ParsedDocument(
                 filename=path.name,
@@ -314,7 +266,7 @@ class MultiFormatParser:
                 text=full_text,
                 word_count=len(full_text.split()),
                 char_count=len(full_text),
-                metadata=metadata
+                metadata=result.metadata
             )
 
         except Exception as e:
@@ -353,7 +305,8 @@ class MultiFormatParser:
 
     def batch_parse(self, directory: str,
                     pattern: str = "*",
-                    recursive: bool = True) -> List[ParsedDocument]:
+                    recursive: bool = True,
+                    max_workers: int = 4) -> List[ParsedDocument]:
         """
         ✅ BEST PRACTICE: Batch-Processing mehrerer Dokumente
 
@@ -361,6 +314,7 @@ class MultiFormatParser:
             directory: Verzeichnis-Pfad
             pattern: Datei-Pattern (z.B. "*.pdf", "*.docx", "*")
             recursive: Unterverzeichnisse durchsuchen
+            max_workers: Parallel geparste Dateien (Pandoc/pdftotext-Subprozesse)
 
         Returns:
             Liste von ParsedDocument Objekten
@@ -388,14 +342,25 @@ class MultiFormatParser:
         results = []
         errors = []
 
-        for file_path in supported_files:
+        def parse_safe(file_path: Path):
             try:
-                doc = self.parse_file(str(file_path))
+                return self.parse_file(str(file_path)), None
+            except Exception as e:
+                return None, e
+
+        if max_workers > 1 and len(supported_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(supported_files))) as pool:
+                outcomes = list(pool.map(parse_safe, supported_files))
+        else:
+            outcomes = [parse_safe(f) for f in supported_files]
+
+        for file_path, (doc, error) in zip(supported_files, outcomes):
+            if error is None:
                 results.append(doc)
                 logger.info(f"✓ Parsed: {file_path.name} ({doc.word_count} words)")
-            except Exception as e:
-                errors.append((file_path.name, str(e)))
-                logger.error(f"✗ Failed: {file_path.name} - {e}")
+            else:
+                errors.append((file_path.name, str(error)))
+                logger.error(f"✗ Failed: {file_path.name} - {error}")
 
         # Summary
         logger.info(f"\n{'=' * 60}")
@@ -0,0 +1,279 @@
+# infrastructure/extractor/ocr_pipeline.py
+
+"""
+OcrPipeline - Parallele, gecachte OCR für gescannte PDFs & Screenshots
+=====================================================================
+
+Ersetzt den seriellen OCR-Fallback (alle Seiten auf einmal bei 200 DPI
+rastern, dann Seite für Seite Tesseract):
+
+1. Lazy Rasterung: Jede Seite wird erst im Worker gerendert
+   (pdf2image ``first_page``/``last_page``) - nie das ganze Dokument im RAM.
+2. Adaptive DPI: Aus der Seitengröße so gewählt, dass die lange Seite
+   ~2500 px hat (A4 ≈ 215 DPI, A5 → 300, A3 → 150).
+3. Prozess-Pool: Seiten laufen parallel (gemeinsamer Pool mit der
+   PdfExtractionEngine), höchstens ``max_workers`` gleichzeitig.
+4. Early-Stop: Sobald ``target_chars`` Zeichen erkannt sind, werden keine
+   weiteren Seiten mehr eingeplant (Stellenanzeigen stehen vorne).
+5. Cache: Schlüssel = SHA-256 des gerenderten Seitenbilds (+ Sprache).
+   Re-Uploads und Re-Runs OCRen keine Seite zweimal.
+"""
+
+import hashlib
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, wait
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+
+from app.infrastructure.cache.cache_manager import CacheManager
+from app.infrastructure.extractor.pdf_extraction_engine import (
+    DEFAULT_WORKERS,
+    PdfSource,
+    coerce_pdf_source,
+    get_process_pool,
+    recycle_process_pool,
+    spooled_pdf_path,
+)
+
+logger = logging.getLogger(__name__)
+
+OCR_LANG = os.getenv("OCR_LANG", "deu")
+DEFAULT_MAX_PAGES = int(os.getenv("OCR_MAX_PAGES", "20"))
+DEFAULT_TARGET_CHARS = int(os.getenv("OCR_TARGET_CHARS", "8000"))
+
+TARGET_LONG_SIDE_PX = 2500
+MIN_DPI = 150
+MAX_DPI = 300
+
+ImageSource = Union[str, bytes, BinaryIO]
+
+
+@dataclass
+class OcrResult:
+    """Ergebnis der OCR über ein PDF."""
+    text: str
+    page_count: int = 0
+    pages: List[int] = field(default_factory=list)
+    cache_hits: int = 0
+    stopped_early: bool = False
+
+
+# ============================================================================
+# HILFSFUNKTIONEN
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def ocr_available() -> bool:
+    """pytesseract + pdf2image installiert und Tesseract-Binary vorhanden?"""
+    try:
+        import pytesseract
+        import pdf2image  # noqa: F401
+
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception as e:
+        logger.warning(f"OCR-Bibliotheken nicht verfügbar: {e}")
+        logger.warning("Install: pip install pdf2image pytesseract")
+        logger.warning("System: apt-get install tesseract-ocr tesseract-ocr-deu poppler-utils")
+        return False
+
+
+def adaptive_dpi(width_pt: float, height_pt: float) -> int:
+    """DPI, bei der die lange Seitenkante ~TARGET_LONG_SIDE_PX Pixel ergibt."""
+    long_side_inch = max(float(width_pt), float(height_pt), 1.0) / 72.0
+    return int(min(MAX_DPI, max(MIN_DPI, round(TARGET_LONG_SIDE_PX / long_side_inch))))
+
+
+def image_fingerprint(image) -> str:
+    """SHA-256 über Modus, Größe und Pixel eines PIL-Bildes."""
+    digest = hashlib.sha256()
+    digest.update(f"{image.mode}:{image.size[0]}x{image.size[1]}".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def default_ocr_cache_dir() -> str:
+    return os.path.join(os.getenv("BASE_DATA_DIR", "data"), "cache", "ocr")
+
+
+@lru_cache(maxsize=4)
+def _cache_for(cache_dir: str) -> CacheManager:
+    """Ein CacheManager pro Verzeichnis und Prozess (auch in Workern)."""
+    return CacheManager(cache_dir=cache_dir)
+
+
+def _tesseract(image, lang: str) -> str:
+    import pytesseract
+
+    return pytesseract.image_to_string(image, lang=lang) or ""
+
+
+def _render_page(path: str, page_no: int, dpi: int):
+    """Rastert genau eine Seite (None, wenn pdf2image nichts liefert)."""
+    from pdf2image import convert_from_path
+
+    images = convert_from_path(path, dpi=dpi, first_page=page_no, last_page=page_no)
+    return images[0] if images else None
+
+
+def _ocr_image_cached(image, lang: str, cache_dir: Optional[str]) -> Tuple[str, bool]:
+    """OCR eines Bildes mit Cache. Returns: (Text, aus_cache)"""
+    cache = _cache_for(cache_dir) if cache_dir else None
+    key = f"ocr:{lang}:{image_fingerprint(image)}"
+    if cache is not None and cache.is_cache_valid(key):
+        cached = cache.load_from_cache(key)
+        if cached is not None:
+            return cached, True
+
+    text = _tesseract(image, lang)
+    if cache is not None:
+        cache.save_to_cache(key, text)
+    return text, False
+
+
+def _ocr_pdf_page(path: str, page_no: int, dpi: int, lang: str, cache_dir: Optional[str]) -> Tuple[int, str, bool]:
+    """Worker: rastert genau eine Seite und OCRt sie (modul-level → pickle-bar)."""
+    image = _render_page(path, page_no, dpi)
+    if image is None:
+        return page_no, "", False
+    text, cached = _ocr_image_cached(image, lang, cache_dir)
+    return page_no, text, cached
+
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+class OcrPipeline:
+    """
+    OCR für gescannte PDFs und Bilder.
+
+    Args:
+        lang: Tesseract-Sprache(n), z.B. 'deu' oder 'deu+eng'
+        max_workers: Parallel bearbeitete Seiten (1 = sequentiell)
+        max_pages: Höchstens so viele Seiten werden betrachtet
+        target_chars: Early-Stop, sobald so viel Text erkannt ist (0 = aus)
+        cache_dir: Verzeichnis des Seiten-Caches (None = ohne Cache)
+    """
+
+    def __init__(
+        self,
+        lang: str = OCR_LANG,
+        max_workers: int = DEFAULT_WORKERS,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        target_chars: int = DEFAULT_TARGET_CHARS,
+        cache_dir: Optional[str] = "",
+    ):
+        self.lang = lang
+        self.max_workers = max(1, max_workers)
+        self.max_pages = max_pages
+        self.target_chars = target_chars
+        self.cache_dir = default_ocr_cache_dir() if cache_dir == "" else cache_dir
+
+    def ocr_pdf(self, source: PdfSource) -> OcrResult:
+        """OCR eines PDFs (Pfad, Bytes oder Stream)."""
+        if not ocr_available():
+            return OcrResult(text="")
+
+        from pypdf import PdfReader
+
+        path, stream = coerce_pdf_source(source)
+        reader = PdfReader(path if path else stream)
+        page_count = len(reader.pages)
+        plan = []
+        for page_no in range(1, min(page_count, self.max_pages) + 1):
+            box = reader.pages[page_no - 1].mediabox
+            plan.append((page_no, adaptive_dpi(box.width, box.height)))
+
+        logger.info(f"🔍 OCR für {len(plan)}/{page_count} Seite(n), {self.max_workers} Worker")
+        with spooled_pdf_path(path, stream) as file_path:
+            results = self._run(file_path, plan)
+
+        texts = [text for _, text, _ in sorted(results) if text.strip()]
+        result = OcrResult(
+            text="\n".join(texts),
+            page_count=page_count,
+            pages=sorted(page for page, _, _ in results),
+            cache_hits=sum(1 for _, _, cached in results if cached),
+            stopped_early=len(results) < len(plan),
+        )
+        logger.info(
+            f"✅ OCR: {len(result.text)} Zeichen aus {len(result.pages)} Seite(n) "
+            f"({result.cache_hits} aus Cache{', Early-Stop' if result.stopped_early else ''})"
+        )
+        return result
+
+    def ocr_image(self, source: ImageSource) -> str:
+        """OCR eines Screenshots/Bildes (Pfad, Bytes oder Stream)."""
+        try:
+            import pytesseract  # noqa: F401
+            from PIL import Image
+        except ImportError as e:
+            logger.warning(f"OCR-Bibliotheken nicht verfügbar: {e}")
+            return ""
+
+        if isinstance(source, (bytes, bytearray)):
+            import io
+            source = io.BytesIO(source)
+        image = Image.open(source)
+        image.load()
+        text, cached = _ocr_image_cached(image, self.lang, self.cache_dir)
+        logger.info(f"✅ Bild-OCR erfolgreich: {len(text)} Zeichen{' (Cache)' if cached else ''}")
+        return text
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+
+    def _enough(self, results: List[Tuple[int, str, bool]]) -> bool:
+        return self.target_chars > 0 and sum(len(t.strip()) for _, t, _ in results) >= self.target_chars
+
+    def _run(self, path: str, plan: List[Tuple[int, int]]) -> List[Tuple[int, str, bool]]:
+        results: List[Tuple[int, str, bool]] = []
+        pool = get_process_pool(self.max_workers) if self.max_workers > 1 and len(plan) > 1 else None
+
+        if pool is None:
+            for page_no, dpi in plan:
+                self._collect(results, page_no, lambda: _ocr_pdf_page(path, page_no, dpi, self.lang, self.cache_dir))
+                if self._enough(results):
+                    break
+            return results
+
+        queue = list(plan)
+        in_flight: Dict = {}
+        while queue or in_flight:
+            # Höchstens max_workers Seiten gleichzeitig einplanen (lazy)
+            while queue and len(in_flight) < self.max_workers and not self._enough(results):
+                page_no, dpi = queue.pop(0)
+                try:
+                    future = pool.submit(_ocr_pdf_page, path, page_no, dpi, self.lang, self.cache_dir)
+                except (BrokenExecutor, RuntimeError):
+                    # Gemeinsamer Pool wurde ersetzt (hängender Worker) → neuen Pool verwenden
+                    recycle_process_pool(pool)
+                    pool = get_process_pool(self.max_workers)
+                    future = pool.submit(_ocr_pdf_page, path, page_no, dpi, self.lang, self.cache_dir)
+                in_flight[future] = page_no
+
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                page_no = in_flight.pop(future)
+                self._collect(results, page_no, future.result)
+
+            if self._enough(results):
+                # Laufende Seiten noch abholen → lückenloser Seitenanfang
+                queue.clear()
+        return results
+
+    @staticmethod
+    def _collect(results: List[Tuple[int, str, bool]], page_no: int, fetch) -> None:
+        try:
+            page, text, cached = fetch()
+            logger.debug(f"   OCR Seite {page}: {len(text)} Zeichen{' (Cache)' if cached else ''}")
+            results.append((page, text, cached))
+        except Exception as e:
+            logger.warning(f"   OCR Seite {page_no} fehlgeschlagen: {e}")
+            results.append((page_no, "", False))
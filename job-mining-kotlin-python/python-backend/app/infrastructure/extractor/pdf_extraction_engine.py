@@ -0,0 +1,458 @@
+# infrastructure/extractor/pdf_extraction_engine.py
+
+"""
+PdfExtractionEngine - Seitenparallele PDF-Text-Extraktion
+=========================================================
+
+Ersetzt die sequentielle pypdf-Schleife in AdvancedTextExtractor und
+MultiFormatParser:
+
+1. Backend-Wahl (einmal pro Prozess ermittelt):
+   - poppler ``pdftotext -layout`` (schnell, C-Code, I/O-bound) wenn vorhanden
+   - sonst pypdf
+2. Große PDFs (Fachbücher, Batch-Backfills) werden in Seitenbereiche zerlegt
+   und parallel verarbeitet: pdftotext-Bereiche im Thread-Pool (Subprozesse),
+   pypdf-Bereiche im Prozess-Pool (CPU-bound, umgeht die GIL).
+3. Zeitlimit pro Seite: pdftotext über das Subprozess-Timeout (Seiten × Limit),
+   pypdf über SIGALRM im Worker. Überschrittene Seiten bleiben leer und werden
+   im Ergebnis markiert - ein defektes Content-Stream blockiert nie das ganze
+   Dokument. Scheitert ein pdftotext-Bereich, wird er mit pypdf im Prozess-Pool
+   nachgeholt. Außerhalb des Main-Threads (kein SIGALRM) läuft pypdf immer im
+   Prozess-Pool, damit das Zeitlimit auch dort greift. Hängt ein Worker in
+   blockierendem C-Code (SIGALRM greift nicht), begrenzt das Budget
+   ``page_timeout × Seiten`` das Warten; danach wird der Pool ersetzt, damit
+   der hängende Prozess keinen Slot dauerhaft belegt.
+4. Ergebnis enthält pro Seite Start-/End-Offsets im zusammengesetzten Text.
+
+Konfiguration über ENV: ``PDF_EXTRACT_WORKERS``, ``PDF_PAGE_TIMEOUT``,
+``PDF_PAGES_PER_CHUNK``.
+"""
+
+import io
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import BrokenExecutor, CancelledError, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+BACKEND_PDFTOTEXT = "pdftotext"
+BACKEND_PYPDF = "pypdf"
+
+DEFAULT_PAGE_TIMEOUT = float(os.getenv("PDF_PAGE_TIMEOUT", "10"))
+DEFAULT_PAGES_PER_CHUNK = int(os.getenv("PDF_PAGES_PER_CHUNK", "8"))
+DEFAULT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Zuschlag zum Worker-Budget (Prozessstart, PDF öffnen)
+POOL_BUDGET_SLACK_SECONDS = 5.0
+
+PdfSource = Union[str, Path, bytes, BinaryIO]
+
+# (Seite 1-basiert, Text, timed_out)
+_RawPage = Tuple[int, str, bool]
+
+
+@dataclass
+class PageText:
+    """Text einer Seite inkl. Position im Gesamttext."""
+    page: int
+    text: str
+    start: int = 0
+    end: int = 0
+    timed_out: bool = False
+
+
+@dataclass
+class PdfExtractionResult:
+    """Ergebnis der PDF-Extraktion."""
+    text: str
+    backend: str
+    page_count: int
+    pages: List[PageText] = field(default_factory=list)
+
+    @property
+    def timed_out_pages(self) -> List[int]:
+        return [p.page for p in self.pages if p.timed_out]
+
+    def page_offsets(self) -> List[Dict[str, int]]:
+        """[{page, start, end}, ...] - z.B. für ParsedDocument.metadata."""
+        return [{"page": p.page, "start": p.start, "end": p.end} for p in self.pages]
+
+
+# ============================================================================
+# BACKEND-ERKENNUNG (einmal pro Prozess)
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def find_pdftotext() -> Optional[str]:
+    """Pfad zu poppler ``pdftotext`` oder None."""
+    binary = shutil.which("pdftotext")
+    if binary:
+        logger.info(f"✅ pdftotext gefunden: {binary}")
+    else:
+        logger.info("ℹ️ pdftotext nicht verfügbar - nutze pypdf")
+    return binary
+
+
+# ============================================================================
+# EINGABE: Pfad / Bytes / Stream
+# ============================================================================
+
+def coerce_pdf_source(source: PdfSource) -> Tuple[Optional[str], Optional[BinaryIO]]:
+    """
+    (Pfad, None) für Dateipfade, sonst (None, Stream am Anfang).
+    Streams, die bereits auf Disk liegen (Datei-Handles mit Pfad), liefern
+    zusätzlich ihren Pfad - dann entfällt das Temp-File.
+    """
+    if isinstance(source, (str, Path)):
+        return str(source), None
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    stream.seek(0)
+    name = getattr(stream, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        return name, stream
+    return None, stream
+
+
+@contextmanager
+def spooled_pdf_path(path: Optional[str], stream: Optional[BinaryIO]):
+    """
+    Dateipfad für pdftotext / Worker-Prozesse. Ein Temp-File entsteht nur
+    bei Stream-Eingaben und wird danach sofort gelöscht.
+    """
+    if path:
+        yield path
+        return
+
+    stream.seek(0)
+    tmp = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+    try:
+        with tmp:
+            shutil.copyfileobj(stream, tmp)
+        yield tmp.name
+    finally:
+        stream.seek(0)
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+
+
+# ============================================================================
+# SEITENBEREICHE (modul-level, damit sie im Prozess-Pool pickle-bar sind)
+# ============================================================================
+
+class _PageTimeout(Exception):
+    pass
+
+
+def _can_use_alarm() -> bool:
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+@contextmanager
+def _page_deadline(seconds: float):
+    """
+    Bricht die Extraktion einer Seite nach ``seconds`` ab (SIGALRM).
+    Außerhalb des Main-Threads (z.B. FastAPI-Threadpool) ohne Limit.
+    """
+    if not seconds or seconds <= 0 or not _can_use_alarm():
+        yield
+        return
+
+    def _raise_timeout(signum, frame):
+        raise _PageTimeout()
+
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _extract_pages_pypdf(reader, first: int, last: int, page_timeout: float) -> List[_RawPage]:
+    pages: List[_RawPage] = []
+    for page_no in range(first, last + 1):
+        try:
+            with _page_deadline(page_timeout):
+                text = reader.pages[page_no - 1].extract_text() or ""
+            pages.append((page_no, text, False))
+        except _PageTimeout:
+            logger.warning(f"⏱️ Seite {page_no}: Zeitlimit ({page_timeout}s) überschritten")
+            pages.append((page_no, "", True))
+        except Exception as e:
+            logger.warning(f"⚠️ Seite {page_no} nicht lesbar: {e}")
+            pages.append((page_no, "", False))
+    return pages
+
+
+def _pypdf_range_worker(path: str, first: int, last: int, page_timeout: float) -> List[_RawPage]:
+    """Worker im Prozess-Pool: öffnet das PDF selbst und liest einen Seitenbereich."""
+    from pypdf import PdfReader
+
+    return _extract_pages_pypdf(PdfReader(path), first, last, page_timeout)
+
+
+def _pdftotext_range(binary: str, path: str, first: int, last: int, page_timeout: float) -> List[_RawPage]:
+    """
+    Ein pdftotext-Aufruf pro Seitenbereich; Seiten sind durch Form-Feeds getrennt.
+    Raises bei Fehler/Timeout (Aufrufer fällt auf pypdf zurück).
+    """
+    n_pages = last - first + 1
+    result = subprocess.run(
+        [binary, "-layout", "-q", "-enc", "UTF-8", "-f", str(first), "-l", str(last), path, "-"],
+        capture_output=True,
+        timeout=page_timeout * n_pages if page_timeout and page_timeout > 0 else None,
+        check=True,
+    )
+    chunks = result.stdout.decode("utf-8", errors="ignore").split("\f")
+    return [
+        (first + i, chunks[i] if i < len(chunks) else "", False)
+        for i in range(n_pages)
+    ]
+
+
+# ============================================================================
+# PROZESS-POOL (lazy, pro Prozess wiederverwendet; auch von der OCR genutzt)
+# ============================================================================
+
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_process_pool(workers: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Gemeinsamer Prozess-Pool für CPU-lastige Dokument-Jobs.
+
+    Feste Größe (``max(PDF_EXTRACT_WORKERS, workers)`` beim ersten Aufruf); größere spätere
+    Anfragen teilen sich die vorhandenen Worker. Ersetzt wird der Pool nur nach einem
+    hängenden Worker (``recycle_process_pool``).
+    """
+    global _PROCESS_POOL
+    with _POOL_LOCK:
+        if _PROCESS_POOL is None:
+            try:
+                _PROCESS_POOL = ProcessPoolExecutor(max_workers=max(DEFAULT_WORKERS, workers))
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"⚠️ Prozess-Pool nicht verfügbar ({e}) - extrahiere sequentiell")
+        return _PROCESS_POOL
+
+
+def recycle_process_pool(pool) -> None:
+    """
+    Verwirft einen Pool mit hängendem oder abgestürztem Worker: Worker-Prozesse beenden,
+    der nächste ``get_process_pool`` legt einen neuen Pool an. Noch offene Futures des
+    alten Pools enden mit ``BrokenProcessPool``.
+    """
+    global _PROCESS_POOL
+    with _POOL_LOCK:
+        if _PROCESS_POOL is pool:
+            _PROCESS_POOL = None
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+    logger.warning("♻️ Prozess-Pool ersetzt (hängender Worker)")
+
+
+def shutdown_pdf_workers() -> None:
+    """Beendet den Prozess-Pool (z.B. beim App-Shutdown)."""
+    global _PROCESS_POOL
+    with _POOL_LOCK:
+        if _PROCESS_POOL is not None:
+            _PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+            _PROCESS_POOL = None
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+class PdfExtractionEngine:
+    """
+    Extrahiert PDF-Text seitenweise mit dem schnellsten verfügbaren Backend.
+
+    Args:
+        max_workers: Parallele Seitenbereiche (1 = sequentiell)
+        pages_per_chunk: Seiten pro Bereich; PDFs bis zu dieser Größe laufen inline
+        page_timeout: Zeitlimit pro Seite in Sekunden (0 = kein Limit)
+        prefer_pdftotext: False erzwingt pypdf (z.B. für Tests)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        pages_per_chunk: int = DEFAULT_PAGES_PER_CHUNK,
+        page_timeout: float = DEFAULT_PAGE_TIMEOUT,
+        prefer_pdftotext: bool = True,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.pages_per_chunk = max(1, pages_per_chunk)
+        self.page_timeout = page_timeout
+        self.prefer_pdftotext = prefer_pdftotext
+
+    @property
+    def backend(self) -> str:
+        if self.prefer_pdftotext and find_pdftotext():
+            return BACKEND_PDFTOTEXT
+        return BACKEND_PYPDF
+
+    def extract(
+        self,
+        source: PdfSource,
+        separator: str = "\n",
+        page_transform: Optional[Callable[[str], str]] = None,
+    ) -> PdfExtractionResult:
+        """
+        Extrahiert alle Seiten.
+
+        Args:
+            source: Pfad, Bytes oder Binär-Stream
+            separator: Trenner zwischen (nicht-leeren) Seiten im Gesamttext
+            page_transform: Optionale Bereinigung pro Seite (vor Offset-Berechnung)
+        """
+        from pypdf import PdfReader
+
+        backend = self.backend
+        path, stream = coerce_pdf_source(source)
+        reader = PdfReader(path if path else stream)
+        page_count = len(reader.pages)
+        ranges = self._page_ranges(page_count)
+        parallel = len(ranges) > 1 and self.max_workers > 1
+        # Ohne SIGALRM (Worker-Thread) hält nur der Prozess-Pool das Seitenlimit ein
+        bounded = bool(self.page_timeout and self.page_timeout > 0) and not _can_use_alarm()
+
+        if backend == BACKEND_PDFTOTEXT or parallel or bounded:
+            with spooled_pdf_path(path, stream) as file_path:
+                if backend == BACKEND_PDFTOTEXT:
+                    raw_pages = self._run_pdftotext(file_path, ranges)
+                else:
+                    raw_pages = self._run_pypdf_pool(file_path, reader, ranges)
+        else:
+            raw_pages = _extract_pages_pypdf(reader, 1, page_count, self.page_timeout)
+
+        result = self._assemble(raw_pages, backend, page_count, separator, page_transform)
+        if result.timed_out_pages:
+            logger.warning(f"⏱️ {len(result.timed_out_pages)} Seite(n) wegen Zeitlimit übersprungen")
+        logger.debug(f"📄 PDF extrahiert ({backend}): {page_count} Seiten, {len(result.text)} Zeichen")
+        return result
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+
+    def _page_ranges(self, page_count: int) -> List[Tuple[int, int]]:
+        step = self.pages_per_chunk
+        return [(first, min(first + step - 1, page_count)) for first in range(1, page_count + 1, step)]
+
+    def _run_pdftotext(self, path: str, ranges: List[Tuple[int, int]]) -> List[_RawPage]:
+        binary = find_pdftotext()
+
+        def run_range(page_range: Tuple[int, int]) -> List[_RawPage]:
+            first, last = page_range
+            try:
+                return _pdftotext_range(binary, path, first, last, self.page_timeout)
+            except (subprocess.SubprocessError, OSError) as e:
+                logger.warning(f"⚠️ pdftotext Seiten {first}-{last} fehlgeschlagen ({e}) - pypdf Fallback")
+                pool, future = self._submit_range(path, first, last)
+                if pool is None:
+                    return _pypdf_range_worker(path, first, last, self.page_timeout)
+                return self._range_result(path, first, last, pool, future)
+
+        if len(ranges) <= 1 or self.max_workers == 1:
+            return [page for r in ranges for page in run_range(r)]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ranges))) as pool:
+            return [page for chunk in pool.map(run_range, ranges) for page in chunk]
+
+    def _run_pypdf_pool(self, path: str, reader, ranges: List[Tuple[int, int]]) -> List[_RawPage]:
+        submitted = [(first, last, *self._submit_range(path, first, last)) for first, last in ranges]
+        if any(pool is None for _, _, pool, _ in submitted):
+            return _extract_pages_pypdf(reader, 1, ranges[-1][1], self.page_timeout)
+        return [
+            page
+            for first, last, pool, future in submitted
+            for page in self._range_result(path, first, last, pool, future)
+        ]
+
+    def _submit_range(self, path: str, first: int, last: int) -> Tuple[Optional[ProcessPoolExecutor], Optional[Future]]:
+        """Plant einen Bereich im gemeinsamen Pool ein; ist der Pool kaputt, im ersetzten Pool"""
+        for _ in range(2):
+            pool = get_process_pool(self.max_workers)
+            if pool is None:
+                return None, None
+            try:
+                return pool, pool.submit(_pypdf_range_worker, path, first, last, self.page_timeout)
+            except (BrokenExecutor, RuntimeError) as e:
+                logger.warning(f"⚠️ Prozess-Pool nicht nutzbar ({e}) - neuer Pool")
+                recycle_process_pool(pool)
+        return None, None
+
+    def _range_result(self, path: str, first: int, last: int, pool, future, retry: bool = True) -> List[_RawPage]:
+        """
+        Ergebnis eines Pool-Bereichs. Worker setzen das Seitenlimit selbst (SIGALRM); hängt ein
+        Worker trotzdem (blockierender C-Code), ist nach ``page_timeout × Seiten`` Schluss: die
+        Seiten werden als timed_out markiert und der Pool ersetzt, damit der Slot frei wird.
+        """
+        budget = self.page_timeout * (last - first + 1) + POOL_BUDGET_SLACK_SECONDS if self.page_timeout else None
+        try:
+            return future.result(timeout=budget)
+        except FutureTimeoutError:
+            if future.cancel():
+                # Noch nicht gestartet (Pool ausgelastet) → nur diesen Bereich aufgeben
+                logger.warning(f"⏱️ Seiten {first}-{last}: Pool ausgelastet, Zeitlimit überschritten")
+            else:
+                logger.warning(f"⏱️ Seiten {first}-{last}: Worker-Zeitlimit überschritten")
+                recycle_process_pool(pool)
+            return [(p, "", True) for p in range(first, last + 1)]
+        except (BrokenExecutor, CancelledError) as e:
+            # Pool wurde wegen eines anderen hängenden Bereichs ersetzt → einmal im neuen Pool
+            if retry:
+                new_pool, new_future = self._submit_range(path, first, last)
+                if new_pool is not None and new_pool is not pool:
+                    return self._range_result(path, first, last, new_pool, new_future, retry=False)
+            logger.warning(f"⚠️ Seiten {first}-{last} fehlgeschlagen: {e}")
+            return [(p, "", False) for p in range(first, last + 1)]
+        except Exception as e:
+            logger.warning(f"⚠️ Seiten {first}-{last} fehlgeschlagen: {e}")
+            return [(p, "", False) for p in range(first, last + 1)]
+
+    @staticmethod
+    def _assemble(
+        raw_pages: List[_RawPage],
+        backend: str,
+        page_count: int,
+        separator: str,
+        page_transform: Optional[Callable[[str], str]],
+    ) -> PdfExtractionResult:
+        parts: List[str] = []
+        pages: List[PageText] = []
+        offset = 0
+        for page_no, text, timed_out in sorted(raw_pages, key=lambda p: p[0]):
+            if page_transform is not None:
+                text = page_transform(text)
+            if text and text.strip():
+                if parts:
+                    offset += len(separator)
+                parts.append(text)
+                start, offset = offset, offset + len(text)
+            else:
+                text, start = "", offset
+            pages.append(PageText(page=page_no, text=text, start=start, end=offset, timed_out=timed_out))
+
+        return PdfExtractionResult(
+            text=separator.join(parts),
+            backend=backend,
+            page_count=page_count,
+            pages=pages,
+        )
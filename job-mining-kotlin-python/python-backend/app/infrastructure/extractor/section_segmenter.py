@@ -0,0 +1,210 @@
+# infrastructure/extractor/section_segmenter.py
+
+"""
+SectionSegmenter - Linearer Abschnitts-Segmentierer für Stellenanzeigen (Ebene 6)
+================================================================================
+
+Ersetzt die DOTALL-Lookahead-Regexe ``(.*?)(?=(?:...|$))`` aus dem
+MetadataExtractor durch einen zeilenorientierten Ein-Pass-Ansatz:
+
+1. Header-Automat: Pro Zeile EIN verankerter Match gegen die Header-Keywords
+   (Aufwand begrenzt durch die längste Keyword-Länge, unabhängig vom Text).
+2. Zustandsmaschine: Jede Zeile gehört zum zuletzt erkannten Abschnitt
+   (intro → tasks → requirements → benefits → about → contact ...).
+
+Zusammengeklappte Scraping-Texte ("... Dein Profil: Python ...") werden vorab an
+Inline-Headern der Form ``KEYWORD:`` aufgeteilt. Kein Pattern enthält
+unbegrenzte Quantoren hinter Alternativen - die Laufzeit ist linear in der
+Textlänge, auch ohne passende Header.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+# Labels
+INTRO = "intro"
+TASKS = "tasks"
+REQUIREMENTS = "requirements"
+BENEFITS = "benefits"
+ABOUT = "about"
+CONTACT = "contact"
+
+# Abschnitte ohne fachlichen Kompetenz-Inhalt (werden aus dem Analysetext entfernt)
+IRRELEVANT_LABELS = frozenset({BENEFITS, ABOUT, CONTACT})
+
+# Header-Keywords je Label (lowercase). Beim Matchen gewinnt die längste
+# Variante, d.h. "deine aufgaben" vor "aufgaben".
+SECTION_HEADERS: Dict[str, Tuple[str, ...]] = {
+    INTRO: (
+        "wir suchen",
+    ),
+    TASKS: (
+        "deine aufgaben", "ihre aufgaben", "aufgaben", "tätigkeiten", "taetigkeiten",
+        "was du bei uns machst", "das erwartet dich", "das erwartet sie",
+        "your tasks", "your responsibilities", "responsibilities", "tasks",
+        "what you will do", "what you'll do",
+    ),
+    REQUIREMENTS: (
+        "dein profil", "ihr profil", "profil", "your profile", "anforderungen",
+        "requirements", "qualifications", "qualifikationen", "qualifikation",
+        "voraussetzungen", "skillset", "das bringst du mit", "das bringen sie mit",
+        "was du mitbringst", "what you bring",
+    ),
+    BENEFITS: (
+        "was wir bieten", "wir bieten", "das bieten wir", "benefits", "what we offer",
+    ),
+    ABOUT: (
+        "about us", "über uns", "ueber uns", "why us", "warum wir", "wer wir sind",
+        "unternehmen",
+    ),
+    CONTACT: (
+        "kontakt", "contact", "bewerbung",
+    ),
+}
+
+# Zeilen ohne Trennzeichen gelten nur als Überschrift, wenn sie kurz sind
+_MAX_BARE_HEADER_LEN = 50
+_MAX_BARE_HEADER_WORDS = 3
+
+
+@dataclass
+class Section:
+    """Ein zusammenhängender Block mit Label und Text."""
+    label: str
+    text: str
+    header: str = ""
+
+
+def _keyword_alternation() -> Tuple[str, Dict[str, str]]:
+    keyword_to_label: Dict[str, str] = {}
+    for label, keywords in SECTION_HEADERS.items():
+        for kw in keywords:
+            keyword_to_label.setdefault(kw, label)
+    ordered = sorted(keyword_to_label, key=len, reverse=True)
+    return "|".join(re.escape(kw) for kw in ordered), keyword_to_label
+
+
+_ALTERNATION, _KEYWORD_TO_LABEL = _keyword_alternation()
+
+# Schneller Vorfilter: Anfangsbuchstaben aller Header-Keywords
+_HEADER_INITIALS = frozenset(kw[0] for kw in _KEYWORD_TO_LABEL) | frozenset(kw[0].upper() for kw in _KEYWORD_TO_LABEL)
+_PREFIX_CHARS = " \t#*•-–>0123456789.)"
+
+# Verankerter Header-Match am Zeilenanfang (nach Bullets/Markdown/Nummerierung)
+_HEADER_RE = re.compile(
+    rf"(?P<prefix>[\s#*•\-–>\d.)]{{0,8}})(?P<kw>{_ALTERNATION})(?![a-zäöüß])(?P<rest>.*)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Inline-Header "KEYWORD:" mitten in einer Zeile (zusammengeklappter Scraping-Text)
+_INLINE_HEADER_RE = re.compile(rf"(?<![a-zäöüß])(?:{_ALTERNATION})[ \t]{{0,3}}:", re.IGNORECASE)
+
+_SEPARATORS = ":-–—|!?"
+_BULLETS = frozenset("*•-–>")
+
+
+class SectionSegmenter:
+    """
+    Segmentiert Stellenanzeigen in tasks / requirements / benefits / about /
+    contact / intro Blöcke - in einem Pass über die Zeilen.
+    """
+
+    def segment(self, text: str) -> List[Section]:
+        """Liefert die Abschnitte in Dokumentreihenfolge."""
+        sections: List[Section] = []
+        current = Section(label=INTRO, text="")
+        buffer: List[str] = []
+
+        for unit in self._iter_units(text or ""):
+            header = self._match_header(unit)
+            if header is None:
+                buffer.append(unit)
+                continue
+
+            label, header_text, rest = header
+            current.text = "\n".join(buffer).strip()
+            if current.text or current.header:
+                sections.append(current)
+
+            current = Section(label=label, text="", header=header_text)
+            buffer = [rest] if rest else []
+
+        current.text = "\n".join(buffer).strip()
+        if current.text or current.header:
+            sections.append(current)
+        return sections
+
+    def split(self, text: str) -> Dict[str, str]:
+        """
+        {label: Text} - mehrere Blöcke desselben Labels werden zusammengefügt.
+        """
+        return self.merge(self.segment(text))
+
+    def strip_irrelevant(self, text: str) -> str:
+        """Entfernt Benefits/About/Kontakt-Blöcke (Fallback: Originaltext)."""
+        return self.relevant_text(self.segment(text), fallback=text)
+
+    @staticmethod
+    def merge(sections: List[Section]) -> Dict[str, str]:
+        """Fügt die Blöcke je Label zusammen."""
+        merged: Dict[str, List[str]] = {}
+        for section in sections:
+            if section.text:
+                merged.setdefault(section.label, []).append(section.text)
+        return {label: "\n".join(parts) for label, parts in merged.items()}
+
+    @staticmethod
+    def relevant_text(sections: List[Section], fallback: str = "") -> str:
+        """Text ohne irrelevante Blöcke; leer → fallback."""
+        kept = [s.text for s in sections if s.label not in IRRELEVANT_LABELS and s.text]
+        cleaned = "\n".join(kept).strip()
+        return cleaned if cleaned else fallback
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _iter_units(text: str):
+        """Zeilen, zusätzlich aufgetrennt an Inline-Headern 'KEYWORD:'."""
+        for line in text.splitlines():
+            if ":" not in line:
+                yield line
+                continue
+            start = 0
+            for m in _INLINE_HEADER_RE.finditer(line):
+                if m.start() > start and line[start:m.start()].strip():
+                    yield line[start:m.start()]
+                    start = m.start()
+            yield line[start:]
+
+    @staticmethod
+    def _match_header(unit: str):
+        """
+        Prüft, ob eine Zeile mit einem Header-Keyword beginnt.
+        Returns: (label, header_text, rest) oder None
+        """
+        head = unit.lstrip(_PREFIX_CHARS)
+        if not head or head[0] not in _HEADER_INITIALS:
+            return None
+
+        m = _HEADER_RE.match(unit)
+        if not m:
+            return None
+
+        rest = m.group("rest").strip()
+        if rest and rest[0] not in _SEPARATORS:
+            # Ohne Trennzeichen: nur kurze, nicht als Aufzählung formatierte Zeilen
+            is_bullet = any(ch in _BULLETS for ch in m.group("prefix"))
+            if (
+                is_bullet
+                or len(unit.strip()) > _MAX_BARE_HEADER_LEN
+                or len(rest.split()) > _MAX_BARE_HEADER_WORDS
+                or rest.endswith(".")
+            ):
+                return None
+
+        label = _KEYWORD_TO_LABEL[m.group("kw").lower()]
+        rest = rest.lstrip(_SEPARATORS + " \t.")
+        return label, m.group("kw"), rest
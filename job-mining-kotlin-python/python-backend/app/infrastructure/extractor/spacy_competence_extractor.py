@@ -1,6 +1,7 @@
 import spacy
 from spacy.matcher import PhraseMatcher
-from typing import List, Optional
+from spacy.tokens import Doc
+from typing import List, Optional, Union
 from spacy.util import is_package
 from app.domain.models import CompetenceDTO
 # NEU: Importiere die Factory statt den Manager
@@ -58,10 +59,8 @@ class SpaCyCompetenceExtractor(ICompetenceExtractor):
 
         # Kompatibilitäts-Alias: 'extract' wird in der Pipeline erwartet
         def _extract_alias(doc_or_text):
-            if isinstance(doc_or_text, str):
-                return self.extract_competences(doc_or_text)
-            else:
-                return self.extract_competences(doc_or_text.text)
+            # Docs aus nlp.pipe (Batch) direkt weiterreichen - kein zweites Parsing
+            return self.extract_competences(doc_or_text)
 
         self.extract = _extract_alias
 
@@ -84,7 +83,7 @@ class SpaCyCompetenceExtractor(ICompetenceExtractor):
         else:
             print("⚠️ spaCy Extractor Warnung: Repository ist leer!")
 
-    def extract_competences(self, text: str, role: str = None) -> List[CompetenceDTO]:
+    def extract_competences(self, text: Union[str, Doc], role: str = None) -> List[CompetenceDTO]:
         """
         OPTIMIERTE KOMPETENZEN-EXTRAKTION mit Rollen-Kontextualisierung:
         1. Text-Analyse mit spaCy-NLP
@@ -96,7 +95,10 @@ class SpaCyCompetenceExtractor(ICompetenceExtractor):
         # Role-Context für Gewichtung vorbereiten (Ebene 6: roleContext)
         role_context = role or "Unbekannt"
 
-        doc = self.nlp(text[:100000]) # Limit protection
+        if isinstance(text, Doc):
+            doc, text = text, text.text
+        else:
+            doc = self.nlp(text[:100000]) # Limit protection
         matches = self.matcher(doc)
         results = []
         seen = set()
@@ -267,7 +269,8 @@ class SpaCyCompetenceExtractor(ICompetenceExtractor):
 
                 labels = self.repository.get_all_identifiable_labels()
                 # Filtere Tokens: alphabetische oder hyphenierte Tokens, keine Stop-Words
-                tokens = [t.text for t in self.nlp(text) if (t.is_alpha or '-' in t.text) and not t.is_stop]
+                token_doc = doc if len(doc.text) == len(text) else self.nlp(text)
+                tokens = [t.text for t in token_doc if (t.is_alpha or '-' in t.text) and not t.is_stop]
                 if not tokens:
                     return results
                 max_n = min(4, max((len(l.split()) for l in labels), default=1))
@@ -1,91 +1,334 @@
 """
 Async Playwright Scraper for JavaScript-heavy pages
+
+Uses a long-lived BrowserPool instead of launching Chromium per URL:
+- one browser per process, reusable contexts/pages (recycled after N uses)
+- request interception: images, fonts, media and third-party trackers are blocked
+- readiness via site-specific selectors, falling back to a short network-idle wait
+- concurrency capped by the number of pooled pages
 """
+import asyncio
 import logging
 import os
 import subprocess
-from typing import Optional
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_PAGES = int(os.getenv("PLAYWRIGHT_MAX_PAGES", "4"))
+DEFAULT_MAX_USES_PER_CONTEXT = int(os.getenv("PLAYWRIGHT_MAX_USES_PER_CONTEXT", "50"))
+READY_TIMEOUT_MS = 5000
+IDLE_FALLBACK_TIMEOUT_MS = 3000
 
-async def scrape_with_rendering(url: str, timeout: int = 30000) -> str:
-    """
-    Scrapes a URL with Playwright (async) for JS rendering
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
 
-    Args:
-        url: The URL to scrape
-        timeout: Timeout in milliseconds (default 30s)
+# Third-party trackers/ads (matched against the request host, incl. subdomains)
+TRACKER_DOMAINS = (
+    "google-analytics.com", "googletagmanager.com", "googlesyndication.com",
+    "doubleclick.net", "googleadservices.com", "facebook.net", "facebook.com",
+    "hotjar.com", "hotjar.io", "segment.io", "segment.com", "mixpanel.com",
+    "adservice.google.com", "bing.com", "clarity.ms", "criteo.com", "criteo.net",
+    "taboola.com", "outbrain.com", "linkedin.com/px", "ads.linkedin.com",
+    "snap.licdn.com", "px.ads.linkedin.com", "cookielaw.org", "onetrust.com",
+    "usercentrics.eu", "consensu.org", "newrelic.com", "nr-data.net",
+)
 
-    Returns:
-        Extracted text from the page
+DEFAULT_READY_SELECTOR = 'h1, .job-title, .title, [itemprop="description"]'
 
-    Raises:
-        ImportError: If Playwright is not installed
-        Exception: On scraping errors
-    """
+# Selectors that appear once the job description is rendered
+READY_SELECTORS = {
+    "linkedin.com": ".show-more-less-html__markup, .description__text, .top-card-layout__title",
+    "xing.com": '[data-testid="job-details-description"], [class*="job-description"], h1',
+    "stepstone.de": '[data-at="job-ad-content"], [data-at="header-job-title"], h1',
+    "indeed.com": "#jobDescriptionText, .jobsearch-JobInfoHeader-title",
+    "karriere.at": ".m-jobContent__jobText, h1",
+    "jobware.de": ".job-description, h1",
+    "personio.com": '[data-test-id="job-description"], .job-description, h1',
+}
+
+
+def ready_selector_for(url: str) -> str:
+    """Readiness selector for a URL (site-specific, else generic)"""
+    host = (urlparse(url).hostname or "").lower()
+    for domain, selector in READY_SELECTORS.items():
+        if host == domain or host.endswith("." + domain):
+            return selector
+    return DEFAULT_READY_SELECTOR
+
+
+def should_block_request(resource_type: str, request_url: str) -> bool:
+    """True for heavy resources (images/fonts/media) and known tracker hosts"""
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    parsed = urlparse(request_url)
+    host = (parsed.hostname or "").lower()
+    host_path = host + parsed.path
+    for tracker in TRACKER_DOMAINS:
+        if "/" in tracker:
+            if host_path.startswith(tracker) or host_path.startswith("www." + tracker):
+                return True
+        elif host == tracker or host.endswith("." + tracker):
+            return True
+    return False
+
+
+def _import_async_playwright():
     try:
         from playwright.async_api import async_playwright
+        return async_playwright
     except ImportError:
-        # Auto-install fallback if PLAYWRIGHT_AUTO_INSTALL is enabled
-        auto_install = os.environ.get("PLAYWRIGHT_AUTO_INSTALL", "false").lower() in {"1", "true", "yes"}
-        if auto_install:
+        pass
+
+    # Auto-install fallback if PLAYWRIGHT_AUTO_INSTALL is enabled
+    auto_install = os.environ.get("PLAYWRIGHT_AUTO_INSTALL", "false").lower() in {"1", "true", "yes"}
+    if not auto_install:
+        raise ImportError(
+            "Playwright not installed. "
+            "Please run: pip install playwright && playwright install chromium"
+        )
+    try:
+        logger.info("Playwright missing - attempting auto-install")
+        subprocess.run(["python3", "-m", "pip", "install", "playwright"], check=True)
+        try:
+            subprocess.run(["playwright", "install", "chromium", "--with-deps"], check=True)
+        except subprocess.CalledProcessError:
+            # Fallback without system dependencies
+            logger.warning("Installing chromium without system dependencies")
             try:
-                logger.info("Playwright missing - attempting auto-install")
-                subprocess.run(["python3", "-m", "pip", "install", "playwright"], check=True)
-                try:
-                    subprocess.run(["playwright", "install", "chromium", "--with-deps"], check=True)
-                except subprocess.CalledProcessError:
-                    # Fallback without system dependencies
-                    logger.warning("Installing chromium without system dependencies")
-                    try:
-                        subprocess.run(["apt-get", "update"], check=True)
-                        subprocess.run(["apt-get", "install", "-y",
-                                        "fonts-unifont",
-                                        "fonts-ubuntu",
-                                        "fonts-dejavu-core"], check=True)
-                    except Exception:
-                        pass
-                    subprocess.run(["playwright", "install", "chromium"], check=True)
-
-                # Retry import after installation
-                from playwright.async_api import async_playwright
-                logger.info("Playwright auto-install successful")
-            except Exception as e:
-                raise ImportError(f"Playwright auto-install failed: {e}")
-        else:
-            raise ImportError(
-                "Playwright not installed. "
-                "Please run: pip install playwright && playwright install chromium"
-            )
+                subprocess.run(["apt-get", "update"], check=True)
+                subprocess.run(["apt-get", "install", "-y",
+                                "fonts-unifont",
+                                "fonts-ubuntu",
+                                "fonts-dejavu-core"], check=True)
+            except Exception:
+                pass
+            subprocess.run(["playwright", "install", "chromium"], check=True)
 
-    logger.info(f"Scraping with Playwright: {url}")
+        # Retry import after installation
+        from playwright.async_api import async_playwright
+        logger.info("Playwright auto-install successful")
+        return async_playwright
+    except Exception as e:
+        raise ImportError(f"Playwright auto-install failed: {e}")
+
+
+@dataclass
+class RenderedPage:
+    """Result of rendering one URL"""
+    url: str
+    final_url: str
+    status: int
+    title: Optional[str]
+    text: str
+    latency_ms: int
+    warnings: List[str] = field(default_factory=list)
+
+
+class _PageSlot:
+    """A browser context with one reusable page"""
+
+    def __init__(self, context, page):
+        self.context = context
+        self.page = page
+        self.uses = 0
+
+    async def close(self) -> None:
+        try:
+            await self.context.close()
+        except Exception as e:
+            logger.debug(f"Closing browser context failed: {e}")
+
+
+class BrowserPool:
+    """
+    Long-lived headless Chromium with a bounded pool of contexts/pages.
+
+    Args:
+        max_pages: Maximum concurrent renders (= pooled contexts)
+        max_uses_per_context: Recycle a context after this many renders (memory, cookies)
+        block_resources: Intercept requests and abort images/fonts/media/trackers
+        headless: Run Chromium headless
+    """
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    def __init__(
+        self,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_uses_per_context: int = DEFAULT_MAX_USES_PER_CONTEXT,
+        block_resources: bool = True,
+        headless: bool = True,
+    ):
+        self.max_pages = max(1, max_pages)
+        self.max_uses_per_context = max(1, max_uses_per_context)
+        self.block_resources = block_resources
+        self.headless = headless
+        self.blocked_requests = 0
+        self._playwright = None
+        self._browser = None
+        self._idle: List[_PageSlot] = []
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+        self._start_lock = asyncio.Lock()
+        self._closed = False
 
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def start(self) -> None:
+        """Launches the browser once (lazy, restarts after a crash)"""
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+        async with self._start_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            if self._playwright is None:
+                self._playwright = await _import_async_playwright()().start()
+            self._idle.clear()
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless,
+                args=["--disable-dev-shm-usage", "--disable-gpu"],
+            )
+            logger.info(f"Chromium started (pool size {self.max_pages})")
+
+    async def render(self, url: str, timeout: int = 30000, ready_selector: Optional[str] = None) -> RenderedPage:
+        """Renders a URL on a pooled page and returns its visible text"""
+        await self._semaphore.acquire()
+        slot = None
+        broken = False
         try:
-            # Navigate and wait for network idle
-            await page.goto(url, wait_until='networkidle', timeout=timeout)
+            await self.start()
+            slot = self._idle.pop() if self._idle else await self._new_slot()
+            slot.uses += 1
+            return await self._render_on(slot.page, url, timeout, ready_selector or ready_selector_for(url))
+        except Exception:
+            broken = True
+            raise
+        finally:
+            if slot is not None:
+                await self._release(slot, broken)
+            self._semaphore.release()
 
-            # Wait for main content (optional, with timeout)
+    async def close(self) -> None:
+        """Closes all contexts, the browser and the Playwright driver"""
+        self._closed = True
+        slots, self._idle = self._idle, []
+        for slot in slots:
+            await slot.close()
+        if self._browser is not None:
             try:
-                await page.wait_for_selector('h1, .job-title, .title', timeout=5000)
+                await self._browser.close()
             except Exception as e:
-                logger.warning(f"Main content selector not found: {e}")
+                logger.debug(f"Closing browser failed: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.info("Browser pool closed")
 
-            # Extract all text from body
-            text = await page.inner_text('body')
+    async def _new_slot(self) -> _PageSlot:
+        context = await self._browser.new_context(
+            locale="de-DE",
+            java_script_enabled=True,
+            service_workers="block",
+        )
+        if self.block_resources:
+            await context.route("**/*", self._route)
+        page = await context.new_page()
+        return _PageSlot(context, page)
 
-            logger.info(f"Scraping successful: {len(text)} characters")
+    async def _release(self, slot: _PageSlot, broken: bool) -> None:
+        if broken or self._closed or slot.uses >= self.max_uses_per_context or slot.page.is_closed():
+            await slot.close()
+        else:
+            self._idle.append(slot)
 
-            return text
+    async def _route(self, route) -> None:
+        request = route.request
+        if should_block_request(request.resource_type, request.url):
+            self.blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
 
-        except Exception as e:
-            logger.error(f"Playwright scraping failed for {url}: {e}")
-            raise
+    async def _render_on(self, page, url: str, timeout: int, ready_selector: str) -> RenderedPage:
+        start = time.monotonic()
+        warnings: List[str] = []
 
-        finally:
-            await page.close()
-            await browser.close()
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+
+        # Readiness: site-specific selector, fallback to a short network-idle wait
+        try:
+            await page.wait_for_selector(ready_selector, state="attached", timeout=READY_TIMEOUT_MS)
+        except Exception:
+            warnings.append(f"Ready selector not found: {ready_selector}")
+            try:
+                await page.wait_for_load_state("networkidle", timeout=IDLE_FALLBACK_TIMEOUT_MS)
+            except Exception:
+                warnings.append("Network did not become idle")
+
+        text = await page.inner_text("body")
+        title = None
+        try:
+            title = (await page.inner_text("h1", timeout=1000)).strip() or None
+        except Exception:
+            title = (await page.title()) or None
+
+        latency_ms = int((time.monotonic() - start) * 1000)
+        logger.info(f"Rendered {url}: {len(text)} characters in {latency_ms}ms")
+        return RenderedPage(
+            url=url,
+            final_url=page.url,
+            status=response.status if response else 0,
+            title=title,
+            text=text,
+            latency_ms=latency_ms,
+            warnings=warnings,
+        )
+
+
+# Shared pool (one browser per process)
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Returns the process-wide pool (browser starts lazily on first render)"""
+    global _browser_pool
+    if _browser_pool is None or _browser_pool.closed:
+        _browser_pool = BrowserPool()
+    return _browser_pool
+
+
+async def shutdown_browser_pool() -> None:
+    """Closes the shared pool (app shutdown)"""
+    global _browser_pool
+    if _browser_pool is not None:
+        await _browser_pool.close()
+        _browser_pool = None
+
+
+async def scrape_with_rendering(url: str, timeout: int = 30000) -> str:
+    """
+    Scrapes a URL with Playwright (async) for JS rendering
+
+    Args:
+        url: The URL to scrape
+        timeout: Timeout in milliseconds (default 30s)
+
+    Returns:
+        Extracted text from the page
+
+    Raises:
+        ImportError: If Playwright is not installed
+        Exception: On scraping errors
+    """
+    logger.info(f"Scraping with Playwright: {url}")
+    try:
+        rendered = await get_browser_pool().render(url, timeout=timeout)
+    except Exception as e:
+        logger.error(f"Playwright scraping failed for {url}: {e}")
+        raise
+    for warning in rendered.warnings:
+        logger.warning(f"{url}: {warning}")
+    return rendered.text
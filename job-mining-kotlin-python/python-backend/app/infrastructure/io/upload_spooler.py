@@ -0,0 +1,135 @@
+"""
+Upload-Limits: Größe prüfen, bevor der Upload gelesen wird
+==========================================================
+
+Starlette nimmt Multipart-Uploads selbst entgegen und lagert sie in ein
+``SpooledTemporaryFile`` aus (``UploadFile.file``). Eine weitere Kopie ist
+daher unnötig - der Handler liest direkt aus ``UploadFile.file``:
+
+- ``BodySizeLimitMiddleware`` erzwingt ``MAX_UPLOAD_BYTES`` vor dem Parsen:
+  ``Content-Length`` wird sofort geprüft (413 ohne den Body zu lesen), bei
+  Chunked-Uploads zählt die Middleware mit und bricht beim Überschreiten ab.
+- ``open_upload`` prüft danach das typ-spezifische Limit (``UPLOAD_TYPE_LIMITS``)
+  und leere Dateien und liefert den bereits gespoolten Stream (keine Kopie).
+"""
+
+import json
+import logging
+import os
+from typing import BinaryIO, Dict
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(50 * 1024 * 1024)))
+# Multipart-Rahmen (Boundaries, Header der Teile) kommt zur Dateigröße hinzu
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+_MB = 1024 * 1024
+
+# Limits je Dateityp (zusätzlich gilt immer MAX_UPLOAD_BYTES)
+UPLOAD_TYPE_LIMITS: Dict[str, int] = {
+    '.pdf': 50 * _MB,
+    '.docx': 20 * _MB,
+    '.png': 15 * _MB,
+    '.jpg': 15 * _MB,
+    '.jpeg': 15 * _MB,
+    '.txt': 2 * _MB,
+    '.md': 2 * _MB,
+    '.csv': 5 * _MB,
+    '.rtf': 5 * _MB,
+}
+
+
+class UploadRejected(ValueError):
+    """Upload verletzt Größen-/Typ-Limits (status_code für die HTTP-Antwort)."""
+
+    def __init__(self, detail: str, status_code: int = 413):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+def upload_limit_for(filename: str) -> int:
+    """Maximale Größe für einen Dateinamen (Typ-Limit, gedeckelt durch MAX_UPLOAD_BYTES)."""
+    ext = os.path.splitext(filename or "")[1].lower()
+    return min(UPLOAD_TYPE_LIMITS.get(ext, MAX_UPLOAD_BYTES), MAX_UPLOAD_BYTES)
+
+
+def open_upload(upload) -> BinaryIO:
+    """
+    Prüft einen von Starlette bereits gespoolten ``UploadFile`` und liefert dessen Stream.
+
+    Raises:
+        UploadRejected: 400 bei leerer Datei, 413 bei Überschreitung des Typ-Limits
+    """
+    filename = upload.filename or ""
+    limit = upload_limit_for(filename)
+    stream = upload.file
+    size = getattr(upload, "size", None)
+    if size is None:
+        size = stream.seek(0, os.SEEK_END)
+    if size > limit:
+        raise UploadRejected(f"Datei zu groß: {size} Bytes (Limit {limit} Bytes für '{filename}')")
+    if size == 0:
+        raise UploadRejected("Datei ist leer", status_code=400)
+    stream.seek(0)
+    logger.info(f"📦 Upload '{filename}': {size} Bytes")
+    return stream
+
+
+class _BodyTooLarge(Exception):
+    pass
+
+
+class BodySizeLimitMiddleware:
+    """
+    ASGI-Middleware: Requests mit mehr als ``max_bytes`` Body werden mit 413 abgelehnt,
+    bevor FastAPI den Body parst (Content-Length) bzw. sobald das Limit erreicht ist (chunked).
+    """
+
+    def __init__(self, app, max_bytes: int = MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        declared = dict(scope.get("headers") or []).get(b"content-length")
+        if declared is not None and declared.isdigit() and int(declared) > self.max_bytes:
+            await self._reject(send, int(declared))
+            return
+
+        received = 0
+        started = False
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise _BodyTooLarge()
+            return message
+
+        async def tracking_send(message):
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except _BodyTooLarge:
+            if started:
+                raise
+            await self._reject(send, received)
+
+    async def _reject(self, send, size: int) -> None:
+        logger.warning(f"⛔ Request-Body zu groß: {size} Bytes (Limit {self.max_bytes} Bytes)")
+        body = json.dumps({"detail": f"Request zu groß (Limit {self.max_bytes} Bytes)"}).encode("utf-8")
+        await send({"type": "http.response.start", "status": 413,
+                    "headers": [(b"content-type", b"application/json"),
+                                (b"content-length", str(len(body)).encode())]})
+        await send({"type": "http.response.body", "body": body})
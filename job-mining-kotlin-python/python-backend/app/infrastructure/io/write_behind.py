@@ -0,0 +1,159 @@
+"""
+Write-behind für JSON-Dateien (ein Dict pro Datei)
+==================================================
+
+Statt jede Änderung sofort als komplette Datei neu zu schreiben, werden
+geänderte Dateien nur als "dirty" markiert und gesammelt geschrieben:
+
+- nach ``WRITE_BEHIND_MAX_PENDING`` Änderungen,
+- spätestens ``WRITE_BEHIND_MAX_DELAY_SECONDS`` nach der ersten ungeschriebenen Änderung,
+- explizit per ``flush()`` und beim Prozessende (atexit).
+
+Geschrieben wird atomar (Temp-Datei + ``os.replace``): nach einem Absturz liegt
+immer der letzte vollständige Stand vor, verloren gehen höchstens die
+Änderungen eines Intervalls. Liest ein anderer Teil des Prozesses dieselbe
+Datei (``load_json``), werden offene Änderungen vorher geschrieben.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+WRITE_BEHIND_MAX_PENDING = int(os.getenv("WRITE_BEHIND_MAX_PENDING", "500"))
+WRITE_BEHIND_MAX_DELAY_SECONDS = float(os.getenv("WRITE_BEHIND_MAX_DELAY_SECONDS", "5"))
+
+_writers: "weakref.WeakSet[WriteBehindWriter]" = weakref.WeakSet()
+
+
+def _snapshot(data: Dict[str, Any]) -> Dict[str, Any]:
+    # dict.copy() ist unter dem GIL atomar; Einträge werden einzeln kopiert,
+    # damit parallele Änderungen das Serialisieren nicht stören
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in data.copy().items()}
+
+
+def write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """Schreibt JSON über eine Temp-Datei im selben Verzeichnis + os.replace"""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_json(path: Path) -> Dict[str, Any]:
+    """
+    Lädt eine JSON-Datei ({} wenn nicht vorhanden). Offene Änderungen an derselben
+    Datei werden vorher geschrieben; eine unlesbare Datei wird beiseitegelegt statt
+    beim nächsten Flush überschrieben.
+    """
+    for writer in list(_writers):
+        writer.flush(path)
+    if not path.exists():
+        return {}
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except ValueError as e:
+        corrupt = path.with_name(f"{path.name}.corrupt-{int(time.time())}")
+        os.replace(path, corrupt)
+        logger.warning(f"⚠️ {path.name} unlesbar ({e}) → {corrupt.name}, starte leer")
+        return {}
+
+
+class WriteBehindWriter:
+    """
+    Sammelt Änderungen an JSON-Dateien und schreibt sie verzögert.
+
+    Args:
+        max_pending: Anzahl Änderungen, nach denen sofort geschrieben wird
+        max_delay: Sekunden, nach denen eine ungeschriebene Änderung spätestens geschrieben wird
+    """
+
+    def __init__(self, max_pending: int = WRITE_BEHIND_MAX_PENDING,
+                 max_delay: float = WRITE_BEHIND_MAX_DELAY_SECONDS):
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self._dirty: Dict[Path, Dict[str, Any]] = {}
+        self._pending = 0
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self.flushes = 0
+        _writers.add(self)
+
+    def mark_dirty(self, path: Path, data: Dict[str, Any], immediate: bool = False) -> None:
+        """Merkt ``data`` zum Schreiben nach ``path`` vor (``immediate``: sofort schreiben)"""
+        with self._lock:
+            self._dirty[Path(path)] = data
+            self._pending += 1
+            if immediate or self._pending >= self.max_pending:
+                self.flush()
+            else:
+                self._schedule()
+
+    def _schedule(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self.max_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self, path: Optional[Path] = None) -> int:
+        """
+        Schreibt offene Änderungen (alle oder nur ``path``).
+
+        Returns:
+            Anzahl geschriebener Dateien
+        """
+        with self._lock:
+            if path is not None:
+                path = Path(path)
+                if path not in self._dirty:
+                    return 0
+                targets = {path: self._dirty.pop(path)}
+            else:
+                targets, self._dirty = self._dirty, {}
+            if not self._dirty:
+                self._pending = 0
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            written = 0
+            for target, data in targets.items():
+                if not target.parent.exists():
+                    # Verzeichnis wurde entfernt (z.B. temporäres Test-Verzeichnis)
+                    logger.warning(f"⚠️ Write-behind verworfen, Verzeichnis fehlt: {target.parent}")
+                    continue
+                try:
+                    write_json_atomic(target, _snapshot(data))
+                    written += 1
+                except Exception as e:
+                    # Bleibt vorgemerkt, nächster Flush versucht es erneut
+                    self._dirty.setdefault(target, data)
+                    logger.error(f"❌ Write-behind für {target.name} fehlgeschlagen: {e}")
+            if self._dirty:
+                self._schedule()
+            if written:
+                self.flushes += 1
+            return written
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+
+@atexit.register
+def flush_all_writers() -> None:
+    """Schreibt offene Änderungen aller Writer (Prozessende / Shutdown-Hook)"""
+    for writer in list(_writers):
+        try:
+            writer.flush()
+        except Exception as e:
+            logger.error(f"❌ Write-behind beim Beenden fehlgeschlagen: {e}")
@@ -11,9 +11,10 @@ Job-Klassifizierungen mit erweiterten Kategorien:
 Basierend auf Job-Titel, Rolle und Industrie.
 """
 
-import re
 from typing import Optional, Dict, List
 
+from app.core.keyword_classifier import KeywordClassifier
+
 
 # ============================================================================
 # JOB-KLASSIFIKATIONS-REGELN
@@ -71,6 +72,10 @@ ROLE_CLASSIFIERS = {
     },
 }
 
+# Einmalig kompiliert: Hauptkategorien + Unterkategorien je Kategorie
+_ROLE_CLASSIFIER = KeywordClassifier({c: r['keywords'] for c, r in ROLE_CLASSIFIERS.items()})
+_SUB_CLASSIFIERS = {c: KeywordClassifier(r.get('sub_categories', {})) for c, r in ROLE_CLASSIFIERS.items()}
+
 
 def classify_job_role(title: str, role: str = '', industry: str = '') -> Dict[str, str]:
     """
@@ -89,20 +94,16 @@ def classify_job_role(title: str, role: str = '', industry: str = '') -> Dict[st
     text = (title + ' ' + role + ' ' + industry).lower()
     
     # Durchsuche alle Kategorien
-    for category, rules in ROLE_CLASSIFIERS.items():
-        if re.search(rules['keywords'], text):
-            # Finde Unterkategorie wenn vorhanden
-            sub = 'general'
-            for sub_cat, sub_pattern in rules.get('sub_categories', {}).items():
-                if re.search(sub_pattern, text):
-                    sub = sub_cat
-                    break
-            
-            return {
-                'category': category,
-                'sub_category': sub,
-                'reason': f'matched {category} keywords'
-            }
+    category = _ROLE_CLASSIFIER.first_match(text)
+    if category:
+        # Finde Unterkategorie wenn vorhanden
+        sub = _SUB_CLASSIFIERS[category].first_match(text) or 'general'
+
+        return {
+            'category': category,
+            'sub_category': sub,
+            'reason': f'matched {category} keywords'
+        }
     
     return {
         'category': 'unknown',
@@ -154,6 +155,8 @@ COMPETENCE_CATEGORIES = {
     },
 }
 
+_COMPETENCE_CLASSIFIER = KeywordClassifier({c: r['keywords'] for c, r in COMPETENCE_CATEGORIES.items()})
+
 
 def categorize_competence(skill_name: str, collections: List[str] = None) -> Dict[str, str]:
     """
@@ -172,13 +175,13 @@ def categorize_competence(skill_name: str, collections: List[str] = None) -> Dic
     text = skill_name.lower()
     
     # Priorisiere Custom-Kategorien
-    for category, rules in COMPETENCE_CATEGORIES.items():
-        if re.search(rules['keywords'], text):
-            return {
-                'category': category,
-                'description': rules['description'],
-                'source': 'custom_model'
-            }
+    category = _COMPETENCE_CLASSIFIER.first_match(text)
+    if category:
+        return {
+            'category': category,
+            'description': COMPETENCE_CATEGORIES[category]['description'],
+            'source': 'custom_model'
+        }
     
     # Fallback: Nutze ESCO-Collections falls vorhanden
     if 'digital' in collections:
@@ -214,6 +217,19 @@ def categorize_competence(skill_name: str, collections: List[str] = None) -> Dic
     }
 
 
+def is_specific_skill(collections: List[str] = None) -> bool:
+    """
+    Filtert Skills nach ESCO-Collections (Top-Skills, Trends):
+    - ✅ Digital, Research → Wertvolle, spezifische Skills
+    - ❌ Language, Transversal → Generic, zu breit für Top-Skills
+    """
+    if not collections:
+        return True  # Occupation-specific Skills ohne Collection → behalten
+
+    # Exclude wenn NUR Language oder Transversal
+    return not set(collections).issubset({'language', 'transversal'})
+
+
 # ============================================================================
 # REPORTING HELPERS
 # ============================================================================
@@ -0,0 +1,238 @@
+"""
+Laufzeit-Metriken der Analyse-Pipeline im Prometheus-Textformat (ohne Zusatzpaket)
+
+- Histogramm je Pipeline-Stufe (``STAGES``): Textextraktion, Metadaten, Branche, Rolle,
+  spaCy-Parsing, Matcher, Fuzzy, Discovery (Pass 3 + Kandidaten-Log), DTO-Aufbau, Export
+- Zähler: Dokumente (nach Status), Kompetenz-Treffer (nach Quelle)
+- Cache-Treffer/-Fehlschläge werden beim Abruf aus den registrierten Caches gelesen
+  (die Caches zählen ohnehin mit, kein Aufwand im Hot Path)
+- Aktiv mit ``LOG_NLP_TIMINGS=1``; sonst liefert ``stage_timer`` einen geteilten No-op-Kontext
+  und ``count`` kehrt sofort zurück
+- ``document_timings()``: sammelt die Stufen-Dauern des aktuellen Dokuments (thread-lokal)
+  für eine Timing-Logzeile je Dokument
+"""
+
+import bisect
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "jobmining"
+STAGES = ("text_extraction", "metadata", "industry", "role", "nlp_parse", "matcher", "fuzzy", "discovery",
+          "discovery_log", "dto_build", "export")
+# Sekunden; spaCy-Parsing langer Anzeigen liegt im Bereich 0.1-2 s, OCR-PDFs deutlich darüber
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_COUNTER_HELP = {
+    "documents_total": "Analysierte Dokumente nach Status",
+    "competence_matches_total": "Gefundene Kompetenzen nach Extraktions-Pass",
+}
+
+_NOOP = nullcontext()
+_local = threading.local()
+
+
+def timings_enabled() -> bool:
+    """LOG_NLP_TIMINGS=1 (docker-compose) schaltet Messung und Timing-Logzeilen ein"""
+    return os.getenv("LOG_NLP_TIMINGS", "0").lower() in {"1", "true", "yes"}
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs: Tuple[Tuple[str, str], ...]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Kumulatives Histogramm mit festen Bucket-Grenzen (nur unter dem Lock des Registers ändern)"""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """[(le, Anzahl <= le)] inklusive '+Inf'"""
+        total = 0
+        rows = []
+        for bound, n in zip(self.buckets, self.counts):
+            total += n
+            rows.append((_number(bound), total))
+        rows.append(("+Inf", self.count))
+        return rows
+
+
+class _StageTimer:
+    __slots__ = ('_metrics', '_stage', '_timings', '_start')
+
+    def __init__(self, metrics: "PipelineMetrics", stage: str, timings: Optional[Dict[str, float]]):
+        self._metrics = metrics
+        self._stage = stage
+        self._timings = timings
+
+    def __enter__(self) -> "_StageTimer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        elapsed = time.perf_counter() - self._start
+        self._metrics.observe(self._stage, elapsed)
+        if self._timings is not None:
+            self._timings[self._stage] = self._timings.get(self._stage, 0.0) + elapsed
+        return False
+
+
+class PipelineMetrics:
+    """
+    Metrik-Register (thread-sicher).
+
+    Args:
+        enabled: Messung aktiv (default: ``LOG_NLP_TIMINGS``)
+    """
+
+    def __init__(self, enabled: Optional[bool] = None):
+        self.enabled = timings_enabled() if enabled is None else enabled
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Histogram] = {}
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        self._caches: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+
+    def stage(self, stage: str):
+        """Kontext, der die Dauer einer Pipeline-Stufe misst (auch in ``document_timings``)"""
+        if not self.enabled:
+            return _NOOP
+        return _StageTimer(self, stage, getattr(_local, 'timings', None))
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = Histogram()
+            histogram.observe(seconds)
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        """Erhöht einen Zähler (``name`` ohne Präfix, z.B. 'documents_total')"""
+        if not self.enabled or not amount:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def register_cache(self, name: str, cache: Any) -> None:
+        """Cache mit ``hits``/``misses``-Attributen; wird beim Abruf gelesen (schwache Referenz)"""
+        self._caches[name] = cache
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+    def render(self) -> str:
+        """Alle Metriken im Prometheus-Textformat (Version 0.0.4)"""
+        with self._lock:
+            stages = {stage: (h.cumulative(), h.sum, h.count) for stage, h in self._stages.items()}
+            counters = dict(self._counters)
+
+        lines = [
+            f"# HELP {PREFIX}_timings_enabled 1 wenn LOG_NLP_TIMINGS aktiv ist",
+            f"# TYPE {PREFIX}_timings_enabled gauge",
+            f"{PREFIX}_timings_enabled {int(self.enabled)}",
+            f"# HELP {PREFIX}_stage_duration_seconds Dauer je Pipeline-Stufe",
+            f"# TYPE {PREFIX}_stage_duration_seconds histogram",
+        ]
+        for stage in sorted(stages, key=lambda s: (STAGES.index(s) if s in STAGES else len(STAGES), s)):
+            buckets, total, count = stages[stage]
+            for le, n in buckets:
+                lines.append(f"{PREFIX}_stage_duration_seconds_bucket{_labels((('stage', stage), ('le', le)))} {n}")
+            lines.append(f"{PREFIX}_stage_duration_seconds_sum{_labels((('stage', stage),))} {_number(total)}")
+            lines.append(f"{PREFIX}_stage_duration_seconds_count{_labels((('stage', stage),))} {count}")
+
+        for name in sorted(set(_COUNTER_HELP) | {name for name, _ in counters}):
+            lines.append(f"# HELP {PREFIX}_{name} {_COUNTER_HELP.get(name, name)}")
+            lines.append(f"# TYPE {PREFIX}_{name} counter")
+            for (counter, labels), value in sorted(counters.items()):
+                if counter == name:
+                    lines.append(f"{PREFIX}_{name}{_labels(labels)} {_number(value)}")
+
+        caches = sorted(self._caches.items())
+        for field in ("hits", "misses"):
+            lines.append(f"# HELP {PREFIX}_cache_{field}_total Cache-{field} seit Prozessstart")
+            lines.append(f"# TYPE {PREFIX}_cache_{field}_total counter")
+            for name, cache in caches:
+                lines.append(f"{PREFIX}_cache_{field}_total{_labels((('cache', name),))} {getattr(cache, field, 0)}")
+        return "\n".join(lines) + "\n"
+
+
+_metrics: Optional[PipelineMetrics] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> PipelineMetrics:
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = PipelineMetrics()
+    return _metrics
+
+
+def stage_timer(stage: str):
+    """Kurzform für ``get_metrics().stage(...)``"""
+    return get_metrics().stage(stage)
+
+
+def count(name: str, amount: float = 1, **labels: str) -> None:
+    """Kurzform für ``get_metrics().inc(...)``"""
+    get_metrics().inc(name, amount, **labels)
+
+
+class _DocumentTimings:
+    __slots__ = ('source_name', 'timings', '_previous')
+
+    def __init__(self, source_name: str):
+        self.source_name = source_name
+        self.timings: Dict[str, float] = {}
+
+    def __enter__(self) -> Dict[str, float]:
+        self._previous = getattr(_local, 'timings', None)
+        _local.timings = self.timings
+        return self.timings
+
+    def __exit__(self, *exc: Any) -> bool:
+        _local.timings = self._previous
+        if self.timings:
+            parts = " | ".join(f"{stage} {seconds * 1000:.0f} ms" for stage, seconds in self.timings.items())
+            logger.info(f"⏱️ {self.source_name}: {parts} (gesamt {sum(self.timings.values()) * 1000:.0f} ms)")
+        return False
+
+
+def document_timings(source_name: str):
+    """
+    Sammelt die Stufen-Dauern eines Dokuments und loggt sie als eine Zeile (nur bei aktiver Messung).
+    Verschachtelt (Datei-Analyse → Pipeline) zählt der äußere Kontext.
+    """
+    if not get_metrics().enabled or getattr(_local, 'timings', None) is not None:
+        return _NOOP
+    return _DocumentTimings(source_name)
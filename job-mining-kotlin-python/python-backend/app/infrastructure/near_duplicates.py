@@ -0,0 +1,81 @@
+"""
+Near-Duplicate-Erkennung für Stellenanzeigen
+Dieselbe Anzeige kommt oft über LinkedIn, XING und die Firmenseite; raw_text_hash erkennt
+nur byte-identische Texte.
+
+- Bereinigter Text: klein, ohne URLs / E-Mail-Adressen, nur Wort-Tokens
+- MinHash (NumPy) über 5-Wort-Shingles → Signatur mit NUM_PERM Werten
+- LSH: Signatur in BANDS Bänder geteilt, ein Bucket-Schlüssel pro Band; der Results-Store
+  hält die Buckets als indizierte Tabelle (``job_bands``) → Kandidaten per Index-Lookup
+  statt Vergleich mit allen Anzeigen
+- Ähnlichkeit = Anteil gleicher MinHash-Werte (Schätzung der Jaccard-Ähnlichkeit der Shingles),
+  Duplikat ab ``NEAR_DUPLICATE_THRESHOLD``
+"""
+
+import os
+import re
+import zlib
+from typing import List, Optional, Set
+
+import numpy as np
+
+NUM_PERM = 128
+BANDS = 32
+SHINGLE_WORDS = 5
+# Kürzere Texte (Test-Fixtures, leere Extraktion) werden nicht indiziert
+MIN_TOKENS = 20
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.7"))
+
+_URL_OR_MAIL = re.compile(r"(https?://\S+|www\.\S+|\S+@\S+)")
+_TOKEN = re.compile(r"\w+")
+
+_rng = np.random.default_rng(20240715)
+# Multiply-Shift-Hashes: (a·h + b) mod 2^64, obere 32 Bit
+_A = _rng.integers(1, 2 ** 63, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_B = _rng.integers(0, 2 ** 63, NUM_PERM, dtype=np.uint64)
+_BAND_MIX = _rng.integers(1, 2 ** 63, NUM_PERM // BANDS, dtype=np.uint64) | np.uint64(1)
+
+
+def near_duplicates_enabled() -> bool:
+    """NEAR_DUPLICATE_DETECTION=0 schaltet Erkennung und Index ab"""
+    return os.getenv("NEAR_DUPLICATE_DETECTION", "1") != "0"
+
+
+def clean_posting_tokens(text: str) -> List[str]:
+    """Wort-Tokens des bereinigten Anzeigentexts"""
+    return _TOKEN.findall(_URL_OR_MAIL.sub(" ", str(text or "").lower()))
+
+
+def posting_shingles(text: str, size: int = SHINGLE_WORDS) -> Set[str]:
+    tokens = clean_posting_tokens(text)
+    return {" ".join(tokens[i:i + size]) for i in range(max(len(tokens) - size + 1, 1))} if tokens else set()
+
+
+def posting_signature(text: str) -> Optional[np.ndarray]:
+    """
+    MinHash-Signatur eines Anzeigentexts (uint32, NUM_PERM Werte).
+
+    Returns:
+        None für zu kurze Texte (werden weder indiziert noch verglichen)
+    """
+    if len(clean_posting_tokens(text)) < MIN_TOKENS:
+        return None
+    h = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in posting_shingles(text)), dtype=np.uint64)
+    values = (_A[:, None] * h[None, :] + _B[:, None]) >> np.uint64(32)
+    return values.min(axis=1).astype(np.uint32)
+
+
+def signature_from_bytes(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype=np.uint32)
+
+
+def band_keys(signature: np.ndarray) -> List[int]:
+    """Ein Bucket-Schlüssel pro Band (63 Bit, passt in SQLite INTEGER)"""
+    bands = signature.astype(np.uint64).reshape(BANDS, NUM_PERM // BANDS)
+    mixed = (bands * _BAND_MIX).sum(axis=1) >> np.uint64(1)
+    return [int(x) for x in mixed]
+
+
+def signature_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Geschätzte Jaccard-Ähnlichkeit (Anteil gleicher MinHash-Werte)"""
+    return float(np.count_nonzero(a == b)) / len(a)
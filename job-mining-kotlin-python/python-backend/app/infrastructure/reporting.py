@@ -1,17 +1,27 @@
 import json
 import os
+import re
 from collections import Counter, defaultdict
-from typing import Dict, List, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from pathlib import Path
 import io
 import csv
+import tempfile
 
+from app.infrastructure.aggregation_engine import (
+    Accumulator,
+    AggregationEngine,
+    JobRecord,
+    iter_job_records,
+)
 from app.infrastructure.job_classifier import (
     classify_job_role,
-    categorize_competence,
     group_jobs_by_category,
     group_skills_by_category,
+    is_specific_skill,
 )
+from app.infrastructure.results_store import ResultsStore, get_results_store, results_store_enabled
+from app.infrastructure.skill_trend_matrix import get_skill_trend_matrix
 
 BATCH_RESULTS_DIR = Path(os.getenv('BATCH_RESULTS_DIR', 'data/exports/batch_results'))
 
@@ -22,6 +32,40 @@ def _iter_job_files() -> List[Path]:
     return [p for p in BATCH_RESULTS_DIR.iterdir() if p.suffix.lower() == '.json' and p.name != 'summary.json']
 
 
+def _aggregate(accumulator: Accumulator) -> Any:
+    """Einzelne Metrik: ein Durchlauf mit nur diesem Akkumulator"""
+    return AggregationEngine([accumulator]).run(_iter_job_files())[accumulator.name]
+
+
+def _use_results_store() -> bool:
+    """SQL-Abfragen auf dem Results-Store (default) statt Verzeichnis-Scan"""
+    return results_store_enabled()
+
+
+def open_results_store() -> ResultsStore:
+    """Results-Store; bestehende JSON-Exporte werden beim ersten Zugriff einmalig importiert"""
+    store = get_results_store()
+    if store.get_meta('json_import_done') is None:
+        store.import_json_exports(_iter_job_files())
+    return store
+
+
+def results_version() -> Tuple[str, float]:
+    """
+    Datenstand für Response-Caches: (Version, Zeitpunkt der letzten Änderung als Epoch).
+    Ändert sich bei jedem gespeicherten Ergebnis; Kosten unabhängig von der Korpusgröße.
+    """
+    if _use_results_store():
+        version, modified = open_results_store().data_version()
+        return f"sqlite:{version}", modified
+    # Verzeichnis-Scan: jeder Export ersetzt summary.json (os.replace) → mtime des Verzeichnisses
+    try:
+        mtime_ns = BATCH_RESULTS_DIR.stat().st_mtime_ns
+    except OSError:
+        return "files:0", 0.0
+    return f"files:{mtime_ns}", mtime_ns / 1e9
+
+
 def load_summary() -> Dict[str, Any]:
     summary_path = BATCH_RESULTS_DIR / 'summary.json'
     if not summary_path.exists():
@@ -31,36 +75,59 @@ def load_summary() -> Dict[str, Any]:
 
 
 def _should_include_in_top_skills(collections: List[str]) -> bool:
-    """
-    Filtert Skills nach ESCO-Collections:
-    - ✅ Digital, Research → Wertvolle, spezifische Skills
-    - ❌ Language, Transversal → Generic, zu breit für Top-Skills
-    """
-    if not collections:
-        return True  # Occupation-specific Skills ohne Collection → behalten
-    
-    # Exclude wenn NUR Language oder Transversal
-    if set(collections).issubset({'language', 'transversal'}):
-        return False
-    
-    return True
+    """Filtert Skills nach ESCO-Collections (keine reinen Language/Transversal-Skills)"""
+    return is_specific_skill(collections)
+
+
+def _domain_label(classification: Dict[str, str]) -> str:
+    category = classification['category']
+    sub_category = classification['sub_category']
+    # Kombiniere Haupt- und Unterkategorie
+    if sub_category and sub_category != 'general':
+        return f"{category.replace('_', ' ').title()} — {sub_category.replace('_', ' ').title()}"
+    return category.replace('_', ' ').title()
+
+
+class TopSkillsAccumulator(Accumulator):
+    """Skill-Häufigkeiten ohne reine Sprach-/Transversal-Skills"""
+
+    name = 'top_skills'
+
+    def __init__(self, top_n: int = 10):
+        self.top_n = top_n
+        self.counter = Counter()
+
+    def add(self, record: JobRecord) -> None:
+        for c in record.competences:
+            label = c.get('esco_label') or c.get('original_term')
+            collections = c.get('collections', [])
+
+            if label and _should_include_in_top_skills(collections):
+                self.counter[label] += 1
+
+    def result(self) -> List[Tuple[str, int]]:
+        return self.counter.most_common(self.top_n)
 
 
 def aggregate_top_skills(top_n: int = 10) -> List[Tuple[str, int]]:
     """Aggregiert Top Skills, filtert nach ESCO-Collections (keine Sprachen/Generic)."""
-    counter = Counter()
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            for c in data.get('competences', []):
-                label = c.get('esco_label') or c.get('original_term')
-                collections = c.get('collections', [])
-                
-                if label and _should_include_in_top_skills(collections):
-                    counter[label] += 1
-        except Exception:
-            continue
-    return counter.most_common(top_n)
+    if _use_results_store():
+        return [(label, n) for label, n in open_results_store().top_labels(top_n)]
+    return _aggregate(TopSkillsAccumulator(top_n))
+
+
+class DomainMixAccumulator(Accumulator):
+    name = 'domain_mix'
+
+    def __init__(self):
+        self.counter = Counter()
+
+    def add(self, record: JobRecord) -> None:
+        # Nutze die Job-Klassifizierung
+        self.counter[_domain_label(record.classification)] += 1
+
+    def result(self) -> Dict[str, int]:
+        return dict(self.counter)
 
 
 def aggregate_domain_mix() -> Dict[str, int]:
@@ -68,31 +135,38 @@ def aggregate_domain_mix() -> Dict[str, int]:
     Aggregiert Domains basierend auf Job-Klassifizierung.
     Gruppiert in: Software Dev, Data Science, Product Management, UX/UI, Consulting, etc.
     """
+    if _use_results_store():
+        return _domain_mix_sql(open_results_store())
+    return _aggregate(DomainMixAccumulator())
+
+
+def _domain_mix_sql(store: ResultsStore) -> Dict[str, int]:
     counter = Counter()
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            title = data.get('title', '')
-            role = data.get('job_role', '')
-            industry = data.get('industry', '')
-            
-            # Nutze die neue Job-Klassifizierung
-            classification = classify_job_role(title, role, industry)
-            category = classification['category']
-            sub_category = classification['sub_category']
-            
-            # Kombiniere Haupt- und Unterkategorie
-            if sub_category and sub_category != 'general':
-                domain = f"{category.replace('_', ' ').title()} — {sub_category.replace('_', ' ').title()}"
-            else:
-                domain = category.replace('_', ' ').title()
-            
-            counter[domain] += 1
-        except Exception:
-            continue
+    for category, sub_category, n in store.role_counts():
+        counter[_domain_label({'category': category, 'sub_category': sub_category})] += n
     return dict(counter)
 
 
+class CollectionBreakdownAccumulator(Accumulator):
+    name = 'collection_breakdown'
+
+    def __init__(self):
+        self.counter = Counter()
+
+    def add(self, record: JobRecord) -> None:
+        for c in record.competences:
+            label = c.get('esco_label') or c.get('original_term')
+            if not label:
+                continue
+
+            # Nutze die Kompetenz-Kategorisierung, Humanize category names
+            category = record.competence_category(label, c.get('collections', []))
+            self.counter[category.replace('_', ' ').title()] += 1
+
+    def result(self) -> Dict[str, int]:
+        return dict(self.counter)
+
+
 def aggregate_collection_breakdown() -> Dict[str, int]:
     """
     Zählt Skills nach Kompetenz-Kategorien (eigenes Modell + ESCO):
@@ -106,78 +180,220 @@ def aggregate_collection_breakdown() -> Dict[str, int]:
     - database: SQL, PostgreSQL, MongoDB, etc.
     - languages: Deutsch, Englisch, etc.
     """
+    if _use_results_store():
+        return _collection_breakdown_sql(open_results_store())
+    return _aggregate(CollectionBreakdownAccumulator())
+
+
+def _collection_breakdown_sql(store: ResultsStore) -> Dict[str, int]:
     counter = Counter()
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            for c in data.get('competences', []):
-                label = c.get('esco_label') or c.get('original_term')
-                collections = c.get('collections', [])
-                
-                if not label:
-                    continue
-                
-                # Nutze die neue Kompetenz-Kategorisierung
-                categorization = categorize_competence(label, collections)
-                category = categorization['category']
-                
-                # Humanize category names
-                category_display = category.replace('_', ' ').title()
-                counter[category_display] += 1
-        except Exception:
-            continue
+    for category, n in store.category_counts():
+        counter[category.replace('_', ' ').title()] += n
     return dict(counter)
 
 
+class SkillYearAccumulator(Accumulator):
+    """
+    {skill: {year: count}} für alle Skills.
+
+    Da die Top-Skills erst am Ende feststehen, werden alle Labels gezählt
+    und ``for_skills`` wählt danach aus.
+    """
+
+    name = 'skill_years'
+
+    def __init__(self):
+        self.counts = defaultdict(lambda: defaultdict(int))
+
+    def add(self, record: JobRecord) -> None:
+        date = record.get('posting_date')
+        if not date:
+            return
+        year = date.split('-')[0]
+        for c in record.competences:
+            label = c.get('esco_label') or c.get('original_term')
+            self.counts[label][year] += 1
+
+    def for_skills(self, skills: List[str]) -> Dict[str, Dict[str, int]]:
+        return {skill: dict(self.counts.get(skill, {})) for skill in skills}
+
+    def result(self) -> Dict[str, Dict[str, int]]:
+        return {skill: dict(year_counts) for skill, year_counts in self.counts.items()}
+
+
 def aggregate_time_series_for_skills(skills: List[str]) -> Dict[str, Dict[str, int]]:
     # return {skill: {year: count}}
-    result = {s: defaultdict(int) for s in skills}
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            date = data.get('posting_date')
-            if not date:
-                continue
-            year = date.split('-')[0]
-            for c in data.get('competences', []):
-                label = c.get('esco_label') or c.get('original_term')
-                if label in result:
-                    result[label][year] += 1
-        except Exception:
-            continue
-    # convert defaultdicts to dicts
-    return {skill: dict(year_counts) for skill, year_counts in result.items()}
+    if _use_results_store():
+        return _time_series_sql(open_results_store(), skills)
+    acc = SkillYearAccumulator()
+    AggregationEngine([acc]).run(_iter_job_files())
+    return acc.for_skills(skills)
+
+
+def _time_series_sql(store: ResultsStore, skills: List[str]) -> Dict[str, Dict[str, int]]:
+    return get_skill_trend_matrix(store).series(list(skills))
+
+
+EXPORT_COLUMNS = ['title', 'job_role', 'region', 'industry', 'posting_date', 'skills_count', 'skills']
+EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '500'))
+_EXPORT_DATE = re.compile(r'^\d{4}(-\d{2}(-\d{2})?)?$')
+_XLSX_BLOCK_SIZE = 64 * 1024
+
+
+def _check_export_date(value: Optional[str], name: str) -> Optional[str]:
+    if value and not _EXPORT_DATE.match(value):
+        raise ValueError(f"{name} muss 'YYYY', 'YYYY-MM' oder 'YYYY-MM-DD' sein: {value!r}")
+    return value or None
+
+
+def _matches_export_filters(record: JobRecord, date_from: Optional[str], date_to: Optional[str],
+                            role: Optional[str], region: Optional[str]) -> bool:
+    """Filter wie ResultsStore.iter_job_rows_with_labels (Verzeichnis-Scan)"""
+    if date_from or date_to:
+        date = record.get('posting_date')
+        if not isinstance(date, str) or not _EXPORT_DATE.match(date[:10]):
+            return False
+        if date_from and date[:len(date_from)] < date_from:
+            return False
+        if date_to and date[:len(date_to)] > date_to:
+            return False
+    if role:
+        job_role = record.get('job_role') or ''
+        category = classify_job_role(record.get('title', ''), record.get('job_role', ''), record.get('industry', ''))['category']
+        if role != category and role.lower() != job_role.lower():
+            return False
+    if region and (record.get('region') or '').lower() != region.lower():
+        return False
+    return True
 
 
-def generate_csv_report() -> io.BytesIO:
-    # produce a simple CSV with one row per job and flattened competence labels
-    rows = []
-    for p in _iter_job_files():
+def iter_export_rows(
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    role: Optional[str] = None,
+    region: Optional[str] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Export-Zeilen (eine pro Job, EXPORT_COLUMNS) in Blöcken zu höchstens ``chunk_size``.
+
+    Es wird nie mehr als ein Block im Speicher gehalten - Grundlage für die Streaming-Exporte.
+    Die Filter werden sofort geprüft, die Zeilen erst beim Iterieren gelesen.
+
+    Args:
+        date_from / date_to: 'YYYY', 'YYYY-MM' oder 'YYYY-MM-DD' (inklusive)
+        role: Rollen-Kategorie (z.B. 'data_science') oder job_role
+        region: Region
+    Raises:
+        ValueError: ungültiges Datumsformat
+    """
+    date_from = _check_export_date(date_from, 'date_from')
+    date_to = _check_export_date(date_to, 'date_to')
+    return _iter_export_chunks(date_from, date_to, role, region, chunk_size)
+
+
+def _iter_export_chunks(date_from: Optional[str], date_to: Optional[str], role: Optional[str],
+                        region: Optional[str], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    if _use_results_store():
+        chunks = open_results_store().iter_job_rows_with_labels(
+            date_from=date_from, date_to=date_to, role=role, region=region, chunk_size=chunk_size,
+        )
+        for chunk in chunks:
+            yield [
+                {'title': title, 'job_role': job_role, 'region': region_, 'industry': industry,
+                 'posting_date': posting_date, 'skills_count': skills_count, 'skills': skills or ''}
+                for title, job_role, region_, industry, posting_date, skills_count, skills in chunk
+            ]
+        return
+
+    chunk = []
+    for record in iter_job_records(_iter_job_files()):
         try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            competences = [c.get('esco_label') or c.get('original_term') for c in data.get('competences', [])]
-            rows.append({
-                'title': data.get('title'),
-                'job_role': data.get('job_role'),
-                'region': data.get('region'),
-                'industry': data.get('industry'),
-                'posting_date': data.get('posting_date'),
+            if not _matches_export_filters(record, date_from, date_to, role, region):
+                continue
+            competences = [c.get('esco_label') or c.get('original_term') for c in record.competences]
+            chunk.append({
+                'title': record.get('title'),
+                'job_role': record.get('job_role'),
+                'region': record.get('region'),
+                'industry': record.get('industry'),
+                'posting_date': record.get('posting_date'),
                 'skills_count': len(competences),
                 'skills': '|'.join(competences)
             })
         except Exception:
             continue
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
 
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=['title', 'job_role', 'region', 'industry', 'posting_date', 'skills_count', 'skills'], delimiter=',')
+def stream_csv_report(**filters: Any) -> Iterator[bytes]:
+    """CSV-Export als Byte-Blöcke (Kopfzeile, dann ein Block je ``chunk_size`` Jobs)"""
+    return _csv_blocks(iter_export_rows(**filters))
+
+
+def _csv_blocks(chunks: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, delimiter=',')
     writer.writeheader()
-    for r in rows:
-        writer.writerow(r)
+    for chunk in chunks:
+        writer.writerows(chunk)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
 
-    bio = io.BytesIO()
-    bio.write(output.getvalue().encode('utf-8'))
-    bio.seek(0)
-    return bio
+
+def stream_ndjson_report(**filters: Any) -> Iterator[bytes]:
+    """NDJSON-Export: ein JSON-Objekt pro Job und Zeile"""
+    return _ndjson_blocks(iter_export_rows(**filters))
+
+
+def _ndjson_blocks(chunks: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield ''.join(json.dumps(row, ensure_ascii=False, default=str) + '\n' for row in chunk).encode('utf-8')
+
+
+def stream_xlsx_report(**filters: Any) -> Iterator[bytes]:
+    """
+    Excel-Export (openpyxl im write-only-Modus).
+
+    Zeilen werden direkt in die temporären Blattdateien von openpyxl geschrieben; XLSX ist ein
+    ZIP-Archiv, daher wird die fertige Datei aus einer temporären Datei blockweise gesendet.
+    """
+    try:
+        from openpyxl import Workbook
+    except Exception:
+        raise RuntimeError("openpyxl ist nicht installiert. Bitte 'openpyxl' in requirements.txt hinzufügen.")
+    return _xlsx_blocks(Workbook, iter_export_rows(**filters))
+
+
+def _xlsx_blocks(workbook_cls: Any, chunks: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    workbook = workbook_cls(write_only=True)
+    sheet = workbook.create_sheet('Jobs')
+    sheet.append(EXPORT_COLUMNS)
+    for chunk in chunks:
+        for row in chunk:
+            sheet.append([row[column] for column in EXPORT_COLUMNS])
+
+    with tempfile.TemporaryFile() as tmp:
+        workbook.save(tmp)
+        tmp.seek(0)
+        while True:
+            block = tmp.read(_XLSX_BLOCK_SIZE)
+            if not block:
+                break
+            yield block
+
+
+def generate_csv_report(**filters: Any) -> io.BytesIO:
+    # produce a simple CSV with one row per job and flattened competence labels
+    # (komplett im Speicher; für Downloads stream_csv_report verwenden)
+    return io.BytesIO(b''.join(stream_csv_report(**filters)))
 
 
 def generate_pdf_report() -> io.BytesIO:
@@ -216,68 +432,81 @@ def generate_pdf_report() -> io.BytesIO:
     return bio
 
 
+class DigitalSkillsAccumulator(Accumulator):
+    name = 'digital_skills_count'
+
+    def __init__(self):
+        self.seen_skills = set()
+
+    def add(self, record: JobRecord) -> None:
+        for c in record.competences:
+            label = c.get('esco_label') or c.get('original_term')
+            if label and c.get('is_digital', False):
+                self.seen_skills.add(label)
+
+    def result(self) -> int:
+        return len(self.seen_skills)
+
+
 def aggregate_digital_skills_count() -> int:
     """Zählt digitale Skills basierend auf ESCO 'is_digital' Flag."""
-    digital_count = 0
-    seen_skills = set()
+    if _use_results_store():
+        return open_results_store().digital_label_count()
+    return _aggregate(DigitalSkillsAccumulator())
 
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            for c in data.get('competences', []):
-                label = c.get('esco_label') or c.get('original_term')
-                is_digital = c.get('is_digital', False)
-
-                if label and is_digital and label not in seen_skills:
-                    seen_skills.add(label)
-                    digital_count += 1
-        except Exception:
-            continue
 
-    return digital_count
+class RegionAccumulator(Accumulator):
+    name = 'regional_distribution'
+
+    def __init__(self):
+        self.counter = Counter()
+
+    def add(self, record: JobRecord) -> None:
+        region = record.get('region', 'Unbekannt')
+        if region:
+            self.counter[region] += 1
+
+    def result(self) -> Dict[str, int]:
+        return dict(self.counter)
 
 
 def aggregate_regional_distribution() -> Dict[str, int]:
     """Aggregiert Jobs nach Region/Stadt."""
-    counter = Counter()
+    if _use_results_store():
+        return dict(open_results_store().region_counts())
+    return _aggregate(RegionAccumulator())
 
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            region = data.get('region', 'Unbekannt')
-            if region:
-                counter[region] += 1
-        except Exception:
-            continue
 
-    return dict(counter)
+class FilteredSkillYearAccumulator(Accumulator):
+    """{skill: {year(int): count}} ohne Sprach-/Transversal-Skills (Basis für Emerging + Level 7)"""
 
+    name = 'filtered_skill_years'
 
-def aggregate_emerging_skills(min_year: int = 2024) -> List[Dict[str, Any]]:
-    """
-    Identifiziert aufstrebende Skills durch Wachstumsanalyse.
-    Vergleicht aktuelle Jahre (>=min_year) mit Vorjahren.
-    """
-    skill_by_year = defaultdict(lambda: defaultdict(int))
+    def __init__(self):
+        self.skill_by_year = defaultdict(lambda: defaultdict(int))
 
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            date = data.get('posting_date')
-            if not date:
-                continue
+    def add(self, record: JobRecord) -> None:
+        date = record.get('posting_date')
+        if not date:
+            return
 
-            year = int(date.split('-')[0])
+        year = str(date).split('-')[0]
+        if not year.isdigit():
+            return  # Kein Jahr (z.B. "ohne-datum") → Job zählt in keinem Jahr
+        year = int(year)
 
-            for c in data.get('competences', []):
-                label = c.get('esco_label') or c.get('original_term')
-                collections = c.get('collections', [])
+        for c in record.competences:
+            label = c.get('esco_label') or c.get('original_term')
+            collections = c.get('collections', [])
 
-                if label and _should_include_in_top_skills(collections):
-                    skill_by_year[label][year] += 1
-        except Exception:
-            continue
+            if label and _should_include_in_top_skills(collections):
+                self.skill_by_year[label][year] += 1
+
+    def result(self) -> Dict[str, Dict[int, int]]:
+        return self.skill_by_year
 
+
+def _emerging_skills(skill_by_year: Dict[str, Dict[int, int]], min_year: int) -> List[Dict[str, Any]]:
     # Berechne Wachstum
     growth_data = []
     for skill, year_counts in skill_by_year.items():
@@ -309,60 +538,141 @@ def aggregate_emerging_skills(min_year: int = 2024) -> List[Dict[str, Any]]:
     return growth_data[:10]
 
 
+def aggregate_emerging_skills(min_year: int = 2024) -> List[Dict[str, Any]]:
+    """
+    Identifiziert aufstrebende Skills durch Wachstumsanalyse.
+    Vergleicht aktuelle Jahre (>=min_year) mit Vorjahren.
+    """
+    if _use_results_store():
+        return get_skill_trend_matrix(open_results_store()).emerging(min_year)
+    return _emerging_skills(_aggregate(FilteredSkillYearAccumulator()), min_year)
+
+
+class QualityAccumulator(Accumulator):
+    """Kategorisiert Jobs nach Extraktionsqualität"""
+
+    name = 'quality_metrics'
+
+    def __init__(self):
+        self.quality_buckets = {
+            'excellent': 0,  # >= 90%
+            'good': 0,       # 70-89%
+            'fair': 0,       # 50-69%
+            'poor': 0        # < 50%
+        }
+        self.extraction_rates = []
+
+    def add(self, record: JobRecord) -> None:
+        self.add_jobs(len(record.competences), 1)
+
+    def add_jobs(self, total_comps: int, jobs: int) -> None:
+        """``jobs`` Jobs mit je ``total_comps`` Kompetenzen"""
+        quality_pct = _quality_pct(total_comps)
+        self.extraction_rates.extend([quality_pct] * jobs)
+
+        if total_comps == 0:
+            self.quality_buckets['poor'] += jobs
+        elif quality_pct >= 90:
+            self.quality_buckets['excellent'] += jobs
+        elif quality_pct >= 70:
+            self.quality_buckets['good'] += jobs
+        elif quality_pct >= 50:
+            self.quality_buckets['fair'] += jobs
+        else:
+            self.quality_buckets['poor'] += jobs
+
+    def result(self) -> Dict[str, Any]:
+        rates = self.extraction_rates
+        avg_quality = sum(rates) / len(rates) if rates else 0
+        return {
+            'buckets': self.quality_buckets,
+            'avg_quality': round(avg_quality, 1),
+            'total_analyzed': len(rates)
+        }
+
+
+def _quality_pct(total_comps: int) -> float:
+    if total_comps == 0:
+        return 0
+
+    # Schätze Qualität basierend auf Anzahl extrahierter Kompetenzen
+    # (20-50 ist optimal laut Anforderungen)
+    if 20 <= total_comps <= 50:
+        quality_pct = 90 + (40 - abs(total_comps - 35)) / 15 * 10  # Peak bei 35
+    elif total_comps < 20:
+        quality_pct = max(50, (total_comps / 20) * 90)
+    else:
+        quality_pct = max(50, 90 - ((total_comps - 50) / 50) * 20)
+
+    return min(100, max(0, quality_pct))
+
+
+def _quality_metrics_sql(store: ResultsStore) -> Dict[str, Any]:
+    acc = QualityAccumulator()
+    for total_comps, jobs in store.competence_count_histogram():
+        acc.add_jobs(total_comps, jobs)
+    return acc.result()
+
+
 def aggregate_quality_metrics() -> Dict[str, Any]:
     """
     Aggregiert Qualitätsmetriken der Extraktion.
     Kategorisiert Jobs nach Extraktionsqualität.
     """
-    quality_buckets = {
-        'excellent': 0,  # >= 90%
-        'good': 0,       # 70-89%
-        'fair': 0,       # 50-69%
-        'poor': 0        # < 50%
-    }
+    if _use_results_store():
+        return _quality_metrics_sql(open_results_store())
+    return _aggregate(QualityAccumulator())
 
-    extraction_rates = []
 
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            total_comps = len(data.get('competences', []))
+class LevelAccumulator(Accumulator):
+    name = 'level_progression'
 
-            if total_comps == 0:
-                quality_buckets['poor'] += 1
-                extraction_rates.append(0)
-                continue
-
-            # Schätze Qualität basierend auf Anzahl extrahierter Kompetenzen
-            # (20-50 ist optimal laut Anforderungen)
-            if 20 <= total_comps <= 50:
-                quality_pct = 90 + (40 - abs(total_comps - 35)) / 15 * 10  # Peak bei 35
-            elif total_comps < 20:
-                quality_pct = max(50, (total_comps / 20) * 90)
-            else:
-                quality_pct = max(50, 90 - ((total_comps - 50) / 50) * 20)
+    LEVEL_NAMES = {
+        1: 'Level 1 (Discovery)',
+        2: 'Level 2 (ESCO/SSoT)',
+        3: 'Level 3 (Digital)',
+        4: 'Level 4 (Fachbücher)',
+        5: 'Level 5 (Academia)',
+    }
 
-            quality_pct = min(100, max(0, quality_pct))
-            extraction_rates.append(quality_pct)
+    def __init__(self):
+        # Korrekte Level-Namen gemäß 7_ebenen_summary.md
+        self.level_counts = {
+            'Level 1 (Discovery)': 0,
+            'Level 2 (ESCO/SSoT)': 0,
+            'Level 3 (Digital)': 0,
+            'Level 4 (Fachbücher)': 0,
+            'Level 5 (Academia)': 0,
+            'Level 6 (Segmentierung)': 0,
+            'Level 7 (Zeitreihen)': 0,
+        }
 
-            if quality_pct >= 90:
-                quality_buckets['excellent'] += 1
-            elif quality_pct >= 70:
-                quality_buckets['good'] += 1
-            elif quality_pct >= 50:
-                quality_buckets['fair'] += 1
+    def add(self, record: JobRecord) -> None:
+        level_counts = self.level_counts
+        for c in record.competences:
+            # Nutze direkt das 'level' Feld aus den Competence-Daten
+            level = c.get('level', 2)  # Default: Level 2 (ESCO)
+            is_discovery = c.get('is_discovery', False)
+            is_digital = c.get('is_digital', False)
+
+            # Level-Zuordnung basierend auf tatsächlichen Daten
+            if is_discovery or level == 1:
+                level_counts['Level 1 (Discovery)'] += 1
+            elif level == 5:
+                level_counts['Level 5 (Academia)'] += 1
+            elif level == 4:
+                level_counts['Level 4 (Fachbücher)'] += 1
+            elif is_digital or level == 3:
+                level_counts['Level 3 (Digital)'] += 1
             else:
-                quality_buckets['poor'] += 1
-        except Exception:
-            continue
+                # Level 2 und Fallback für unbekannte Levels
+                level_counts['Level 2 (ESCO/SSoT)'] += 1
 
-    avg_quality = sum(extraction_rates) / len(extraction_rates) if extraction_rates else 0
+            # Level 6 & 7 sind Analyse-Ebenen, nicht in einzelnen Kompetenzen
+            # Diese werden nicht aus Job-Daten gezählt
 
-    return {
-        'buckets': quality_buckets,
-        'avg_quality': round(avg_quality, 1),
-        'total_analyzed': len(extraction_rates)
-    }
+    def result(self) -> Dict[str, int]:
+        return self.level_counts
 
 
 def aggregate_level_progression() -> Dict[str, int]:
@@ -377,47 +687,16 @@ def aggregate_level_progression() -> Dict[str, int]:
     Ebene 6: Segmentierung & Kontext (Analyse-Ebene, nicht in Kompetenzen)
     Ebene 7: Zeitreihen/Validierung (Analyse-Ebene, nicht in Kompetenzen)
     """
-    # Korrekte Level-Namen gemäß 7_ebenen_summary.md
-    level_counts = {
-        'Level 1 (Discovery)': 0,
-        'Level 2 (ESCO/SSoT)': 0,
-        'Level 3 (Digital)': 0,
-        'Level 4 (Fachbücher)': 0,
-        'Level 5 (Academia)': 0,
-        'Level 6 (Segmentierung)': 0,
-        'Level 7 (Zeitreihen)': 0,
-    }
+    if _use_results_store():
+        return _level_progression_sql(open_results_store())
+    return _aggregate(LevelAccumulator())
 
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            for c in data.get('competences', []):
-                # Nutze direkt das 'level' Feld aus den Competence-Daten
-                level = c.get('level', 2)  # Default: Level 2 (ESCO)
-                is_discovery = c.get('is_discovery', False)
-                is_digital = c.get('is_digital', False)
-
-                # Level-Zuordnung basierend auf tatsächlichen Daten
-                if is_discovery or level == 1:
-                    level_counts['Level 1 (Discovery)'] += 1
-                elif level == 5:
-                    level_counts['Level 5 (Academia)'] += 1
-                elif level == 4:
-                    level_counts['Level 4 (Fachbücher)'] += 1
-                elif is_digital or level == 3:
-                    level_counts['Level 3 (Digital)'] += 1
-                elif level == 2:
-                    level_counts['Level 2 (ESCO/SSoT)'] += 1
-                else:
-                    # Fallback für unbekannte Levels
-                    level_counts['Level 2 (ESCO/SSoT)'] += 1
-
-                # Level 6 & 7 sind Analyse-Ebenen, nicht in einzelnen Kompetenzen
-                # Diese werden nicht aus Job-Daten gezählt
-        except Exception:
-            continue
 
-    return level_counts
+def _level_progression_sql(store: ResultsStore) -> Dict[str, int]:
+    acc = LevelAccumulator()
+    for level, n in store.model_level_counts():
+        acc.level_counts[LevelAccumulator.LEVEL_NAMES[level]] += n
+    return acc.result()
 
 
 def aggregate_pipeline_metrics() -> Dict[str, float]:
@@ -433,37 +712,7 @@ def aggregate_pipeline_metrics() -> Dict[str, float]:
     }
 
 
-def aggregate_time_series_validation() -> Dict[str, Any]:
-    """
-    Validiert Zeitreihen-Daten (Level 7: Zeitreihen/Validierung).
-
-    Prüft:
-    - Ausreichend Datenpunkte für Trend-Analyse
-    - Lücken in Zeitreihen
-    - Datenqualität über Zeit
-    - Trend-Klassifikation (Rising/Stable/Falling)
-    """
-    skill_by_year = defaultdict(lambda: defaultdict(int))
-
-    # Sammle alle Zeitreihen-Daten
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            date = data.get('posting_date')
-            if not date:
-                continue
-
-            year = int(date.split('-')[0])
-
-            for c in data.get('competences', []):
-                label = c.get('esco_label') or c.get('original_term')
-                collections = c.get('collections', [])
-
-                if label and _should_include_in_top_skills(collections):
-                    skill_by_year[label][year] += 1
-        except Exception:
-            continue
-
+def _time_series_validation(skill_by_year: Dict[str, Dict[int, int]]) -> Dict[str, Any]:
     # Validierungs-Metriken
     validated_skills = 0
     skills_with_gaps = 0
@@ -530,27 +779,45 @@ def aggregate_time_series_validation() -> Dict[str, Any]:
     }
 
 
+def aggregate_time_series_validation() -> Dict[str, Any]:
+    """
+    Validiert Zeitreihen-Daten (Level 7: Zeitreihen/Validierung).
+
+    Prüft:
+    - Ausreichend Datenpunkte für Trend-Analyse
+    - Lücken in Zeitreihen
+    - Datenqualität über Zeit
+    - Trend-Klassifikation (Rising/Stable/Falling)
+    """
+    if _use_results_store():
+        return get_skill_trend_matrix(open_results_store()).time_series_validation()
+    return _time_series_validation(_aggregate(FilteredSkillYearAccumulator()))
+
+
 def build_dashboard_metrics(top_n: int = 10) -> Dict[str, Any]:
-    summary = load_summary()
-    total_jobs = summary.get('processed') or 0
-    total_skills = summary.get('skills_total') or 0
-    top_skills = aggregate_top_skills(top_n=top_n)
-    domain_mix = aggregate_domain_mix()
-    collection_breakdown = aggregate_collection_breakdown()
-    time_series = aggregate_time_series_for_skills([s for s, _ in top_skills])
-
-    # Neue Features: Job-Gruppierung nach Rolle
-    job_groups = aggregate_jobs_by_role()
-    skill_groups = aggregate_skills_by_competence_category()
+    if _use_results_store():
+        # Summen aus dem Store: Near-Duplicates und nachgerückte Anzeigen sind dort aktuell
+        store = open_results_store()
+        total_jobs = store.count_jobs()
+        total_skills = store.competence_total()
+        results = _collect_metrics_sql(top_n)
+    else:
+        summary = load_summary()
+        total_jobs = summary.get('processed') or 0
+        total_skills = summary.get('skills_total') or 0
+        results = _collect_metrics_files(top_n)
+    top_skills = results['top_skills']
+    time_series = results['time_series']
+
+    # Job-Gruppierung nach Rolle
+    job_groups = results['job_groups']
+    skill_groups = results['skill_groups']
 
     # Erweiterte Metriken (DASHBOARD_GUIDE.md Features)
-    digital_skills_count = aggregate_digital_skills_count()
-    regional_dist = aggregate_regional_distribution()
-    emerging_skills = aggregate_emerging_skills(min_year=2024)
-    quality_metrics = aggregate_quality_metrics()
-    level_progression = aggregate_level_progression()
+    quality_metrics = results['quality_metrics']
+    emerging_skills = results['emerging_skills']
     pipeline_metrics = aggregate_pipeline_metrics()
-    time_series_validation = aggregate_time_series_validation()  # Level 7
+    time_series_validation = results['time_series_validation']  # Level 7
 
     # Role distribution (vereinfacht aus job_groups)
     role_distribution = {k.replace('_', ' ').title(): v['total'] for k, v in job_groups.items()}
@@ -558,24 +825,109 @@ def build_dashboard_metrics(top_n: int = 10) -> Dict[str, Any]:
     return {
         'total_jobs': total_jobs,
         'total_skills': total_skills,
-        'digital_skills_count': digital_skills_count,
+        'digital_skills_count': results['digital_skills_count'],
         'avg_quality': quality_metrics['avg_quality'],
         'top_skills': [{'skill': s, 'count': c} for s, c in top_skills],
-        'domain_mix': domain_mix,
-        'collection_breakdown': collection_breakdown,
+        'domain_mix': results['domain_mix'],
+        'collection_breakdown': results['collection_breakdown'],
         'time_series': time_series,
         'job_groups': job_groups,
         'skill_groups': skill_groups,
-        'regional_distribution': regional_dist,  # NEU
+        'regional_distribution': results['regional_distribution'],  # NEU
         'emerging_skills': emerging_skills,  # NEU
         'quality_metrics': quality_metrics,  # NEU
-        'level_progression': level_progression,  # NEU
+        'level_progression': results['level_progression'],  # NEU
         'pipeline_metrics': pipeline_metrics,  # NEU
         'role_distribution': role_distribution,  # NEU
         'time_series_validation': time_series_validation,  # NEU - Level 7
     }
 
 
+def _collect_metrics_files(top_n: int) -> Dict[str, Any]:
+    """Ein Durchlauf über alle Ergebnis-Dateien für sämtliche Metriken"""
+    skill_years = SkillYearAccumulator()
+    results = AggregationEngine([
+        TopSkillsAccumulator(top_n),
+        DomainMixAccumulator(),
+        CollectionBreakdownAccumulator(),
+        skill_years,
+        JobsByRoleAccumulator(),
+        SkillsByCategoryAccumulator(),
+        DigitalSkillsAccumulator(),
+        RegionAccumulator(),
+        FilteredSkillYearAccumulator(),
+        QualityAccumulator(),
+        LevelAccumulator(),
+    ]).run(_iter_job_files())
+    results['time_series'] = skill_years.for_skills([s for s, _ in results['top_skills']])
+    results['emerging_skills'] = _emerging_skills(results['filtered_skill_years'], min_year=2024)
+    results['time_series_validation'] = _time_series_validation(results['filtered_skill_years'])
+    return results
+
+
+def _collect_metrics_sql(top_n: int) -> Dict[str, Any]:
+    """Alle Metriken als (indizierte) SQL-Aggregate bzw. über die Skill-Trend-Matrix des Results-Stores"""
+    store = open_results_store()
+    trends = get_skill_trend_matrix(store)
+    top_skills = [(label, n) for label, n in store.top_labels(top_n)]
+    return {
+        'top_skills': top_skills,
+        'domain_mix': _domain_mix_sql(store),
+        'collection_breakdown': _collection_breakdown_sql(store),
+        'time_series': trends.series([s for s, _ in top_skills]),
+        'job_groups': _jobs_by_role_sql(store),
+        'skill_groups': _skills_by_category_sql(store),
+        'digital_skills_count': store.digital_label_count(),
+        'regional_distribution': dict(store.region_counts()),
+        'emerging_skills': trends.emerging(min_year=2024),
+        'time_series_validation': trends.time_series_validation(),
+        'quality_metrics': _quality_metrics_sql(store),
+        'level_progression': _level_progression_sql(store),
+    }
+
+
+class JobsByRoleAccumulator(Accumulator):
+    name = 'job_groups'
+
+    def __init__(self):
+        self.groups = {}
+
+    def add(self, record: JobRecord) -> None:
+        classification = record.classification
+        category = classification['category']
+        sub = classification['sub_category']
+
+        group = self.groups.get(category)
+        if group is None:
+            group = self.groups[category] = {
+                'total': 0,
+                'sub_categories': Counter(),
+                'skills_counter': Counter(),
+            }
+
+        group['total'] += 1
+        if sub and sub != 'unknown':
+            group['sub_categories'][sub] += 1
+
+        # Sammle Skills für diese Rolle
+        for c in record.competences:
+            label = c.get('esco_label') or c.get('original_term')
+            if label:
+                group['skills_counter'][label] += 1
+
+    def result(self) -> Dict[str, Dict[str, Any]]:
+        # Formatiere für JSON-Output
+        result = {}
+        for cat, data in self.groups.items():
+            top_skills = data['skills_counter'].most_common(5)
+            result[cat] = {
+                'total': data['total'],
+                'sub_categories': dict(data['sub_categories']),
+                'top_skills': [{'skill': s, 'count': c} for s, c in top_skills],
+            }
+        return result
+
+
 def aggregate_jobs_by_role() -> Dict[str, Dict[str, Any]]:
     """
     Gruppiert alle Jobs nach ihrer Klassifizierung:
@@ -589,51 +941,64 @@ def aggregate_jobs_by_role() -> Dict[str, Dict[str, Any]]:
         ...
     }
     """
-    groups = {}
-    
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            title = data.get('title', '')
-            role = data.get('job_role', '')
-            industry = data.get('industry', '')
-            
-            classification = classify_job_role(title, role, industry)
-            category = classification['category']
-            sub = classification['sub_category']
-            
-            if category not in groups:
-                groups[category] = {
-                    'total': 0,
-                    'sub_categories': Counter(),
-                    'skills_counter': Counter(),
-                }
-            
-            groups[category]['total'] += 1
-            if sub and sub != 'unknown':
-                groups[category]['sub_categories'][sub] += 1
-            
-            # Sammle Skills für diese Rolle
-            for c in data.get('competences', []):
-                label = c.get('esco_label') or c.get('original_term')
-                if label:
-                    groups[category]['skills_counter'][label] += 1
-        except Exception:
-            continue
-    
-    # Formatiere für JSON-Output
+    if _use_results_store():
+        return _jobs_by_role_sql(open_results_store())
+    return _aggregate(JobsByRoleAccumulator())
+
+
+def _jobs_by_role_sql(store: ResultsStore) -> Dict[str, Dict[str, Any]]:
     result = {}
-    for cat, data in groups.items():
-        top_skills = data['skills_counter'].most_common(5)
-        result[cat] = {
-            'total': data['total'],
-            'sub_categories': dict(data['sub_categories']),
-            'top_skills': [{'skill': s, 'count': c} for s, c in top_skills],
-        }
-    
+    for category, sub, n in store.role_counts():
+        group = result.setdefault(category, {'total': 0, 'sub_categories': {}, 'top_skills': []})
+        group['total'] += n
+        if sub and sub != 'unknown':
+            group['sub_categories'][sub] = group['sub_categories'].get(sub, 0) + n
+    for category, label, n in store.role_top_labels(5):
+        result[category]['top_skills'].append({'skill': label, 'count': n})
     return result
 
 
+class SkillsByCategoryAccumulator(Accumulator):
+    name = 'skill_groups'
+
+    def __init__(self):
+        self.categories = {}
+
+    def add(self, record: JobRecord) -> None:
+        job_cat = record.classification['category']
+
+        for c in record.competences:
+            label = c.get('esco_label') or c.get('original_term')
+            if not label:
+                continue
+
+            cat = record.competence_category(label, c.get('collections', []))
+            entry = self.categories.get(cat)
+            if entry is None:
+                entry = self.categories[cat] = {
+                    'total': 0,
+                    'skills': Counter(),
+                    'roles': Counter(),
+                }
+
+            entry['total'] += 1
+            entry['skills'][label] += 1
+            entry['roles'][job_cat] += 1
+
+    def result(self) -> Dict[str, Dict[str, Any]]:
+        # Formatiere für JSON-Output
+        result = {}
+        for cat, data in self.categories.items():
+            top_skills = data['skills'].most_common(10)
+            top_roles = data['roles'].most_common(5)
+            result[cat] = {
+                'total': data['total'],
+                'top_skills': [{'skill': s, 'count': c} for s, c in top_skills],
+                'top_roles': [{'role': r, 'count': c} for r, c in top_roles],
+            }
+        return result
+
+
 def aggregate_skills_by_competence_category() -> Dict[str, Dict[str, Any]]:
     """
     Gruppiert alle Skills nach ihrer Kompetenz-Kategorie:
@@ -646,47 +1011,15 @@ def aggregate_skills_by_competence_category() -> Dict[str, Dict[str, Any]]:
         ...
     }
     """
-    categories = {}
-    
-    for p in _iter_job_files():
-        try:
-            data = json.load(open(p, 'r', encoding='utf-8'))
-            title = data.get('title', '')
-            role = data.get('job_role', '')
-            industry = data.get('industry', '')
-            job_cat = classify_job_role(title, role, industry)['category']
-            
-            for c in data.get('competences', []):
-                label = c.get('esco_label') or c.get('original_term')
-                if not label:
-                    continue
-                
-                collections = c.get('collections', [])
-                categorization = categorize_competence(label, collections)
-                cat = categorization['category']
-                
-                if cat not in categories:
-                    categories[cat] = {
-                        'total': 0,
-                        'skills': Counter(),
-                        'roles': Counter(),
-                    }
-                
-                categories[cat]['total'] += 1
-                categories[cat]['skills'][label] += 1
-                categories[cat]['roles'][job_cat] += 1
-        except Exception:
-            continue
-    
-    # Formatiere für JSON-Output
-    result = {}
-    for cat, data in categories.items():
-        top_skills = data['skills'].most_common(10)
-        top_roles = data['roles'].most_common(5)
-        result[cat] = {
-            'total': data['total'],
-            'top_skills': [{'skill': s, 'count': c} for s, c in top_skills],
-            'top_roles': [{'role': r, 'count': c} for r, c in top_roles],
-        }
-    
+    if _use_results_store():
+        return _skills_by_category_sql(open_results_store())
+    return _aggregate(SkillsByCategoryAccumulator())
+
+
+def _skills_by_category_sql(store: ResultsStore) -> Dict[str, Dict[str, Any]]:
+    result = {category: {'total': n, 'top_skills': [], 'top_roles': []} for category, n in store.category_counts()}
+    for category, label, n in store.category_top_labels(10):
+        result[category]['top_skills'].append({'skill': label, 'count': n})
+    for category, role, n in store.category_top_roles(5):
+        result[category]['top_roles'].append({'role': role, 'count': n})
     return result
@@ -0,0 +1,1126 @@
+"""
+Results-Store: Analyse-Ergebnisse in einer eingebetteten SQLite-Datenbank
+Ersetzt den Verzeichnis-Scan über batch_results/*.json als Abfragequelle.
+
+- Normalisiert: ``jobs`` (ein Eintrag pro raw_text_hash) + ``competences``
+- Indizes auf posting_date/-jahr, Region, Rolle, Label, Kategorie
+- Rollen- und Kompetenz-Klassifizierung werden beim Schreiben vorberechnet
+- Bulk-Insert in einer Transaktion (``save_result`` / Batch-Export)
+- Einmaliger Import bestehender JSON-Exporte (``import_json_exports``)
+- Export-Zeilen blockweise per Keyset-Paginierung (``iter_job_rows_with_labels``)
+- Materialisierte Zähl-Matrix Skill × Monat (× Rolle, Region) für Trend-Abfragen
+  sowie Ko-Vorkommen Skill × Skill und Rolle × Skill, in derselben Transaktion
+  inkrementell gepflegt (``skill_month_counts``, ``skill_pair_counts``, ``role_skill_counts``)
+- Near-Duplicates: MinHash-Signatur + LSH-Bänder je Anzeige (``job_signatures``, ``job_bands``);
+  Duplikate verweisen auf die kanonische Anzeige (``duplicate_of``) und zählen in keiner Statistik
+- Kein Datenbank-Server nötig (Standardbibliothek ``sqlite3``, WAL-Modus)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from collections import Counter
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from app.infrastructure.job_classifier import (
+    categorize_competence,
+    classify_job_role,
+    is_specific_skill,
+)
+from app.infrastructure.near_duplicates import (
+    NEAR_DUPLICATE_THRESHOLD,
+    band_keys,
+    near_duplicates_enabled,
+    posting_signature,
+    signature_from_bytes,
+    signature_similarity,
+)
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = 500
+EXPORT_CHUNK_SIZE = 500
+
+# Erhöhen, wenn sich Aufbau/Semantik von skill_month_counts ändert → einmaliger Neuaufbau
+SKILL_COUNTS_VERSION = "2"
+# Erhöhen, wenn sich Signatur/Bänder ändern → einmaliger Neuaufbau des Duplikat-Index
+NEAR_DUPLICATE_VERSION = "1"
+# Anzahl gemerkter eigener Datenstände (älter → Konsumenten laden sicherheitshalber neu)
+LOCAL_DATA_VERSIONS_LIMIT = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    raw_text_hash TEXT NOT NULL UNIQUE,
+    title TEXT,
+    job_role TEXT,
+    industry TEXT,
+    region TEXT,
+    posting_date TEXT,
+    posting_year TEXT,
+    posting_year_int INTEGER,
+    posting_month INTEGER,
+    source_url TEXT,
+    role_category TEXT,
+    role_sub_category TEXT,
+    competence_count INTEGER NOT NULL DEFAULT 0,
+    file_name TEXT,
+    payload TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    duplicate_of TEXT,
+    duplicate_similarity REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_posting_date ON jobs(posting_date);
+CREATE INDEX IF NOT EXISTS idx_jobs_posting_year ON jobs(posting_year_int);
+CREATE INDEX IF NOT EXISTS idx_jobs_region ON jobs(region);
+CREATE INDEX IF NOT EXISTS idx_jobs_role ON jobs(job_role);
+CREATE INDEX IF NOT EXISTS idx_jobs_role_category ON jobs(role_category);
+
+CREATE TABLE IF NOT EXISTS competences (
+    id INTEGER PRIMARY KEY,
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    label TEXT,
+    original_term TEXT,
+    esco_label TEXT,
+    esco_uri TEXT,
+    level INTEGER,
+    is_digital INTEGER NOT NULL DEFAULT 0,
+    is_discovery INTEGER NOT NULL DEFAULT 0,
+    collections TEXT,
+    is_specific INTEGER NOT NULL DEFAULT 1,
+    category TEXT,
+    skill_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_comp_job ON competences(job_id);
+CREATE INDEX IF NOT EXISTS idx_comp_label ON competences(label);
+CREATE INDEX IF NOT EXISTS idx_comp_specific_label ON competences(is_specific, label);
+CREATE INDEX IF NOT EXISTS idx_comp_category ON competences(category);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+-- Skill-Vokabular: stabile, dichte IDs in Reihenfolge des ersten Auftretens
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    label TEXT NOT NULL UNIQUE
+);
+
+-- Dünn besetzte Zähl-Matrix: Vorkommen je Skill, Monat (year*12 + month-1), Rolle, Region
+CREATE TABLE IF NOT EXISTS skill_month_counts (
+    skill_id INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    role_category TEXT NOT NULL,
+    region TEXT NOT NULL,
+    is_specific INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (skill_id, month, role_category, region, is_specific)
+) WITHOUT ROWID;
+
+-- Ko-Vorkommen: Anzahl Jobs, die beide Skills enthalten (skill_a < skill_b)
+CREATE TABLE IF NOT EXISTS skill_pair_counts (
+    skill_a INTEGER NOT NULL,
+    skill_b INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (skill_a, skill_b)
+) WITHOUT ROWID;
+
+-- Anzahl Jobs je Rollen-Kategorie, die den Skill enthalten
+CREATE TABLE IF NOT EXISTS role_skill_counts (
+    role_category TEXT NOT NULL,
+    skill_id INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (role_category, skill_id)
+) WITHOUT ROWID;
+
+-- MinHash-Signatur je Anzeige (uint32-Array) für die Near-Duplicate-Erkennung
+CREATE TABLE IF NOT EXISTS job_signatures (
+    job_id INTEGER PRIMARY KEY REFERENCES jobs(id) ON DELETE CASCADE,
+    signature BLOB NOT NULL
+);
+
+-- LSH-Buckets der kanonischen Anzeigen: ein Eintrag je (Band, Bucket-Schlüssel)
+CREATE TABLE IF NOT EXISTS job_bands (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    PRIMARY KEY (band, bucket, job_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_job_bands_job ON job_bands(job_id);
+"""
+
+# Ebenen-Zuordnung wie reporting.aggregate_level_progression
+_MODEL_LEVEL_SQL = """
+    CASE
+        WHEN c.is_discovery = 1 OR c.level = 1 THEN 1
+        WHEN c.level = 5 THEN 5
+        WHEN c.level = 4 THEN 4
+        WHEN c.is_digital = 1 OR c.level = 3 THEN 3
+        ELSE 2
+    END
+"""
+
+
+def results_store_enabled() -> bool:
+    """RESULTS_BACKEND=sqlite (default): Results-Store; =files: nur JSON-Exporte + Verzeichnis-Scan"""
+    return os.getenv("RESULTS_BACKEND", "sqlite").lower() != "files"
+
+
+def default_db_path() -> str:
+    base = os.getenv("BASE_DATA_DIR", "data")
+    return os.getenv("RESULTS_DB_PATH", os.path.join(base, "results", "results.sqlite3"))
+
+
+def _posting_years(date: Any) -> Tuple[Optional[str], Optional[int]]:
+    """Jahr als Text (Zeitreihe) und als Zahl (Trend-Analysen), wie bisher aus 'YYYY-...' gelesen"""
+    if not date or not isinstance(date, str):
+        return None, None
+    year = date.split('-')[0]
+    try:
+        return year, int(year)
+    except ValueError:
+        return year, None
+
+
+def _posting_month(date: Any) -> Optional[int]:
+    """Monatsindex year*12 + (month-1) aus 'YYYY-MM-...'; reine Jahresangaben zählen als Januar"""
+    if not date or not isinstance(date, str):
+        return None
+    parts = date.split('-')
+    try:
+        year = int(parts[0])
+        month = int(parts[1][:2]) if len(parts) > 1 and parts[1] else 1
+    except ValueError:
+        return None
+    if not 1 <= month <= 12:
+        return None
+    return year * 12 + month - 1
+
+
+def _competence_row(position: int, c: Dict[str, Any]) -> Tuple:
+    label = c.get('esco_label') or c.get('original_term')
+    collections = c.get('collections') or []
+    category = categorize_competence(label, collections)['category'] if label else None
+    level = c.get('level', 2)
+    return (
+        position, label, c.get('original_term'), c.get('esco_label'), c.get('esco_uri'),
+        level if isinstance(level, int) else None,
+        int(bool(c.get('is_digital', False))), int(bool(c.get('is_discovery', False))),
+        json.dumps(collections, ensure_ascii=False), int(is_specific_skill(collections)), category,
+    )
+
+
+class _CountDeltas:
+    """Zähler-Differenzen einer Transaktion (Skill × Monat und Ko-Vorkommen)"""
+
+    def __init__(self):
+        self.month_counts: Counter = Counter()
+        self.pairs: Counter = Counter()
+        self.role_skills: Counter = Counter()
+        # (Vorzeichen, Rollen-Kategorie, Skill-IDs, Labels) je betroffenem Job
+        self.jobs: List[Tuple[int, str, Tuple[int, ...], Tuple[str, ...]]] = []
+
+
+class ResultsStore:
+    """
+    SQLite-Store für Analyse-Ergebnisse (thread-sicher, eine Verbindung).
+
+    Args:
+        db_path: Datenbankdatei (``:memory:`` für Tests)
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or default_db_path()
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            if self.db_path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(_SCHEMA)
+            self._migrate()
+        self._skill_ids: Dict[str, int] = {}
+        self._listeners: Dict[str, List[Callable[[int, Optional[List[Tuple]]], None]]] = {}
+        self.counts_version = 0
+        # Von diesem Prozess geschriebene data_version-Stände (Abgleich mit anderen Prozessen)
+        self._local_data_versions: Set[int] = set()
+        if near_duplicates_enabled() and self.get_meta('near_duplicate_version') != NEAR_DUPLICATE_VERSION:
+            self.rebuild_duplicate_index()
+        elif self.get_meta('skill_counts_version') != SKILL_COUNTS_VERSION:
+            self.rebuild_skill_counts()
+
+    def _migrate(self) -> None:
+        """Ergänzt Spalten, die ältere Datenbanken noch nicht haben"""
+        conn = self._conn
+        job_cols = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        if 'posting_month' not in job_cols:
+            conn.execute("ALTER TABLE jobs ADD COLUMN posting_month INTEGER")
+        if 'duplicate_of' not in job_cols:
+            conn.execute("ALTER TABLE jobs ADD COLUMN duplicate_of TEXT")
+            conn.execute("ALTER TABLE jobs ADD COLUMN duplicate_similarity REAL")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_duplicate_of ON jobs(duplicate_of)")
+        comp_cols = {row[1] for row in conn.execute("PRAGMA table_info(competences)")}
+        if 'skill_id' not in comp_cols:
+            conn.execute("ALTER TABLE competences ADD COLUMN skill_id INTEGER")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_comp_skill ON competences(skill_id)")
+
+    # ------------------------------------------------------------------
+    # Schreiben
+    # ------------------------------------------------------------------
+
+    def upsert_many(self, results: Iterable[Dict[str, Any]], file_names: Optional[List[Optional[str]]] = None) -> int:
+        """
+        Schreibt Ergebnisse (dicts wie ``AnalysisResultDTO.dict()``) in einer Transaktion.
+        Gleicher raw_text_hash ersetzt den bisherigen Eintrag samt Kompetenzen.
+        Near-Duplicates einer kanonischen Anzeige werden verknüpft (``duplicate_of``) und
+        ohne Kompetenz-Zeilen gespeichert → keine Beiträge zu Zählungen und Trends.
+
+        Returns:
+            Anzahl geschriebener Jobs
+        """
+        results = list(results)
+        names = file_names or [None] * len(results)
+        rows = [self._prepare(data, name) for data, name in zip(results, names)]
+        rows = [r for r in rows if r is not None]
+        if not rows:
+            return 0
+
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            deltas = _CountDeltas()
+            try:
+                for job_row, competence_rows, signature in rows:
+                    old = conn.execute("SELECT id, duplicate_of FROM jobs WHERE raw_text_hash = ?",
+                                       (job_row[0],)).fetchone()
+                    if old:
+                        self._collect_job_counts(old[0], -1, deltas)
+                    match = None
+                    # Bestehende kanonische Anzeigen bleiben kanonisch (keine Ketten von Verweisen)
+                    if signature is not None and (old is None or old[1] is not None):
+                        match = self._match_signature(signature, job_row[0])
+                    duplicate = (match[0], match[1]) if match else (None, None)
+                    conn.execute(
+                        """INSERT INTO jobs (raw_text_hash, title, job_role, industry, region, posting_date,
+                                             posting_year, posting_year_int, posting_month, source_url, role_category,
+                                             role_sub_category, competence_count, file_name, payload, updated_at,
+                                             duplicate_of, duplicate_similarity)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                           ON CONFLICT(raw_text_hash) DO UPDATE SET
+                               title = excluded.title, job_role = excluded.job_role, industry = excluded.industry,
+                               region = excluded.region, posting_date = excluded.posting_date,
+                               posting_year = excluded.posting_year, posting_year_int = excluded.posting_year_int,
+                               posting_month = excluded.posting_month, source_url = excluded.source_url,
+                               role_category = excluded.role_category,
+                               role_sub_category = excluded.role_sub_category,
+                               competence_count = excluded.competence_count,
+                               file_name = COALESCE(excluded.file_name, jobs.file_name),
+                               payload = excluded.payload, updated_at = excluded.updated_at,
+                               duplicate_of = excluded.duplicate_of,
+                               duplicate_similarity = excluded.duplicate_similarity""",
+                        (*job_row, *duplicate),
+                    )
+                    job_id = conn.execute("SELECT id FROM jobs WHERE raw_text_hash = ?", (job_row[0],)).fetchone()[0]
+                    conn.execute("DELETE FROM competences WHERE job_id = ?", (job_id,))
+                    if match is None:
+                        self._insert_competences(job_id, competence_rows)
+                    self._index_signature(job_id, signature, canonical=match is None)
+                    self._collect_job_counts(job_id, 1, deltas)
+                changes = self._apply_count_deltas(deltas)
+                data_version = self._touch_data_version()
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                self._skill_ids.clear()
+                raise
+            self._remember_data_version(data_version)
+            version = self._bump_counts_version(changes)
+        self._notify_listeners(version, changes)
+        return len(rows)
+
+    def upsert(self, data: Dict[str, Any], file_name: Optional[str] = None) -> int:
+        return self.upsert_many([data], [file_name])
+
+    def _insert_competences(self, job_id: int, competence_rows: List[Tuple]) -> None:
+        skill_ids = self._skill_ids_for(row[1] for row in competence_rows)
+        self._conn.executemany(
+            """INSERT INTO competences (job_id, position, label, original_term, esco_label, esco_uri,
+                                        level, is_digital, is_discovery, collections, is_specific, category,
+                                        skill_id)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [(job_id, *row, skill_ids.get(row[1])) for row in competence_rows],
+        )
+
+    @staticmethod
+    def _prepare(data: Dict[str, Any], file_name: Optional[str]) -> Optional[Tuple[Tuple, List[Tuple], Any]]:
+        if not isinstance(data, dict):
+            return None
+        key = data.get('raw_text_hash') or (Path(file_name).stem if file_name else None)
+        if not key:
+            return None
+        competences = data.get('competences') or []
+        classification = classify_job_role(data.get('title', ''), data.get('job_role', ''), data.get('industry', ''))
+        year, year_int = _posting_years(data.get('posting_date'))
+        job_row = (
+            key, data.get('title'), data.get('job_role'), data.get('industry'),
+            data.get('region'), data.get('posting_date'), year, year_int, _posting_month(data.get('posting_date')),
+            data.get('source_url'), classification['category'], classification['sub_category'],
+            len(competences), file_name, json.dumps(data, ensure_ascii=False, default=str), time.time(),
+        )
+        competence_rows = [_competence_row(i, c) for i, c in enumerate(competences) if isinstance(c, dict)]
+        signature = posting_signature(data.get('raw_text')) if near_duplicates_enabled() else None
+        return job_row, competence_rows, signature
+
+    def delete(self, raw_text_hash: str) -> bool:
+        """Löscht einen Job; das erste Duplikat einer gelöschten kanonischen Anzeige rückt nach"""
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT id FROM jobs WHERE raw_text_hash = ?", (raw_text_hash,)).fetchone()
+                deltas = _CountDeltas()
+                data_version = None
+                if row:
+                    self._collect_job_counts(row[0], -1, deltas)
+                    conn.execute("DELETE FROM jobs WHERE id = ?", (row[0],))
+                    self._promote_duplicate(raw_text_hash, deltas)
+                    data_version = self._touch_data_version()
+                changes = self._apply_count_deltas(deltas)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._remember_data_version(data_version)
+            version = self._bump_counts_version(changes)
+        self._notify_listeners(version, changes)
+        return row is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs")
+            for table in ("skill_month_counts", "skill_pair_counts", "role_skill_counts", "skills"):
+                self._conn.execute(f"DELETE FROM {table}")
+            # data_version bleibt erhalten (monoton), sonst wären alte ETags wieder gültig
+            self._conn.execute("DELETE FROM meta WHERE key NOT IN ('data_version', 'data_modified')")
+            self._conn.execute("INSERT INTO meta (key, value) VALUES ('skill_counts_version', ?)",
+                               (SKILL_COUNTS_VERSION,))
+            self._conn.execute("INSERT INTO meta (key, value) VALUES ('near_duplicate_version', ?)",
+                               (NEAR_DUPLICATE_VERSION,))
+            self._remember_data_version(self._touch_data_version())
+            self._skill_ids.clear()
+            version = self._bump_counts_version(None)
+        self._notify_listeners(version, None)
+
+    # ------------------------------------------------------------------
+    # Near-Duplicates (MinHash-Signaturen, LSH-Bänder)
+    # ------------------------------------------------------------------
+
+    def _match_signature(self, signature: Any, exclude_hash: Optional[str] = None) -> Optional[Tuple[str, float, int]]:
+        """
+        Ähnlichste kanonische Anzeige über die LSH-Bänder (Index-Lookup statt Vollvergleich).
+
+        Returns:
+            (raw_text_hash, Ähnlichkeit, job_id) ab NEAR_DUPLICATE_THRESHOLD, sonst None
+        """
+        keys = band_keys(signature)
+        values = ",".join("(?, ?)" for _ in keys)
+        params = [value for band, key in enumerate(keys) for value in (band, key)]
+        rows = self._conn.execute(
+            f"""SELECT j.id, j.raw_text_hash, s.signature
+                FROM (SELECT DISTINCT job_id FROM job_bands WHERE (band, bucket) IN (VALUES {values})) b
+                JOIN jobs j ON j.id = b.job_id JOIN job_signatures s ON s.job_id = b.job_id
+                WHERE j.raw_text_hash != ?""",
+            (*params, exclude_hash or ""),
+        ).fetchall()
+        best = None
+        for job_id, key, blob in rows:
+            similarity = signature_similarity(signature, signature_from_bytes(blob))
+            if similarity >= NEAR_DUPLICATE_THRESHOLD and (best is None or similarity > best[1]):
+                best = (key, round(similarity, 4), job_id)
+        return best
+
+    def _index_signature(self, job_id: int, signature: Any, canonical: bool) -> None:
+        """Speichert die Signatur; Bänder nur für kanonische Anzeigen (Duplikate sind nie Treffer)"""
+        conn = self._conn
+        conn.execute("DELETE FROM job_bands WHERE job_id = ?", (job_id,))
+        if signature is None:
+            conn.execute("DELETE FROM job_signatures WHERE job_id = ?", (job_id,))
+            return
+        conn.execute("INSERT OR REPLACE INTO job_signatures (job_id, signature) VALUES (?, ?)",
+                     (job_id, signature.tobytes()))
+        if canonical:
+            conn.executemany("INSERT OR IGNORE INTO job_bands (band, bucket, job_id) VALUES (?, ?, ?)",
+                             [(band, key, job_id) for band, key in enumerate(band_keys(signature))])
+
+    def _promote_duplicate(self, canonical_hash: str, deltas: _CountDeltas) -> None:
+        """Erstes Duplikat wird kanonisch (Kompetenzen aus dem Payload), die übrigen verweisen darauf"""
+        conn = self._conn
+        duplicates = conn.execute(
+            """SELECT j.id, j.raw_text_hash, j.payload, s.signature FROM jobs j
+               LEFT JOIN job_signatures s ON s.job_id = j.id
+               WHERE j.duplicate_of = ? ORDER BY j.id""",
+            (canonical_hash,),
+        ).fetchall()
+        if not duplicates:
+            return
+        job_id, key, payload, blob = duplicates[0]
+        competences = json.loads(payload).get('competences') or []
+        conn.execute("UPDATE jobs SET duplicate_of = NULL, duplicate_similarity = NULL WHERE id = ?", (job_id,))
+        self._insert_competences(job_id, [_competence_row(i, c) for i, c in enumerate(competences)
+                                          if isinstance(c, dict)])
+        signature = signature_from_bytes(blob) if blob is not None else None
+        self._index_signature(job_id, signature, canonical=True)
+        self._collect_job_counts(job_id, 1, deltas)
+        conn.executemany(
+            "UPDATE jobs SET duplicate_of = ?, duplicate_similarity = ? WHERE id = ?",
+            [(key, round(signature_similarity(signature, signature_from_bytes(other)), 4)
+              if signature is not None and other is not None else None, other_id)
+             for other_id, _, _, other in duplicates[1:]],
+        )
+
+    def find_near_duplicate(self, text: str, exclude_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Kanonische Anzeige, von der ``text`` ein Near-Duplicate ist (vor der Analyse).
+
+        Returns:
+            {'raw_text_hash', 'similarity', 'payload'} oder None
+        """
+        signature = posting_signature(text)
+        if signature is None:
+            return None
+        with self._lock:
+            match = self._match_signature(signature, exclude_hash)
+            if match is None:
+                return None
+            payload = self._conn.execute("SELECT payload FROM jobs WHERE id = ?", (match[2],)).fetchone()[0]
+        return {'raw_text_hash': match[0], 'similarity': match[1], 'payload': json.loads(payload)}
+
+    def duplicate_summary(self, limit: int = 50) -> Dict[str, Any]:
+        """Anzahl verknüpfter Duplikate und die kanonischen Anzeigen mit den meisten Duplikaten"""
+        rows = self.query(
+            """SELECT c.raw_text_hash, c.title, c.source_url, COUNT(*) AS n, MIN(d.duplicate_similarity)
+               FROM jobs d JOIN jobs c ON c.raw_text_hash = d.duplicate_of
+               GROUP BY d.duplicate_of ORDER BY n DESC, MIN(d.id) LIMIT ?""",
+            (limit,),
+        )
+        return {
+            'duplicates': self.query("SELECT COUNT(*) FROM jobs WHERE duplicate_of IS NOT NULL")[0][0],
+            'canonical': [{'raw_text_hash': key, 'title': title, 'source_url': url, 'duplicates': n,
+                           'min_similarity': similarity} for key, title, url, n, similarity in rows],
+        }
+
+    def rebuild_duplicate_index(self) -> None:
+        """
+        Berechnet Signaturen, Bänder und Verknüpfungen aller Jobs neu (Migration bestehender
+        Datenbanken), danach die Skill-Zählungen ohne die Duplikate. Nicht mehr verknüpfte
+        Duplikate erhalten ihre Kompetenzen aus dem Payload zurück.
+        """
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                previous = {row[0] for row in conn.execute("SELECT id FROM jobs WHERE duplicate_of IS NOT NULL")}
+                conn.execute("DELETE FROM job_bands")
+                conn.execute("DELETE FROM job_signatures")
+                conn.execute("UPDATE jobs SET duplicate_of = NULL, duplicate_similarity = NULL")
+                linked = 0
+                unlinked = 0
+                last_id = 0
+                while True:
+                    chunk = conn.execute("SELECT id, raw_text_hash, payload FROM jobs WHERE id > ? ORDER BY id LIMIT ?",
+                                         (last_id, IMPORT_BATCH_SIZE)).fetchall()
+                    if not chunk:
+                        break
+                    last_id = chunk[-1][0]
+                    for job_id, key, payload in chunk:
+                        data = json.loads(payload)
+                        signature = posting_signature(data.get('raw_text'))
+                        match = self._match_signature(signature, key) if signature is not None else None
+                        if match:
+                            conn.execute("UPDATE jobs SET duplicate_of = ?, duplicate_similarity = ? WHERE id = ?",
+                                         (match[0], match[1], job_id))
+                            conn.execute("DELETE FROM competences WHERE job_id = ?", (job_id,))
+                            linked += 1
+                        elif job_id in previous:
+                            # Früheres Duplikat ist wieder kanonisch (z.B. höhere Schwelle) → Kompetenzen zurück
+                            self._insert_competences(job_id, [_competence_row(i, c) for i, c in
+                                                              enumerate(data.get('competences') or [])
+                                                              if isinstance(c, dict)])
+                            unlinked += 1
+                        self._index_signature(job_id, signature, canonical=match is None)
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('near_duplicate_version', ?)",
+                             (NEAR_DUPLICATE_VERSION,))
+                data_version = self._touch_data_version() if linked or unlinked else None
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._remember_data_version(data_version)
+        if linked or unlinked:
+            logger.info(f"🔁 {linked} Near-Duplicates mit kanonischen Anzeigen verknüpft, {unlinked} gelöst")
+        self.rebuild_skill_counts()
+
+    # ------------------------------------------------------------------
+    # Materialisierte Skill-Zählungen (Skill × Monat, Ko-Vorkommen)
+    # ------------------------------------------------------------------
+
+    def _skill_ids_for(self, labels: Iterable[Optional[str]]) -> Dict[str, int]:
+        """Skill-IDs der Labels; neue Labels werden ans Vokabular angehängt (innerhalb der Transaktion)"""
+        conn = self._conn
+        wanted = [label for label in dict.fromkeys(labels) if label]
+        missing = [label for label in wanted if label not in self._skill_ids]
+        if missing:
+            conn.executemany("INSERT OR IGNORE INTO skills (label) VALUES (?)", [(label,) for label in missing])
+            placeholders = ",".join("?" * len(missing))
+            for skill_id, label in conn.execute(
+                f"SELECT id, label FROM skills WHERE label IN ({placeholders})", tuple(missing)
+            ):
+                self._skill_ids[label] = skill_id
+        return {label: self._skill_ids[label] for label in wanted}
+
+    def _job_skill_counts(self, job_id: int) -> Counter:
+        """Beitrag eines Jobs zur Zähl-Matrix: {(skill_id, label, month, role, region, is_specific): n}"""
+        rows = self._conn.execute(
+            """SELECT c.skill_id, s.label, j.posting_month, COALESCE(j.role_category, ''), COALESCE(j.region, ''),
+                      c.is_specific, COUNT(*)
+               FROM competences c JOIN jobs j ON j.id = c.job_id JOIN skills s ON s.id = c.skill_id
+               WHERE c.job_id = ? AND j.posting_month IS NOT NULL
+               GROUP BY c.skill_id, c.is_specific""",
+            (job_id,),
+        )
+        return Counter({tuple(row[:6]): row[6] for row in rows})
+
+    def _collect_job_counts(self, job_id: int, sign: int, deltas: _CountDeltas) -> None:
+        """Merkt den Beitrag eines Jobs (sign=+1 neu, -1 bisheriger Stand) für alle Zählungen vor"""
+        month_counts = self._job_skill_counts(job_id)
+        if sign > 0:
+            deltas.month_counts.update(month_counts)
+        else:
+            deltas.month_counts.subtract(month_counts)
+
+        rows = self._conn.execute(
+            """SELECT DISTINCT c.skill_id, s.label, COALESCE(j.role_category, '')
+               FROM competences c JOIN jobs j ON j.id = c.job_id JOIN skills s ON s.id = c.skill_id
+               WHERE c.job_id = ? ORDER BY c.skill_id""",
+            (job_id,),
+        ).fetchall()
+        if not rows:
+            return
+        role = rows[0][2]
+        skill_ids = tuple(row[0] for row in rows)
+        for pair in combinations(skill_ids, 2):
+            deltas.pairs[pair] += sign
+        for skill_id in skill_ids:
+            deltas.role_skills[(role, skill_id)] += sign
+        deltas.jobs.append((sign, role, skill_ids, tuple(row[1] for row in rows)))
+
+    def _apply_count_deltas(self, deltas: _CountDeltas) -> Dict[str, List[Tuple]]:
+        """
+        Schreibt Zähler-Differenzen (n += delta).
+
+        Returns:
+            {'skill_counts': [(skill_id, label, month, role, region, spec, delta)],
+             'cooccurrence': [(vorzeichen, rolle, skill_ids, labels)]}
+        """
+        conn = self._conn
+        changes = [(*key, n) for key, n in deltas.month_counts.items() if n]
+        conn.executemany(
+            """INSERT INTO skill_month_counts (skill_id, month, role_category, region, is_specific, n)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT(skill_id, month, role_category, region, is_specific) DO UPDATE SET n = n + excluded.n""",
+            [(skill_id, month, role, region, spec, n) for skill_id, _, month, role, region, spec, n in changes],
+        )
+        pairs = [(a, b, n) for (a, b), n in deltas.pairs.items() if n]
+        conn.executemany(
+            """INSERT INTO skill_pair_counts (skill_a, skill_b, n) VALUES (?, ?, ?)
+               ON CONFLICT(skill_a, skill_b) DO UPDATE SET n = n + excluded.n""",
+            pairs,
+        )
+        role_skills = [(role, skill_id, n) for (role, skill_id), n in deltas.role_skills.items() if n]
+        conn.executemany(
+            """INSERT INTO role_skill_counts (role_category, skill_id, n) VALUES (?, ?, ?)
+               ON CONFLICT(role_category, skill_id) DO UPDATE SET n = n + excluded.n""",
+            role_skills,
+        )
+        for table, rows in (("skill_month_counts", changes), ("skill_pair_counts", pairs),
+                            ("role_skill_counts", role_skills)):
+            if any(row[-1] < 0 for row in rows):
+                conn.execute(f"DELETE FROM {table} WHERE n <= 0")
+        return {'skill_counts': changes, 'cooccurrence': deltas.jobs}
+
+    def rebuild_skill_counts(self) -> None:
+        """Baut Monatsindex, Skill-Vokabular und alle Skill-Zählungen aus jobs/competences neu auf (Migration/Reparatur)"""
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                months = [(_posting_month(date), job_id)
+                          for job_id, date in conn.execute("SELECT id, posting_date FROM jobs").fetchall()]
+                conn.executemany("UPDATE jobs SET posting_month = ? WHERE id = ?", months)
+                conn.execute(
+                    """INSERT OR IGNORE INTO skills (label)
+                       SELECT label FROM competences WHERE label IS NOT NULL AND label != ''
+                       GROUP BY label ORDER BY MIN(id)"""
+                )
+                conn.execute("UPDATE competences SET skill_id = (SELECT id FROM skills WHERE label = competences.label)")
+                conn.execute("DELETE FROM skill_month_counts")
+                conn.execute(
+                    """INSERT INTO skill_month_counts (skill_id, month, role_category, region, is_specific, n)
+                       SELECT c.skill_id, j.posting_month, COALESCE(j.role_category, ''), COALESCE(j.region, ''),
+                              c.is_specific, COUNT(*)
+                       FROM competences c JOIN jobs j ON j.id = c.job_id
+                       WHERE c.skill_id IS NOT NULL AND j.posting_month IS NOT NULL
+                       GROUP BY 1, 2, 3, 4, 5"""
+                )
+                conn.execute("DELETE FROM skill_pair_counts")
+                conn.execute(
+                    """WITH js AS (SELECT DISTINCT job_id, skill_id FROM competences WHERE skill_id IS NOT NULL)
+                       INSERT INTO skill_pair_counts (skill_a, skill_b, n)
+                       SELECT a.skill_id, b.skill_id, COUNT(*)
+                       FROM js a JOIN js b ON a.job_id = b.job_id AND a.skill_id < b.skill_id
+                       GROUP BY 1, 2"""
+                )
+                conn.execute("DELETE FROM role_skill_counts")
+                conn.execute(
+                    """INSERT INTO role_skill_counts (role_category, skill_id, n)
+                       SELECT COALESCE(j.role_category, ''), c.skill_id, COUNT(DISTINCT c.job_id)
+                       FROM competences c JOIN jobs j ON j.id = c.job_id
+                       WHERE c.skill_id IS NOT NULL
+                       GROUP BY 1, 2"""
+                )
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('skill_counts_version', ?)",
+                             (SKILL_COUNTS_VERSION,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._skill_ids.clear()
+            version = self._bump_counts_version(None)
+        self._notify_listeners(version, None)
+
+    def add_change_listener(self, kind: str, listener: Callable[[int, Optional[List[Tuple]]], None]) -> None:
+        """
+        Listener für Änderungen der materialisierten Zählungen (nach COMMIT).
+
+        Args:
+            kind: 'skill_counts' (Skill × Monat) oder 'cooccurrence' (Jobs mit ihren Skill-IDs)
+            listener: Aufruf mit (Version, Differenzen) bzw. (Version, ``None``) nach einem Neuaufbau
+        """
+        self._listeners.setdefault(kind, []).append(listener)
+
+    def _bump_counts_version(self, changes: Optional[Dict[str, List[Tuple]]]) -> int:
+        # Nur unter self._lock aufrufen
+        if changes is None or any(changes.values()):
+            self.counts_version += 1
+        return self.counts_version
+
+    def _notify_listeners(self, version: int, changes: Optional[Dict[str, List[Tuple]]]) -> None:
+        for kind, listeners in list(self._listeners.items()):
+            payload = None if changes is None else changes.get(kind)
+            if payload == []:
+                continue
+            for listener in list(listeners):
+                try:
+                    listener(version, payload)
+                except Exception as e:
+                    logger.warning(f"⚠️ Listener für {kind} fehlgeschlagen: {e}")
+
+    def _touch_data_version(self) -> int:
+        # Nur unter self._lock innerhalb der Schreib-Transaktion aufrufen; nach COMMIT an
+        # _remember_data_version übergeben
+        self._conn.execute(
+            """INSERT INTO meta (key, value) VALUES ('data_version', '1')
+               ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"""
+        )
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('data_modified', ?)", (str(time.time()),))
+        return int(self._conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()[0])
+
+    def _remember_data_version(self, version: Optional[int]) -> None:
+        # Nur unter self._lock aufrufen (nach COMMIT)
+        if version is None:
+            return
+        self._local_data_versions.add(version)
+        if len(self._local_data_versions) > LOCAL_DATA_VERSIONS_LIMIT:
+            floor = version - LOCAL_DATA_VERSIONS_LIMIT // 2
+            self._local_data_versions = {v for v in self._local_data_versions if v > floor}
+
+    def touch_data_version(self) -> None:
+        """Erhöht den Datenstand ohne Job-Änderung (z.B. nach dem Summary-Rebuild) → neue ETags"""
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                data_version = self._touch_data_version()
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._remember_data_version(data_version)
+
+    def data_version(self) -> Tuple[int, float]:
+        """
+        Datenstand für Caches (HTTP-ETags): (Version, Zeitpunkt der letzten Änderung).
+
+        Wird in jeder schreibenden Transaktion erhöht und in ``meta`` gespeichert,
+        gilt also auch über Prozesse hinweg (Batch-CLI, mehrere Worker).
+        """
+        rows = dict(self.query("SELECT key, value FROM meta WHERE key IN ('data_version', 'data_modified')"))
+        return int(rows.get('data_version') or 0), float(rows.get('data_modified') or 0.0)
+
+    def changed_elsewhere(self, since: int) -> Tuple[bool, int]:
+        """
+        Hat seit dem Datenstand ``since`` ein anderer Prozess geschrieben?
+        Eigene Änderungen erreichen die Konsumenten über die Listener, fremde nicht.
+
+        Returns:
+            (fremde Änderung seit ``since``, aktueller Datenstand)
+        """
+        version = self.data_version()[0]
+        with self._lock:
+            if version - since > len(self._local_data_versions):
+                return True, version
+            return any(v not in self._local_data_versions for v in range(since + 1, version + 1)), version
+
+    def skill_month_counts(self) -> Tuple[int, List[Tuple[int, str, int, str, str, int, int]]]:
+        """
+        Komplette Zähl-Matrix samt Version.
+
+        Returns:
+            (counts_version, [(skill_id, label, month, role_category, region, is_specific, n)])
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT c.skill_id, s.label, c.month, c.role_category, c.region, c.is_specific, c.n
+                   FROM skill_month_counts c JOIN skills s ON s.id = c.skill_id"""
+            ).fetchall()
+            return self.counts_version, rows
+
+    def cooccurrence_counts(self) -> Dict[str, Any]:
+        """
+        Kompletter Stand der Ko-Vorkommen samt Version.
+
+        Returns:
+            {'version', 'skills': [(id, label)], 'pairs': [(skill_a, skill_b, n)],
+             'role_skills': [(rolle, skill_id, n)], 'role_jobs': [(rolle, jobs mit Skills)]}
+        """
+        with self._lock:
+            conn = self._conn
+            return {
+                'version': self.counts_version,
+                'skills': conn.execute("SELECT id, label FROM skills").fetchall(),
+                'pairs': conn.execute("SELECT skill_a, skill_b, n FROM skill_pair_counts").fetchall(),
+                'role_skills': conn.execute("SELECT role_category, skill_id, n FROM role_skill_counts").fetchall(),
+                'role_jobs': conn.execute(
+                    """SELECT COALESCE(role_category, ''), COUNT(*) FROM jobs j
+                       WHERE EXISTS (SELECT 1 FROM competences c WHERE c.job_id = j.id AND c.skill_id IS NOT NULL)
+                       GROUP BY 1"""
+                ).fetchall(),
+            }
+
+    # ------------------------------------------------------------------
+    # Import bestehender JSON-Exporte
+    # ------------------------------------------------------------------
+
+    def import_json_exports(self, paths: Iterable[Path]) -> int:
+        """Importiert JSON-Exporte (batchweise Transaktionen). Returns: Anzahl importierter Jobs"""
+        imported = 0
+        batch: List[Dict[str, Any]] = []
+        names: List[str] = []
+        for path in paths:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.warning(f"⚠️ Import übersprungen ({path.name}): {e}")
+                continue
+            batch.append(data)
+            names.append(path.name)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                imported += self.upsert_many(batch, names)
+                batch, names = [], []
+        if batch:
+            imported += self.upsert_many(batch, names)
+        self.set_meta('json_import_done', str(time.time()))
+        logger.info(f"📥 {imported} Ergebnisse aus JSON-Exporten importiert")
+        return imported
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    # ------------------------------------------------------------------
+    # Abfragen
+    # ------------------------------------------------------------------
+
+    def query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def count_jobs(self) -> int:
+        """Anzahl Jobs ohne Near-Duplicates"""
+        return self.query("SELECT COUNT(*) FROM jobs WHERE duplicate_of IS NULL")[0][0]
+
+    def competence_total(self) -> int:
+        """Summe der Kompetenzen aller Jobs ohne Near-Duplicates"""
+        return self.query("SELECT COALESCE(SUM(competence_count), 0) FROM jobs WHERE duplicate_of IS NULL")[0][0]
+
+    def duplicate_keys(self, raw_text_hashes: Iterable[str]) -> Set[str]:
+        """Teilmenge der Hashes, die als Near-Duplicate verknüpft sind"""
+        keys = [key for key in raw_text_hashes if key]
+        found: Set[str] = set()
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(row[0] for row in self.query(
+                f"SELECT raw_text_hash FROM jobs WHERE duplicate_of IS NOT NULL AND raw_text_hash IN ({placeholders})",
+                tuple(chunk)))
+        return found
+
+    def top_labels(self, top_n: int, specific_only: bool = True) -> List[Tuple[str, int]]:
+        """Häufigste Labels (bei Gleichstand: zuerst gesehenes Label)"""
+        where = "AND is_specific = 1" if specific_only else ""
+        return self.query(
+            f"""SELECT label, COUNT(*) AS n FROM competences
+                WHERE label IS NOT NULL AND label != '' {where}
+                GROUP BY label ORDER BY n DESC, MIN(id) LIMIT ?""",
+            (top_n,),
+        )
+
+    def role_counts(self) -> List[Tuple[str, Optional[str], int]]:
+        """(Kategorie, Unterkategorie, Anzahl Jobs) in Reihenfolge des ersten Auftretens"""
+        return self.query(
+            """SELECT role_category, role_sub_category, COUNT(*) FROM jobs WHERE duplicate_of IS NULL
+               GROUP BY role_category, role_sub_category ORDER BY MIN(id)"""
+        )
+
+    def category_counts(self) -> List[Tuple[str, int]]:
+        return self.query(
+            """SELECT category, COUNT(*) FROM competences
+               WHERE label IS NOT NULL AND label != '' GROUP BY category ORDER BY MIN(id)"""
+        )
+
+    def digital_label_count(self) -> int:
+        return self.query(
+            """SELECT COUNT(DISTINCT label) FROM competences
+               WHERE is_digital = 1 AND label IS NOT NULL AND label != ''"""
+        )[0][0]
+
+    def region_counts(self) -> List[Tuple[str, int]]:
+        return self.query(
+            """SELECT region, COUNT(*) FROM jobs
+               WHERE region IS NOT NULL AND region != '' AND duplicate_of IS NULL
+               GROUP BY region ORDER BY MIN(id)"""
+        )
+
+    def competence_count_histogram(self) -> List[Tuple[int, int]]:
+        """(Anzahl Kompetenzen pro Job, Anzahl Jobs)"""
+        return self.query(
+            "SELECT competence_count, COUNT(*) FROM jobs WHERE duplicate_of IS NULL GROUP BY competence_count"
+        )
+
+    def model_level_counts(self) -> List[Tuple[int, int]]:
+        """Kompetenzen je Ebene des 7-Ebenen-Modells (1-5)"""
+        return self.query(f"SELECT {_MODEL_LEVEL_SQL} AS lvl, COUNT(*) FROM competences c GROUP BY lvl")
+
+    def role_top_labels(self, per_role: int) -> List[Tuple[str, str, int]]:
+        """(Rollen-Kategorie, Label, Anzahl) - die häufigsten Labels je Rolle"""
+        return self.query(
+            """SELECT role_category, label, n FROM (
+                   SELECT j.role_category, c.label, COUNT(*) AS n,
+                          ROW_NUMBER() OVER (PARTITION BY j.role_category ORDER BY COUNT(*) DESC, MIN(c.id)) AS rn
+                   FROM competences c JOIN jobs j ON j.id = c.job_id
+                   WHERE c.label IS NOT NULL AND c.label != ''
+                   GROUP BY j.role_category, c.label)
+               WHERE rn <= ? ORDER BY role_category, rn""",
+            (per_role,),
+        )
+
+    def category_top_labels(self, per_category: int) -> List[Tuple[str, str, int]]:
+        """(Kompetenz-Kategorie, Label, Anzahl) - die häufigsten Labels je Kategorie"""
+        return self.query(
+            """SELECT category, label, n FROM (
+                   SELECT category, label, COUNT(*) AS n,
+                          ROW_NUMBER() OVER (PARTITION BY category ORDER BY COUNT(*) DESC, MIN(id)) AS rn
+                   FROM competences WHERE label IS NOT NULL AND label != ''
+                   GROUP BY category, label)
+               WHERE rn <= ? ORDER BY category, rn""",
+            (per_category,),
+        )
+
+    def category_top_roles(self, per_category: int) -> List[Tuple[str, str, int]]:
+        """(Kompetenz-Kategorie, Rollen-Kategorie, Anzahl) - die häufigsten Rollen je Kategorie"""
+        return self.query(
+            """SELECT category, role_category, n FROM (
+                   SELECT c.category, j.role_category, COUNT(*) AS n,
+                          ROW_NUMBER() OVER (PARTITION BY c.category ORDER BY COUNT(*) DESC, MIN(c.id)) AS rn
+                   FROM competences c JOIN jobs j ON j.id = c.job_id
+                   WHERE c.label IS NOT NULL AND c.label != ''
+                   GROUP BY c.category, j.role_category)
+               WHERE rn <= ? ORDER BY category, rn""",
+            (per_category,),
+        )
+
+    def iter_job_rows_with_labels(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        role: Optional[str] = None,
+        region: Optional[str] = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> Iterator[List[Tuple]]:
+        """
+        (title, job_role, region, industry, posting_date, competence_count, 'label|label|...')
+        je Job in Einfügereihenfolge, in Blöcken zu höchstens ``chunk_size`` Zeilen.
+        Jobs mit Kompetenzen ohne Label fehlen (wie im CSV-Export), Near-Duplicates ebenso.
+
+        Keyset-Paginierung über ``jobs.id``: jeder Block ist eine eigene kurze Abfrage,
+        die Verbindung ist zwischen den Blöcken für Schreibzugriffe frei.
+
+        Args:
+            date_from / date_to: 'YYYY', 'YYYY-MM' oder 'YYYY-MM-DD' (inklusive, Präfix-Vergleich)
+            role: Rollen-Kategorie (z.B. 'data_science') oder job_role (Groß-/Kleinschreibung egal)
+            region: Region (Groß-/Kleinschreibung egal)
+        """
+        where, params = [], []
+        if date_from or date_to:
+            where.append("j.posting_month IS NOT NULL")
+        if date_from:
+            where.append("substr(j.posting_date, 1, ?) >= ?")
+            params += [len(date_from), date_from]
+        if date_to:
+            where.append("substr(j.posting_date, 1, ?) <= ?")
+            params += [len(date_to), date_to]
+        if role:
+            where.append("(j.role_category = ? OR j.job_role = ? COLLATE NOCASE)")
+            params += [role, role]
+        if region:
+            where.append("j.region = ? COLLATE NOCASE")
+            params.append(region)
+        filters = "".join(f" AND {clause}" for clause in where)
+        sql = f"""SELECT j.id, j.title, j.job_role, j.region, j.industry, j.posting_date, j.competence_count,
+                         (SELECT GROUP_CONCAT(label, '|') FROM
+                             (SELECT label FROM competences WHERE job_id = j.id ORDER BY position))
+                  FROM jobs j
+                  WHERE j.id > ? AND j.duplicate_of IS NULL
+                    AND NOT EXISTS (SELECT 1 FROM competences c WHERE c.job_id = j.id AND c.label IS NULL)
+                    {filters}
+                  ORDER BY j.id LIMIT ?"""
+
+        last_id = 0
+        while True:
+            rows = self.query(sql, (last_id, *params, chunk_size))
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [row[1:] for row in rows]
+            if len(rows) < chunk_size:
+                return
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_stores: Dict[str, ResultsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_results_store(db_path: Optional[str] = None) -> ResultsStore:
+    """Store-Instanz pro Datenbankpfad (default: RESULTS_DB_PATH bzw. BASE_DATA_DIR/results)"""
+    path = db_path or default_db_path()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = ResultsStore(path)
+            _stores[path] = store
+        return store
+
+
+T = TypeVar("T")
+
+
+class PerStoreSingleton(Generic[T]):
+    """Ergebnis von ``per_store_singleton``: ``get(store)`` liefert die Instanz zum Store"""
+
+    def __init__(self, kind: str, factory: Callable[[], T]):
+        self.kind = kind
+        self.factory = factory
+        # Schwache Schlüssel: id(store) könnte nach dem Schließen eines Stores wiederverwendet werden
+        self._instances: "weakref.WeakKeyDictionary[ResultsStore, T]" = weakref.WeakKeyDictionary()
+        self._synced: "weakref.WeakKeyDictionary[ResultsStore, int]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def get(self, store: ResultsStore) -> T:
+        with self._lock:
+            instance = self._instances.get(store)
+            if instance is None:
+                instance = self._instances[store] = self.factory()
+                store.add_change_listener(self.kind, self._listener(store, instance))
+                self._load(store, instance)
+                return instance
+            changed, version = store.changed_elsewhere(self._synced[store])
+            if changed:
+                logger.info(f"🔄 {type(instance).__name__}: Daten eines anderen Prozesses, lade neu")
+                self._load(store, instance)
+            else:
+                self._synced[store] = version
+            return instance
+
+    def _load(self, store: ResultsStore, instance: T) -> None:
+        # Datenstand vor dem Laden merken: fremde Schreibvorgänge währenddessen → erneut laden
+        self._synced[store] = store.data_version()[0]
+        instance.load(store)
+
+    @staticmethod
+    def _listener(store: ResultsStore, instance: T) -> Callable[[int, Optional[List[Tuple]]], None]:
+        def _on_change(version: int, changes: Optional[List[Tuple]]) -> None:
+            with instance._lock:
+                if version <= instance.version:
+                    return  # bereits im geladenen Stand enthalten
+                if changes is None:
+                    instance.load(store)
+                else:
+                    instance.apply(changes)
+                    instance.version = version
+
+        return _on_change
+
+
+def per_store_singleton(kind: str, factory: Callable[[], T]) -> PerStoreSingleton[T]:
+    """
+    Eine im Speicher materialisierte Sicht pro Store (z.B. Skill-Trend-Matrix, Ko-Vorkommen).
+
+    Die Instanz wird einmal geladen (``load(store)``) und über die Store-Listener ``kind``
+    inkrementell gepflegt (``apply(changes)``, ``version``, ``_lock``). Hat seit dem letzten
+    Abgleich ein anderer Prozess geschrieben (``data_version``), wird beim Zugriff neu geladen.
+    """
+    return PerStoreSingleton(kind, factory)
+
+
+if __name__ == "__main__":
+    # Einmaliger Import: python -m app.infrastructure.results_store [batch_results-Verzeichnis]
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    source = Path(sys.argv[1] if len(sys.argv) > 1 else os.getenv("BATCH_RESULTS_DIR", "data/exports/batch_results"))
+    files = sorted(p for p in source.glob("*.json") if p.name != "summary.json")
+    print(get_results_store().import_json_exports(files))
@@ -0,0 +1,312 @@
+"""
+Skill-Trend-Matrix: materialisierte Zählungen Skill × Monat im Speicher (NumPy)
+Basis für Zeitreihen-, Wachstums- und Emerging-Skill-Abfragen.
+
+- Quelle: ``skill_month_counts`` des Results-Stores (einmal geladen)
+- Danach inkrementell: der Store meldet jede Änderung als Differenz (Listener);
+  Schreibvorgänge anderer Prozesse (``data_version``) → Neuladen beim nächsten Zugriff
+- Dünn besetzt (COO: skill, month, role, region, specific, n); dichte Skill × Zeitraum-
+  Matrizen werden pro Slice (Rolle/Region/spezifisch) lazy gebaut und bis zur nächsten
+  Änderung gecacht
+- Alle Abfragen sind vektorisiert, keine Schleifen über Jobs oder Dateien
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.infrastructure.results_store import ResultsStore, per_store_singleton
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = ('skill', 'month', 'role', 'region', 'specific', 'n')
+
+
+def month_label(month: int) -> str:
+    """Monatsindex (year*12 + month-1) → 'YYYY-MM'"""
+    return f"{month // 12:04d}-{month % 12 + 1:02d}"
+
+
+class SkillTrendMatrix:
+    """
+    Dünn besetzte Zähl-Matrix Skill × Monat mit Rollen- und Regions-Slices.
+
+    Beispiel:
+        matrix = get_skill_trend_matrix(store)
+        matrix.series(['Python'], freq='month', role='data_science')
+        matrix.emerging(min_year=2024)
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.version = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self.labels: List[Optional[str]] = []      # Index = skill_id
+        self.label_index: Dict[str, int] = {}
+        self._roles: Dict[str, int] = {}
+        self._regions: Dict[str, int] = {}
+        self._coo: Dict[str, np.ndarray] = {name: np.zeros(0, dtype=np.int64) for name in _COLUMNS}
+        self._pending: List[Tuple[int, int, int, int, int, int]] = []
+        self._merged_size = 0
+        self._dense: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = {}
+
+    # ------------------------------------------------------------------
+    # Laden / inkrementelle Pflege
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple]) -> "SkillTrendMatrix":
+        """Aus Zeilen (skill_id, label, month, role, region, is_specific, n)"""
+        matrix = cls()
+        matrix._load_rows(rows)
+        return matrix
+
+    def load(self, store: ResultsStore) -> None:
+        with self._lock:
+            self.version, rows = store.skill_month_counts()
+            self._load_rows(rows)
+        logger.info(f"📈 Skill-Trend-Matrix geladen: {len(self.label_index)} Skills, {len(rows)} Zellen")
+
+    def _load_rows(self, rows: List[Tuple]) -> None:
+        """Kompletter Stand (eindeutige Zellen) - spaltenweise statt Zeile für Zeile"""
+        self._reset()
+        if not rows:
+            return
+        skill_ids, labels, months, roles, regions, specific, n = zip(*rows)
+        for skill_id, label in dict(zip(skill_ids, labels)).items():
+            if skill_id >= len(self.labels):
+                self.labels.extend([None] * (skill_id + 1 - len(self.labels)))
+            self.labels[skill_id] = label
+            self.label_index[label] = skill_id
+        for vocab, values in ((self._roles, roles), (self._regions, regions)):
+            for value in dict.fromkeys(values):
+                vocab[value or ''] = len(vocab)
+        self._coo = {
+            'skill': np.array(skill_ids, dtype=np.int64),
+            'month': np.array(months, dtype=np.int64),
+            'role': np.array([self._roles[r or ''] for r in roles], dtype=np.int64),
+            'region': np.array([self._regions[r or ''] for r in regions], dtype=np.int64),
+            'specific': np.array(specific, dtype=np.int64),
+            'n': np.array(n, dtype=np.int64),
+        }
+        self._merged_size = len(rows)
+
+    def apply(self, changes: List[Tuple]) -> None:
+        """Übernimmt Differenzen (skill_id, label, month, role, region, is_specific, delta)"""
+        with self._lock:
+            for skill_id, label, month, role, region, specific, n in changes:
+                if skill_id >= len(self.labels):
+                    self.labels.extend([None] * (skill_id + 1 - len(self.labels)))
+                if self.labels[skill_id] is None:
+                    self.labels[skill_id] = label
+                    self.label_index[label] = skill_id
+                role_idx = self._roles.setdefault(role or '', len(self._roles))
+                region_idx = self._regions.setdefault(region or '', len(self._regions))
+                self._pending.append((skill_id, month, role_idx, region_idx, int(specific), n))
+                self._update_dense(skill_id, month, role or '', region or '', int(specific), n)
+
+    def _update_dense(self, skill_id: int, month: int, role: str, region: str, specific: int, n: int) -> None:
+        """Gecachte dichte Slices direkt mitführen; passt die Zelle nicht hinein, wird der Slice verworfen"""
+        for key, (periods, matrix) in list(self._dense.items()):
+            freq, slice_role, slice_region, specific_only = key
+            if (slice_role is not None and slice_role != role) or \
+                    (slice_region is not None and slice_region != region) or (specific_only and not specific):
+                continue
+            period = month if freq == 'month' else month // 12
+            if len(periods) and skill_id < matrix.shape[0] and periods[0] <= period <= periods[-1]:
+                matrix[skill_id, period - periods[0]] += n
+            else:
+                del self._dense[key]
+
+    def _compact(self) -> None:
+        if not self._pending:
+            return
+        pending = np.array(self._pending, dtype=np.int64)
+        self._pending = []
+        for i, name in enumerate(_COLUMNS):
+            self._coo[name] = np.concatenate([self._coo[name], pending[:, i]])
+        # Doppelte Zellen (viele kleine Differenzen) zusammenfassen, sobald sich die Größe verdoppelt hat
+        if len(self._coo['n']) > 2 * max(self._merged_size, 1024):
+            keys = np.stack([self._coo[name] for name in _COLUMNS[:-1]], axis=1)
+            unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+            n = np.bincount(inverse.ravel(), weights=self._coo['n']).astype(np.int64)
+            keep = n != 0
+            for i, name in enumerate(_COLUMNS[:-1]):
+                self._coo[name] = unique[keep, i]
+            self._coo['n'] = n[keep]
+            self._merged_size = len(self._coo['n'])
+
+    def _dense_matrix(self, freq: str = 'year', role: Optional[str] = None, region: Optional[str] = None,
+                      specific_only: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Dichte Matrix Skill × Zeitraum für einen Slice.
+
+        Returns:
+            (Zeiträume als Jahr bzw. Monatsindex, Matrix [skill_id, zeitraum])
+        """
+        key = (freq, role, region, specific_only)
+        with self._lock:
+            cached = self._dense.get(key)
+            if cached is not None:
+                return cached
+            self._compact()
+            coo = self._coo
+            mask = np.ones(len(coo['n']), dtype=bool)
+            if role is not None:
+                mask &= coo['role'] == self._roles.get(role, -1)
+            if region is not None:
+                mask &= coo['region'] == self._regions.get(region, -1)
+            if specific_only:
+                mask &= coo['specific'] == 1
+            periods_raw = coo['month'][mask] if freq == 'month' else coo['month'][mask] // 12
+            skills, n = coo['skill'][mask], coo['n'][mask]
+            if len(n) == 0:
+                result = (np.zeros(0, dtype=np.int64), np.zeros((len(self.labels), 0), dtype=np.int64))
+            else:
+                start, end = int(periods_raw.min()), int(periods_raw.max())
+                width = end - start + 1
+                flat = skills * width + (periods_raw - start)
+                counts = np.bincount(flat, weights=n, minlength=len(self.labels) * width)
+                result = (np.arange(start, end + 1), counts.astype(np.int64).reshape(len(self.labels), width))
+            self._dense[key] = result
+            return result
+
+    # ------------------------------------------------------------------
+    # Abfragen
+    # ------------------------------------------------------------------
+
+    def _period_label(self, period: int, freq: str) -> str:
+        return month_label(period) if freq == 'month' else str(period)
+
+    def series(self, labels: List[str], freq: str = 'year', role: Optional[str] = None,
+               region: Optional[str] = None, specific_only: bool = False) -> Dict[str, Dict[str, int]]:
+        """{label: {zeitraum: anzahl}} - nur Zeiträume mit Vorkommen (wie aggregate_time_series_for_skills)"""
+        periods, matrix = self._dense_matrix(freq, role, region, specific_only)
+        result: Dict[str, Dict[str, int]] = {}
+        for label in labels:
+            skill_id = self.label_index.get(label)
+            if skill_id is None or matrix.shape[1] == 0:
+                result[label] = {}
+                continue
+            row = matrix[skill_id]
+            nz = np.flatnonzero(row)
+            result[label] = {self._period_label(int(periods[i]), freq): int(row[i]) for i in nz}
+        return result
+
+    def top_labels(self, top_n: int, role: Optional[str] = None, region: Optional[str] = None,
+                   specific_only: bool = False) -> List[Tuple[str, int]]:
+        """Häufigste Skills im Slice (bei Gleichstand: kleinere skill_id zuerst)"""
+        _, matrix = self._dense_matrix('year', role, region, specific_only)
+        totals = matrix.sum(axis=1)
+        order = np.argsort(-totals, kind='stable')[:top_n]
+        return [(self.labels[i], int(totals[i])) for i in order if totals[i] > 0]
+
+    def growth(self, from_year: int, to_year: int, top_n: int = 10, role: Optional[str] = None,
+               region: Optional[str] = None, specific_only: bool = False) -> List[Dict[str, Any]]:
+        """Skills mit dem größten absoluten Zuwachs von ``from_year`` auf ``to_year``"""
+        years, matrix = self._dense_matrix('year', role, region, specific_only)
+        before = matrix[:, years == from_year].sum(axis=1)
+        after = matrix[:, years == to_year].sum(axis=1)
+        diff = after - before
+        candidates = np.flatnonzero(diff > 0)
+        order = candidates[np.argsort(-diff[candidates], kind='stable')][:top_n]
+        return [
+            {
+                'skill': self.labels[i],
+                'growth': int(diff[i]),
+                'growth_pct': round((after[i] / max(before[i], 1) - 1) * 100, 1),
+                f'count_{to_year}': int(after[i]),
+                f'count_{from_year}': int(before[i]),
+            }
+            for i in order
+        ]
+
+    def emerging(self, min_year: int, top_n: int = 10, role: Optional[str] = None,
+                 region: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Aufstrebende spezifische Skills: Jahre >= min_year gegen die Vorjahre.
+        Gleiche Regeln wie reporting._emerging_skills (inkl. Marker 999 für neue Skills).
+        """
+        years, matrix = self._dense_matrix('year', role, region, specific_only=True)
+        recent = matrix[:, years >= min_year].sum(axis=1)
+        older = matrix[:, years < min_year].sum(axis=1)
+        both = (recent > 0) & (older > 0)
+        new = ~both & (recent > 5)
+        growth = np.where(both, recent - older, recent)
+        candidates = np.flatnonzero(both | new)
+        order = candidates[np.argsort(-growth[candidates], kind='stable')][:top_n]
+        result = []
+        for i in order:
+            if both[i]:
+                growth_pct = round(float((recent[i] - older[i]) / older[i] * 100), 1)
+            else:
+                growth_pct = 999  # Marker für "NEU"
+            result.append({
+                'skill': self.labels[i],
+                'growth': int(growth[i]),
+                'growth_pct': growth_pct,
+                'recent_count': int(recent[i]),
+                'older_count': int(older[i]),
+            })
+        return result
+
+    def time_series_validation(self, min_years: int = 3, role: Optional[str] = None,
+                               region: Optional[str] = None) -> Dict[str, Any]:
+        """Level 7: Datenpunkte, Lücken und Trend je spezifischem Skill (wie reporting._time_series_validation)"""
+        _, matrix = self._dense_matrix('year', role, region, specific_only=True)
+        present = matrix > 0
+        k = present.sum(axis=1)
+        total_skills = int((k > 0).sum())
+        validated = k >= min_years
+
+        width = matrix.shape[1]
+        gaps = np.zeros(len(k), dtype=bool)
+        rising = falling = np.zeros(len(k), dtype=bool)
+        if width:
+            first = present.argmax(axis=1)
+            last = width - 1 - present[:, ::-1].argmax(axis=1)
+            gaps = validated & (k > 1) & (k < last - first + 1)
+
+            # Erste Hälfte der Jahre mit Daten gegen zweite Hälfte
+            rank = np.cumsum(present, axis=1) - 1
+            mid = (k // 2)[:, None]
+            first_sum = np.where(present & (rank < mid), matrix, 0).sum(axis=1)
+            second_sum = np.where(present & (rank >= mid), matrix, 0).sum(axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                first_avg = np.where(k // 2 > 0, first_sum / np.maximum(k // 2, 1), 0.0)
+                second_avg = np.where(k - k // 2 > 0, second_sum / np.maximum(k - k // 2, 1), 0.0)
+            rising = validated & (second_avg > first_avg * 1.2)
+            falling = validated & ~rising & (second_avg < first_avg * 0.8)
+
+        validated_skills = int(validated.sum())
+        rising_trends, falling_trends = int(rising.sum()), int(falling.sum())
+        skills_with_gaps = int(gaps.sum())
+        validation_score = validated_skills / total_skills * 100 if total_skills else 0
+        gap_rate = skills_with_gaps / validated_skills * 100 if validated_skills else 0
+
+        return {
+            'total_skills': total_skills,
+            'validated_skills': validated_skills,  # >= 3 Jahre Daten
+            'skills_with_gaps': skills_with_gaps,
+            'skills_with_trend': rising_trends + falling_trends,
+            'validation_score': round(validation_score, 1),
+            'gap_rate': round(gap_rate, 1),
+            'trend_classification': {
+                'rising': rising_trends,
+                'stable': validated_skills - rising_trends - falling_trends,
+                'falling': falling_trends
+            },
+            'min_years_required': min_years
+        }
+
+
+_matrices = per_store_singleton('skill_counts', SkillTrendMatrix)
+
+
+def get_skill_trend_matrix(store: ResultsStore) -> SkillTrendMatrix:
+    """Matrix-Instanz pro Store: einmal laden, danach über die Store-Differenzen aktuell halten"""
+    return _matrices.get(store)
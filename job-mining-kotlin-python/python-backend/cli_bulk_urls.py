@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+CLI für Bulk-URL-Analyse (z.B. wöchentlicher Job-Board-Sweep)
+Schickt alle URLs in einem Request an POST /analyse/scrape-urls und
+schreibt die NDJSON-Ergebnisse fortlaufend mit, sobald sie eintreffen.
+
+Usage:
+  python cli_bulk_urls.py --file urls.txt
+  python cli_bulk_urls.py --file urls.txt --output results.ndjson
+  python cli_bulk_urls.py https://firma.de/job/1 https://firma.de/job/2
+  python cli_bulk_urls.py --help
+"""
+
+import sys
+import os
+import json
+import argparse
+import logging
+from pathlib import Path
+
+import httpx
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_BASE = os.getenv("PYTHON_API_BASE", "http://localhost:8000")
+
+
+def read_urls(file_path: Path) -> list:
+    """Eine URL pro Zeile; leere Zeilen und #-Kommentare werden ignoriert."""
+    urls = []
+    for line in file_path.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            urls.append(line)
+    return urls
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Bulk-URL-Analyse über die Python-API (NDJSON-Stream)"
+    )
+    parser.add_argument('urls', nargs='*', help='URLs (zusätzlich zu --file)')
+    parser.add_argument('--file', type=Path, default=None, help='Textdatei mit einer URL pro Zeile')
+    parser.add_argument('--output', type=Path, default=None, help='NDJSON-Ausgabedatei (default: stdout)')
+    parser.add_argument('--api', default=DEFAULT_API_BASE, help=f'API-Basis-URL (default: {DEFAULT_API_BASE})')
+    parser.add_argument('--batch-size', type=int, default=8, help='Texte pro NLP-Batch (default: 8)')
+    parser.add_argument('--full-text', action='store_true', help='Vollen Text analysieren (fast-Modus aus)')
+    parser.add_argument('--timeout', type=float, default=1800.0, help='Gesamt-Timeout in Sekunden (default: 1800)')
+
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.file:
+        if not args.file.exists():
+            logger.error(f"❌ Datei nicht gefunden: {args.file}")
+            sys.exit(1)
+        urls.extend(read_urls(args.file))
+
+    if not urls:
+        logger.warning("⚠️  Keine URLs angegeben")
+        sys.exit(0)
+
+    logger.info(f"🌍 Sende {len(urls)} URLs an {args.api}/analyse/scrape-urls")
+    payload = {'urls': urls, 'batch_size': args.batch_size, 'fast': not args.full_text}
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    summary = {}
+    try:
+        timeout = httpx.Timeout(args.timeout, connect=10.0)
+        with httpx.stream('POST', f"{args.api.rstrip('/')}/analyse/scrape-urls", json=payload, timeout=timeout) as response:
+            if response.status_code != 200:
+                response.read()
+                logger.error(f"❌ API-Fehler {response.status_code}: {response.text[:500]}")
+                sys.exit(1)
+            for line in response.iter_lines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get('type') == 'summary':
+                    summary = record
+                    continue
+                out.write(line + "\n")
+                out.flush()
+                if record.get('status') == 'error':
+                    logger.warning(f"   ❌ {record.get('url')}: {record.get('error')}")
+    except httpx.HTTPError as e:
+        logger.error(f"❌ Verbindung zur API fehlgeschlagen: {e}")
+        sys.exit(1)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    logger.info(
+        f"✅ Fertig: {summary.get('ok', 0)} ok, {summary.get('errors', 0)} Fehler, "
+        f"{summary.get('duplicates', 0)} Duplikate, {summary.get('skipped', 0)} übersprungen "
+        f"({summary.get('elapsed_ms', 0) / 1000:.1f}s)"
+    )
+    sys.exit(0 if summary.get('errors', 0) == 0 else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -237,7 +237,36 @@ st.header("🔍 Skill Discovery Management")
 
 try:
     # Lade Discovery-Statistiken
-    resp_candidates = requests.get(f"{PYTHON_API_BASE}/discovery/candidates", timeout=5)
+    # Review-Seite: Filter + Cursor kommen aus der Session (Seite vor/zurück)
+    if "discovery_cursors" not in st.session_state:
+        st.session_state.discovery_cursors = [None]
+
+    filter_cols = st.columns([2, 2, 1, 1])
+    prefix = filter_cols[0].text_input("Begriff beginnt mit", key="discovery_prefix")
+    role_filter = filter_cols[1].text_input("Rolle", key="discovery_role")
+    min_count = filter_cols[2].number_input("Mindest-Häufigkeit", min_value=1, value=1, key="discovery_min_count")
+    sort = filter_cols[3].selectbox("Sortierung", ["count", "term"], key="discovery_sort",
+                                    format_func=lambda s: "Häufigkeit" if s == "count" else "Begriff")
+
+    group_variants = st.checkbox("🧩 Schreibvarianten gruppieren (Freigabe pro Cluster)", key="discovery_group")
+
+    filters = (prefix, role_filter, min_count, sort, group_variants)
+    if st.session_state.get("discovery_filters") != filters:
+        st.session_state.discovery_filters = filters
+        st.session_state.discovery_cursors = [None]
+
+    params = {"limit": 20, "min_count": int(min_count)}
+    if not group_variants:
+        params["sort"] = sort
+    if prefix:
+        params["prefix"] = prefix
+    if role_filter:
+        params["role"] = role_filter
+    if st.session_state.discovery_cursors[-1]:
+        params["cursor"] = st.session_state.discovery_cursors[-1]
+
+    page_path = "clusters/page" if group_variants else "candidates/page"
+    resp_candidates = requests.get(f"{PYTHON_API_BASE}/discovery/{page_path}", params=params, timeout=5)
     resp_approved = requests.get(f"{PYTHON_API_BASE}/discovery/approved", timeout=5)
     resp_ignored = requests.get(f"{PYTHON_API_BASE}/discovery/ignored", timeout=5)
     
@@ -248,7 +277,7 @@ try:
         
         # Statistik-Übersicht
         col1, col2, col3 = st.columns(3)
-        col1.metric("📋 Kandidaten", candidates_data.get("total", 0))
+        col1.metric("🧩 Cluster" if group_variants else "📋 Kandidaten", candidates_data.get("total", 0))
         col2.metric("✅ Genehmigt", approved_data.get("total", 0))
         col3.metric("🚫 Ignoriert", ignored_data.get("total", 0))
         
@@ -256,16 +285,32 @@ try:
 
         # Kandidaten-Tabelle mit Buttons pro Zeile
         st.subheader("📋 Discovery-Kandidaten")
-        candidates = candidates_data.get("candidates", [])
+        if group_variants:
+            # Ein Eintrag pro Cluster: Repräsentant, Summe, Varianten als Hinweis
+            candidates = [
+                {"term": c.get("representative"), "count": c.get("count", 0), "role": ", ".join(c.get("roles", [])),
+                 "variants": [v.get("term") for v in c.get("terms", [])]}
+                for c in candidates_data.get("clusters", [])
+            ]
+        else:
+            candidates = candidates_data.get("candidates", [])
+        approve_action = "clusters/approve" if group_variants else "approve"
+        ignore_action = "clusters/ignore" if group_variants else "ignore"
 
-        if candidates:
-            # Filter nach Häufigkeit
-            max_count = max([c.get('count', 0) for c in candidates], default=1)
-            min_count = st.slider("Mindest-Häufigkeit", 1, max_count, 1)
+        def _review(action: str, terms: list, message: str):
+            try:
+                resp = requests.post(f"{PYTHON_API_BASE}/discovery/{action}", json={"terms": terms}, timeout=5)
+                if resp.status_code == 200:
+                    st.success(message)
+                    st.rerun()
+                else:
+                    st.error(f"Fehler: {resp.status_code}")
+            except Exception as e:
+                st.error(f"Fehler: {e}")
 
-            # Gefilterte Kandidaten
-            filtered = [c for c in candidates if c.get('count', 0) >= min_count]
-            st.caption(f"Zeige {len(filtered)} von {len(candidates)} Kandidaten (min. {min_count}x)")
+        if candidates:
+            page_no = len(st.session_state.discovery_cursors)
+            st.caption(f"Seite {page_no}: {len(candidates)} Kandidaten")
 
             # Tabellen-Header
             header_cols = st.columns([3, 1, 2, 1, 1])
@@ -277,52 +322,43 @@ try:
 
             st.markdown("---")
 
-            # Zeilen mit Approve/Reject Buttons (Top 20)
-            for idx, c in enumerate(filtered[:20]):
+            # Zeilen mit Approve/Reject Buttons (eine Seite)
+            for idx, c in enumerate(candidates):
                 term = c.get('term', 'N/A')
                 count = c.get('count', 0)
                 role = c.get('role', 'N/A')
 
                 cols = st.columns([3, 1, 2, 1, 1])
                 cols[0].text(term)
+                if len(c.get('variants', [])) > 1:
+                    cols[0].caption(" · ".join(c['variants']))
                 cols[1].text(str(count))
                 cols[2].text(role)
 
-                # Approve Button
-                if cols[3].button("✅", key=f"approve_{idx}_{term}", help="Genehmigen"):
-                    try:
-                        # Mapping: Term bleibt gleich (oder später custom mapping)
-                        resp = requests.post(
-                            f"{PYTHON_API_BASE}/discovery/approve",
-                            json={"terms": [term]},
-                            timeout=5
-                        )
-                        if resp.status_code == 200:
-                            st.success(f"✅ '{term}' genehmigt")
-                            st.rerun()
-                        else:
-                            st.error(f"Fehler: {resp.status_code}")
-                    except Exception as e:
-                        st.error(f"Fehler: {e}")
+                # Approve Button (Mapping: Term bleibt gleich, oder später custom mapping)
+                if cols[3].button("✅", key=f"approve_{page_no}_{idx}_{term}", help="Genehmigen"):
+                    _review(approve_action, [term], f"✅ '{term}' genehmigt")
 
                 # Reject Button
-                if cols[4].button("❌", key=f"reject_{idx}_{term}", help="Ignorieren"):
-                    try:
-                        resp = requests.post(
-                            f"{PYTHON_API_BASE}/discovery/ignore",
-                            json={"terms": [term]},
-                            timeout=5
-                        )
-                        if resp.status_code == 200:
-                            st.success(f"❌ '{term}' ignoriert")
-                            st.rerun()
-                        else:
-                            st.error(f"Fehler: {resp.status_code}")
-                    except Exception as e:
-                        st.error(f"Fehler: {e}")
-
-            if len(filtered) > 20:
-                st.info(f"Zeige Top 20. {len(filtered) - 20} weitere verfügbar (Filter anpassen)")
+                if cols[4].button("❌", key=f"reject_{page_no}_{idx}_{term}", help="Ignorieren"):
+                    _review(ignore_action, [term], f"❌ '{term}' ignoriert")
+
+            # Sammelaktionen für die angezeigte Seite
+            page_terms = sorted({c.get('term') for c in candidates if c.get('term')})
+            bulk_cols = st.columns(2)
+            if bulk_cols[0].button("✅ Seite genehmigen", key=f"approve_page_{page_no}"):
+                _review(approve_action, page_terms, f"✅ {len(page_terms)} Einträge genehmigt")
+            if bulk_cols[1].button("❌ Seite ignorieren", key=f"ignore_page_{page_no}"):
+                _review(ignore_action, page_terms, f"❌ {len(page_terms)} Einträge ignoriert")
+
+            # Blättern
+            nav_cols = st.columns(2)
+            if page_no > 1 and nav_cols[0].button("⬅️ Zurück"):
+                st.session_state.discovery_cursors.pop()
+                st.rerun()
+            if candidates_data.get("next_cursor") and nav_cols[1].button("Weiter ➡️"):
+                st.session_state.discovery_cursors.append(candidates_data["next_cursor"])
+                st.rerun()
 
             # Clear-Button
             st.markdown("---")
@@ -331,6 +367,7 @@ try:
                     resp = requests.delete(f"{PYTHON_API_BASE}/discovery/candidates", timeout=5)
                     if resp.status_code == 200:
                         st.success("🗑️ Alle Kandidaten gelöscht")
+                        st.session_state.discovery_cursors = [None]
                         st.rerun()
                     else:
                         st.error(f"❌ Fehler: {resp.status_code}")
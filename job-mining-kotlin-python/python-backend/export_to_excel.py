@@ -2,6 +2,28 @@ import psycopg2
 import csv
 from datetime import datetime
 
+FETCH_SIZE = 2000
+
+# Spalten der Auswertung: (SQL-Ausdruck, Spaltenname in der CSV)
+EXPORT_COLUMNS = [
+    ("j.id", "job_id"),
+    ("j.title", "title"),
+    ("j.job_role", "job_role"),
+    ("j.industry", "industry"),
+    ("j.region", "region"),
+    ("j.posting_date", "posting_date"),
+    ("EXTRACT(YEAR FROM j.posting_date)", "jahr"),
+    ("c.esco_label", "esco_label"),
+    ("c.esco_uri", "esco_uri"),
+    ("c.original_term", "original_term"),
+    ("c.is_digital", "is_digital"),
+    ("c.level", "level"),
+    ("c.is_discovery", "is_discovery"),
+    ("c.source_domain", "source_domain"),
+    ("c.role_context", "role_context"),
+    ("c.confidence_score", "confidence_score"),
+]
+
 def export_job_mining_data():
     # Zugangsdaten basierend auf deiner docker-compose.yml
     db_config = {
@@ -16,52 +38,42 @@ def export_job_mining_data():
 
     # SQL für die longitudinale Auswertung
     # Verknüpft Jobs mit Kompetenzen und extrahiert das Jahr für die Zeitreihe
-    query = """
+    columns = ",\n                ".join(f"{expr} AS {name}" for expr, name in EXPORT_COLUMNS)
+    query = f"""
             SELECT
-                j.id as job_id,
-                j.title,
-                j.job_role,
-                j.industry,
-                j.region,
-                j.posting_date,
-                EXTRACT(YEAR FROM j.posting_date) as jahr,
-                c.esco_label,
-                c.esco_uri,
-                c.original_term,
-                c.is_digital,
-                c.level,
-                c.is_discovery,
-                c.source_domain,
-                c.role_context
-                c.confidence_score
+                {columns}
             FROM job_posting j
                      LEFT JOIN competence c ON j.id = c.job_posting_id
-            ORDER BY j.posting_date DESC; \
+            ORDER BY j.posting_date DESC;
             """
 
+    conn = cur = None
     try:
         conn = psycopg2.connect(**db_config)
-        cur = conn.cursor()
+        # Serverseitiger Cursor: Zeilen kommen in Blöcken zu itersize statt komplett per fetchall()
+        cur = conn.cursor(name="job_mining_export")
+        cur.itersize = FETCH_SIZE
         cur.execute(query)
-        rows = cur.fetchall()
-        colnames = [desc[0] for desc in cur.description]
-
-        # Die Spaltennamen werden automatisch aus dem Query übernommen
-        colnames = [desc[0] for desc in cur.description]
 
+        written = 0
         with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
             writer = csv.writer(f, delimiter=';') # Semikolon für direkten Excel-Import
-            writer.writerow(colnames)
-            writer.writerows(rows)
+            # Kopfzeile vor der Schleife: auch ein leeres Ergebnis hat Spaltennamen
+            # (cursor.description ist beim serverseitigen Cursor erst nach dem ersten Fetch gesetzt)
+            writer.writerow([name for _, name in EXPORT_COLUMNS])
+            for row in cur:
+                writer.writerow(row)
+                written += 1
 
-        print(f"✅ Erfolg! {len(rows)} Datensätze wurden nach '{output_file}' exportiert.")
+        print(f"✅ Erfolg! {written} Datensätze wurden nach '{output_file}' exportiert.")
         print("💡 Du kannst diese Datei jetzt direkt in Excel öffnen.")
 
     except Exception as e:
         print(f"❌ Fehler beim Datenbank-Export: {e}")
     finally:
-        if conn:
+        if cur is not None:
             cur.close()
+        if conn is not None:
             conn.close()
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import logging
@@ -10,8 +11,9 @@ import pandas as pd
 import requests
 
 import uvicorn
-from fastapi import FastAPI, UploadFile, File, HTTPException, Depends, requests
-from typing import List, Dict
+from fastapi import FastAPI, UploadFile, File, HTTPException, Depends, Request, requests
+from fastapi.responses import Response, StreamingResponse
+from typing import List, Dict, Optional
 import subprocess
 
 # --- 1. KORREKTE IMPORTE (Mit 'app.' Prefix) ---
@@ -22,13 +24,23 @@ from app.interfaces.interfaces import IJobMiningWorkflowManager
 from app.infrastructure.clients.kotlin_rule_client import KotlinRuleClient
 from app.infrastructure.repositories.hybrid_competence_repository import HybridCompetenceRepository
 from app.infrastructure.extractor.advanced_text_extractor import AdvancedTextExtractor
+from app.infrastructure.extractor.pdf_extraction_engine import shutdown_pdf_workers
+from app.infrastructure.crawling.async_http_client import close_async_http_client
+from app.infrastructure.cache.http_cache import get_http_cache
 from app.infrastructure.extractor.spacy_competence_extractor import SpaCyCompetenceExtractor
 from app.infrastructure.extractor.fuzzy_competence_extractor import FuzzyCompetenceExtractor
 from app.infrastructure.extractor.competence_extractor import CompetenceExtractor
 from app.infrastructure.extractor.discovery_extractor import DiscoveryExtractor
+from app.infrastructure.extractor.discovery_store import close_discovery_stores
 from app.infrastructure.extractor.metadata_extractor import MetadataExtractor
-from app.infrastructure.exporter import save_result, rebuild_summary
+from app.infrastructure.exporter import save_result, save_results, rebuild_summary, get_summary_store
+from app.infrastructure.results_store import get_results_store, results_store_enabled
+from app.infrastructure.near_duplicates import near_duplicates_enabled
+from app.infrastructure.metrics import get_metrics
 from app.infrastructure.io.job_directory_processor import JobDirectoryProcessor
+from app.infrastructure.io.upload_spooler import BodySizeLimitMiddleware, UploadRejected, open_upload
+from app.infrastructure.io.js_scraper import shutdown_browser_pool
+from app.infrastructure.io.write_behind import flush_all_writers
 
 # Domain Services
 from app.application.services.organization_service import OrganizationService
@@ -38,8 +50,11 @@ from app.application.services.role_service import RoleService
 from app.application.job_mining_workflow_manager import JobMiningWorkflowManager
 
 # API Helper
-from app.core.api_endpoints import scrape_and_analyze_url, URLInput
+from app.core.api_endpoints import scrape_and_analyze_url, URLInput, BulkURLInput, stream_bulk_url_analysis, validate_bulk_input
+from app.core.api_endpoints import CrawlInput, start_crawl, crawl_status, stop_crawl
+from app.core.api_endpoints import cached_report_response, conditional_stream_response
 from app.api.dashboard_api import router as dashboard_router
+from app.api.dashboard_routes import router as dashboard_db_router
 from dashboard_app import PYTHON_API_BASE
 
 1
@@ -51,9 +66,12 @@ BASE_DATA_DIR = os.getenv("BASE_DATA_DIR", "data")
 JOB_DIR = os.path.join(BASE_DATA_DIR, "jobs")
 
 app = FastAPI(title="Job Mining Python Analysis Engine", version="2.3.0")
+# MAX_UPLOAD_BYTES vor dem Multipart-Parsen erzwingen (413 ohne den Body zu lesen)
+app.add_middleware(BodySizeLimitMiddleware)
 
 # ✅ Dashboard-Routes hinzufügen
 app.include_router(dashboard_router)
+app.include_router(dashboard_db_router)
 
 # =========================================================
 # 3. SYSTEM-VERDRAHTUNG (WIRING) MIT FEHLERBEHANDLUNG
@@ -108,6 +126,9 @@ try:
     )
     # Inject the real competence extractor into the manager
     WORKFLOW_MANAGER.competence_extractor = COMPETENCE_EXTRACTOR
+    # Near-Duplicates (LinkedIn / XING / Firmenseite) vor der NLP-Analyse erkennen
+    if results_store_enabled() and near_duplicates_enabled():
+        WORKFLOW_MANAGER.duplicate_index = get_results_store()
 
     # F. Batch
     DIRECTORY_PROCESSOR = JobDirectoryProcessor(
@@ -195,6 +216,21 @@ async def startup_event():
         logger.error(f"❌ Kritischer Fehler beim Startup: {e}")
         logger.info("   System versucht trotzdem zu starten...")
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Stoppt den Crawler, gibt Worker-Pools, HTTP-Verbindungen und den Browser-Pool frei,
+    kompaktiert das Discovery-Log und schreibt offene Write-behind-Änderungen
+    """
+    await stop_crawl()
+    shutdown_pdf_workers()
+    await close_async_http_client()
+    await shutdown_browser_pool()
+    close_discovery_stores()
+    flush_all_writers()
+    logger.info("👋 API beendet")
+
 @st.cache_data(ttl=60)
 def fetch_discovery_candidates():
     try:
@@ -255,16 +291,13 @@ async def analyze_file(file: UploadFile = File(...)):
         if not file.filename:
             raise HTTPException(status_code=400, detail="Dateiname fehlt")
 
-        # Dateiinhalt prüfen
-        content = await file.read()
-        if not content:
-            raise HTTPException(status_code=400, detail="Datei ist leer")
-
-        # Reset file pointer für weitere Verarbeitung
-        from io import BytesIO
-        file_obj = BytesIO(content)
+        # Starlette hat den Upload bereits gespoolt → direkt aus file.file lesen (Typ-Limit, leer)
+        try:
+            upload = open_upload(file)
+        except UploadRejected as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
 
-        return await WORKFLOW_MANAGER.run_full_analysis(file_obj, file.filename)
+        return await WORKFLOW_MANAGER.run_full_analysis(upload, file.filename)
     except HTTPException:
         raise
     except ValueError as e:
@@ -285,13 +318,15 @@ async def scrape_url_endpoint(url_input: URLInput):
     try:
         if not url_input.url or not url_input.url.strip():
             raise HTTPException(status_code=400, detail="URL fehlt oder ist leer")
-        result = await scrape_and_analyze_url(url_input, manager=WORKFLOW_MANAGER)
-        try:
-            save_result(result)
-            rebuild_summary()
-        except Exception as e:
-            logger.warning(f"Export fehlgeschlagen: {e}")
-        return result
+
+        def _export(result):
+            try:
+                save_result(result)
+            except Exception as e:
+                logger.warning(f"Export fehlgeschlagen: {e}")
+
+        # Export nur für neue Ergebnisse (unveränderte Seiten kommen aus dem HTTP-Cache)
+        return await scrape_and_analyze_url(url_input, manager=WORKFLOW_MANAGER, on_new_result=_export)
     except HTTPException:
         raise
     except Exception as e:
@@ -299,6 +334,30 @@ async def scrape_url_endpoint(url_input: URLInput):
         raise HTTPException(status_code=500, detail=f"Scraping fehlgeschlagen: {str(e)}")
 
 
+@app.post("/analyse/scrape-urls")
+async def scrape_urls_bulk_endpoint(bulk_input: BulkURLInput):
+    """Bulk-Scraping: viele URLs parallel laden, NLP im Batch, Ergebnisse als NDJSON-Stream."""
+    logger.info(f"🌍 [POST /analyse/scrape-urls] {len(bulk_input.urls)} URLs")
+    validate_bulk_input(bulk_input)
+    return StreamingResponse(
+        stream_bulk_url_analysis(bulk_input, WORKFLOW_MANAGER, on_result=save_result),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.post("/crawl/run")
+async def crawl_run_endpoint(crawl_input: CrawlInput):
+    """Startet einen Crawl über Listing-Seiten (Hintergrund); neue Postings laufen durch die Analyse."""
+    logger.info(f"🕷️ [POST /crawl/run] {len(crawl_input.seeds)} Seeds, Budget {crawl_input.max_fetches}")
+    return start_crawl(crawl_input, WORKFLOW_MANAGER, on_result=save_result)
+
+
+@app.get("/crawl/status")
+def crawl_status_endpoint():
+    """Frontier-Stand (je Typ/Zustand) und Zähler des letzten Laufs"""
+    return crawl_status()
+
+
 # --- PFAD-FIX 3: /system/status statt /health ---
 @app.get("/system/status")
 def system_status():
@@ -324,6 +383,12 @@ def system_status():
             "error": str(e)
         }
 
+
+@app.get("/metrics")
+def prometheus_metrics():
+    """Pipeline-Metriken im Prometheus-Textformat (Stufen-Dauern nur mit LOG_NLP_TIMINGS=1)"""
+    return Response(get_metrics().render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 # --- PFAD-FIX 4: /role-mappings (NEU) ---
 @app.get("/role-mappings")
 def get_role_mappings():
@@ -344,27 +409,76 @@ def get_role_mappings():
 
 # --- DASHBOARD / REPORTING ENDPOINTS ---
 from fastapi.responses import StreamingResponse
-from app.infrastructure.reporting import build_dashboard_metrics, generate_csv_report, generate_pdf_report
+from app.infrastructure.reporting import (
+    build_dashboard_metrics,
+    generate_pdf_report,
+    stream_csv_report,
+    stream_ndjson_report,
+    stream_xlsx_report,
+)
 
 @app.get("/reports/dashboard-metrics")
-def get_dashboard_metrics(top_n: int = 10):
-    """Aggregierte Metriken für das Dashboard (Top Skills, Domain Mix, Zeitreihen)"""
-    metrics = build_dashboard_metrics(top_n=top_n)
-    return metrics
+def get_dashboard_metrics(request: Request, top_n: int = 10):
+    """Aggregierte Metriken für das Dashboard (Top Skills, Domain Mix, Zeitreihen) - gecacht je Datenstand"""
+    def compute() -> bytes:
+        return json.dumps(build_dashboard_metrics(top_n=top_n), ensure_ascii=False, default=str).encode("utf-8")
+
+    return cached_report_response(request, {"top_n": top_n}, compute, "application/json")
+
+
+def _export_response(request: Request, stream_report, media_type: str, file_name: str, date_from: Optional[str],
+                     date_to: Optional[str], role: Optional[str], region: Optional[str]) -> Response:
+    """Streaming-Download: Zeilen werden blockweise aus dem Results-Store gelesen und gesendet (304 bei gleichem Stand)"""
+    filters = {"date_from": date_from, "date_to": date_to, "role": role, "region": region}
+    try:
+        body = stream_report(**filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        # Optionale Abhängigkeit fehlt (z.B. openpyxl für XLSX) → Format nicht verfügbar statt 500
+        raise HTTPException(status_code=501, detail=str(e))
+    return conditional_stream_response(request, filters, body, media_type,
+                                       headers={"Content-Disposition": f"attachment; filename={file_name}"})
 
 
 @app.get("/reports/export.csv")
-def download_csv_report():
-    """Generiert einen CSV-Export der aktuell verarbeiteten Jobs."""
-    csv_bio = generate_csv_report()
-    return StreamingResponse(csv_bio, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=job_mining_data_report.csv"})
+def download_csv_report(request: Request, date_from: Optional[str] = None, date_to: Optional[str] = None,
+                        role: Optional[str] = None, region: Optional[str] = None):
+    """CSV-Export der verarbeiteten Jobs (optional gefiltert nach Zeitraum, Rolle, Region)."""
+    return _export_response(request, stream_csv_report, "text/csv", "job_mining_data_report.csv",
+                            date_from, date_to, role, region)
+
+
+@app.get("/reports/export.ndjson")
+def download_ndjson_report(request: Request, date_from: Optional[str] = None, date_to: Optional[str] = None,
+                           role: Optional[str] = None, region: Optional[str] = None):
+    """NDJSON-Export (ein Job pro Zeile) mit denselben Filtern wie der CSV-Export."""
+    return _export_response(request, stream_ndjson_report, "application/x-ndjson", "job_mining_data_report.ndjson",
+                            date_from, date_to, role, region)
+
+
+@app.get("/reports/export.xlsx")
+def download_xlsx_report(request: Request, date_from: Optional[str] = None, date_to: Optional[str] = None,
+                         role: Optional[str] = None, region: Optional[str] = None):
+    """Excel-Export (write-only) mit denselben Filtern wie der CSV-Export."""
+    return _export_response(request, stream_xlsx_report,
+                            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            "job_mining_data_report.xlsx", date_from, date_to, role, region)
 
 
 @app.get("/reports/export.pdf")
-def download_pdf_report():
-    """Generiert einen einfachen PDF-Report der aktuell verarbeiteten Jobs."""
-    pdf_bio = generate_pdf_report()
-    return StreamingResponse(pdf_bio, media_type="application/pdf", headers={"Content-Disposition": "attachment; filename=job_mining_report.pdf"})
+def download_pdf_report(request: Request):
+    """Generiert einen einfachen PDF-Report der aktuell verarbeiteten Jobs (gecacht je Datenstand)."""
+    return cached_report_response(request, {}, lambda: generate_pdf_report().getvalue(), "application/pdf",
+                                  headers={"Content-Disposition": "attachment; filename=job_mining_report.pdf"})
+
+
+@app.get("/reports/duplicates")
+def get_duplicate_report(limit: int = 50):
+    """Verknüpfte Near-Duplicates: Anzahl und kanonische Anzeigen mit den meisten Duplikaten"""
+    if not results_store_enabled():
+        raise HTTPException(status_code=404, detail="Near-Duplicate-Index nur mit RESULTS_BACKEND=sqlite")
+    return get_results_store().duplicate_summary(limit=limit)
 
 
 # Bestehende Pfade (waren bereits korrekt/grün)
@@ -375,9 +489,7 @@ async def trigger_batch():
     try:
         results = await DIRECTORY_PROCESSOR.process_all_jobs()
         try:
-            for r in results:
-                save_result(r)
-            rebuild_summary()
+            save_results(results)
         except Exception as e:
             logger.warning(f"Batch-Export fehlgeschlagen: {e}")
         logger.info(f"📦 Batch fertig: {len(results)} Dateien analysiert.")
@@ -386,6 +498,17 @@ async def trigger_batch():
         logger.error(f"❌ Fehler bei Batch-Verarbeitung: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Batch-Verarbeitung fehlgeschlagen: {str(e)}")
 
+@app.post("/internal/admin/rebuild-summary")
+def rebuild_summary_endpoint():
+    """Reparatur: Summary aus allen Export-Dateien neu aufbauen (save_result pflegt sie sonst inkrementell)"""
+    logger.info("🔧 [POST /internal/admin/rebuild-summary] Vollständiger Rebuild...")
+    try:
+        rebuild_summary()
+        return {"status": "success", "summary": get_summary_store().summary()}
+    except Exception as e:
+        logger.error(f"❌ Summary-Rebuild fehlgeschlagen: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Summary-Rebuild fehlgeschlagen: {str(e)}")
+
 @app.post("/internal/admin/refresh-knowledge")
 def refresh_knowledge():
     """Knowledge-Base-Refresh mit umfassender Fehlerbehandlung"""
@@ -415,6 +538,15 @@ def refresh_knowledge():
                 logger.error(f"Fehler beim Laden der Blacklist: {e}")
                 errors.append(f"_load_dynamic_blacklist: {str(e)}")
 
+        # Gecachte URL-Analysen beruhen auf der alten Knowledge Base
+        try:
+            http_cache = get_http_cache()
+            if http_cache is not None:
+                http_cache.clear_analyses()
+        except Exception as e:
+            logger.error(f"Fehler beim Leeren des Analyse-Caches: {e}")
+            errors.append(f"http_cache: {str(e)}")
+
         # WICHTIG: Extractor NICHT neu initialisieren! Das führt zu Memory-Problemen und Container-Crash.
         # Der Extractor wird die neuen Daten automatisch über das Repository verwenden.
         # try:
@@ -464,21 +596,12 @@ class DiscoveryIgnore(BaseModel):
 @app.get("/discovery/candidates")
 def get_discovery_candidates():
     """
-    📋 Liefert alle entdeckten Kandidaten aus candidates.json
+    📋 Liefert alle entdeckten Kandidaten (Snapshot candidates.json + Discovery-Log)
     """
     try:
-        from app.infrastructure.extractor.discovery_logger import _data_base_dir, _ensure_discovery_dir
-        base = _data_base_dir()
-        ddir = _ensure_discovery_dir(base)
-        fpath = ddir / "candidates.json"
-
-        if not fpath.exists():
-            return {"candidates": [], "total": 0}
-
-        import json
-        candidates = json.loads(fpath.read_text(encoding="utf-8")) or []
-        # Sortiere nach count (häufigste zuerst)
-        candidates.sort(key=lambda x: x.get("count", 0), reverse=True)
+        from app.infrastructure.extractor.discovery_logger import get_store
+        # Snapshot + noch nicht kompaktierte Log-Einträge, häufigste zuerst
+        candidates = get_store().candidates()
 
         return {
             "candidates": candidates,
@@ -489,22 +612,42 @@ def get_discovery_candidates():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/discovery/approved")
-def get_approved_skills():
+@app.get("/discovery/candidates/page")
+def get_discovery_candidates_page(
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    sort: str = "count",
+    entity_type: Optional[str] = None,
+    role: Optional[str] = None,
+    min_count: int = 1,
+    prefix: Optional[str] = None,
+):
     """
-    ✅ Liefert alle genehmigten Skills aus approved_skills.json
+    📄 Eine Seite Discovery-Kandidaten für das Review (Cursor-Pagination über den Store-Index)
+
+    - sort: "count" (häufigste zuerst) oder "term" (alphabetisch)
+    - Filter: entity_type, role, min_count, prefix (Begriffsanfang)
+    - Nächste Seite: ``cursor`` = ``next_cursor`` der Antwort (None = letzte Seite)
     """
     try:
-        from app.infrastructure.extractor.discovery_logger import _data_base_dir, _ensure_discovery_dir
-        base = _data_base_dir()
-        ddir = _ensure_discovery_dir(base)
-        fpath = ddir / "approved_skills.json"
+        from app.infrastructure.extractor.discovery_logger import get_store
+        return get_store().query(entity_type=entity_type, role=role, min_count=min_count, prefix=prefix,
+                                 sort=sort, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ Error loading candidate page: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        if not fpath.exists():
-            return {"approved": {}, "total": 0}
 
-        import json
-        approved = json.loads(fpath.read_text(encoding="utf-8")) or {}
+@app.get("/discovery/approved")
+def get_approved_skills():
+    """
+    ✅ Liefert alle genehmigten Skills (approved_skills.json + noch nicht kompaktierte Freigaben)
+    """
+    try:
+        from app.infrastructure.extractor.discovery_logger import get_store
+        approved = get_store().approved()
 
         return {
             "approved": approved,
@@ -518,19 +661,11 @@ def get_approved_skills():
 @app.get("/discovery/ignored")
 def get_ignored_skills():
     """
-    🚫 Liefert alle ignorierten Terms aus ignore_skills.json
+    🚫 Liefert alle ignorierten Terms (ignore_skills.json + noch nicht kompaktierte Einträge)
     """
     try:
-        from app.infrastructure.extractor.discovery_logger import _data_base_dir, _ensure_discovery_dir
-        base = _data_base_dir()
-        ddir = _ensure_discovery_dir(base)
-        fpath = ddir / "ignore_skills.json"
-
-        if not fpath.exists():
-            return {"ignored": [], "total": 0}
-
-        import json
-        ignored = json.loads(fpath.read_text(encoding="utf-8")) or []
+        from app.infrastructure.extractor.discovery_logger import get_store
+        ignored = get_store().ignored()
 
         return {
             "ignored": ignored,
@@ -541,47 +676,48 @@ def get_ignored_skills():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/discovery/approve")
-def approve_candidates(approval: DiscoveryApproval):
+def _approve_discovery_terms(terms: List[str], canonical: Optional[Dict[str, str]] = None) -> Dict:
     """
-    ✅ Genehmigt Kandidaten → Verschiebt von candidates.json zu approved_skills.json
+    Verschiebt Kandidaten nach approved_skills.json (Mapping Begriff → Label).
+    ``canonical``: normalisierter Begriff → Label (Cluster-Freigabe), sonst Label = Begriff.
+    Nur die k Begriffe werden als Log-Ereignis geschrieben (O(k)), die JSON-Datei folgt
+    mit der nächsten Kompaktierung des Discovery-Stores.
     """
-    try:
-        from app.infrastructure.extractor.discovery_logger import _data_base_dir, _ensure_discovery_dir
-        import json
+    from app.infrastructure.extractor.discovery_logger import get_store
+
+    store = get_store()
+    approved = store.approve_terms(terms, canonical)
 
-        base = _data_base_dir()
-        ddir = _ensure_discovery_dir(base)
-        candidates_path = ddir / "candidates.json"
-        approved_path = ddir / "approved_skills.json"
+    logger.info(f"✅ Approved {len(approved)} candidates")
+    return {
+        "status": "success",
+        "approved_count": len(approved),
+        "remaining_candidates": store.count()
+    }
 
-        # Lade bestehende Daten
-        candidates = json.loads(candidates_path.read_text(encoding="utf-8")) if candidates_path.exists() else []
-        approved = json.loads(approved_path.read_text(encoding="utf-8")) if approved_path.exists() else {}
 
-        # Normalisiere terms zu lowercase
-        terms_lower = {t.lower().strip() for t in approval.terms}
+def _ignore_discovery_terms(terms: List[str]) -> Dict:
+    """Verschiebt Kandidaten nach ignore_skills.json (Log-Ereignis, Datei folgt mit der Kompaktierung)"""
+    from app.infrastructure.extractor.discovery_logger import get_store
 
-        # Finde und verschiebe
-        to_approve = [c for c in candidates if c.get("term", "").lower().strip() in terms_lower]
-        candidates = [c for c in candidates if c.get("term", "").lower().strip() not in terms_lower]
+    store = get_store()
+    ignored = store.ignore_terms(terms)
 
-        # Füge zu approved hinzu (als Mapping: term -> term, für Custom Skills kompatibel)
-        for item in to_approve:
-            term = item.get("term")
-            if term:
-                approved[term] = term  # Simple 1:1 mapping
+    logger.info(f"🚫 Ignored {len(ignored)} candidates")
+    return {
+        "status": "success",
+        "ignored_count": len(ignored),
+        "remaining_candidates": store.count()
+    }
 
-        # Speichere
-        candidates_path.write_text(json.dumps(candidates, ensure_ascii=False, indent=2), encoding="utf-8")
-        approved_path.write_text(json.dumps(approved, ensure_ascii=False, indent=2), encoding="utf-8")
 
-        logger.info(f"✅ Approved {len(to_approve)} candidates")
-        return {
-            "status": "success",
-            "approved_count": len(to_approve),
-            "remaining_candidates": len(candidates)
-        }
+@app.post("/discovery/approve")
+def approve_candidates(approval: DiscoveryApproval):
+    """
+    ✅ Genehmigt Kandidaten → Verschiebt von candidates.json zu approved_skills.json
+    """
+    try:
+        return _approve_discovery_terms(approval.terms)
     except Exception as e:
         logger.error(f"❌ Error approving candidates: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -593,41 +729,68 @@ def ignore_candidates(ignore: DiscoveryIgnore):
     🚫 Ignoriert Kandidaten → Verschiebt von candidates.json zu ignore_skills.json
     """
     try:
-        from app.infrastructure.extractor.discovery_logger import _data_base_dir, _ensure_discovery_dir
-        import json
+        return _ignore_discovery_terms(ignore.terms)
+    except Exception as e:
+        logger.error(f"❌ Error ignoring candidates: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        base = _data_base_dir()
-        ddir = _ensure_discovery_dir(base)
-        candidates_path = ddir / "candidates.json"
-        ignore_path = ddir / "ignore_skills.json"
 
-        # Lade bestehende Daten
-        candidates = json.loads(candidates_path.read_text(encoding="utf-8")) if candidates_path.exists() else []
-        ignored = json.loads(ignore_path.read_text(encoding="utf-8")) if ignore_path.exists() else []
+@app.get("/discovery/clusters/page")
+def get_discovery_clusters_page(
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    role: Optional[str] = None,
+    min_count: int = 1,
+    prefix: Optional[str] = None,
+):
+    """
+    🧩 Eine Seite Varianten-Cluster ("Cloud-Plattformen" / "Cloudplattform" / ...) mit Repräsentant
 
-        # Normalisiere terms
-        terms_lower = {t.lower().strip() for t in ignore.terms}
+    - Sortierung: Summe der Häufigkeiten aller Varianten, absteigend
+    - Filter: role, min_count (Summe), prefix (irgendeine Variante)
+    - Freigabe / Ignorieren pro Cluster: POST /discovery/clusters/approve bzw. /ignore
+    """
+    try:
+        from app.infrastructure.extractor.discovery_logger import get_store
+        return get_store().cluster_query(role=role, min_count=min_count, prefix=prefix, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ Error loading candidate clusters: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Entferne aus candidates
-        to_ignore = [c.get("term") for c in candidates if c.get("term", "").lower().strip() in terms_lower]
-        candidates = [c for c in candidates if c.get("term", "").lower().strip() not in terms_lower]
 
-        # Füge zu ignored hinzu
-        ignored.extend(to_ignore)
-        ignored = list(set(ignored))  # Duplikate entfernen
+@app.post("/discovery/clusters/approve")
+def approve_candidate_clusters(approval: DiscoveryApproval):
+    """
+    ✅ Genehmigt ganze Cluster (terms = Repräsentanten oder beliebige Varianten):
+    alle Varianten → approved_skills.json, jeweils gemappt auf den Repräsentanten
+    """
+    try:
+        from app.infrastructure.extractor.discovery_logger import get_store
+        clusters = get_store().cluster_members(approval.terms)
+        canonical = {term.lower().strip(): c["representative"] for c in clusters for term in c["terms"]}
+        result = _approve_discovery_terms(list(canonical), canonical)
+        result["approved_clusters"] = len(clusters)
+        return result
+    except Exception as e:
+        logger.error(f"❌ Error approving candidate clusters: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Speichere
-        candidates_path.write_text(json.dumps(candidates, ensure_ascii=False, indent=2), encoding="utf-8")
-        ignore_path.write_text(json.dumps(ignored, ensure_ascii=False, indent=2), encoding="utf-8")
 
-        logger.info(f"🚫 Ignored {len(to_ignore)} candidates")
-        return {
-            "status": "success",
-            "ignored_count": len(to_ignore),
-            "remaining_candidates": len(candidates)
-        }
+@app.post("/discovery/clusters/ignore")
+def ignore_candidate_clusters(ignore: DiscoveryIgnore):
+    """
+    🚫 Ignoriert ganze Cluster (alle Varianten → ignore_skills.json)
+    """
+    try:
+        from app.infrastructure.extractor.discovery_logger import get_store
+        clusters = get_store().cluster_members(ignore.terms)
+        result = _ignore_discovery_terms([term for c in clusters for term in c["terms"]])
+        result["ignored_clusters"] = len(clusters)
+        return result
     except Exception as e:
-        logger.error(f"❌ Error ignoring candidates: {e}")
+        logger.error(f"❌ Error ignoring candidate clusters: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -637,13 +800,9 @@ def clear_candidates():
     🗑️ Löscht alle Kandidaten (candidates.json leeren)
     """
     try:
-        from app.infrastructure.extractor.discovery_logger import _data_base_dir, _ensure_discovery_dir
-
-        base = _data_base_dir()
-        ddir = _ensure_discovery_dir(base)
-        fpath = ddir / "candidates.json"
+        from app.infrastructure.extractor.discovery_logger import get_store
 
-        fpath.write_text("[]", encoding="utf-8")
+        get_store().clear()
 
         logger.info("🗑️ Cleared all candidates")
         return {"status": "success", "message": "All candidates cleared"}
@@ -101,6 +101,23 @@ def fetch_discovery_candidates():
         logger.error(f"Fehler beim Laden der Discovery Candidates: {e}")
         return []
 
+@st.cache_data(ttl=60)
+def fetch_skill_trends(freq="month", role=None, region=None, top_n=5):
+    """Lädt Skill-Zeitreihen + Emerging Skills (serverseitig vorberechnete Skill-Trend-Matrix)"""
+    params = {"freq": freq, "top_n": top_n}
+    if role:
+        params["role"] = role
+    if region:
+        params["region"] = region
+    try:
+        response = requests.get(f"{PYTHON_API_BASE}/dashboard/skill-trends", params=params, timeout=10)
+        if response.status_code == 200:
+            return response.json()
+        return {}
+    except Exception as e:
+        logger.error(f"Fehler beim Laden der Skill-Trends: {e}")
+        return {}
+
 @st.cache_data(ttl=300)
 def fetch_jobs_sample(limit=100):
     """Lädt Sample von Jobs für Skill-Analyse"""
@@ -184,26 +201,47 @@ def main():
         st.markdown("### Skills & Tools: Zeitreihe")
         st.caption("Entwicklung der wichtigsten Skills über Zeit")
 
-        # Erstelle Timeline-Chart
-        timeline_df = create_timeline_data()
+        freq = st.radio("Auflösung", ["month", "year"], horizontal=True,
+                        format_func=lambda f: "Monat" if f == "month" else "Jahr")
+
+        # Zeitreihen kommen fertig aggregiert aus dem Backend
+        with st.spinner("Lade Skill-Trends..."):
+            trends = fetch_skill_trends(freq=freq)
 
         fig = go.Figure()
 
         colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
-        skills = ['Python', 'JavaScript', 'Docker', 'Kubernetes', 'Machine Learning']
-
-        for skill, color in zip(skills, colors):
-            fig.add_trace(go.Scatter(
-                x=timeline_df['Datum'],
-                y=timeline_df[skill],
-                mode='lines+markers',
-                name=skill,
-                line=dict(color=color, width=2),
-                marker=dict(size=6)
-            ))
+
+        if trends.get('datasets'):
+            for dataset, color in zip(trends['datasets'], colors):
+                fig.add_trace(go.Scatter(
+                    x=trends['labels'],
+                    y=dataset['data'],
+                    mode='lines+markers',
+                    name=dataset['label'],
+                    line=dict(color=color, width=2),
+                    marker=dict(size=6)
+                ))
+            chart_title = "Skill-Entwicklung"
+        else:
+            # Fallback: Demo-Daten, solange noch keine Ergebnisse vorliegen
+            st.info("Noch keine Analyse-Ergebnisse verfügbar. Zeige Beispiel-Daten:")
+            timeline_df = create_timeline_data()
+            skills = ['Python', 'JavaScript', 'Docker', 'Kubernetes', 'Machine Learning']
+
+            for skill, color in zip(skills, colors):
+                fig.add_trace(go.Scatter(
+                    x=timeline_df['Datum'],
+                    y=timeline_df[skill],
+                    mode='lines+markers',
+                    name=skill,
+                    line=dict(color=color, width=2),
+                    marker=dict(size=6)
+                ))
+            chart_title = "Skill-Entwicklung 2020-2025"
 
         fig.update_layout(
-            title="Skill-Entwicklung 2020-2025",
+            title=chart_title,
             xaxis_title="Zeitraum",
             yaxis_title="Vorkommen in Jobs",
             hovermode='x unified',
@@ -219,16 +257,14 @@ def main():
 
         st.plotly_chart(fig, use_container_width=True)
 
-        # Stats unterhalb
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("🐍 Python", "+28%", delta="seit 2020")
-        with col2:
-            st.metric("☕ JavaScript", "+18%", delta="seit 2020")
-        with col3:
-            st.metric("🐳 Docker", "+82%", delta="seit 2020")
-        with col4:
-            st.metric("☸️ Kubernetes", "+142%", delta="seit 2020")
+        # Stats unterhalb: Veränderung erster → letzter Zeitraum
+        datasets = trends.get('datasets', [])[:4]
+        if datasets:
+            for col, dataset in zip(st.columns(len(datasets)), datasets):
+                first, last = dataset['data'][0], dataset['data'][-1]
+                change = f"{(last / first - 1) * 100:+.0f}%" if first else "neu"
+                with col:
+                    st.metric(dataset['label'], last, delta=f"{change} seit {trends['labels'][0]}")
 
     # ========================================
     # TAB 2: EMERGING SKILLS
@@ -237,69 +273,90 @@ def main():
         st.markdown("### ☁️ Emerging Skills")
         st.caption("Neu entdeckte Skills mit dem höchsten Wachstum")
 
-        # Lade Discovery Candidates
-        with st.spinner("Lade Discovery-Daten..."):
-            candidates = fetch_discovery_candidates()
-
-        if candidates:
-            emerging_skills = calculate_emerging_skills(candidates)
-
-            if emerging_skills:
-                # Erstelle DataFrame
-                df_emerging = pd.DataFrame(emerging_skills)
-
-                # Bar Chart
-                fig = px.bar(
-                    df_emerging,
-                    x='skill',
-                    y='growth',
-                    title="Top Emerging Skills (Wachstum in %)",
-                    labels={'skill': 'Skill', 'growth': 'Wachstum (%)'},
-                    color='growth',
-                    color_continuous_scale='Viridis'
-                )
-
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
-
-                # Liste
-                st.markdown("### 📋 Top 10 Emerging Skills")
-
-                for idx, skill_data in enumerate(emerging_skills, 1):
-                    col1, col2, col3 = st.columns([3, 1, 1])
-
+        # Emerging Skills aus den Analyse-Ergebnissen (Wachstum ab 2024 gegenüber Vorjahren)
+        server_emerging = fetch_skill_trends(freq="year").get('emerging_skills', [])
+
+        if server_emerging:
+            df_emerging = pd.DataFrame(server_emerging)
+            df_emerging['growth_label'] = df_emerging['growth_pct'].apply(lambda p: "NEU" if p == 999 else f"+{p}%")
+
+            fig = px.bar(
+                df_emerging,
+                x='skill',
+                y='growth',
+                title="Top Emerging Skills (Zuwachs an Vorkommen)",
+                labels={'skill': 'Skill', 'growth': 'Zuwachs'},
+                color='growth',
+                color_continuous_scale='Viridis',
+                hover_data=['growth_label', 'recent_count', 'older_count']
+            )
+            fig.update_layout(height=400)
+            st.plotly_chart(fig, use_container_width=True)
+            st.caption("Basis: Skill-Trend-Matrix der analysierten Stellenanzeigen")
+        else:
+            # Lade Discovery Candidates
+            with st.spinner("Lade Discovery-Daten..."):
+                candidates = fetch_discovery_candidates()
+
+            if candidates:
+                emerging_skills = calculate_emerging_skills(candidates)
+
+                if emerging_skills:
+                    # Erstelle DataFrame
+                    df_emerging = pd.DataFrame(emerging_skills)
+
+                    # Bar Chart
+                    fig = px.bar(
+                        df_emerging,
+                        x='skill',
+                        y='growth',
+                        title="Top Emerging Skills (Wachstum in %)",
+                        labels={'skill': 'Skill', 'growth': 'Wachstum (%)'},
+                        color='growth',
+                        color_continuous_scale='Viridis'
+                    )
+
+                    fig.update_layout(height=400)
+                    st.plotly_chart(fig, use_container_width=True)
+
+                    # Liste
+                    st.markdown("### 📋 Top 10 Emerging Skills")
+
+                    for idx, skill_data in enumerate(emerging_skills, 1):
+                        col1, col2, col3 = st.columns([3, 1, 1])
+
+                        with col1:
+                            st.markdown(f"**{idx}. {skill_data['skill']}**")
+
+                        with col2:
+                            growth_class = "growth-positive" if skill_data['growth'] > 0 else "growth-negative"
+                            st.markdown(f'<span class="{growth_class}">+{skill_data["growth"]}%</span>', unsafe_allow_html=True)
+
+                        with col3:
+                            st.caption(f"{skill_data['occurrences']}× gesehen")
+                else:
+                    st.info("Keine Emerging Skills gefunden.")
+            else:
+                # Fallback mit Beispiel-Daten
+                st.info("Discovery-Service nicht verfügbar. Zeige Beispiel-Daten:")
+
+                example_skills = [
+                    {'name': 'Large Language Models', 'growth': 28},
+                    {'name': 'ChatGPT Integration', 'growth': 82},
+                    {'name': 'Deep Learning', 'growth': 51},
+                    {'name': 'Vector Databases', 'growth': 45},
+                    {'name': 'Prompt Engineering', 'growth': 67},
+                    {'name': 'Edge Computing', 'growth': 39},
+                    {'name': 'Rust Programming', 'growth': 42},
+                    {'name': 'WebAssembly', 'growth': 35},
+                ]
+
+                for idx, skill in enumerate(example_skills, 1):
+                    col1, col2 = st.columns([3, 1])
                     with col1:
-                        st.markdown(f"**{idx}. {skill_data['skill']}**")
-
+                        st.markdown(f"**{idx}. {skill['name']}**")
                     with col2:
-                        growth_class = "growth-positive" if skill_data['growth'] > 0 else "growth-negative"
-                        st.markdown(f'<span class="{growth_class}">+{skill_data["growth"]}%</span>', unsafe_allow_html=True)
-
-                    with col3:
-                        st.caption(f"{skill_data['occurrences']}× gesehen")
-            else:
-                st.info("Keine Emerging Skills gefunden.")
-        else:
-            # Fallback mit Beispiel-Daten
-            st.info("Discovery-Service nicht verfügbar. Zeige Beispiel-Daten:")
-
-            example_skills = [
-                {'name': 'Large Language Models', 'growth': 28},
-                {'name': 'ChatGPT Integration', 'growth': 82},
-                {'name': 'Deep Learning', 'growth': 51},
-                {'name': 'Vector Databases', 'growth': 45},
-                {'name': 'Prompt Engineering', 'growth': 67},
-                {'name': 'Edge Computing', 'growth': 39},
-                {'name': 'Rust Programming', 'growth': 42},
-                {'name': 'WebAssembly', 'growth': 35},
-            ]
-
-            for idx, skill in enumerate(example_skills, 1):
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.markdown(f"**{idx}. {skill['name']}**")
-                with col2:
-                    st.markdown(f'<span class="growth-positive">+{skill["growth"]}%</span>', unsafe_allow_html=True)
+                        st.markdown(f'<span class="growth-positive">+{skill["growth"]}%</span>', unsafe_allow_html=True)
 
     # ========================================
     # TAB 3: ROLLEN IM WANDEL
@@ -113,6 +113,45 @@ def fetch_jobs_for_role(role_pattern, limit=50):
         logger.error(f"Fehler beim Laden der Jobs: {e}")
         return []
 
+@st.cache_data(ttl=300)
+def fetch_role_skills(role, top_k=15):
+    """Lädt die typischen Skills einer Rolle über alle analysierten Jobs (Ko-Vorkommen-Engine)"""
+    try:
+        response = requests.get(f"{PYTHON_API_BASE}/dashboard/roles/skills",
+                                params={"role": role, "top_k": top_k}, timeout=10)
+        if response.status_code == 200:
+            return response.json()
+        return {}
+    except Exception as e:
+        logger.error(f"Fehler beim Laden der Rollen-Skills: {e}")
+        return {}
+
+@st.cache_data(ttl=300)
+def fetch_role_network(min_similarity=0.1):
+    """Lädt das vorberechnete Rollen-Netzwerk (Ähnlichkeit der Skill-Profile)"""
+    try:
+        response = requests.get(f"{PYTHON_API_BASE}/dashboard/roles/network",
+                                params={"min_similarity": min_similarity}, timeout=10)
+        if response.status_code == 200:
+            return response.json()
+        return {}
+    except Exception as e:
+        logger.error(f"Fehler beim Laden des Rollen-Netzwerks: {e}")
+        return {}
+
+@st.cache_data(ttl=300)
+def fetch_skill_graph(seed, top_nodes=20):
+    """Lädt den Skill-Graph rund um einen Skill (stärkste gemeinsame Nennungen)"""
+    try:
+        response = requests.get(f"{PYTHON_API_BASE}/dashboard/skills/graph",
+                                params={"seed": seed, "top_nodes": top_nodes, "min_count": 2}, timeout=10)
+        if response.status_code == 200:
+            return response.json()
+        return {}
+    except Exception as e:
+        logger.error(f"Fehler beim Laden des Skill-Graphs: {e}")
+        return {}
+
 def analyze_role_skills(jobs):
     """Analysiert Skills für eine Rolle"""
     skill_counter = Counter()
@@ -199,8 +238,19 @@ def get_role_evolution_data(role):
         "technical": ["Technische Umsetzung", "Automation", "Innovation"]
     })
 
+def create_network(network):
+    """Erstellt Network Graph aus vorberechneten Knoten/Kanten der API"""
+    G = nx.Graph()
+
+    for node in network.get('nodes', []):
+        G.add_node(node['id'])
+    for edge in network.get('edges', []):
+        G.add_edge(edge['source'], edge['target'], weight=edge['weight'])
+
+    return G
+
 def create_role_network(roles):
-    """Erstellt Network Graph für verwandte Rollen"""
+    """Erstellt Network Graph für verwandte Rollen (Beispiel-Daten)"""
     G = nx.Graph()
 
     # Definiere Beziehungen basierend auf Skill-Overlap
@@ -223,7 +273,7 @@ def create_role_network(roles):
 
     return G
 
-def plot_network_graph(G, selected_role):
+def plot_network_graph(G, selected_role, title="Verwandte Rollen (Berührungspunkte)"):
     """Erstellt Plotly Network Graph"""
     pos = nx.spring_layout(G, k=2, iterations=50)
 
@@ -278,7 +328,7 @@ def plot_network_graph(G, selected_role):
     fig = go.Figure(data=edge_trace + [node_trace])
 
     fig.update_layout(
-        title="Verwandte Rollen (Berührungspunkte)",
+        title=title,
         showlegend=False,
         hovermode='closest',
         margin=dict(b=0, l=0, r=0, t=40),
@@ -407,29 +457,44 @@ def main():
     # Verwandte Rollen Network
     st.markdown("### 🕸️ Verwandte Rollen (Berührungspunkte)")
 
-    # Erstelle Network
-    related_roles = ["Data Scientist", "ML Engineer", "Backend Developer",
-                     "Fullstack Developer", "DevOps Engineer", "Cloud Architect"]
-
-    G = create_role_network(related_roles)
+    # Rollen-Skills und Netzwerk kommen vorberechnet aus dem Backend (alle analysierten Jobs)
+    role_data = fetch_role_skills(selected_role)
+    network = fetch_role_network()
 
-    if G.number_of_nodes() > 0:
-        fig = plot_network_graph(G, selected_role)
+    if network.get('edges'):
+        G = create_network(network)
+        fig = plot_network_graph(G, role_data.get('role_category'))
         st.plotly_chart(fig, use_container_width=True)
+        st.caption("Kanten: Ähnlichkeit der Skill-Profile der Rollen-Kategorien")
     else:
-        st.info("Keine verwandten Rollen gefunden.")
+        # Fallback: Beispiel-Beziehungen
+        related_roles = ["Data Scientist", "ML Engineer", "Backend Developer",
+                         "Fullstack Developer", "DevOps Engineer", "Cloud Architect"]
+
+        G = create_role_network(related_roles)
+
+        if G.number_of_nodes() > 0:
+            fig = plot_network_graph(G, selected_role)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Keine verwandten Rollen gefunden.")
 
     st.markdown("---")
 
     # Top Skills für diese Rolle
     st.markdown(f"### 🎯 Top Skills für {selected_role}")
 
-    with st.spinner("Analysiere Jobs..."):
-        jobs = fetch_jobs_for_role(selected_role, limit=50)
-
-    if jobs:
-        skills = analyze_role_skills(jobs)
+    jobs_loaded = True
+    if role_data.get('skills'):
+        skills = [(s['skill'], s['count']) for s in role_data['skills']]
+    else:
+        # Fallback: Stichprobe der Kotlin-API
+        with st.spinner("Analysiere Jobs..."):
+            jobs = fetch_jobs_for_role(selected_role, limit=50)
+        jobs_loaded = bool(jobs)
+        skills = analyze_role_skills(jobs) if jobs else []
 
+    if jobs_loaded:
         if skills:
             col1, col2 = st.columns([2, 1])
 
@@ -448,5 +513,14 @@ def main():
     else:
         st.warning("Keine Jobs geladen. Bitte Backend-Services starten.")
 
+    # Skill-Netzwerk rund um den wichtigsten Skill der Rolle
+    if skills:
+        graph = fetch_skill_graph(skills[0][0])
+        if graph.get('edges'):
+            st.markdown("---")
+            st.markdown(f"### 🔗 Skill-Netzwerk: {skills[0][0]}")
+            fig = plot_network_graph(create_network(graph), skills[0][0], title="Gemeinsam geforderte Skills")
+            st.plotly_chart(fig, use_container_width=True)
+
 if __name__ == "__main__":
     main()
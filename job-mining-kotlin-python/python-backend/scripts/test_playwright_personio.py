@@ -1,5 +1,5 @@
 import asyncio
-from app.infrastructure.io.js_scraper import scrape_with_rendering
+from app.infrastructure.io.js_scraper import scrape_with_rendering, shutdown_browser_pool
 
 URLS = [
     "https://escape.jobs.personio.com/job/742758?language=de&display=de",
@@ -7,14 +7,17 @@ URLS = [
 ]
 
 async def main():
-    for url in URLS:
-        print(f"=== TEST JS RENDER: {url} ===")
-        try:
-            text = await scrape_with_rendering(url)
-            print(f"Text length: {len(text)}")
-            print(text[:500])
-        except Exception as e:
-            print(f"ERROR: {e}")
+    try:
+        for url in URLS:
+            print(f"=== TEST JS RENDER: {url} ===")
+            try:
+                text = await scrape_with_rendering(url)
+                print(f"Text length: {len(text)}")
+                print(text[:500])
+            except Exception as e:
+                print(f"ERROR: {e}")
+    finally:
+        await shutdown_browser_pool()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,17 @@
+"""
+Gemeinsame Test-Fixtures
+
+- Laufzeitdaten (Caches, Discovery-Log, Results-Store) landen im tmp_path des Tests,
+  nie im Daten-Verzeichnis des Repos
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch):
+    data_dir = tmp_path / "base_data"
+    data_dir.mkdir()
+    monkeypatch.setenv("BASE_DATA_DIR", str(data_dir))
+    monkeypatch.setenv("RESULTS_DB_PATH", str(data_dir / "results" / "results.sqlite3"))
+    return data_dir
@@ -0,0 +1,87 @@
+"""
+Lokaler Stub-HTTP-Server für Scraping-/Crawling-Tests (keine Netzwerkzugriffe)
+
+Routen: {Pfad: (Status, Header, Body)} oder {Pfad: callable(handler) -> (Status, Header, Body)}
+Protokolliert alle Requests (Pfad, Header, Client-Port) und die maximale Parallelität.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubServer:
+    def __init__(self, routes=None, delay_s: float = 0.0):
+        self.routes = dict(routes or {})
+        self.delay_s = delay_s
+        self.requests = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def paths(self):
+        return [r["path"] for r in self.requests]
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with stub._lock:
+                    stub._in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub._in_flight)
+                    stub.requests.append({
+                        "path": self.path,
+                        "headers": {k.lower(): v for k, v in self.headers.items()},
+                        "port": self.client_address[1],
+                        "time": time.monotonic(),
+                    })
+                try:
+                    if stub.delay_s and not self.path.endswith("robots.txt"):
+                        time.sleep(stub.delay_s)
+                    route = stub.routes.get(self.path)
+                    if route is None:
+                        status, headers, body = 404, {}, b"not found"
+                    elif callable(route):
+                        status, headers, body = route(self)
+                    else:
+                        status, headers, body = route
+                    if isinstance(body, str):
+                        body = body.encode("utf-8")
+                    self.send_response(status)
+                    headers = {"Content-Type": "text/html; charset=utf-8", **headers}
+                    for key, value in headers.items():
+                        self.send_header(key, value)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    if status != 304:
+                        self.wfile.write(body)
+                finally:
+                    with stub._lock:
+                        stub._in_flight -= 1
+
+        return Handler
@@ -0,0 +1,102 @@
+"""
+Test für AggregationEngine (Dashboard-Metriken in einem Durchlauf)
+
+Testet:
+- build_dashboard_metrics liest jede Ergebnis-Datei genau einmal
+- Ergebnisse stimmen mit den Einzel-Aggregationen überein
+- Kaputte Dateien und fehlerhafte Felder betreffen nur den jeweiligen Akkumulator
+- Fehler eines Akkumulators werden mit seinem Namen geloggt; Accumulator ist abstrakt
+"""
+
+import json
+import logging
+
+import pytest
+
+from app.infrastructure import aggregation_engine, reporting
+
+
+def _write_corpus(directory):
+    jobs = [
+        {"title": "Data Scientist", "job_role": "IT", "region": "Berlin", "posting_date": "2022-03-01",
+         "competences": [{"original_term": "Python", "collections": ["digital"], "is_digital": True},
+                         {"original_term": "Englisch", "collections": ["language"]}]},
+        {"title": "Backend Developer", "job_role": "IT", "region": "München", "posting_date": "2024-05-01",
+         "competences": [{"original_term": "Python", "level": 3}, {"esco_label": "SQL", "original_term": "sql"}]},
+        {"title": "UX Designer", "region": "Berlin", "posting_date": "ohne-datum",
+         "competences": [{"original_term": "Figma", "level": 1}]},
+    ]
+    for i, job in enumerate(jobs):
+        (directory / f"job_{i}.json").write_text(json.dumps(job), encoding="utf-8")
+    (directory / "kaputt.json").write_text("{nicht json", encoding="utf-8")
+    (directory / "summary.json").write_text(json.dumps({"processed": 3, "skills_total": 5}), encoding="utf-8")
+
+
+def test_dashboard_metrics_single_pass_matches_individual_aggregations(tmp_path, monkeypatch):
+    _write_corpus(tmp_path)
+    monkeypatch.setattr(reporting, "BATCH_RESULTS_DIR", tmp_path)
+    monkeypatch.setenv("RESULTS_BACKEND", "files")
+
+    loads = []
+    original_load = aggregation_engine.load_job_file
+
+    def counting_load(path):
+        loads.append(path.name)
+        return original_load(path)
+
+    monkeypatch.setattr(aggregation_engine, "load_job_file", counting_load)
+    metrics = reporting.build_dashboard_metrics(top_n=5)
+
+    assert sorted(loads) == ["job_0.json", "job_1.json", "job_2.json", "kaputt.json"]
+    assert metrics["total_jobs"] == 3
+    assert metrics["top_skills"] == [{"skill": s, "count": c} for s, c in reporting.aggregate_top_skills(5)]
+    assert metrics["top_skills"][0] == {"skill": "Python", "count": 2}
+    assert metrics["regional_distribution"] == reporting.aggregate_regional_distribution() == {"Berlin": 2, "München": 1}
+    assert metrics["domain_mix"] == reporting.aggregate_domain_mix()
+    assert metrics["job_groups"] == reporting.aggregate_jobs_by_role()
+    assert metrics["skill_groups"] == reporting.aggregate_skills_by_competence_category()
+    assert metrics["level_progression"] == reporting.aggregate_level_progression()
+    assert metrics["quality_metrics"] == reporting.aggregate_quality_metrics()
+    assert metrics["digital_skills_count"] == reporting.aggregate_digital_skills_count() == 1
+    top_labels = [s["skill"] for s in metrics["top_skills"]]
+    assert metrics["time_series"] == reporting.aggregate_time_series_for_skills(top_labels)
+    assert metrics["time_series"]["Python"] == {"2022": 1, "2024": 1}
+    # "ohne-datum" ist kein Jahr → Job fehlt nur in den jahresbasierten Trend-Metriken
+    assert all(e["skill"] != "Figma" for e in metrics["emerging_skills"])
+    assert metrics["emerging_skills"] == reporting.aggregate_emerging_skills(min_year=2024)
+    assert metrics["time_series_validation"] == reporting.aggregate_time_series_validation()
+
+
+class _Failing(aggregation_engine.Accumulator):
+    name = 'kaputt'
+
+    def add(self, record):
+        raise KeyError('posting_date')
+
+    def result(self):
+        return None
+
+
+class _Counting(aggregation_engine.Accumulator):
+    name = 'jobs'
+
+    def __init__(self):
+        self.count = 0
+
+    def add(self, record):
+        self.count += 1
+
+    def result(self):
+        return self.count
+
+
+def test_failing_accumulator_is_logged_by_name(caplog):
+    engine = aggregation_engine.AggregationEngine([_Failing(), _Counting()])
+    records = [aggregation_engine.JobRecord({"title": "A"}), aggregation_engine.JobRecord({"title": "B"})]
+    with caplog.at_level(logging.WARNING, logger="app.infrastructure.aggregation_engine"):
+        assert engine.run_records(records) == {"kaputt": None, "jobs": 2}
+    messages = [r.getMessage() for r in caplog.records if r.name == "app.infrastructure.aggregation_engine"]
+    assert len(messages) == 2 and all("'kaputt'" in m and "posting_date" in m for m in messages)
+
+    with pytest.raises(TypeError):
+        aggregation_engine.Accumulator()
@@ -0,0 +1,92 @@
+"""
+Test für AsyncHttpClient (gepoolter Async-Client mit Host-Politeness)
+
+Testet gegen einen lokalen Stub-Server:
+- Keep-Alive: mehrere Abrufe über dieselbe Verbindung
+- robots.txt wird pro Host einmal geladen und beachtet
+- MAX_HTML_BYTES-Budget kürzt große Seiten
+- Parallelität pro Host ist begrenzt
+- WebScraper.scrape_async baut ScrapedContent aus dem Abruf
+"""
+
+import asyncio
+
+from app.infrastructure.crawling.async_http_client import AsyncHttpClient
+from tests.stub_http_server import StubServer
+
+JOB_HTML = (
+    "<html><head><title>Data Engineer</title></head><body>"
+    "<h1>Data Engineer (m/w/d)</h1><p>" + "Python Spark Airflow Kubernetes. " * 10 + "</p>"
+    "</body></html>"
+)
+
+
+def test_keep_alive_and_robots_cached():
+    routes = {
+        "/robots.txt": (200, {"Content-Type": "text/plain"}, "User-agent: *\nDisallow: /intern/\n"),
+        "/job/1": (200, {}, JOB_HTML),
+        "/job/2": (200, {}, JOB_HTML),
+        "/intern/admin": (200, {}, "geheim"),
+    }
+    with StubServer(routes) as server:
+        async def run():
+            async with AsyncHttpClient(min_interval_s=0) as client:
+                first = await client.fetch(server.url("/job/1"))
+                second = await client.fetch(server.url("/job/2"))
+                blocked = await client.fetch(server.url("/intern/admin"))
+                return first, second, blocked
+
+        first, second, blocked = asyncio.run(run())
+
+    assert first.ok and second.ok
+    assert "Data Engineer" in first.text
+    assert blocked.error and not blocked.ok
+    assert server.paths().count("/robots.txt") == 1
+    assert "/intern/admin" not in server.paths()
+    page_ports = {r["port"] for r in server.requests if r["path"].startswith("/job/")}
+    assert len(page_ports) == 1
+
+
+def test_max_bytes_budget_truncates_body():
+    with StubServer({"/big": (200, {}, "x" * 50_000)}) as server:
+        async def run():
+            async with AsyncHttpClient(max_bytes=10_000, respect_robots=False) as client:
+                return await client.fetch(server.url("/big"))
+
+        result = asyncio.run(run())
+
+    assert result.truncated
+    assert len(result.body) == 10_000
+    assert any("gekürzt" in w for w in result.warnings)
+
+
+def test_per_host_concurrency_is_capped():
+    routes = {f"/job/{i}": (200, {}, JOB_HTML) for i in range(8)}
+    with StubServer(routes, delay_s=0.05) as server:
+        async def run():
+            async with AsyncHttpClient(max_per_host=2, min_interval_s=0, respect_robots=False) as client:
+                return await client.fetch_many(server.url(f"/job/{i}") for i in range(8))
+
+        results = asyncio.run(run())
+
+    assert all(r.ok for r in results)
+    assert server.max_in_flight <= 2
+
+
+def test_scrape_async_builds_content():
+    from app.infrastructure.crawling import async_http_client
+    from app.infrastructure.crawling.web_scraper import WebScraper
+
+    with StubServer({"/job/42": (200, {}, JOB_HTML)}) as server:
+        async def run():
+            try:
+                return await WebScraper(use_playwright=False).scrape_async(server.url("/job/42?utm_source=x"), use_cache=False)
+            finally:
+                await async_http_client.close_async_http_client()
+
+        content = asyncio.run(run())
+
+    assert content.canonical_url == server.url("/job/42")
+    assert content.title == "Data Engineer (m/w/d)"
+    assert content.render_engine == "httpx"
+    assert "Kubernetes" in content.text
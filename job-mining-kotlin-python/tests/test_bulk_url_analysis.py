@@ -0,0 +1,109 @@
+"""
+Test für BulkUrlAnalysisService (Bulk-URL-Analyse mit Batch-NLP)
+
+Testet gegen einen lokalen Stub-Server:
+- Deduplizierung über die kanonische URL (Query-Parameter)
+- Parallele Abrufe, NLP in Batches statt pro URL
+- Fehler-Records für zu kurze Seiten / HTTP-Fehler
+- Summary-Record am Ende
+- on_result (Export) läuft im Thread, nicht auf dem Event-Loop
+- CompetenceExtractor.extract_many parst über nlp.pipe
+"""
+
+import asyncio
+import threading
+
+import spacy
+
+from app.application.services.bulk_url_analysis_service import BulkUrlAnalysisService
+from app.infrastructure.crawling import async_http_client
+from app.infrastructure.crawling.web_scraper import WebScraper
+from app.infrastructure.extractor.competence_extractor import CompetenceExtractor
+from tests.stub_http_server import StubServer
+
+JOB_HTML = "<html><body><h1>Job {i}</h1><p>" + "Python SQL Docker Cloud Analytics. " * 10 + "</p></body></html>"
+
+
+class _Result:
+    def __init__(self, source):
+        self.source = source
+
+    def dict(self):
+        return {'source_url': self.source}
+
+
+class _BatchManager:
+    """Workflow-Manager-Ersatz: zeichnet die Batch-Größen auf"""
+
+    def __init__(self):
+        self.batches = []
+
+    def run_analyses_from_scraped_texts(self, items, batch_size=16):
+        self.batches.append(len(items))
+        return [_Result(source) for _, source in items]
+
+
+def _run(service, urls):
+    async def run():
+        try:
+            return [record async for record in service.analyze(urls)]
+        finally:
+            await async_http_client.close_async_http_client()
+
+    return asyncio.run(run())
+
+
+def test_bulk_dedupes_batches_and_reports_errors(monkeypatch):
+    monkeypatch.setenv("HTTP_CACHE_ENABLED", "false")
+    routes = {f"/job/{i}": (200, {}, JOB_HTML.format(i=i)) for i in range(6)}
+    routes["/kurz"] = (200, {}, "<html><body>zu kurz</body></html>")
+    routes["/robots.txt"] = (404, {}, "")
+
+    with StubServer(routes) as server:
+        urls = [server.url(f"/job/{i}") for i in range(6)]
+        urls += [server.url("/job/0?utm_source=newsletter"), server.url("/kurz"), server.url("/fehlt"), "ftp://x/y"]
+        manager = _BatchManager()
+        saved = []
+        service = BulkUrlAnalysisService(manager, scraper=WebScraper(use_playwright=False), batch_size=4,
+                                         on_result=lambda result: saved.append(threading.current_thread()))
+        records = _run(service, urls)
+
+    summary = records[-1]
+    by_status = {}
+    for record in records[:-1]:
+        by_status.setdefault(record['status'], []).append(record)
+
+    assert summary['type'] == 'summary'
+    assert summary['total'] == len(urls)
+    assert summary['ok'] == 6 and summary['duplicates'] == 1 and summary['errors'] == 3
+    assert by_status['duplicate'][0]['duplicate_of'] == server.url("/job/0")
+    assert sum(manager.batches) == 6
+    assert max(manager.batches) <= 4
+    assert len(saved) == 6
+    assert threading.main_thread() not in saved
+    assert server.paths().count("/job/0") == 1
+
+
+def test_extract_many_uses_nlp_pipe():
+    nlp = spacy.blank("de")
+    pipe_calls = []
+    original_pipe = nlp.pipe
+
+    def counting_pipe(texts, **kwargs):
+        pipe_calls.append(kwargs.get('batch_size'))
+        return original_pipe(texts, **kwargs)
+
+    nlp.pipe = counting_pipe
+
+    class _Pass:
+        def extract(self, doc):
+            return []
+
+        def extract_competences(self, text):
+            return []
+
+    extractor = CompetenceExtractor(spacy_ext=_Pass(), fuzzy_ext=_Pass(), discovery_ext=_Pass(), nlp_model=nlp)
+    results = extractor.extract_many(["Python und SQL", "Docker"], ["Data", "Ops"], batch_size=2)
+
+    assert results == [[], []]
+    assert pipe_calls == [2]
@@ -0,0 +1,137 @@
+"""
+Test für die Ko-Vorkommen-Engine (Skill × Skill, Rolle × Skill)
+
+Testet:
+- skill_pair_counts / role_skill_counts werden beim Speichern, Ersetzen und Löschen gepflegt
+- Die Engine folgt den Änderungen inkrementell (gleiches Ergebnis wie frisch geladen)
+- Lift/PMI/Jaccard auf einem kleinen Hand-Beispiel
+- Rollen-Skills, Rollen-Netzwerk, Skill-Graph und API-Fehlerfälle
+- Engine-Cache hängt am Store-Objekt (nicht an id(store)) und verschwindet mit ihm
+- Jobs eines anderen Prozesses (gleiche Datenbankdatei) erscheinen nach dem nächsten Zugriff
+"""
+
+import asyncio
+import gc
+import math
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import dashboard_routes
+from app.infrastructure import cooccurrence_engine, reporting
+from app.infrastructure.cooccurrence_engine import SkillCooccurrence, get_skill_cooccurrence
+from app.infrastructure.results_store import ResultsStore
+
+
+def _job(key, title, skills):
+    return {"raw_text_hash": key, "title": title, "posting_date": "2024-02-01",
+            "competences": [{"original_term": s} for s in skills]}
+
+
+JOBS = [
+    _job("a", "Data Scientist", ["Python", "SQL", "Python"]),
+    _job("b", "Data Scientist", ["Python", "SQL", "Spark"]),
+    _job("c", "Backend Developer", ["Python", "Docker"]),
+    _job("d", "UX Designer", ["Figma"]),
+]
+
+
+def _pairs(store):
+    return sorted(store.query("SELECT skill_a, skill_b, n FROM skill_pair_counts"))
+
+
+def test_counts_follow_upserts_and_deletes():
+    store = ResultsStore(":memory:")
+    engine = get_skill_cooccurrence(store)
+
+    store.upsert_many(JOBS)
+    store.upsert(_job("c", "Backend Developer", ["Python", "Docker", "SQL"]))  # Gleicher Hash: ersetzen
+    store.delete("d")
+    incremental = _pairs(store)
+
+    fresh = SkillCooccurrence()
+    fresh.load(store)
+    assert engine.total_jobs == fresh.total_jobs == 3
+    assert engine.related("Python", min_count=1) == fresh.related("Python", min_count=1)
+    assert engine.top_pairs(min_count=1) == fresh.top_pairs(min_count=1)
+
+    store.rebuild_skill_counts()
+    assert _pairs(store) == incremental
+    assert engine.related("SQL", metric="count", min_count=1)[0] == fresh.related("SQL", metric="count", min_count=1)[0]
+    store.close()
+
+
+def test_pair_metrics_on_small_example():
+    store = ResultsStore(":memory:")
+    store.upsert_many(JOBS)
+    engine = SkillCooccurrence()
+    engine.load(store)
+
+    # 4 Jobs; Python in 3, SQL in 2, beide zusammen in 2
+    sql = engine.related("Python", metric="count", min_count=1)[0]
+    assert sql["skill"] == "SQL" and sql["count"] == 2
+    assert sql["lift"] == pytest.approx(2 * 4 / (3 * 2), abs=1e-4)
+    assert sql["pmi"] == pytest.approx(math.log2(4 / 3), abs=1e-4)
+    assert sql["jaccard"] == pytest.approx(2 / 3, abs=1e-4)
+    assert engine.related("Figma", min_count=1) == []
+    store.close()
+
+
+def test_role_queries_graph_and_routes(tmp_path, monkeypatch):
+    monkeypatch.setenv("RESULTS_DB_PATH", str(tmp_path / "results.sqlite3"))
+    monkeypatch.setattr(reporting, "BATCH_RESULTS_DIR", tmp_path / "batch_results")
+    store = reporting.open_results_store()
+    store.upsert_many(JOBS)
+
+    role = asyncio.run(dashboard_routes.get_role_skills("Data Scientist", top_k=2))
+    assert role["role_category"] == "data_science"
+    assert [s["skill"] for s in role["skills"]] == ["Python", "SQL"]
+
+    network = asyncio.run(dashboard_routes.get_role_network(min_similarity=0.1))
+    assert {n["id"] for n in network["nodes"]} == {"data_science", "software_dev", "ux_design"}
+    assert [(e["source"], e["target"]) for e in network["edges"]] == [("data_science", "software_dev")]
+
+    graph = asyncio.run(dashboard_routes.get_skill_graph(seed="Python", min_count=1))
+    assert graph["nodes"][0]["id"] == "Python"
+    assert any({e["source"], e["target"]} == {"Python", "SQL"} for e in graph["edges"])
+
+    with pytest.raises(HTTPException) as missing:
+        asyncio.run(dashboard_routes.get_related_skills("Cobol"))
+    assert missing.value.status_code == 404
+    with pytest.raises(HTTPException) as bad_metric:
+        asyncio.run(dashboard_routes.get_skill_pairs(metric="chi2"))
+    assert bad_metric.value.status_code == 400
+
+
+def test_engine_cache_is_bound_to_store_object():
+    cached = len(cooccurrence_engine._engines)
+    store = ResultsStore(":memory:")
+    store.upsert_many(JOBS)
+    assert get_skill_cooccurrence(store) is get_skill_cooccurrence(store)
+    assert len(cooccurrence_engine._engines) == cached + 1
+    store.close()
+    del store
+    gc.collect()
+    assert len(cooccurrence_engine._engines) == cached
+
+    # Neuer Store (evtl. mit gleicher id) bekommt eine eigene, leere Engine
+    fresh = ResultsStore(":memory:")
+    assert get_skill_cooccurrence(fresh).total_jobs == 0
+    fresh.close()
+
+
+def test_engine_reloads_after_writes_of_other_process(tmp_path):
+    db_path = str(tmp_path / "results.sqlite3")
+    api, batch = ResultsStore(db_path), ResultsStore(db_path)  # zwei Prozesse auf derselben Datei
+    api.upsert_many(JOBS[:2])
+    engine = get_skill_cooccurrence(api)
+    before = engine.total_jobs
+
+    batch.upsert_many(JOBS[2:])
+    assert get_skill_cooccurrence(api) is engine
+    fresh = SkillCooccurrence()
+    fresh.load(api)
+    assert engine.total_jobs == fresh.total_jobs > before
+    assert engine.top_pairs(min_count=1) == fresh.top_pairs(min_count=1)
+    api.close()
+    batch.close()
@@ -0,0 +1,113 @@
+"""
+Test für CrawlFrontier + JobCrawler (Listing-Seiten → Detail-URLs)
+
+Testet gegen einen lokalen Stub-Server:
+- Listing-Seite wird über rel="next" paginiert, Details gehen gebündelt an on_details
+- Zweiter Lauf lädt bekannte Detailseiten nicht erneut
+- Kanonische URLs (Tracking-Parameter, Fragment) verhindern Duplikate
+- Unterbrochene Claims werden beim Neuöffnen wieder freigegeben (Resume)
+- Politeness: pro Host höchstens eine URL gleichzeitig
+"""
+
+import asyncio
+
+from app.infrastructure.crawling import async_http_client
+from app.infrastructure.crawling.crawl_frontier import (
+    CrawlFrontier,
+    KIND_DETAIL,
+    STATE_DONE,
+    STATE_PENDING,
+    canonicalize_url,
+)
+from app.infrastructure.crawling.job_crawler import CrawlRules, JobCrawler, extract_links
+from app.infrastructure.crawling.web_scraper import WebScraper
+from tests.stub_http_server import StubServer
+
+DETAIL_HTML = "<html><body><h1>Stelle {i}</h1><p>" + "Python Kafka SQL Docker Kubernetes. " * 10 + "</p></body></html>"
+
+
+def _listing(ids, next_page=None):
+    links = "".join(f'<a href="/jobs/{i}?utm_source=board">Stelle {i}</a>' for i in ids)
+    nav = f'<a rel="next" href="{next_page}">Weiter</a>' if next_page else ""
+    return f'<html><body><a href="/impressum">Impressum</a>{links}{nav}</body></html>'
+
+
+def _routes():
+    routes = {
+        "/jobs": (200, {}, _listing([1, 2, 3], next_page="/jobs?page=2")),
+        "/jobs?page=2": (200, {}, _listing([3, 4])),
+        "/robots.txt": (404, {}, ""),
+    }
+    for i in range(1, 5):
+        routes[f"/jobs/{i}"] = (200, {}, DETAIL_HTML.format(i=i))
+    return routes
+
+
+def _crawl(frontier, seeds, analysed):
+    async def on_details(batch):
+        analysed.extend(canonical for _, canonical, _ in batch)
+        return len(batch)
+
+    async def run():
+        try:
+            crawler = JobCrawler(frontier, scraper=WebScraper(use_playwright=False),
+                                 detail_batch_size=2, on_details=on_details)
+            return await crawler.run(seeds)
+        finally:
+            await async_http_client.close_async_http_client()
+
+    return asyncio.run(run())
+
+
+def test_crawl_expands_listings_and_skips_known_details(tmp_path, monkeypatch):
+    monkeypatch.setenv("HTTP_CACHE_ENABLED", "false")
+    frontier = CrawlFrontier(str(tmp_path / "f.sqlite3"), host_interval_s=0)
+    analysed = []
+
+    with StubServer(_routes()) as server:
+        stats = _crawl(frontier, [server.url("/jobs")], analysed)
+        first_paths = list(server.paths())
+        second = _crawl(frontier, [server.url("/jobs")], analysed)
+        second_paths = server.paths()[len(first_paths):]
+        max_in_flight = server.max_in_flight
+
+    assert stats.listings_fetched == 2
+    assert stats.details_fetched == 4 and stats.analysed == 4
+    assert sorted(analysed) == sorted(server.url(f"/jobs/{i}") for i in range(1, 5))
+    assert all(first_paths.count(f"/jobs/{i}") == 1 for i in range(1, 5))
+    assert "/impressum" not in first_paths
+    # Seed ist frisch gecrawlt, Details bekannt → nichts zu tun
+    assert second.details_fetched == 0 and not [p for p in second_paths if p.startswith("/jobs/")]
+    assert frontier.stats()[KIND_DETAIL] == {STATE_DONE: 4}
+    assert max_in_flight == 1
+    frontier.close()
+
+
+def test_canonical_urls_dedupe_and_link_extraction():
+    assert canonicalize_url("HTTPS://Example.com/jobs/7?utm_campaign=x&ref=mail#apply") == "https://example.com/jobs/7"
+    assert (canonicalize_url("https://example.com/jobs?page=2&q=python", keep_query=True)
+            == canonicalize_url("https://example.com/jobs?q=python&page=2", keep_query=True))
+
+    html = _listing([1, 2], next_page="/jobs?page=2") + '<a href="https://other.example/jobs/9">extern</a>'
+    details, listings = extract_links(html, "https://example.com/jobs", CrawlRules())
+    assert details == ["https://example.com/jobs/1?utm_source=board", "https://example.com/jobs/2?utm_source=board"]
+    assert listings == ["https://example.com/jobs?page=2"]
+
+
+def test_frontier_dedupes_and_resumes_stale_claims(tmp_path):
+    db_path = str(tmp_path / "f.sqlite3")
+    frontier = CrawlFrontier(db_path, host_interval_s=0)
+    added = frontier.add_many(["https://a.example/jobs/1?utm_source=x", "https://a.example/jobs/1",
+                               "https://b.example/jobs/2"])
+    assert added == 2
+    assert frontier.is_known("https://a.example/jobs/1#top")
+
+    claimed = frontier.claim(10)
+    assert len(claimed) == 2
+    assert frontier.claim(10) == []
+    frontier.close()  # Abbruch mitten im Lauf
+
+    reopened = CrawlFrontier(db_path, host_interval_s=0)
+    assert reopened.stats()[KIND_DETAIL] == {STATE_PENDING: 2}
+    assert {item.canonical_url for item in reopened.claim(10)} == {"https://a.example/jobs/1", "https://b.example/jobs/2"}
+    reopened.close()
@@ -0,0 +1,92 @@
+"""
+Test für die Varianten-Cluster der Discovery-Kandidaten (MinHash/LSH + RapidFuzz)
+
+Testet:
+- Schreibvarianten (Bindestrich, Leerzeichen, Plural, Umlaute) landen in einem Cluster,
+  ähnliche aber verschiedene Begriffe nicht
+- Inkrementell: neue Begriffe wachsen in bestehende Cluster, entfernte verlassen sie
+- Store: Cluster-Seiten mit Repräsentant (häufigste Variante), Cursor und Filtern,
+  cluster_members liefert alle Varianten für die Freigabe pro Cluster
+"""
+
+import pytest
+
+from app.infrastructure.extractor.discovery_clusters import CandidateClusterer, fold_term
+from app.infrastructure.extractor.discovery_store import DiscoveryStore
+
+
+def _groups(clusterer):
+    groups = {}
+    for term in clusterer.terms():
+        groups.setdefault(clusterer.cluster_of(term), set()).add(term)
+    return sorted(sorted(g) for g in groups.values())
+
+
+def test_variants_are_grouped():
+    clusterer = CandidateClusterer()
+    for term in ["cloud-plattformen", "cloudplattform", "cloud plattform", "teamfähigkeit", "teamfaehigkeit",
+                 "kubernetes", "kubernetes-cluster", "java", "javascript", "c++", "c#"]:
+        clusterer.add(term)
+    assert clusterer.process_pending() == 11
+
+    assert fold_term("Cloud-Plattformen") == "cloudplattformen"
+    assert _groups(clusterer) == [
+        ["c#"], ["c++"], ["cloud plattform", "cloud-plattformen", "cloudplattform"], ["java"], ["javascript"],
+        ["kubernetes"], ["kubernetes-cluster"], ["teamfaehigkeit", "teamfähigkeit"],
+    ]
+
+
+def test_incremental_add_and_remove():
+    clusterer = CandidateClusterer()
+    clusterer.add("datenanalyse")
+    clusterer.add("projektmanagement")
+    clusterer.process_pending()
+    clusterer.pop_changed()
+
+    clusterer.add("datenanalysen")
+    clusterer.add("daten-analyse")
+    assert clusterer.process_pending() == 2
+    cid = clusterer.cluster_of("datenanalyse")
+    assert clusterer.members(cid) == {"datenanalyse", "datenanalysen", "daten-analyse"}
+    assert cid in clusterer.pop_changed()
+
+    clusterer.remove("datenanalyse")
+    assert clusterer.members(clusterer.cluster_of("datenanalysen")) == {"datenanalysen", "daten-analyse"}
+    clusterer.remove("projektmanagement")
+    assert len(clusterer) == 1
+
+
+def _cand(term, count=1, role="Data Scientist"):
+    return {"term": term, "role": role, "context": "segmented", "count": count}
+
+
+def test_store_cluster_pages_and_members(tmp_path):
+    store = DiscoveryStore(tmp_path)
+    store.log_candidates([_cand("Cloud-Plattformen", 3), _cand("Cloudplattform", 2), _cand("cloud plattform", 1, "DevOps"),
+                          _cand("Kubernetes", 4), _cand("Datenanalyse", 2), _cand("Datenanalysen", 1)])
+
+    first = store.cluster_query(limit=2)
+    assert first["total"] == 3
+    assert [(c["representative"], c["count"], c["size"]) for c in first["clusters"]] == [
+        ("Cloud-Plattformen", 6, 3), ("Kubernetes", 4, 1)]
+    assert first["clusters"][0]["roles"] == ["Data Scientist", "DevOps"]
+    second = store.cluster_query(limit=2, cursor=first["next_cursor"])
+    assert [c["representative"] for c in second["clusters"]] == ["Datenanalyse"]
+    assert second["next_cursor"] is None
+
+    # Neue Variante wird inkrementell eingeordnet und kann Repräsentant werden
+    store.log_candidates([_cand("Cloudplattformen", 5)])
+    top = store.cluster_query(limit=1)["clusters"][0]
+    assert (top["representative"], top["count"], top["size"]) == ("Cloudplattformen", 11, 4)
+
+    assert [c["representative"] for c in store.cluster_query(role="devops")["clusters"]] == ["Cloudplattformen"]
+    assert [c["representative"] for c in store.cluster_query(prefix="daten", min_count=3)["clusters"]] == ["Datenanalyse"]
+
+    clusters = store.cluster_members(["cloud-plattformen", "unbekannt"])
+    assert clusters == [{"representative": "Cloudplattformen",
+                         "terms": ["Cloudplattformen", "Cloud-Plattformen", "Cloudplattform", "cloud plattform"]}]
+    store.remove_terms(clusters[0]["terms"])
+    assert [c["representative"] for c in store.cluster_query()["clusters"]] == ["Kubernetes", "Datenanalyse"]
+
+    with pytest.raises(ValueError):
+        store.cluster_query(cursor=store.query(limit=1)["next_cursor"])
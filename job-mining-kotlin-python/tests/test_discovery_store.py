@@ -0,0 +1,180 @@
+"""
+Test für den Discovery-Store (Append-only-Log + kompaktierter Snapshot)
+
+Testet:
+- log_candidates hängt eine Zeile an, candidates.json bleibt bis zur Kompaktierung unverändert
+- Merge nach (term, role), ignorierte Begriffe werden übersprungen
+- Zwei Instanzen auf demselben Verzeichnis (wie zwei Prozesse) sehen dieselben Zählungen,
+  auch nach einer Kompaktierung durch die andere Instanz
+- remove_terms / clear schreiben den Snapshot sofort, abgebrochene Log-Zeilen werden übersprungen
+- Review-Abfrage: Cursor-Pagination, Sortierung, Filter (Typ, Rolle, Mindest-Häufigkeit, Präfix)
+- Entfernen über den Term-Index landet als Log-Ereignis auch bei anderen Instanzen
+- Freigeben/Ignorieren: nur ein Log-Ereignis pro Aktion, approved_skills.json /
+  ignore_skills.json erst bei der Kompaktierung; von außen ergänzte Ignore-Liste wirkt sofort
+"""
+
+import json
+
+import pytest
+
+from app.infrastructure.extractor.discovery_store import DiscoveryStore
+
+
+def _cand(term, count=1, role="Data Scientist"):
+    return {"term": term, "role": role, "context": "segmented", "count": count}
+
+
+def _counts(store):
+    return {(c["term"], c["role"]): c["count"] for c in store.candidates()}
+
+
+def test_append_merge_and_compaction(tmp_path):
+    (tmp_path / "ignore_skills.json").write_text(json.dumps(["Teamfähigkeit"]), encoding="utf-8")
+    (tmp_path / "candidates.json").write_text(json.dumps([_cand("MLOps", 2)]), encoding="utf-8")
+    store = DiscoveryStore(tmp_path)
+
+    assert store.log_candidates([_cand("mlops "), _cand("Prompt Engineering", 3), _cand("Teamfähigkeit")]) == 2
+    store.log_candidates([_cand("Prompt Engineering", role="Backend Developer")])
+    assert len((tmp_path / "candidates.log").read_text(encoding="utf-8").splitlines()) == 2
+    assert json.loads((tmp_path / "candidates.json").read_text(encoding="utf-8")) == [_cand("MLOps", 2)]
+
+    expected = {("MLOps", "Data Scientist"): 3, ("Prompt Engineering", "Data Scientist"): 3,
+                ("Prompt Engineering", "Backend Developer"): 1}
+    assert _counts(store) == expected
+    assert store.candidates()[-1]["count"] == 1  # häufigste zuerst
+
+    store.compact()
+    assert (tmp_path / "candidates.log").read_bytes() == b""
+    snapshot = json.loads((tmp_path / "candidates.json").read_text(encoding="utf-8"))
+    assert {(c["term"], c["role"]): c["count"] for c in snapshot} == expected
+    assert _counts(DiscoveryStore(tmp_path)) == expected
+
+
+def test_instances_share_log_and_snapshot(tmp_path):
+    first, second = DiscoveryStore(tmp_path), DiscoveryStore(tmp_path)
+    first.log_candidates([_cand("Spark", 2)])
+    second.log_candidates([_cand("Spark")])
+    assert _counts(first) == _counts(second) == {("Spark", "Data Scientist"): 3}
+
+    first.compact()
+    second.log_candidates([_cand("Kafka")])
+    assert _counts(first) == _counts(second) == {("Spark", "Data Scientist"): 3, ("Kafka", "Data Scientist"): 1}
+
+
+def test_remove_clear_and_torn_log_line(tmp_path):
+    store = DiscoveryStore(tmp_path)
+    store.log_candidates([_cand("Docker"), _cand("Docker", role="DevOps"), _cand("Helm")])
+    removed = store.remove_terms(["DOCKER"])
+    assert {c["role"] for c in removed} == {"Data Scientist", "DevOps"}
+    assert [c["term"] for c in json.loads((tmp_path / "candidates.json").read_text(encoding="utf-8"))] == ["Helm"]
+
+    # Abgebrochener Append eines anderen Prozesses
+    with open(tmp_path / "candidates.log", "ab") as f:
+        f.write(b'{"t": 1, "c": [["Hel')
+    store.log_candidates([_cand("Helm")])
+    assert _counts(DiscoveryStore(tmp_path)) == {("Helm", "Data Scientist"): 2}
+
+    store.clear()
+    assert store.candidates() == []
+    assert json.loads((tmp_path / "candidates.json").read_text(encoding="utf-8")) == []
+
+
+def _pages(store, **kwargs):
+    pages, cursor = [], None
+    while True:
+        page = store.query(cursor=cursor, limit=2, **kwargs)
+        pages.append([(c["term"], c["role"], c["count"]) for c in page["candidates"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_review_query_pages_and_filters(tmp_path):
+    store = DiscoveryStore(tmp_path)
+    store.log_candidates([_cand("Kafka", 5), _cand("Kotlin", 3), _cand("Kubernetes", 3, role="DevOps"),
+                          _cand("Airflow", 1), _cand("Kanban", 2, role="DevOps"),
+                          dict(_cand("Scrum Master", 4), entity_type="role")])
+
+    assert _pages(store) == [
+        [("Kafka", "Data Scientist", 5), ("Scrum Master", "Data Scientist", 4)],
+        [("Kotlin", "Data Scientist", 3), ("Kubernetes", "DevOps", 3)],
+        [("Kanban", "DevOps", 2), ("Airflow", "Data Scientist", 1)],
+    ]
+    assert _pages(store, sort="term", prefix="k") == [
+        [("Kafka", "Data Scientist", 5), ("Kanban", "DevOps", 2)],
+        [("Kotlin", "Data Scientist", 3), ("Kubernetes", "DevOps", 3)],
+    ]
+    assert _pages(store, role="devops", min_count=3) == [[("Kubernetes", "DevOps", 3)]]
+    assert _pages(store, entity_type="role") == [[("Scrum Master", "Data Scientist", 4)]]
+    assert _pages(store, prefix="ka", min_count=2) == [[("Kafka", "Data Scientist", 5), ("Kanban", "DevOps", 2)]]
+
+    # Cursor bleibt gültig, wenn zwischen zwei Seiten Kandidaten dazukommen
+    first = store.query(limit=2)
+    store.log_candidates([_cand("Kafka", 10), _cand("Zig", 4)])
+    second = store.query(limit=2, cursor=first["next_cursor"])
+    assert [c["term"] for c in second["candidates"]] == ["Zig", "Kotlin"]
+    assert second["total"] == 7
+
+    with pytest.raises(ValueError):
+        store.query(sort="random")
+    with pytest.raises(ValueError):
+        store.query(sort="term", cursor=first["next_cursor"])
+
+
+def test_bulk_remove_is_logged_for_other_instances(tmp_path):
+    reviewer, worker = DiscoveryStore(tmp_path), DiscoveryStore(tmp_path)
+    worker.log_candidates([_cand(f"Tool {i}", i + 1) for i in range(10)])
+    reviewer.start_compactor(interval=3600)
+    try:
+        removed = reviewer.remove_terms(["tool 1", "TOOL 2", "unbekannt"])
+        assert sorted(c["term"] for c in removed) == ["Tool 1", "Tool 2"]
+        # Kein sofortiges Neuschreiben des Snapshots, nur ein Ereignis im Log
+        assert not (tmp_path / "candidates.json").exists()
+        assert worker.count() == reviewer.count() == 8
+        assert "Tool 1" not in {c["term"] for c in worker.query(limit=20)["candidates"]}
+    finally:
+        reviewer.close()
+    assert len(json.loads((tmp_path / "candidates.json").read_text(encoding="utf-8"))) == 8
+
+
+def test_approve_and_ignore_are_logged_and_compacted(tmp_path):
+    (tmp_path / "approved_skills.json").write_text(json.dumps({"Spark": "Spark"}), encoding="utf-8")
+    (tmp_path / "ignore_skills.json").write_text(json.dumps(["Teamfähigkeit"]), encoding="utf-8")
+    reviewer, worker = DiscoveryStore(tmp_path), DiscoveryStore(tmp_path)
+    worker.log_candidates([_cand("dbt"), _cand("DBT Core", role="DevOps"), _cand("Excel"), _cand("Kafka")])
+    reviewer.start_compactor(interval=3600)
+    try:
+        assert len(reviewer.approve_terms(["dbt", "dbt core"], {"dbt core": "dbt"})) == 2
+        assert [c["term"] for c in reviewer.ignore_terms(["EXCEL", "unbekannt"])] == ["Excel"]
+        # JSON-Dateien unverändert, Entscheidungen nur im Log
+        assert json.loads((tmp_path / "approved_skills.json").read_text(encoding="utf-8")) == {"Spark": "Spark"}
+        assert json.loads((tmp_path / "ignore_skills.json").read_text(encoding="utf-8")) == ["Teamfähigkeit"]
+        assert worker.approved() == {"Spark": "Spark", "dbt": "dbt", "DBT Core": "dbt"}
+        assert worker.ignored() == ["Teamfähigkeit", "Excel"]
+        assert worker.log_candidates([_cand("excel")]) == 0
+        assert _counts(worker) == {("Kafka", "Data Scientist"): 1}
+    finally:
+        reviewer.close()
+    assert json.loads((tmp_path / "approved_skills.json").read_text(encoding="utf-8")) == {
+        "Spark": "Spark", "dbt": "dbt", "DBT Core": "dbt"}
+    assert json.loads((tmp_path / "ignore_skills.json").read_text(encoding="utf-8")) == ["Teamfähigkeit", "Excel"]
+    assert worker.ignored() == ["Teamfähigkeit", "Excel"]
+
+
+def test_external_ignore_list_drops_only_new_terms(tmp_path, monkeypatch):
+    (tmp_path / "ignore_skills.json").write_text(json.dumps(["Teamfähigkeit"]), encoding="utf-8")
+    store = DiscoveryStore(tmp_path)
+    store.log_candidates([_cand("Kafka"), _cand("Excel")])
+    store.start_compactor(interval=3600)
+    try:
+        store.ignore_terms(["Kafka"])
+        dropped = []
+        original = store._drop_term
+        monkeypatch.setattr(store, "_drop_term", lambda term: dropped.append(term) or original(term))
+        # Kotlin-API ergänzt die Datei, ohne die noch nicht kompaktierten Einträge zu kennen
+        (tmp_path / "ignore_skills.json").write_text(json.dumps(["Teamfähigkeit", "Excel"]), encoding="utf-8")
+        assert store.count() == 0
+        assert dropped == ["excel"]
+        assert store.ignored() == ["Teamfähigkeit", "Excel", "Kafka"]
+    finally:
+        store.close()
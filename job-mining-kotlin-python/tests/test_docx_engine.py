@@ -0,0 +1,54 @@
+"""
+Test für DocxEngine (DOCX ohne Temp-Dateien)
+
+Testet:
+- Streaming-XML: Absätze + Tabellenzeilen in Dokumentreihenfolge
+- Core-Metadaten aus docProps/core.xml
+- Batch-Modus behält Reihenfolge, defekte Dateien → None
+"""
+
+import io
+
+from docx import Document
+
+from app.infrastructure.extractor.docx_engine import PARSER_XML, DocxEngine
+
+
+def _make_docx(title: str = "") -> bytes:
+    document = Document()
+    document.core_properties.title = title
+    document.add_paragraph("Ihre Aufgaben")
+    table = document.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "Python"
+    table.cell(0, 1).text = "Docker"
+    document.add_paragraph("Ihr Profil")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def test_xml_stream_keeps_document_order():
+    result = DocxEngine(prefer_pandoc=False).extract(_make_docx(title="Data Engineer"))
+
+    assert result.parser == PARSER_XML
+    assert result.paragraphs == ["Ihre Aufgaben", "Python | Docker", "Ihr Profil"]
+    assert result.metadata["title"] == "Data Engineer"
+
+
+def test_stream_input_matches_python_docx_paragraphs():
+    data = _make_docx()
+    expected = [p.text for p in Document(io.BytesIO(data)).paragraphs if p.text.strip()]
+
+    result = DocxEngine(prefer_pandoc=False).extract(io.BytesIO(data))
+
+    assert [p for p in result.paragraphs if " | " not in p] == expected
+
+
+def test_extract_many_preserves_order():
+    engine = DocxEngine(prefer_pandoc=False)
+
+    results = engine.extract_many([_make_docx("A"), b"PK\x03\x04kaputt", _make_docx("B")], max_workers=2)
+
+    assert results[0].metadata["title"] == "A"
+    assert results[1] is None
+    assert results[2].metadata["title"] == "B"
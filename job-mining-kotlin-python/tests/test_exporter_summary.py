@@ -0,0 +1,77 @@
+"""
+Test für die inkrementelle Summary in exporter.save_result
+
+Testet:
+- Zähler steigen pro neuem raw_text_hash, Überschreiben zählt nicht doppelt
+- Titeländerung bei gleichem Text ersetzt die alte Export-Datei
+- rebuild_summary (Reparatur) stellt den Stand aus den Dateien wieder her und erneuert den Datenstand (ETags)
+- summary.json bleibt für reporting.load_summary lesbar
+- Near-Duplicates zählen weder in der Summary noch in den Dashboard-Summen
+"""
+
+import json
+
+from app.domain.models import AnalysisResultDTO, CompetenceDTO
+from app.infrastructure import exporter, reporting
+
+
+def _result(title, text, skills):
+    return AnalysisResultDTO.create_with_hash(
+        title=title, job_role="IT", region="Berlin", industry="IT", posting_date="2024-12-01",
+        raw_text=text, competences=[CompetenceDTO(original_term=s) for s in skills],
+    )
+
+
+def _summary(export_dir):
+    return json.loads((export_dir / exporter.SUMMARY_FILE).read_text(encoding="utf-8"))
+
+
+def test_save_result_updates_summary_incrementally(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporter, "EXPORT_DIR", tmp_path)
+    monkeypatch.setenv("RESULTS_DB_PATH", str(tmp_path / "results.sqlite3"))
+
+    exporter.save_result(_result("Data Engineer", "Text A", ["Python", "SQL"]))
+    exporter.save_result(_result("Backend Developer", "Text B", ["Java"]))
+    assert _summary(tmp_path) == {"processed": 2, "skills_total": 3}
+
+    # Gleicher Text erneut analysiert (mehr Skills, anderer Titel) → kein Doppelzählen
+    exporter.save_result(_result("Senior Data Engineer", "Text A", ["Python", "SQL", "Spark"]))
+    assert _summary(tmp_path) == {"processed": 2, "skills_total": 4}
+    job_files = sorted(p.name for p in tmp_path.glob("*.json") if p.name != exporter.SUMMARY_FILE)
+    assert len(job_files) == 2 and not any(name.startswith("data_engineer_") for name in job_files)
+
+
+def test_rebuild_summary_repairs_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporter, "EXPORT_DIR", tmp_path)
+    monkeypatch.setenv("RESULTS_DB_PATH", str(tmp_path / "results.sqlite3"))
+    exporter.save_result(_result("Data Engineer", "Text A", ["Python", "SQL"]))
+
+    # Datei außerhalb von save_result hinzugefügt → Store weiß nichts davon
+    manual = _result("Cloud Engineer", "Text C", ["AWS"])
+    (tmp_path / "manual.json").write_text(json.dumps(manual.dict(), default=str), encoding="utf-8")
+    assert _summary(tmp_path)["processed"] == 1
+
+    monkeypatch.setattr(reporting, "BATCH_RESULTS_DIR", tmp_path)
+    version = reporting.results_version()[0]
+    exporter.rebuild_summary()
+    assert _summary(tmp_path) == {"processed": 2, "skills_total": 3}
+    assert exporter.get_summary_store().summary() == {"processed": 2, "skills_total": 3}
+    assert reporting.results_version()[0] != version
+
+
+def test_near_duplicates_excluded_from_dashboard_totals(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporter, "EXPORT_DIR", tmp_path)
+    monkeypatch.setattr(reporting, "BATCH_RESULTS_DIR", tmp_path)
+    monkeypatch.setenv("RESULTS_DB_PATH", str(tmp_path / "results.sqlite3"))
+    posting = " ".join(f"Aufgabe {i} im Team mit Python und SQL für Kunden" for i in range(12))
+
+    exporter.save_result(_result("Data Engineer", posting, ["Python", "SQL"]))
+    exporter.save_result(_result("Data Engineer", "Jetzt bewerben! " + posting, ["Python", "SQL"]))
+    assert _summary(tmp_path) == {"processed": 1, "skills_total": 2}
+
+    metrics = reporting.build_dashboard_metrics(top_n=5)
+    assert (metrics["total_jobs"], metrics["total_skills"]) == (1, 2)
+
+    # Reparatur aus den Dateien: duplicate_of fehlt in der Datei, der Store kennt die Verknüpfung
+    exporter.rebuild_summary()
+    assert _summary(tmp_path) == {"processed": 1, "skills_total": 2}
@@ -0,0 +1,106 @@
+"""
+Test für HttpResponseCache (Conditional GET für wiederholt gescrapte URLs)
+
+Testet gegen einen lokalen Stub-Server:
+- ETag → If-None-Match, 304 liefert gecachten Text
+- Ohne Validatoren: gleicher Body → unverändert
+- Geänderter Inhalt → neu geparst, Analyse-Cache passt nicht mehr
+- scrape_and_analyze_url überspringt die Pipeline bei unverändertem Inhalt
+"""
+
+import asyncio
+
+from app.core import api_endpoints
+from app.domain.models import AnalysisResultDTO
+from app.infrastructure.cache import http_cache as http_cache_module
+from app.infrastructure.cache.http_cache import HttpResponseCache
+from app.infrastructure.crawling import async_http_client
+from app.infrastructure.crawling.web_scraper import WebScraper
+from tests.stub_http_server import StubServer
+
+PAGE = "<html><body><h1>{title}</h1><p>" + "Python Kafka Terraform Kubernetes Monitoring. " * 8 + "</p></body></html>"
+
+
+def _scrape(url, cache):
+    async def run():
+        try:
+            return await WebScraper(use_playwright=False).scrape_async(url, http_cache=cache)
+        finally:
+            await async_http_client.close_async_http_client()
+
+    return asyncio.run(run())
+
+
+def test_etag_revalidation_returns_cached_text(tmp_path):
+    def etag_route(handler):
+        if handler.headers.get("If-None-Match") == '"v1"':
+            return 304, {"ETag": '"v1"'}, b""
+        return 200, {"ETag": '"v1"'}, PAGE.format(title="Data Engineer")
+
+    cache = HttpResponseCache(str(tmp_path))
+    with StubServer({"/job/1": etag_route, "/robots.txt": (404, {}, "")}) as server:
+        first = _scrape(server.url("/job/1?ref=mail"), cache)
+        second = _scrape(server.url("/job/1"), cache)
+        job_requests = [r for r in server.requests if r["path"] == "/job/1"]
+
+    assert not first.unchanged and first.render_engine == "httpx"
+    assert second.unchanged and second.render_engine == "cache"
+    assert second.text == first.text
+    assert second.content_sha256 == first.content_sha256
+    assert job_requests[1]["headers"].get("if-none-match") == '"v1"'
+    assert cache.not_modified == 1
+
+
+def test_unchanged_body_without_validators_and_changed_content(tmp_path):
+    pages = {"title": "Backend Developer"}
+
+    def route(handler):
+        return 200, {}, PAGE.format(title=pages["title"])
+
+    cache = HttpResponseCache(str(tmp_path))
+    with StubServer({"/job/2": route, "/robots.txt": (404, {}, "")}) as server:
+        first = _scrape(server.url("/job/2"), cache)
+        cache.put_analysis(first.canonical_url, first.content_sha256, "fast", {"title": "x"})
+        same = _scrape(server.url("/job/2"), cache)
+        pages["title"] = "Frontend Developer"
+        changed = _scrape(server.url("/job/2"), cache)
+
+    assert same.unchanged
+    assert cache.get_analysis(same.canonical_url, same.content_sha256, "fast") == {"title": "x"}
+    assert not changed.unchanged and changed.title == "Frontend Developer"
+    assert cache.get_analysis(changed.canonical_url, changed.content_sha256, "fast") is None
+    assert cache.get(changed.canonical_url).text_sha256 == changed.content_sha256
+
+
+def test_scrape_and_analyze_skips_pipeline_when_unchanged(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache_module, "_http_cache", HttpResponseCache(str(tmp_path)))
+    monkeypatch.setenv("HTTP_CACHE_ENABLED", "true")
+
+    class _Manager:
+        calls = 0
+
+        def run_analysis_from_scraped_text(self, text, source_name):
+            self.calls += 1
+            return AnalysisResultDTO.create_with_hash(
+                title="Cloud Engineer", job_role="IT", region="Berlin", industry="IT",
+                posting_date="2024-12-01", raw_text=text, source_url=source_name,
+            )
+
+    manager = _Manager()
+    exported = []
+    with StubServer({"/job/3": (200, {"ETag": '"abc"'}, PAGE.format(title="Cloud Engineer")),
+                     "/robots.txt": (404, {}, "")}) as server:
+        async def run():
+            try:
+                url_input = api_endpoints.URLInput(url=server.url("/job/3"))
+                first = await api_endpoints.scrape_and_analyze_url(url_input, manager, on_new_result=exported.append)
+                second = await api_endpoints.scrape_and_analyze_url(url_input, manager, on_new_result=exported.append)
+                return first, second
+            finally:
+                await async_http_client.close_async_http_client()
+
+        first, second = asyncio.run(run())
+
+    assert manager.calls == 1
+    assert len(exported) == 1
+    assert second.dict() == first.dict()
@@ -0,0 +1,69 @@
+"""
+Test für BrowserPool (Playwright-Pool für JS-Seiten)
+
+Testet:
+- Request-Blocking: Bilder/Fonts/Media + Tracker, normale Requests erlaubt
+- Readiness-Selektoren pro Domain (inkl. Subdomains) mit Fallback
+- Rendering über wiederverwendete Seiten gegen Stub-Server
+  (nur wenn Chromium installiert ist)
+"""
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.io.js_scraper import (
+    BrowserPool,
+    DEFAULT_READY_SELECTOR,
+    ready_selector_for,
+    should_block_request,
+)
+from tests.stub_http_server import StubServer
+
+
+def test_should_block_request():
+    assert should_block_request("image", "https://firma.de/logo.png")
+    assert should_block_request("font", "https://fonts.gstatic.com/x.woff2")
+    assert should_block_request("media", "https://firma.de/video.mp4")
+    assert should_block_request("script", "https://www.googletagmanager.com/gtm.js")
+    assert should_block_request("xhr", "https://px.ads.linkedin.com/collect")
+    assert not should_block_request("document", "https://www.linkedin.com/jobs/view/123")
+    assert not should_block_request("script", "https://firma.de/app.js")
+
+
+def test_ready_selector_for_domains():
+    assert "show-more-less-html" in ready_selector_for("https://de.linkedin.com/jobs/view/1")
+    assert "job-ad-content" in ready_selector_for("https://www.stepstone.de/stellenangebote--x.html")
+    assert ready_selector_for("https://example.org/job") == DEFAULT_READY_SELECTOR
+    assert ready_selector_for("https://notlinkedin.com/job") == DEFAULT_READY_SELECTOR
+
+
+def test_pool_renders_with_reused_pages():
+    page_html = (
+        "<html><body><img src='/logo.png'><h1>Job {i}</h1>"
+        "<script>document.body.insertAdjacentHTML('beforeend', '<p class=\"job-title\">gerendert</p>')</script>"
+        "</body></html>"
+    )
+    routes = {f"/job/{i}": (200, {}, page_html.format(i=i)) for i in range(4)}
+    routes["/logo.png"] = (200, {"Content-Type": "image/png"}, b"\x89PNG")
+
+    with StubServer(routes) as server:
+        async def run():
+            pool = BrowserPool(max_pages=2)
+            try:
+                try:
+                    await pool.start()
+                except Exception as e:
+                    pytest.skip(f"Chromium nicht verfügbar: {e}")
+                pages = await asyncio.gather(*(pool.render(server.url(f"/job/{i}")) for i in range(4)))
+                return pages, len(pool._idle), pool.blocked_requests
+            finally:
+                await pool.close()
+
+        pages, idle_slots, blocked = asyncio.run(run())
+
+    assert [p.title for p in pages] == [f"Job {i}" for i in range(4)]
+    assert all("gerendert" in p.text for p in pages)
+    assert idle_slots <= 2
+    assert blocked >= 4
+    assert "/logo.png" not in server.paths()
@@ -0,0 +1,59 @@
+"""
+Test für KeywordClassifier (vorkompilierte Rollen-/Branchen-Regeln)
+
+Testet:
+- Prioritätsreihenfolge bei first_match
+- Trefferzählung für alle Kategorien
+- Cache: Neuaufbau nur bei geänderten Regeln
+- Ungültige Patterns werden übersprungen
+"""
+
+from app.core.keyword_classifier import (
+    KeywordClassifier,
+    clear_keyword_classifier_cache,
+    get_keyword_classifier,
+)
+
+
+def test_first_match_respects_priority():
+    classifier = KeywordClassifier({
+        "Fullstack Developer": [r"\bfullstack|full[\s-]?stack\b"],
+        "Frontend Developer": [r"\bfrontend|front[\s-]?end\b", r"\breact|vue\b"],
+    })
+
+    assert classifier.first_match("Full-Stack mit React") == "Fullstack Developer"
+    assert classifier.first_match("Frontend mit Vue") == "Frontend Developer"
+    assert classifier.first_match("Buchhaltung") is None
+
+
+def test_count_hits_for_all_categories():
+    classifier = KeywordClassifier({
+        "IT & Software": "Software|Cloud",
+        "Finanzen": "Bank|Versicherung",
+        "Logistik": "Lager",
+    })
+
+    hits = classifier.count_hits("Software für Banken: Cloud-Lösungen, Software-Betrieb, Versicherung")
+
+    assert hits == {"IT & Software": 3, "Finanzen": 2}
+    assert classifier.best_match("Bank Bank Software") == "Finanzen"
+
+
+def test_cache_rebuilds_only_on_rule_change():
+    clear_keyword_classifier_cache()
+    rules = {"Entwickler": "Developer|Programmierer"}
+
+    first = get_keyword_classifier(rules)
+    assert get_keyword_classifier(dict(rules)) is first
+
+    rules["Manager"] = "Leiter|Head of"
+    rebuilt = get_keyword_classifier(rules)
+    assert rebuilt is not first
+    assert rebuilt.first_match("head of engineering") == "Manager"
+
+
+def test_invalid_pattern_is_skipped():
+    classifier = KeywordClassifier({"Kaputt": "(unclosed", "Ok": "python"})
+
+    assert classifier.categories == ["Ok"]
+    assert classifier.first_match("Python Entwickler") == "Ok"
@@ -0,0 +1,86 @@
+"""
+Test für die Pipeline-Metriken (Prometheus-Textformat)
+
+Testet:
+- Deaktiviert: geteilter No-op-Kontext, keine Zähler, nur der Status-Gauge
+- Histogramme: kumulative Buckets, _sum/_count je Stufe; Zähler mit Labels
+- Cache-Treffer werden aus registrierten Caches gelesen
+- CompetenceExtractor misst Parsing und die drei Pässe, document_timings loggt eine Zeile
+"""
+
+import logging
+
+import spacy
+
+from app.infrastructure import metrics
+from app.infrastructure.extractor.competence_extractor import CompetenceExtractor
+from app.infrastructure.metrics import PipelineMetrics
+
+
+def test_disabled_is_noop():
+    registry = PipelineMetrics(enabled=False)
+    assert registry.stage("matcher") is registry.stage("fuzzy")
+    with registry.stage("matcher"):
+        pass
+    registry.inc("documents_total", status="analysed")
+
+    text = registry.render()
+    assert "jobmining_timings_enabled 0" in text
+    assert "_bucket" not in text and 'status="analysed"' not in text
+
+
+def test_histograms_counters_and_caches():
+    registry = PipelineMetrics(enabled=True)
+    for seconds in (0.002, 0.02, 0.02, 3.0):
+        registry.observe("metadata", seconds)
+    registry.inc("documents_total", status="analysed")
+    registry.inc("documents_total", status="analysed")
+    registry.inc("competence_matches_total", 5, source="fuzzy")
+
+    class _Cache:
+        hits, misses = 7, 2
+
+    cache = _Cache()
+    registry.register_cache("text", cache)
+
+    lines = registry.render().splitlines()
+    assert 'jobmining_stage_duration_seconds_bucket{stage="metadata",le="0.001"} 0' in lines
+    assert 'jobmining_stage_duration_seconds_bucket{stage="metadata",le="0.025"} 3' in lines
+    assert 'jobmining_stage_duration_seconds_bucket{stage="metadata",le="2.5"} 3' in lines
+    assert 'jobmining_stage_duration_seconds_bucket{stage="metadata",le="+Inf"} 4' in lines
+    assert 'jobmining_stage_duration_seconds_count{stage="metadata"} 4' in lines
+    assert 'jobmining_documents_total{status="analysed"} 2' in lines
+    assert 'jobmining_competence_matches_total{source="fuzzy"} 5' in lines
+    assert 'jobmining_cache_hits_total{cache="text"} 7' in lines
+    assert "# TYPE jobmining_stage_duration_seconds histogram" in lines
+
+
+def test_extractor_stages_and_document_log(monkeypatch, caplog):
+    registry = PipelineMetrics(enabled=True)
+    monkeypatch.setattr(metrics, "_metrics", registry)
+
+    class _Pass:
+        def extract(self, doc):
+            return ["treffer"]
+
+        def extract_competences(self, text):
+            return []
+
+    extractor = CompetenceExtractor(spacy_ext=_Pass(), fuzzy_ext=_Pass(), discovery_ext=_Pass(),
+                                    nlp_model=spacy.blank("de"))
+    monkeypatch.setattr(extractor, "_merge_and_level_check", lambda dtos, role: dtos)
+
+    with caplog.at_level(logging.INFO, logger="app.infrastructure.metrics"):
+        with metrics.document_timings("anzeige.pdf") as timings:
+            # Verschachtelter Kontext (Pipeline innerhalb der Datei-Analyse) loggt nicht selbst
+            with metrics.document_timings("innen"):
+                assert extractor.extract("Python und SQL", "Data") == ["treffer", "treffer"]
+
+    assert list(timings) == ["nlp_parse", "matcher", "fuzzy", "discovery"]
+    # Nur Einträge des Metrik-Loggers (Hintergrund-Threads anderer Tests loggen ebenfalls)
+    records = [r for r in caplog.records if r.name == "app.infrastructure.metrics"]
+    assert [r.getMessage().split(":")[0] for r in records] == ["⏱️ anzeige.pdf"]
+    text = registry.render()
+    assert 'jobmining_stage_duration_seconds_count{stage="nlp_parse"} 1' in text
+    assert 'jobmining_competence_matches_total{source="matcher"} 1' in text
+    assert 'source="fuzzy"' not in text
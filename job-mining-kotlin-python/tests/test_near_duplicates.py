@@ -0,0 +1,127 @@
+"""
+Test für die Near-Duplicate-Erkennung (MinHash/LSH im Results-Store)
+
+Testet:
+- Signatur: gleiche Anzeige mit anderem Rahmen (Portal-Footer, URL) ähnlich, andere Anzeige nicht
+- Store: Duplikat wird verknüpft und zählt weder in Jobs noch in Skill-Zählungen
+- Löschen der kanonischen Anzeige: erstes Duplikat rückt nach
+- Migration: bestehende Datenbank wird beim Öffnen einmalig verknüpft
+- Neuaufbau mit höherer Schwelle: gelöste Duplikate erhalten ihre Kompetenzen zurück
+- Workflow: Duplikate übernehmen das kanonische Ergebnis ohne NLP-Analyse
+"""
+
+import random
+
+from app.application.job_mining_workflow_manager import JobMiningWorkflowManager
+from app.infrastructure import results_store
+from app.infrastructure.near_duplicates import posting_signature, signature_similarity
+from app.infrastructure.results_store import ResultsStore
+
+_WORDS = ("daten analyse python cloud team kunden projekt entwicklung verantwortung erfahrung "
+          "kenntnisse aufgaben profil sql modelle prozesse beratung agil scrum berichte qualität").split()
+
+
+def _posting(seed: int, words: int = 150) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+CANONICAL = _posting(1)
+LINKEDIN = "Jetzt auf LinkedIn bewerben. " + CANONICAL + " Mehr unter https://www.linkedin.com/jobs/view/123"
+XING = CANONICAL + " Diese Anzeige wurde über XING veröffentlicht, Kontakt: jobs@example.com"
+
+
+def _job(key: str, text: str, labels=("Python", "SQL")):
+    return {"raw_text_hash": key, "raw_text": text, "title": "Data Scientist", "job_role": "Data Scientist",
+            "region": "Berlin", "industry": "IT", "posting_date": "2024-05-01",
+            "competences": [{"original_term": label, "esco_label": label, "collections": ["digital"]}
+                            for label in labels]}
+
+
+def test_signature_similarity():
+    base = posting_signature(CANONICAL)
+    assert signature_similarity(base, posting_signature(LINKEDIN)) >= 0.8
+    assert signature_similarity(base, posting_signature(_posting(2))) < 0.3
+    assert posting_signature("Zu kurz für einen Vergleich") is None
+
+
+def test_store_links_duplicates_and_excludes_them_from_counts():
+    store = ResultsStore(":memory:")
+    store.upsert_many([_job("a", CANONICAL), _job("b", LINKEDIN), _job("c", _posting(2), ("Java",))])
+    store.upsert(_job("d", XING))
+
+    rows = dict(store.query("SELECT raw_text_hash, duplicate_of FROM jobs"))
+    assert rows == {"a": None, "b": "a", "c": None, "d": "a"}
+    assert store.count_jobs() == 2
+    assert sorted(label for _, label, *_ in store.skill_month_counts()[1]) == ["Java", "Python", "SQL"]
+    assert {row[-1] for row in store.skill_month_counts()[1]} == {1}
+    assert store.find_near_duplicate(XING, exclude_hash="d")["raw_text_hash"] == "a"
+    assert store.find_near_duplicate(_posting(3)) is None
+    assert store.duplicate_summary()["canonical"][0]["duplicates"] == 2
+
+    store.delete("a")
+    rows = dict(store.query("SELECT raw_text_hash, duplicate_of FROM jobs"))
+    assert rows == {"b": None, "c": None, "d": "b"}
+    assert store.count_jobs() == 2
+    assert sorted(store.top_labels(5)) == [("Java", 1), ("Python", 1), ("SQL", 1)]
+
+
+def test_existing_database_is_linked_on_open(tmp_path, monkeypatch):
+    db = str(tmp_path / "results.sqlite3")
+    monkeypatch.setenv("NEAR_DUPLICATE_DETECTION", "0")
+    store = ResultsStore(db)
+    store.upsert_many([_job("a", CANONICAL), _job("b", LINKEDIN)])
+    assert store.count_jobs() == 2
+    store.close()
+
+    monkeypatch.setenv("NEAR_DUPLICATE_DETECTION", "1")
+    store = ResultsStore(db)
+    assert store.count_jobs() == 1
+    assert store.query("SELECT duplicate_of FROM jobs WHERE raw_text_hash = 'b'") == [("a",)]
+    assert store.top_labels(5) == [("Python", 1), ("SQL", 1)]
+    store.close()
+
+
+def test_rebuild_restores_competences_of_unlinked_duplicates(tmp_path, monkeypatch):
+    db = str(tmp_path / "results.sqlite3")
+    store = ResultsStore(db)
+    store.upsert_many([_job("a", CANONICAL), _job("b", LINKEDIN)])
+    assert store.count_jobs() == 1
+    version = store.data_version()
+    store.set_meta("near_duplicate_version", "0")
+    store.close()
+
+    monkeypatch.setattr(results_store, "NEAR_DUPLICATE_THRESHOLD", 0.99)
+    store = ResultsStore(db)
+    assert store.query("SELECT duplicate_of FROM jobs WHERE raw_text_hash = 'b'") == [(None,)]
+    assert store.count_jobs() == 2 and store.competence_total() == 4
+    assert store.query("SELECT COUNT(*) FROM competences c JOIN jobs j ON j.id = c.job_id "
+                       "WHERE j.raw_text_hash = 'b'") == [(2,)]
+    assert store.top_labels(5) == [("Python", 2), ("SQL", 2)]
+    assert store.data_version() != version
+    store.close()
+
+
+class _NoNLP:
+    """Jeder Zugriff auf Extraktoren/Services wäre eine (unerwünschte) Analyse"""
+
+    def __getattr__(self, name):
+        raise AssertionError(f"NLP-Schritt aufgerufen: {name}")
+
+
+def test_workflow_skips_analysis_for_duplicates():
+    store = ResultsStore(":memory:")
+    store.upsert(_job("a", CANONICAL))
+    manager = JobMiningWorkflowManager(_NoNLP(), _NoNLP(), _NoNLP(), _NoNLP(), _NoNLP(), duplicate_index=store)
+
+    single = manager.run_analysis_from_scraped_text(XING, "https://firma.example/jobs/1")
+    batch = manager.run_analyses_from_scraped_texts([(LINKEDIN, "https://linkedin.example/jobs/1")])
+
+    for result in (single, batch[0]):
+        assert result.duplicate_of == "a" and result.duplicate_similarity >= 0.8
+        assert [c.original_term for c in result.competences] == ["Python", "SQL"]
+        assert result.title == "Data Scientist"
+    assert batch[0].source_url == "https://linkedin.example/jobs/1"
+
+    store.upsert_many([single.dict(), batch[0].dict()])
+    assert store.count_jobs() == 1
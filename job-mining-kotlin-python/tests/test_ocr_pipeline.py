@@ -0,0 +1,144 @@
+"""
+Test für OcrPipeline (parallele, gecachte OCR)
+
+Testet:
+- Adaptive DPI aus der Seitengröße (A4 / A5 / A3)
+- Bild-Fingerprint als Cache-Schlüssel (stabil, inhaltsabhängig)
+- Ohne OCR-Bibliotheken: leeres Ergebnis statt Exception
+- Parallele Seiten (Stub-OCR, Thread-Pool statt Prozess-Pool) in Seitenreihenfolge
+- Seiten-Cache: zweiter Lauf OCRt keine Seite erneut
+- Early-Stop: nach target_chars werden keine weiteren Seiten eingeplant
+"""
+
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image, ImageDraw
+from reportlab.pdfgen import canvas
+
+from app.infrastructure.extractor import ocr_pipeline
+from app.infrastructure.extractor.ocr_pipeline import (
+    MAX_DPI,
+    MIN_DPI,
+    OcrPipeline,
+    adaptive_dpi,
+    image_fingerprint,
+    ocr_available,
+)
+
+
+def _make_pdf(n_pages: int) -> bytes:
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for i in range(1, n_pages + 1):
+        pdf.drawString(72, 720, f"Seite {i}")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def stub_ocr(monkeypatch):
+    """Stub-Rasterung (Seitennummer im Bild) und Stub-Tesseract; zählt OCR-Aufrufe je Seite"""
+    calls = []
+    lock = threading.Lock()
+
+    def render(path, page_no, dpi):
+        image = Image.new("L", (120, 40), color=255)
+        ImageDraw.Draw(image).text((5, 5), f"Seite {page_no}", fill=0)
+        image.info["page"] = page_no
+        return image
+
+    def tesseract(image, lang):
+        page_no = image.info["page"]
+        with lock:
+            calls.append(page_no)
+        return f"Seite {page_no} " + "x" * 100
+
+    monkeypatch.setattr(ocr_pipeline, "ocr_available", lambda: True)
+    monkeypatch.setattr(ocr_pipeline, "_render_page", render)
+    monkeypatch.setattr(ocr_pipeline, "_tesseract", tesseract)
+    return calls
+
+
+@pytest.fixture
+def thread_pool(monkeypatch):
+    # Prozess-Worker sähen die Stubs nicht → gleicher Ablauf im Thread-Pool
+    pool = ThreadPoolExecutor(max_workers=4)
+    monkeypatch.setattr(ocr_pipeline, "get_process_pool", lambda workers: pool)
+    yield pool
+    pool.shutdown()
+
+
+def test_adaptive_dpi_scales_with_page_size():
+    a4 = adaptive_dpi(595, 842)
+    a5 = adaptive_dpi(420, 595)
+    a3 = adaptive_dpi(842, 1191)
+
+    assert MIN_DPI < a4 < MAX_DPI
+    assert a5 == MAX_DPI
+    assert a3 >= MIN_DPI
+    assert a3 < a4 < a5
+
+
+def test_image_fingerprint_depends_on_pixels():
+    first = Image.new("RGB", (200, 50), color="white")
+    ImageDraw.Draw(first).text((5, 5), "Python Entwickler", fill="black")
+    same = first.copy()
+    other = first.copy()
+    ImageDraw.Draw(other).text((5, 25), "Java", fill="black")
+
+    assert image_fingerprint(first) == image_fingerprint(same)
+    assert image_fingerprint(first) != image_fingerprint(other)
+
+
+def test_ocr_pdf_without_backend_returns_empty(tmp_path):
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    pdf.showPage()
+    pdf.save()
+
+    pipeline = OcrPipeline(max_workers=1, cache_dir=str(tmp_path))
+    result = pipeline.ocr_pdf(buffer)
+
+    assert isinstance(result.text, str)
+    if not ocr_available():
+        assert result.text == ""
+        assert result.pages == []
+
+
+def test_parallel_ocr_keeps_page_order(stub_ocr, thread_pool, tmp_path):
+    pipeline = OcrPipeline(max_workers=3, target_chars=0, cache_dir=str(tmp_path))
+
+    result = pipeline.ocr_pdf(_make_pdf(6))
+
+    assert result.pages == [1, 2, 3, 4, 5, 6]
+    assert [line.split(" x")[0] for line in result.text.split("\n")] == [f"Seite {i}" for i in range(1, 7)]
+    assert sorted(stub_ocr) == [1, 2, 3, 4, 5, 6]
+    assert not result.stopped_early
+
+
+def test_page_cache_ocrs_each_page_once(stub_ocr, thread_pool, tmp_path):
+    pipeline = OcrPipeline(max_workers=2, target_chars=0, cache_dir=str(tmp_path))
+    data = _make_pdf(4)
+
+    first = pipeline.ocr_pdf(data)
+    second = pipeline.ocr_pdf(data)
+
+    assert sorted(stub_ocr) == [1, 2, 3, 4]
+    assert first.cache_hits == 0 and second.cache_hits == 4
+    assert second.text == first.text
+
+
+def test_early_stop_after_target_chars(stub_ocr, tmp_path):
+    # Jede Stub-Seite liefert > 100 Zeichen → nach zwei Seiten ist das Ziel erreicht
+    pipeline = OcrPipeline(max_workers=1, target_chars=200, cache_dir=None)
+
+    result = pipeline.ocr_pdf(_make_pdf(8))
+
+    assert stub_ocr == [1, 2]
+    assert result.pages == [1, 2] and result.stopped_early
+    assert pipeline._enough([(1, "x" * 120, False), (2, "x" * 80, False)])
+    assert not pipeline._enough([(1, "x" * 120, False)])
@@ -0,0 +1,144 @@
+"""
+Test für PdfExtractionEngine (seitenparallele PDF-Extraktion)
+
+Testet:
+- Seiten-Offsets zeigen exakt auf den Seitentext im Gesamttext
+- Parallele Seitenbereiche liefern dasselbe Ergebnis wie sequentiell
+- Bereinigung pro Seite (MultiFormatParser) hält Offsets konsistent
+- Gemeinsamer Prozess-Pool wird für größere Anfragen nicht ersetzt (laufende submits bleiben gültig)
+- Außerhalb des Main-Threads (kein SIGALRM): pypdf und der pdftotext-Fallback laufen mit Zeitbudget im Pool,
+  hängende Bereiche werden als timed_out markiert
+- Hängender Worker (Budget überschritten): Prozess wird beendet, der Pool ersetzt; Bereiche des alten
+  Pools werden einmal im neuen Pool wiederholt
+"""
+
+import io
+import subprocess
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from reportlab.pdfgen import canvas
+
+from app.infrastructure.extractor import pdf_extraction_engine
+from app.infrastructure.extractor.pdf_extraction_engine import BACKEND_PYPDF, PdfExtractionEngine, get_process_pool
+
+
+def _make_pdf(n_pages: int) -> bytes:
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for i in range(1, n_pages + 1):
+        pdf.drawString(72, 720, f"Seite {i}: Python Entwickler mit Docker Erfahrung")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def test_page_offsets_point_into_text():
+    engine = PdfExtractionEngine(max_workers=1, prefer_pdftotext=False)
+
+    result = engine.extract(io.BytesIO(_make_pdf(3)))
+
+    assert result.backend == BACKEND_PYPDF
+    assert result.page_count == 3
+    for page in result.pages:
+        assert result.text[page.start:page.end] == page.text
+        assert f"Seite {page.page}:" in page.text
+
+
+def test_parallel_ranges_match_sequential():
+    data = _make_pdf(7)
+    sequential = PdfExtractionEngine(max_workers=1, prefer_pdftotext=False).extract(data)
+    parallel = PdfExtractionEngine(max_workers=2, pages_per_chunk=2, prefer_pdftotext=False).extract(data)
+
+    assert parallel.text == sequential.text
+    assert [p.page for p in parallel.pages] == list(range(1, 8))
+    assert parallel.page_offsets() == sequential.page_offsets()
+    assert parallel.timed_out_pages == []
+
+
+def test_page_transform_keeps_offsets_consistent(tmp_path):
+    pdf_path = tmp_path / "stellenanzeige.pdf"
+    pdf_path.write_bytes(_make_pdf(2))
+    engine = PdfExtractionEngine(max_workers=1, prefer_pdftotext=False)
+
+    result = engine.extract(pdf_path, separator=" ", page_transform=lambda t: " ".join(t.split()))
+
+    assert "\n" not in result.text
+    second = result.pages[1]
+    assert result.text[second.start:second.end].startswith("Seite 2:")
+
+
+def test_shared_pool_is_not_replaced_for_larger_requests():
+    pool = get_process_pool(1)
+    assert get_process_pool(64) is pool
+    assert pool.submit(len, "abc").result(timeout=30) == 3
+
+
+class _HangingPool:
+    """Pool, dessen Bereiche nie fertig werden (hängender Worker)"""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, path, first, last, page_timeout):
+        self.submitted.append((first, last))
+        return Future()
+
+
+def _in_worker_thread(fn):
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(fn).result(timeout=30)
+
+
+def test_worker_thread_extraction_is_time_bounded(monkeypatch):
+    monkeypatch.setattr(pdf_extraction_engine, "POOL_BUDGET_SLACK_SECONDS", 0)
+    pool = _HangingPool()
+    monkeypatch.setattr(pdf_extraction_engine, "get_process_pool", lambda workers: pool)
+    engine = PdfExtractionEngine(max_workers=1, page_timeout=0.01, prefer_pdftotext=False)
+
+    result = _in_worker_thread(lambda: engine.extract(_make_pdf(2)))
+
+    assert pool.submitted == [(1, 2)]
+    assert result.timed_out_pages == [1, 2]
+
+
+def test_pdftotext_fallback_runs_in_pool_with_budget(monkeypatch):
+    def failing_pdftotext(binary, path, first, last, page_timeout):
+        raise subprocess.TimeoutExpired("pdftotext", page_timeout)
+
+    pool = _HangingPool()
+    monkeypatch.setattr(pdf_extraction_engine, "POOL_BUDGET_SLACK_SECONDS", 0)
+    monkeypatch.setattr(pdf_extraction_engine, "find_pdftotext", lambda: "pdftotext")
+    monkeypatch.setattr(pdf_extraction_engine, "_pdftotext_range", failing_pdftotext)
+    monkeypatch.setattr(pdf_extraction_engine, "get_process_pool", lambda workers: pool)
+    engine = PdfExtractionEngine(max_workers=2, pages_per_chunk=2, page_timeout=0.01)
+
+    result = _in_worker_thread(lambda: engine.extract(_make_pdf(3)))
+
+    assert sorted(pool.submitted) == [(1, 2), (3, 3)]
+    assert result.timed_out_pages == [1, 2, 3]
+
+
+def test_hung_worker_recycles_shared_pool(monkeypatch, tmp_path):
+    monkeypatch.setattr(pdf_extraction_engine, "POOL_BUDGET_SLACK_SECONDS", 0)
+    engine = PdfExtractionEngine(max_workers=1, page_timeout=0.2, prefer_pdftotext=False)
+    pool = get_process_pool(1)
+    hung = pool.submit(time.sleep, 60)  # blockiert wie C-Code, den SIGALRM nicht unterbricht
+    other = pool.submit(time.sleep, 60)  # Bereich einer anderen Anfrage im selben Pool
+    workers = list(pool._processes.values())
+    while not hung.running():
+        time.sleep(0.01)
+
+    assert engine._range_result("x.pdf", 1, 2, pool, hung) == [(1, "", True), (2, "", True)]
+    fresh = get_process_pool(1)
+    assert fresh is not pool
+    for process in workers:
+        process.join(timeout=10)
+        assert not process.is_alive()
+
+    # Bereich des alten Pools läuft einmal im neuen Pool
+    pdf = tmp_path / "doku.pdf"
+    pdf.write_bytes(_make_pdf(2))
+    pages = engine._range_result(str(pdf), 1, 2, pool, other)
+    assert [p for p, _, _ in pages] == [1, 2] and "Seite 2" in pages[1][1]
+    assert fresh.submit(len, "abc").result(timeout=30) == 3
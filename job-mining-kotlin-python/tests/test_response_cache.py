@@ -0,0 +1,109 @@
+"""
+Test für den Response-Cache der Report-Endpunkte (ETag / Last-Modified / 304)
+
+Testet:
+- Gleicher Datenstand + gleiche Parameter → Body nur einmal berechnet
+- If-None-Match / If-Modified-Since → 304 ohne Berechnung
+- Neu gespeichertes Ergebnis → neues ETag, Cache-Eintrag wird ersetzt
+- Streaming-Exporte liefern Validatoren und 304, ohne den Body zu cachen
+"""
+
+import json
+import time
+
+import pytest
+from fastapi import Request
+
+from app.core import api_endpoints
+from app.infrastructure import reporting
+from app.infrastructure.cache import response_cache
+from app.infrastructure.cache.response_cache import ResponseCache, is_not_modified
+
+
+def _request(path, headers=None, query=b""):
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": path, "headers": raw, "query_string": query})
+
+
+def _job(key, skills):
+    return {"raw_text_hash": key, "title": "Data Scientist", "posting_date": "2024-02-01",
+            "competences": [{"original_term": s} for s in skills]}
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("RESULTS_DB_PATH", str(tmp_path / "results.sqlite3"))
+    monkeypatch.setattr(reporting, "BATCH_RESULTS_DIR", tmp_path / "batch_results")
+    monkeypatch.setattr(response_cache, "_response_cache", ResponseCache(max_entries=4))
+    store = reporting.open_results_store()
+    store.upsert(_job("a", ["Python"]))
+    return store
+
+
+def test_cached_report_and_conditional_requests(store):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return json.dumps({"total_jobs": store.count_jobs()}).encode()
+
+    path = "/reports/dashboard-metrics"
+    first = api_endpoints.cached_report_response(_request(path), {"top_n": 10}, compute, "application/json")
+    again = api_endpoints.cached_report_response(_request(path), {"top_n": 10}, compute, "application/json")
+    etag = first.headers["etag"]
+    assert first.status_code == again.status_code == 200
+    assert again.body == first.body and again.headers["etag"] == etag
+    assert len(calls) == 1
+
+    # Andere Parameter → eigener Eintrag und eigenes ETag
+    other = api_endpoints.cached_report_response(_request(path), {"top_n": 5}, compute, "application/json")
+    assert other.headers["etag"] != etag and len(calls) == 2
+
+    not_modified = api_endpoints.cached_report_response(
+        _request(path, {"If-None-Match": etag}), {"top_n": 10}, compute, "application/json")
+    assert not_modified.status_code == 304 and not_modified.headers["etag"] == etag
+    since = api_endpoints.cached_report_response(
+        _request(path, {"If-Modified-Since": first.headers["last-modified"]}), {"top_n": 10}, compute, "application/json")
+    assert since.status_code == 304
+    assert len(calls) == 2
+
+    # Neues Ergebnis → neuer Datenstand, Revalidierung liefert den neuen Body
+    store.upsert(_job("b", ["SQL"]))
+    fresh = api_endpoints.cached_report_response(
+        _request(path, {"If-None-Match": etag}), {"top_n": 10}, compute, "application/json")
+    assert fresh.status_code == 200 and fresh.headers["etag"] != etag
+    assert json.loads(fresh.body) == {"total_jobs": 2}
+    assert response_cache.get_response_cache().stats()["entries"] == 1
+
+
+def test_streaming_export_revalidation(store):
+    path = "/reports/export.csv"
+    filters = {"date_from": "2024", "date_to": None, "role": None, "region": None}
+    response = api_endpoints.conditional_stream_response(
+        _request(path), filters, reporting.stream_csv_report(**filters), "text/csv")
+    etag = response.headers["etag"]
+    assert response.status_code == 200 and response.headers["cache-control"] == "no-cache"
+
+    repeat = api_endpoints.conditional_stream_response(
+        _request(path, {"If-None-Match": f"{etag}, \"other\""}), filters, reporting.stream_csv_report(**filters), "text/csv")
+    assert repeat.status_code == 304
+
+    store.delete("a")
+    changed = api_endpoints.conditional_stream_response(
+        _request(path, {"If-None-Match": etag}), filters, reporting.stream_csv_report(**filters), "text/csv")
+    assert changed.status_code == 200
+
+
+def test_is_not_modified_rules():
+    etag = 'W/"abc"'
+    assert is_not_modified(etag, 0, '"abc"', None)  # schwacher Vergleich
+    assert is_not_modified(etag, 0, "*", None)
+    assert not is_not_modified(etag, 0, 'W/"xyz"', None)
+
+    modified = time.time()
+    later = "Sun, 06 Nov 2044 08:49:37 GMT"
+    assert is_not_modified(etag, modified, None, later)
+    assert not is_not_modified(etag, modified, None, "Sun, 06 Nov 1994 08:49:37 GMT")
+    assert not is_not_modified(etag, modified, None, "kein Datum")
+    # If-None-Match hat Vorrang vor If-Modified-Since
+    assert not is_not_modified(etag, modified, 'W/"xyz"', later)
@@ -0,0 +1,99 @@
+"""
+Test für ResultsStore (eingebettete SQLite-Datenbank für Analyse-Ergebnisse)
+
+Testet:
+- save_results schreibt Jobs + Kompetenzen, gleicher Hash ersetzt statt zu duplizieren
+- Einmaliger Import bestehender JSON-Exporte beim ersten Reporting-Zugriff
+- SQL-Metriken stimmen mit dem Verzeichnis-Scan überein
+- Dashboard-Routen laufen ohne externen Datenbank-Server
+"""
+
+import asyncio
+import json
+
+from app.api import dashboard_routes
+from app.domain.models import AnalysisResultDTO, CompetenceDTO
+from app.infrastructure import exporter, reporting
+from app.infrastructure.results_store import ResultsStore
+
+JOBS = [
+    {"title": "Data Scientist", "job_role": "Data", "region": "Berlin", "industry": "IT", "posting_date": "2023-03-01",
+     "competences": [{"original_term": "Python", "collections": ["digital"], "is_digital": True, "esco_uri": "esco:1"},
+                     {"original_term": "Englisch", "collections": ["language"]}]},
+    {"title": "Backend Developer", "job_role": "IT", "region": "München", "industry": "IT", "posting_date": "2024-05-01",
+     "competences": [{"original_term": "Python", "level": 3, "esco_uri": "esco:1"},
+                     {"esco_label": "SQL", "original_term": "sql", "esco_uri": "esco:2"},
+                     {"original_term": "Python", "level": 1, "is_discovery": True}]},
+    {"title": "UX Designer", "job_role": "Design", "region": "Berlin", "industry": "Agentur", "posting_date": "2024-01-10",
+     "competences": [{"original_term": "Figma", "level": 4}]},
+]
+
+
+def _write_corpus(directory):
+    for i, job in enumerate(JOBS):
+        (directory / f"job_{i}.json").write_text(json.dumps({**job, "raw_text_hash": f"hash{i}"}), encoding="utf-8")
+    (directory / "summary.json").write_text(json.dumps({"processed": 3, "skills_total": 6}), encoding="utf-8")
+
+
+def test_save_results_upserts_jobs_and_competences(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporter, "EXPORT_DIR", tmp_path)
+    db_path = str(tmp_path / "results.sqlite3")
+    monkeypatch.setenv("RESULTS_DB_PATH", db_path)
+
+    def result(skills):
+        return AnalysisResultDTO.create_with_hash(
+            title="Data Engineer", job_role="IT", region="Berlin", industry="IT", posting_date="2024-02-01",
+            raw_text="Gleicher Text", competences=[CompetenceDTO(original_term=s) for s in skills],
+        )
+
+    exporter.save_results([result(["Python", "SQL"])])
+    exporter.save_result(result(["Python", "SQL", "Spark"]))
+
+    store = ResultsStore(db_path)
+    assert store.count_jobs() == 1
+    assert store.query("SELECT label FROM competences ORDER BY position") == [("Python",), ("SQL",), ("Spark",)]
+    assert store.query("SELECT posting_year_int, region, role_category FROM jobs") == [(2024, "Berlin", "software_dev")]
+    store.close()
+
+
+def test_sql_metrics_match_directory_scan(tmp_path, monkeypatch):
+    corpus = tmp_path / "batch_results"
+    corpus.mkdir()
+    _write_corpus(corpus)
+    monkeypatch.setattr(reporting, "BATCH_RESULTS_DIR", corpus)
+    monkeypatch.setenv("RESULTS_DB_PATH", str(tmp_path / "results.sqlite3"))
+
+    monkeypatch.setenv("RESULTS_BACKEND", "files")
+    from_files = reporting.build_dashboard_metrics(top_n=5)
+    csv_files = reporting.generate_csv_report().getvalue()
+
+    monkeypatch.setenv("RESULTS_BACKEND", "sqlite")
+    from_sql = reporting.build_dashboard_metrics(top_n=5)
+
+    assert reporting.open_results_store().count_jobs() == 3  # einmalig importiert
+    assert from_sql == from_files
+    assert reporting.generate_csv_report().getvalue() == csv_files
+    assert reporting.aggregate_regional_distribution() == {"Berlin": 2, "München": 1}
+
+
+def test_dashboard_routes_query_results_store(tmp_path, monkeypatch):
+    corpus = tmp_path / "batch_results"
+    corpus.mkdir()
+    _write_corpus(corpus)
+    monkeypatch.setattr(reporting, "BATCH_RESULTS_DIR", corpus)
+    monkeypatch.setenv("RESULTS_DB_PATH", str(tmp_path / "results.sqlite3"))
+
+    stats = asyncio.run(dashboard_routes.get_dashboard_stats())
+    roles = asyncio.run(dashboard_routes.get_role_distribution())
+    trends = asyncio.run(dashboard_routes.get_competence_trends())
+    levels = asyncio.run(dashboard_routes.get_level_progression())
+    emerging = asyncio.run(dashboard_routes.get_emerging_skills())
+
+    assert stats["total_jobs"] == 3 and stats["total_skills"] == 2 and stats["discovery_skills"] == 1
+    assert stats["years_covered"] == [2023, 2024]
+    assert dict(zip(roles["labels"], roles["datasets"][0]["data"])) == {"Data": 1, "IT": 1, "Design": 1}
+    assert trends["labels"] == ["2023", "2024"]
+    python = next(d for d in trends["datasets"] if d["label"] == "Python")
+    assert python["data"] == [1, 2]
+    assert dict(zip(levels["labels"], levels["datasets"][0]["data"]))["Level 4: Fachbuch"] == 1
+    assert {e["skill"]: e["growth"] for e in emerging} == {"Python": 1, "SQL": 1, "Figma": 1}
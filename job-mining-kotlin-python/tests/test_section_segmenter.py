@@ -0,0 +1,85 @@
+"""
+Test für SectionSegmenter (Ebene 6: Segmentierung)
+
+Testet:
+- Zeilenbasierte Header (Aufgaben / Profil / Benefits)
+- Zusammengeklappte Scraping-Texte mit Inline-Headern
+- Aufzählungszeilen werden nicht als Header fehlinterpretiert
+- Benchmark: lineare Laufzeit auf pathologischen Eingaben
+"""
+
+import time
+
+from app.infrastructure.extractor.section_segmenter import SectionSegmenter
+
+
+def test_line_headers_are_labelled():
+    segmenter = SectionSegmenter()
+    text = (
+        "Senior Software Entwickler (m/w/d)\n"
+        "Ihre Aufgaben:\n"
+        "* Entwicklung von Python Backends mit FastAPI.\n"
+        "Ihr Profil:\n"
+        "* Erfahrung mit NLP und Spacy.\n"
+        "Wir bieten\n"
+        "Obstkiste und Kicker."
+    )
+
+    sections = segmenter.split(text)
+
+    assert "FastAPI" in sections["tasks"]
+    assert "Spacy" in sections["requirements"]
+    assert "Obstkiste" in sections["benefits"]
+    assert "Obstkiste" not in segmenter.strip_irrelevant(text)
+
+
+def test_collapsed_scraped_text_is_split_inline():
+    segmenter = SectionSegmenter()
+    text = "Backend Dev Deine Aufgaben: APIs bauen. Dein Profil: Python, Docker. Über uns: Startup."
+
+    sections = segmenter.split(text)
+
+    assert sections["tasks"] == "APIs bauen."
+    assert sections["requirements"] == "Python, Docker."
+    assert sections["about"] == "Startup."
+
+
+def test_bullet_lines_are_not_headers():
+    segmenter = SectionSegmenter()
+    text = "Dein Profil:\n- Aufgaben im Team verteilen\n- Kontakt zu Kunden halten"
+
+    sections = segmenter.split(text)
+
+    assert list(sections) == ["requirements"]
+    assert "Kontakt zu Kunden" in sections["requirements"]
+
+
+def _time_segment(segmenter, text, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        segmenter.segment(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_benchmark_pathological_inputs_scale_linearly():
+    """
+    Benchmark: Texte ohne passende Header bzw. mit vielen Beinahe-Treffern.
+    8-fache Eingabe darf nicht mehr als ~8-fache Zeit kosten (Toleranz für Timer-Rauschen;
+    quadratisches Verhalten läge bei ~64).
+    """
+    segmenter = SectionSegmenter()
+    pathological = {
+        "no_headers": "lorem ipsum dolor sit amet " * 4000,
+        "near_miss_headers": "aufgabe profile tasksx: " * 4000,
+        "header_without_stop": "Deine Aufgaben: " + "python docker " * 4000,
+        "many_lines": "* python docker kubernetes\n" * 4000,
+    }
+
+    for name, text in pathological.items():
+        small = _time_segment(segmenter, text)
+        large = _time_segment(segmenter, text * 8)
+        ratio = large / max(small, 1e-6)
+        assert ratio < 12, f"{name}: nicht-lineares Laufzeitverhalten ({ratio:.1f}x)"
+        assert large < 2.0
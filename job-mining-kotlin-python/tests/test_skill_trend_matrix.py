@@ -0,0 +1,135 @@
+"""
+Test für die Skill-Trend-Matrix (materialisierte Zählungen Skill × Monat)
+
+Testet:
+- skill_month_counts wird beim Speichern, Überschreiben und Löschen inkrementell gepflegt
+- Die im Speicher gehaltene Matrix folgt den Änderungen ohne Neuladen
+- Emerging Skills / Zeitreihen-Validierung liefern dasselbe wie die bisherige Berechnung
+- Monats-Zeitreihen mit Rollen- und Regions-Filter
+- Matrix-Cache hängt am Store-Objekt (nicht an id(store)) und verschwindet mit ihm
+- Schreibvorgänge eines anderen Prozesses (data_version) → Neuladen beim nächsten Zugriff,
+  eigene Änderungen laufen weiter nur über die Listener
+"""
+
+import gc
+import random
+
+from app.infrastructure import reporting, skill_trend_matrix
+from app.infrastructure.results_store import ResultsStore
+from app.infrastructure.skill_trend_matrix import SkillTrendMatrix, get_skill_trend_matrix
+
+
+def _job(key, date, region, skills):
+    return {"raw_text_hash": key, "title": "Data Scientist", "job_role": "Data", "region": region,
+            "posting_date": date, "competences": [{"original_term": s} for s in skills]}
+
+
+def _counts(store):
+    return sorted(store.query("SELECT skill_id, month, role_category, region, is_specific, n FROM skill_month_counts"))
+
+
+def test_counts_are_maintained_incrementally(tmp_path):
+    db_path = str(tmp_path / "results.sqlite3")
+    store = ResultsStore(db_path)
+    matrix = get_skill_trend_matrix(store)
+
+    store.upsert_many([
+        _job("a", "2023-03-01", "Berlin", ["Python", "SQL"]),
+        _job("b", "2024-05-20", "München", ["Python", "Python", "Englisch"]),
+        _job("c", "unbekannt", "Berlin", ["Python"]),
+    ])
+    store.upsert(_job("a", "2024-01-15", "Berlin", ["Python", "Spark"]))  # Gleicher Hash: ersetzen
+    store.delete("b")
+    incremental = _counts(store)
+
+    store.rebuild_skill_counts()
+    assert _counts(store) == incremental
+    assert matrix.series(["Python", "SQL", "Spark"], freq="month") == {
+        "Python": {"2024-01": 1}, "SQL": {}, "Spark": {"2024-01": 1},
+    }
+    store.close()
+
+    # Ältere Datenbank ohne Zähl-Matrix: wird beim Öffnen einmalig aufgebaut
+    store = ResultsStore(db_path)
+    store.query("DELETE FROM skill_month_counts")
+    store.query("DELETE FROM meta WHERE key = 'skill_counts_version'")
+    store.close()
+    store = ResultsStore(db_path)
+    assert _counts(store) == incremental
+    store.close()
+
+
+def test_matrix_queries_match_reference_implementation():
+    rnd = random.Random(7)
+    skill_by_year = {}
+    rows = []
+    for skill_id in range(1, 60):
+        label = f"Skill {skill_id}"
+        for year in range(2019, 2026):
+            if rnd.random() < 0.6:
+                n = rnd.randint(1, 9)
+                skill_by_year.setdefault(label, {})[year] = n
+                rows.append((skill_id, label, year * 12 + rnd.randint(0, 11), "", "", 1, n))
+        rows.append((skill_id, label, 2024 * 12, "", "", 0, 3))  # Sprach-Skills zählen nicht mit
+
+    matrix = SkillTrendMatrix.from_rows(rows)
+    assert matrix.emerging(min_year=2024) == reporting._emerging_skills(skill_by_year, min_year=2024)
+    assert matrix.time_series_validation() == reporting._time_series_validation(skill_by_year)
+
+
+def test_month_series_with_role_and_region_slices():
+    matrix = SkillTrendMatrix.from_rows([
+        (1, "Python", 2024 * 12 + 0, "data_science", "Berlin", 1, 2),
+        (1, "Python", 2024 * 12 + 2, "software_dev", "München", 1, 5),
+        (2, "SQL", 2023 * 12 + 11, "data_science", "Berlin", 1, 1),
+    ])
+    assert matrix.series(["Python"], freq="month") == {"Python": {"2024-01": 2, "2024-03": 5}}
+    assert matrix.series(["Python"], role="data_science") == {"Python": {"2024": 2}}
+    assert matrix.series(["Python", "SQL"], region="Berlin") == {"Python": {"2024": 2}, "SQL": {"2023": 1}}
+
+    # Differenz in einen gecachten Slice übernehmen
+    matrix.apply([(2, "SQL", 2024 * 12 + 1, "data_science", "Berlin", 1, 4)])
+    assert matrix.series(["SQL"], region="Berlin") == {"SQL": {"2023": 1, "2024": 4}}
+    assert matrix.growth(2023, 2024)[0]["skill"] == "Python"
+
+
+def test_matrix_cache_is_bound_to_store_object():
+    cached = len(skill_trend_matrix._matrices)
+    store = ResultsStore(":memory:")
+    store.upsert(_job("a", "2024-01-15", "Berlin", ["Python"]))
+    assert get_skill_trend_matrix(store) is get_skill_trend_matrix(store)
+    assert len(skill_trend_matrix._matrices) == cached + 1
+    store.close()
+    del store
+    gc.collect()
+    assert len(skill_trend_matrix._matrices) == cached
+
+    # Neuer Store (evtl. mit gleicher id) bekommt eine eigene, leere Matrix
+    fresh = ResultsStore(":memory:")
+    assert get_skill_trend_matrix(fresh).series(["Python"], freq="month") == {"Python": {}}
+    fresh.close()
+
+
+def test_matrix_reloads_after_writes_of_other_process(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "results.sqlite3")
+    api, batch = ResultsStore(db_path), ResultsStore(db_path)  # zwei Prozesse auf derselben Datei
+    api.upsert(_job("a", "2024-01-15", "Berlin", ["Python"]))
+    matrix = get_skill_trend_matrix(api)
+    loads = []
+    original = matrix.load
+    monkeypatch.setattr(matrix, "load", lambda store: loads.append(store) or original(store))
+
+    api.upsert(_job("b", "2024-02-15", "Berlin", ["Python"]))
+    api.touch_data_version()
+    assert get_skill_trend_matrix(api) is matrix
+    assert loads == []  # eigene Änderungen: Listener genügt
+    assert matrix.series(["Python"], freq="month") == {"Python": {"2024-01": 1, "2024-02": 1}}
+
+    batch.upsert(_job("c", "2024-03-15", "Berlin", ["Python"]))
+    assert get_skill_trend_matrix(api).series(["Python"], freq="month") == {
+        "Python": {"2024-01": 1, "2024-02": 1, "2024-03": 1}}
+    assert loads == [api]
+    get_skill_trend_matrix(api)
+    assert loads == [api]
+    api.close()
+    batch.close()
@@ -0,0 +1,95 @@
+"""
+Test für die Streaming-Exporte (CSV, NDJSON, XLSX)
+
+Testet:
+- Zeilen kommen blockweise (höchstens chunk_size Jobs pro Block) aus dem Results-Store
+- Filter nach Zeitraum, Rolle und Region - gleiches Ergebnis für SQL und Verzeichnis-Scan
+- CSV-Stream entspricht generate_csv_report, NDJSON/XLSX enthalten dieselben Zeilen
+- Ungültiges Datumsformat wird sofort abgelehnt
+- XLSX ohne openpyxl scheitert sofort beim Aufruf (Endpunkt → 501), nicht erst im Stream
+"""
+
+import io
+import json
+import sys
+
+import pytest
+from openpyxl import load_workbook
+
+from app.infrastructure import reporting
+
+
+def _job(i, title, region, date):
+    return {"raw_text_hash": f"hash{i}", "title": title, "job_role": "IT", "region": region, "industry": "IT",
+            "posting_date": date, "competences": [{"original_term": "Python"}, {"original_term": f"Skill {i}"}]}
+
+
+JOBS = [
+    _job(0, "Data Scientist", "Berlin", "2023-11-20"),
+    _job(1, "Data Scientist", "München", "2024-01-05"),
+    _job(2, "Backend Developer", "Berlin", "2024-02-01"),
+    _job(3, "Data Scientist", "berlin", "2024-03-15"),
+    _job(4, "UX Designer", "Berlin", "unbekannt"),
+]
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    directory = tmp_path / "batch_results"
+    directory.mkdir()
+    for job in JOBS:
+        (directory / f"{job['raw_text_hash']}.json").write_text(json.dumps(job), encoding="utf-8")
+    monkeypatch.setattr(reporting, "BATCH_RESULTS_DIR", directory)
+    monkeypatch.setenv("RESULTS_DB_PATH", str(tmp_path / "results.sqlite3"))
+    return directory
+
+
+def _titles(chunks):
+    # Reihenfolge = Einfügereihenfolge bzw. Verzeichnis-Reihenfolge
+    return sorted((row["title"], row["posting_date"]) for chunk in chunks for row in chunk)
+
+
+def test_rows_are_streamed_in_chunks(corpus):
+    chunks = list(reporting.iter_export_rows(chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[0][0]["skills"].startswith("Python|Skill ")
+
+    blocks = list(reporting.stream_csv_report(chunk_size=2))
+    assert len(blocks) == 3
+    assert b"".join(blocks) == reporting.generate_csv_report().getvalue()
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "files"])
+def test_filters_match_for_both_backends(corpus, monkeypatch, backend):
+    monkeypatch.setenv("RESULTS_BACKEND", backend)
+
+    assert _titles(reporting.iter_export_rows(date_from="2024-01", date_to="2024-02")) == [
+        ("Backend Developer", "2024-02-01"), ("Data Scientist", "2024-01-05"),
+    ]
+    assert _titles(reporting.iter_export_rows(date_to="2023")) == [("Data Scientist", "2023-11-20")]
+    assert _titles(reporting.iter_export_rows(role="data_science", region="Berlin")) == [
+        ("Data Scientist", "2023-11-20"), ("Data Scientist", "2024-03-15"),
+    ]
+    assert len(_titles(reporting.iter_export_rows(role="it"))) == 5  # job_role, Groß-/Kleinschreibung egal
+
+    with pytest.raises(ValueError):
+        reporting.stream_csv_report(date_from="01.02.2024")
+
+
+def test_ndjson_and_xlsx_contain_the_same_rows(corpus):
+    expected = [row for chunk in reporting.iter_export_rows(region="Berlin") for row in chunk]
+
+    ndjson = b"".join(reporting.stream_ndjson_report(region="Berlin", chunk_size=2)).decode("utf-8")
+    assert [json.loads(line) for line in ndjson.splitlines()] == expected
+
+    xlsx = b"".join(reporting.stream_xlsx_report(region="Berlin"))
+    sheet = load_workbook(io.BytesIO(xlsx), read_only=True)["Jobs"]
+    rows = list(sheet.iter_rows(values_only=True))
+    assert list(rows[0]) == reporting.EXPORT_COLUMNS
+    assert [row[0] for row in rows[1:]] == [row["title"] for row in expected]
+
+
+def test_xlsx_without_openpyxl_fails_before_streaming(monkeypatch):
+    monkeypatch.setitem(sys.modules, "openpyxl", None)
+    with pytest.raises(RuntimeError, match="openpyxl"):
+        reporting.stream_xlsx_report()
@@ -0,0 +1,63 @@
+"""
+Test für ExtractedTextCache (content-addressed Text-Cache)
+
+Testet:
+- Roundtrip gzip-komprimiert inkl. Metadaten
+- Versionswechsel invalidiert alte Einträge
+- AdvancedTextExtractor / MultiFormatParser parsen gleiche Bytes nur einmal
+"""
+
+import io
+
+from reportlab.pdfgen import canvas
+
+from app.infrastructure.cache.text_cache import ExtractedTextCache, sha256_stream
+from app.infrastructure.extractor.advanced_text_extractor import AdvancedTextExtractor
+from app.infrastructure.extractor.multi_format_parser import MultiFormatParser
+
+
+def test_roundtrip_and_version_invalidation(tmp_path):
+    cache = ExtractedTextCache(cache_dir=str(tmp_path))
+    digest = sha256_stream(io.BytesIO(b"%PDF-1.4 Stellenanzeige"))
+
+    assert cache.get(digest, "parser.pdf") is None
+    cache.put(digest, "parser.pdf", "Python Entwickler (m/w/d)", {"page_count": 2})
+
+    entry = cache.get(digest, "parser.pdf")
+    assert entry == {"text": "Python Entwickler (m/w/d)", "metadata": {"page_count": 2}}
+    assert cache.get(digest, "extractor.pdf") is None
+    assert ExtractedTextCache(cache_dir=str(tmp_path), version=99).get(digest, "parser.pdf") is None
+
+
+def test_extractor_serves_identical_bytes_from_cache(tmp_path):
+    cache = ExtractedTextCache(cache_dir=str(tmp_path))
+    extractor = AdvancedTextExtractor(text_cache=cache)
+    payload = "Wir suchen einen Data Engineer mit Spark und Airflow.".encode("utf-8")
+
+    first = extractor.extract_text(io.BytesIO(payload), "anzeige.txt")
+    second = extractor.extract_text(io.BytesIO(payload), "kopie.txt")
+
+    assert first == second
+    assert cache.hits == 1
+    assert cache.get_cache_info()["entries"] == 1
+
+
+def test_parser_cache_hit_keeps_metadata(tmp_path):
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    pdf.drawString(72, 720, "Senior UX Designer mit Figma Erfahrung")
+    pdf.save()
+    pdf_path = tmp_path / "ux.pdf"
+    pdf_path.write_bytes(buffer.getvalue())
+
+    cache = ExtractedTextCache(cache_dir=str(tmp_path / "cache"))
+    parser = MultiFormatParser(text_cache=cache)
+
+    parsed = parser.parse_file(str(pdf_path))
+    cached = parser.parse_file(str(pdf_path))
+
+    assert cache.hits == 1
+    assert cached.text == parsed.text
+    assert cached.file_type == "pdf"
+    assert cached.metadata["page_count"] == 1
+    assert cached.metadata["content_sha256"] == parsed.metadata["content_sha256"]
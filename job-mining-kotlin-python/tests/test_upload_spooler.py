@@ -0,0 +1,92 @@
+"""
+Test für Upload-Limits (open_upload / BodySizeLimitMiddleware)
+
+Testet:
+- open_upload liefert den bereits gespoolten Stream von Starlette (keine Kopie)
+- Typ-Limits → 413, leere Uploads → 400
+- Middleware lehnt zu große Requests per Content-Length ab, ohne den Body zu lesen
+- Chunked-Requests ohne Content-Length werden beim Überschreiten abgebrochen
+"""
+
+import asyncio
+import io
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from app.infrastructure.io.upload_spooler import (
+    BodySizeLimitMiddleware,
+    UploadRejected,
+    open_upload,
+    upload_limit_for,
+)
+
+
+def _upload(data: bytes, filename: str) -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), filename=filename)
+
+
+def test_open_upload_returns_spooled_stream():
+    upload = _upload(b"Python Entwickler", "job.txt")
+    upload.file.read()
+
+    stream = open_upload(upload)
+
+    assert stream is upload.file
+    assert stream.read() == b"Python Entwickler"
+
+
+def test_limits_and_empty_upload_are_rejected():
+    too_big = b"x" * (upload_limit_for("notes.txt") + 1)
+
+    with pytest.raises(UploadRejected) as exc:
+        open_upload(_upload(too_big, "notes.txt"))
+    assert exc.value.status_code == 413
+
+    with pytest.raises(UploadRejected) as exc:
+        open_upload(_upload(b"", "leer.pdf"))
+    assert exc.value.status_code == 400
+
+
+async def _echo_app(scope, receive, send):
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            break
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _call(middleware, headers, chunks):
+    received = []
+    sent = []
+
+    async def receive():
+        received.append(len(chunks))
+        chunk = chunks.pop(0)
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": "/analyse/file", "headers": headers}
+    asyncio.run(middleware(scope, receive, send))
+    return sent[0]["status"], received
+
+
+def test_middleware_rejects_by_content_length_without_reading():
+    middleware = BodySizeLimitMiddleware(_echo_app, max_bytes=100)
+
+    status, received = _call(middleware, [(b"content-length", b"1000")], [b"x" * 1000])
+
+    assert status == 413
+    assert received == []
+
+
+def test_middleware_aborts_chunked_body_over_limit():
+    middleware = BodySizeLimitMiddleware(_echo_app, max_bytes=100)
+
+    assert _call(middleware, [], [b"x" * 60, b"x" * 60, b"x" * 60])[0] == 413
+    assert _call(middleware, [(b"content-length", b"80")], [b"x" * 40, b"x" * 40])[0] == 200
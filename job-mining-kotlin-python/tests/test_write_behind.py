@@ -0,0 +1,76 @@
+"""
+Test für Write-behind-Persistenz (DiscoveryLearningService)
+
+Testet:
+- Viele wiederholte Sichtungen → wenige komplette Schreibvorgänge (Schwelle max_pending)
+- Zeit-Schwelle: ungeschriebene Änderungen landen spätestens nach max_delay auf der Platte
+- Validierung (manuelle Aktion) wird sofort geschrieben
+- Neue Instanz im selben Prozess sieht offene Änderungen; unlesbare Datei wird beiseitegelegt
+- Instanzen ohne eigenen Writer teilen den Modul-Writer; flush_all_writers (Shutdown) schreibt ihn
+"""
+
+import json
+import time
+
+from app.application.services import discovery_learning_service
+from app.application.services.discovery_learning_service import DiscoveryLearningService
+from app.infrastructure.io.write_behind import WriteBehindWriter, flush_all_writers, load_json
+
+
+def test_repeat_sightings_are_batched(tmp_path):
+    writer = WriteBehindWriter(max_pending=500, max_delay=60)
+    service = DiscoveryLearningService(data_dir=tmp_path, writer=writer)
+
+    for i in range(1200):
+        service.discover_skill(f"Skill {i % 40}", context="Batch")
+    # 1200 Sichtungen + 40 Auto-Promotionen → 2 Schreibvorgänge statt 1240
+    assert writer.flushes == 2
+    assert writer.pending == 240
+
+    skills_file = tmp_path / "discovered_skills.json"
+    assert json.loads(skills_file.read_text(encoding="utf-8"))["skill 0"]["frequency"] < 30
+
+    service.flush()
+    assert writer.pending == 0
+    assert json.loads(skills_file.read_text(encoding="utf-8"))["skill 0"]["frequency"] == 30
+
+    service.discover_role("Prompt Engineer")
+    service.validate_role("Prompt Engineer")
+    assert json.loads((tmp_path / "discovered_roles.json").read_text(encoding="utf-8"))["prompt engineer"]["validated"]
+
+
+def test_time_threshold_flushes_in_background(tmp_path):
+    writer = WriteBehindWriter(max_pending=1000, max_delay=0.05)
+    service = DiscoveryLearningService(data_dir=tmp_path, writer=writer)
+    service.discover_industry("Mobility", company_name="Tesla")
+    assert not (tmp_path / "discovered_industries.json").exists()
+
+    deadline = time.time() + 5
+    while not (tmp_path / "discovered_industries.json").exists() and time.time() < deadline:
+        time.sleep(0.01)
+    assert "mobility" in json.loads((tmp_path / "discovered_industries.json").read_text(encoding="utf-8"))
+
+
+def test_reload_sees_pending_changes_and_survives_corrupt_file(tmp_path):
+    first = DiscoveryLearningService(data_dir=tmp_path, writer=WriteBehindWriter(max_pending=1000, max_delay=60))
+    first.discover_skill("Solidity")
+    second = DiscoveryLearningService(data_dir=tmp_path)
+    assert "solidity" in second.discovered_skills
+
+    # Abgebrochener Schreibvorgang eines alten Prozesses (nicht atomar geschrieben)
+    (tmp_path / "discovered_roles.json").write_text('{"ux designer": {"lev', encoding="utf-8")
+    assert load_json(tmp_path / "discovered_roles.json") == {}
+    assert list(tmp_path.glob("discovered_roles.json.corrupt-*"))
+
+
+def test_instances_share_module_writer_flushed_on_shutdown(tmp_path):
+    first = DiscoveryLearningService(data_dir=tmp_path / "a")
+    second = DiscoveryLearningService(data_dir=tmp_path / "b")
+    assert first._writer is second._writer is discovery_learning_service._writer
+
+    first.discover_skill("Solidity")
+    second.discover_skill("Rust")
+    assert not (tmp_path / "a" / "discovered_skills.json").exists()
+    flush_all_writers()
+    assert "solidity" in json.loads((tmp_path / "a" / "discovered_skills.json").read_text(encoding="utf-8"))
+    assert "rust" in json.loads((tmp_path / "b" / "discovered_skills.json").read_text(encoding="utf-8"))